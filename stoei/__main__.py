@@ -4,10 +4,9 @@ import argparse
 import os
 import sys
 import traceback
-from importlib.metadata import version
+from pathlib import Path
 
-from stoei.app import main
-from stoei.logger import get_logger
+from stoei.logger import configure_logging, get_logger, set_file_log_level, shutdown_logging
 
 logger = get_logger(__name__)
 
@@ -29,7 +28,7 @@ def _ensure_truecolor() -> None:
     colorterm = os.environ.get("COLORTERM", "")
     if colorterm.lower() not in ("truecolor", "24bit"):
         os.environ["COLORTERM"] = "truecolor"
-        logger.debug(f"Set COLORTERM=truecolor (was: {colorterm!r})")
+        logger.debug("Set COLORTERM=truecolor (was: {!r})", colorterm)
 
 
 def _set_terminal_title(title: str) -> None:
@@ -53,7 +52,7 @@ def _set_terminal_title(title: str) -> None:
         sys.stdout.write(f"\033k{title}\033\\")
 
     sys.stdout.flush()
-    logger.debug(f"Set terminal title to {title!r}")
+    logger.debug("Set terminal title to {!r}", title)
 
 
 def _restore_terminal_title() -> None:
@@ -80,12 +79,39 @@ def get_version() -> str:
     Returns:
         The package version string.
     """
+    # importlib.metadata is slow to import; only --version needs it
+    from importlib.metadata import version  # noqa: PLC0415
+
     try:
         return version("stoei")
     except Exception:
         return "unknown"
 
 
+def main() -> None:
+    """Run the SLURM monitor TUI app.
+
+    Textual and the app modules are imported here rather than at module
+    load, so argparse-only invocations such as ``--version`` stay fast.
+    The critical-path SLURM fetches are started first, so they overlap with
+    importing Textual and constructing the app.
+    """
+    from stoei.slurm.prefetch import StartupFetch  # noqa: PLC0415
+
+    startup_fetch = StartupFetch()
+
+    # Settings import Textual's theme module; the squeue fetch is already running
+    from stoei.settings import load_settings  # noqa: PLC0415
+
+    settings = load_settings()
+    set_file_log_level(settings.log_level)
+    startup_fetch.start_history(settings.job_history_days)
+
+    from stoei.app import main as app_main  # noqa: PLC0415
+
+    app_main(startup_fetch)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments.
 
@@ -99,17 +125,55 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=f"%(prog)s {get_version()}",
+        action="store_true",
         help="Show program version and exit.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        type=Path,
+        help="Profile the session (or --profile-cycles refresh cycles) and write the profiles to DIR. "
+        "Sending SIGUSR1 starts or stops profiling at any time.",
+    )
+    parser.add_argument(
+        "--profile-cycles",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Stop profiling after N refresh cycles (default: profile until exit or the next SIGUSR1).",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        type=Path,
+        help="Record refresh cycles as spans and write them to FILE on exit, in the Chrome trace "
+        "format (open with chrome://tracing or ui.perfetto.dev).",
+    )
+    args = parser.parse_args()
+    if args.profile_cycles < 0:
+        parser.error("--profile-cycles must not be negative")
+    if args.version:
+        # Looked up only when asked for, unlike argparse's "version" action
+        parser.exit(message=f"{parser.prog} {get_version()}\n")
+    return args
 
 
 def run() -> None:
     """Run the app with standard Python tracebacks."""
     # Parse arguments (handles --version automatically)
-    parse_args()
+    args = parse_args()
+
+    # Log to file only once we know the TUI will run
+    configure_logging()
+
+    from stoei.profiling import configure_profiling, start_profiling, stop_profiling  # noqa: PLC0415
+    from stoei.tracing import configure_tracing, write_trace  # noqa: PLC0415
+
+    configure_tracing(args.trace)
+    configure_profiling(args.profile, args.profile_cycles)
+    if args.profile is not None:
+        # Started before the app is imported, so startup is profiled too
+        start_profiling()
 
     # Ensure true color mode for consistent theme colors
     _ensure_truecolor()
@@ -126,6 +190,13 @@ def run() -> None:
         sys.exit(1)
     finally:
         _restore_terminal_title()
+        profile_dir = stop_profiling()
+        if profile_dir is not None:
+            print(f"Profile written to {profile_dir}", file=sys.stderr)
+        trace_path = write_trace()
+        if trace_path is not None:
+            print(f"Trace written to {trace_path}", file=sys.stderr)
+        shutdown_logging()
 
 
 if __name__ == "__main__":
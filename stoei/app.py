@@ -1,12 +1,18 @@
 """Main Textual TUI application for stoei."""
 
+import asyncio
 import contextlib
+import functools
+import inspect
 import re
-from collections.abc import Callable
+import signal
+import time
+from collections.abc import Callable, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
-from typing import ClassVar, TypeAlias, cast
+from typing import Any, ClassVar, ParamSpec, TypeAlias, TypeVar, cast
 
 from textual._path import CSSPathType
 from textual.app import App, ComposeResult
@@ -15,13 +21,18 @@ from textual.containers import Container, Horizontal
 from textual.events import Key
 from textual.message import Message
 from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import DataTable, Footer, Header, Static
 from textual.widgets.data_table import RowKey
-from textual.worker import Worker, WorkerState, get_current_worker
+from textual.worker import ResultType, Worker, WorkerState, WorkType, get_current_worker
 
-from stoei.colors import get_theme_colors
+from stoei.colors import ThemeColors, get_theme_colors
+from stoei.dataflow import Dataflow
 from stoei.keybindings import Actions, KeybindingConfig
-from stoei.logger import add_tui_sink, get_logger, remove_tui_sink
+from stoei.last_snapshot import LastSnapshot, format_age, load_last_snapshot, save_last_snapshot
+from stoei.logger import add_tui_sink, get_logger, remove_tui_sink, set_file_log_level
+from stoei.paths import get_cache_dir
+from stoei.profiling import is_profiling, profiled, record_refresh_cycle, start_profiling, stop_profiling
 from stoei.settings import (
     MAX_SIDEBAR_WIDTH_PERCENT,
     MIN_SIDEBAR_WIDTH_PERCENT,
@@ -29,23 +40,39 @@ from stoei.settings import (
     load_settings,
     save_settings,
 )
+from stoei.slurm.account_index import (
+    account_usage,
+    build_account_tree,
+    rollup_account_priorities,
+    subtree_accounts,
+)
 from stoei.slurm.array_parser import normalize_array_job_id, parse_array_size
 from stoei.slurm.cache import Job, JobCache, JobState
 from stoei.slurm.commands import (
     cancel_job,
+    command_flight_counters,
     get_all_running_jobs,
     get_cluster_nodes,
     get_energy_job_history,
     get_fair_share_priority,
     get_job_history,
     get_job_info_and_log_paths,
+    get_job_schedule_fields,
+    get_jobs_info_and_log_paths,
     get_node_info,
     get_pending_job_priority,
     get_running_jobs,
     get_user_jobs,
     get_wait_time_job_history,
 )
-from stoei.slurm.formatters import format_account_info, format_compact_timeline, format_user_info
+from stoei.slurm.fingerprint import UNCHANGED, OutputFingerprints, Unchanged
+from stoei.slurm.formatters import (
+    format_account_info,
+    format_compact_timeline,
+    format_node_info,
+    format_node_jobs,
+    format_user_info,
+)
 from stoei.slurm.gpu_parser import (
     aggregate_gpu_counts,
     calculate_total_gpus,
@@ -54,17 +81,32 @@ from stoei.slurm.gpu_parser import (
     parse_gpu_entries,
     parse_gpu_from_gres,
 )
+from stoei.slurm.job_index import JobIndex
+from stoei.slurm.job_info_cache import JobInfoCache
+from stoei.slurm.nodelist import get_node_registry
 from stoei.slurm.parser import parse_sprio_output, parse_sshare_output, parse_tres_resources
+from stoei.slurm.prefetch import StartupFetch
+from stoei.slurm.user_index import (
+    index_fair_share_by_user,
+    index_job_priorities_by_user,
+    select_running_jobs,
+    select_user_jobs,
+    to_running_job_row,
+    to_user_job_row,
+)
 from stoei.slurm.validation import check_slurm_available, get_current_username
-from stoei.slurm.wait_time import calculate_partition_wait_stats
+from stoei.slurm.wait_time import RollingWaitTimeStore, calculate_partition_wait_stats
+from stoei.snapshot import ClusterSnapshot, SnapshotAttribute, SnapshotStore
+from stoei.telemetry import APPLY, get_telemetry
 from stoei.themes import DEFAULT_THEME_NAME, REGISTERED_THEMES
+from stoei.tracing import APPLY_RESULT, CYCLE, FETCH, UI_CALLBACK, span, traced
 from stoei.widgets.cluster_sidebar import ClusterSidebar, ClusterStats, PendingPartitionStats
 from stoei.widgets.filterable_table import ColumnConfig, FilterableDataTable
-from stoei.widgets.help_screen import HelpScreen
 from stoei.widgets.loading_indicator import LoadingIndicator
 from stoei.widgets.loading_screen import LoadingScreen, LoadingStep
 from stoei.widgets.log_pane import LogPane
 from stoei.widgets.node_overview import NodeInfo, NodeOverviewTab
+from stoei.widgets.performance_tab import PerformanceTab
 from stoei.widgets.priority_overview import (
     AccountPriority,
     JobPriority,
@@ -85,8 +127,6 @@ from stoei.widgets.screens import (
     NodeInfoScreen,
     UserInfoScreen,
 )
-from stoei.widgets.settings_screen import SettingsScreen
-from stoei.widgets.slurm_error_screen import SlurmUnavailableScreen
 from stoei.widgets.tabs import TabContainer, TabSwitched
 from stoei.widgets.user_overview import (
     UserEnergyStats,
@@ -97,12 +137,15 @@ from stoei.widgets.user_overview import (
 
 logger = get_logger(__name__)
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
 # Type aliases for fetch result types used in _apply_fetch_result.
 _UserJobsResult: TypeAlias = tuple[list[tuple[str, ...]] | None, list[tuple[str, ...]] | None, int, int, int]
-_PriorityHalfResult: TypeAlias = tuple[list[tuple[str, ...]], str | None]
+_PriorityHalfResult: TypeAlias = tuple[list[tuple[str, ...]] | Unchanged, str | None]
 _EnergyResult: TypeAlias = tuple[list[tuple[str, ...]], bool]
 _FetchResult: TypeAlias = (
-    _UserJobsResult | list[dict[str, str]] | list[tuple[str, ...]] | _PriorityHalfResult | _EnergyResult
+    _UserJobsResult | list[dict[str, str]] | list[tuple[str, ...]] | _PriorityHalfResult | _EnergyResult | Unchanged
 )
 
 # Path to styles directory
@@ -112,6 +155,15 @@ STYLES_DIR = Path(__file__).parent / "styles"
 # The priority tab is updated once both halves have arrived in the same cycle.
 _PRIORITY_FETCH_COUNT = 2
 
+# Upper bound on the rows prefetched per batch (one viewport of the jobs table)
+_PREFETCH_MAX_JOBS = 100
+
+# Minimum seconds between saves of the last known data for the next launch
+_LAST_SNAPSHOT_SAVE_INTERVAL = 300.0
+
+# Seconds before the pending reason and estimated start time of a pending job are queried again
+_SCHEDULE_FIELDS_MAX_AGE = 60.0
+
 # Minimum window width to show sidebar (sidebar is 30 wide, need space for content)
 MIN_WIDTH_FOR_SIDEBAR = 100
 
@@ -123,6 +175,61 @@ LOADING_STEPS = [
 ]
 
 
+# ClusterStats fields filled by the pending-resources and wait-time parts of the sidebar stats
+_PENDING_STATS_FIELDS = (
+    "pending_jobs_count",
+    "pending_cpus",
+    "pending_memory_gb",
+    "pending_gpus",
+    "pending_gpus_by_type",
+    "pending_by_partition",
+)
+_WAIT_STATS_FIELDS = (
+    "wait_stats_by_partition",
+    "wait_stats_hours",
+    "wait_stats_by_window",
+    "wait_stats_covered_seconds",
+)
+
+
+def _merge_cluster_stats(
+    node_stats: ClusterStats, pending_stats: ClusterStats, wait_stats: ClusterStats
+) -> ClusterStats:
+    """Combine separately computed parts of the cluster sidebar stats.
+
+    Args:
+        node_stats: Stats with the node, CPU, memory and GPU totals filled.
+        pending_stats: Stats with the pending job resource fields filled.
+        wait_stats: Stats with the wait time fields filled.
+
+    Returns:
+        New ClusterStats combining all three parts.
+    """
+    return replace(
+        node_stats,
+        **{name: getattr(pending_stats, name) for name in _PENDING_STATS_FIELDS},
+        **{name: getattr(wait_stats, name) for name in _WAIT_STATS_FIELDS},
+    )
+
+
+def _submit_fetch(
+    pool: ThreadPoolExecutor, label: str, fetch: Callable[_P, _R], *args: _P.args, **kwargs: _P.kwargs
+) -> Future[_R]:
+    """Submit a refresh fetcher, profiled and traced as a ``fetch <label>`` span.
+
+    Args:
+        pool: The refresh cycle's thread pool.
+        label: Fetch result label, as passed to ``_apply_fetch_result``.
+        fetch: Fetcher to run.
+        *args: Positional arguments for ``fetch``.
+        **kwargs: Keyword arguments for ``fetch``.
+
+    Returns:
+        The future of the fetch result.
+    """
+    return pool.submit(traced(f"fetch {label}", FETCH)(profiled(fetch)), *args, **kwargs)
+
+
 class _UICallback(Message, bubble=False):
     """Non-blocking callback message posted from worker threads."""
 
@@ -170,6 +277,7 @@ class SlurmMonitor(App[None]):
         Binding("3", "switch_tab_users", "Users Tab", show=False),
         Binding("4", "switch_tab_priority", "Priority Tab", show=False),
         Binding("5", "switch_tab_logs", "Logs Tab", show=False),
+        Binding("6", "switch_tab_performance", "Performance Tab", show=False),
         Binding("left", "previous_tab", "Previous Tab", show=False),
         Binding("right", "next_tab", "Next Tab", show=False),
         Binding("shift+tab", "previous_tab", "Previous Tab", show=False),
@@ -194,13 +302,153 @@ class SlurmMonitor(App[None]):
         ColumnConfig(name="Timeline", key="timeline", sortable=False, filterable=True),  # Auto width
     ]
 
+    # Refresh data lives in an immutable, versioned ClusterSnapshot shared with the
+    # worker threads. These attributes read the current generation; assigning one
+    # publishes a new generation for its source.
+    _cluster_nodes = SnapshotAttribute[list[dict[str, str]]]("cluster_nodes", "nodes")
+    _cached_node_infos = SnapshotAttribute[list[NodeInfo]]("node_infos", "node_infos")
+    _all_users_jobs = SnapshotAttribute[list[tuple[str, ...]]]("all_users_jobs", "all_jobs")
+    _cached_running_user_stats = SnapshotAttribute[list[UserStats]]("running_user_stats", "user_stats")
+    _cached_pending_user_stats = SnapshotAttribute[list[UserPendingStats]]("pending_user_stats", "user_stats")
+    _energy_history_jobs = SnapshotAttribute[list[tuple[str, ...]]]("energy_history_jobs", "energy")
+    _cached_energy_user_stats = SnapshotAttribute[list[UserEnergyStats]]("energy_user_stats", "energy_stats")
+    _wait_time_jobs = SnapshotAttribute[list[tuple[str, ...]]]("wait_time_jobs", "wait_time")
+    _cached_cluster_stats = SnapshotAttribute[ClusterStats | None]("cluster_stats", "cluster_stats")
+    _fair_share_entries = SnapshotAttribute[list[tuple[str, ...]]]("fair_share_entries", "fair_share")
+    _job_priority_entries = SnapshotAttribute[list[tuple[str, ...]]]("job_priority_entries", "job_priority")
+    _cached_user_priorities = SnapshotAttribute[list[UserPriority]]("user_priorities", "priority")
+    _cached_account_priorities = SnapshotAttribute[list[AccountPriority]]("account_priorities", "priority")
+    _cached_job_priorities = SnapshotAttribute[list[JobPriority]]("job_priorities", "priority")
+    _cached_user_priority_rows = SnapshotAttribute[list[tuple[str, ...]]]("user_priority_rows", "priority")
+    _cached_account_priority_rows = SnapshotAttribute[list[tuple[str, ...]]]("account_priority_rows", "priority")
+    _cached_job_priority_rows = SnapshotAttribute[list[tuple[str, ...]]]("job_priority_rows", "priority")
+    _cached_my_job_priority_rows = SnapshotAttribute[list[tuple[str, ...]]]("my_job_priority_rows", "priority")
+    _cached_priority_summary_markup = SnapshotAttribute[str]("priority_summary_markup", "priority")
+
     def get_theme_variable_defaults(self) -> dict[str, str]:
         """Provide default values for custom theme variables."""
         return {**super().get_theme_variable_defaults(), **self.THEME_VARIABLE_DEFAULTS}
 
-    def __init__(self) -> None:
-        """Initialize the SLURM monitor app."""
+    def _define_derived_views(self) -> None:
+        """Declare the caches derived from snapshot sources and what they depend on.
+
+        Views are recomputed lazily: only when an input changed and a visible
+        widget asks for them.
+        """
+        flow = self._dataflow
+        # Node/user/partition -> jobs index, diffed incrementally against the previous all-jobs snapshot
+        self._job_index_view = flow.view("job_index", ("all_jobs",), self._update_job_index, initial=None)
+        # NodeName -> node data, so node details are served without another scontrol call
+        self._nodes_by_name_view = flow.view(
+            "nodes_by_name",
+            ("nodes",),
+            lambda snapshot: {node.get("NodeName", "").strip(): node for node in snapshot.cluster_nodes},
+            initial={},
+        )
+        parsed_node_infos = flow.view(
+            "parsed_node_infos", ("nodes",), lambda snapshot: self._parse_node_infos(snapshot.cluster_nodes), initial=[]
+        )
+        self._node_infos_view = flow.view(
+            "node_infos",
+            (parsed_node_infos, self._job_index_view),
+            lambda _snapshot: self._compute_node_infos(parsed_node_infos.value),
+            initial=None,
+        )
+        self._user_stats_view = flow.view("user_stats", ("all_jobs",), self._compute_user_overview_cache, initial=None)
+        self._energy_stats_view = flow.view("energy_stats", ("energy",), self._compute_energy_stats, initial=None)
+        # Per-user lookups for the user info modal
+        self._energy_stats_by_user_view = flow.view(
+            "energy_stats_by_user",
+            (self._energy_stats_view,),
+            lambda _snapshot: {stats.username: stats for stats in self._cached_energy_user_stats},
+            initial={},
+        )
+        self._fair_share_by_user_view = flow.view(
+            "fair_share_by_user",
+            ("fair_share",),
+            lambda snapshot: index_fair_share_by_user(snapshot.fair_share_entries),
+            initial={},
+        )
+        self._job_priorities_by_user_view = flow.view(
+            "job_priorities_by_user",
+            ("job_priority",),
+            lambda snapshot: index_job_priorities_by_user(snapshot.job_priority_entries),
+            initial={},
+        )
+        # Account tree from sshare -a, with per-account priority rollups for the account info modal
+        self._account_tree_view = flow.view(
+            "account_tree",
+            ("fair_share",),
+            lambda snapshot: build_account_tree(snapshot.fair_share_entries),
+            initial={},
+        )
+        self._account_priorities_view = flow.view(
+            "account_priorities",
+            (self._account_tree_view, "job_priority"),
+            lambda snapshot: rollup_account_priorities(self._account_tree_view.value, snapshot.job_priority_entries),
+            initial={},
+        )
+        # Cluster sidebar stats, split so a wait-time update does not redo node or pending-job aggregation
+        node_stats = flow.view("node_stats", ("nodes",), self._calculate_node_stats, initial=ClusterStats())
+        pending_stats = flow.view("pending_stats", ("all_jobs",), self._calculate_pending_stats, initial=ClusterStats())
+        # Each wait-time batch is already ingested into the rolling store, whose
+        # version only changes when new jobs arrive or a bucket rolls over
+        wait_stats = flow.view(
+            "wait_stats",
+            (),
+            self._calculate_wait_stats,
+            initial=ClusterStats(),
+            key=lambda _snapshot: self._wait_time_store.stats_key(datetime.now()),
+        )
+        self._cluster_stats_view = flow.view(
+            "cluster_stats",
+            (node_stats, pending_stats, wait_stats),
+            lambda _snapshot: self._publish_cluster_stats(
+                _merge_cluster_stats(node_stats.value, pending_stats.value, wait_stats.value)
+            ),
+            initial=ClusterStats(),
+        )
+
+        # Priority tab: each half is rebuilt only when its own command output (or the theme) changed
+        def colors_key(_snapshot: ClusterSnapshot) -> ThemeColors:
+            return get_theme_colors(self)
+
+        fair_share_rows = flow.view(
+            "fair_share_rows",
+            ("fair_share",),
+            lambda snapshot: self._compute_fair_share_rows(snapshot.fair_share_entries, get_theme_colors(self)),
+            initial={},
+            key=colors_key,
+        )
+        job_priority_rows = flow.view(
+            "job_priority_rows",
+            ("job_priority",),
+            lambda snapshot: self._compute_job_priority_rows(snapshot.job_priority_entries, get_theme_colors(self)),
+            initial={},
+            key=colors_key,
+        )
+        self._priority_view = flow.view(
+            "priority",
+            (fair_share_rows, job_priority_rows),
+            lambda _snapshot: self._publish_priority_rows({**fair_share_rows.value, **job_priority_rows.value}),
+            initial=None,
+        )
+
+    def __init__(self, startup_fetch: StartupFetch | None = None) -> None:
+        """Initialize the SLURM monitor app.
+
+        Args:
+            startup_fetch: Critical-path SLURM fetches already started by the
+                entry point, used by the initial load instead of new commands.
+        """
+        self._startup_fetch = startup_fetch
+        # Reference point of the time-to-first-data measurement
+        self._launched_at = startup_fetch.started_at if startup_fetch else time.monotonic()
         self._settings: Settings = load_settings()
+        self._snapshot_store = SnapshotStore()  # Backs the SnapshotAttribute fields above
+        self._job_index = JobIndex()
+        self._dataflow = Dataflow(self._snapshot_store)
+        self._define_derived_views()
         super().__init__()
         self._register_custom_themes()
         self._apply_theme(self._settings.theme)
@@ -211,13 +459,16 @@ class SlurmMonitor(App[None]):
         self._initial_load_complete: bool = False
         self._current_username: str = get_current_username()
         self._log_sink_id: int | None = None
-        self._cluster_nodes: list[dict[str, str]] = []
-        self._all_users_jobs: list[tuple[str, ...]] = []
-        self._energy_history_jobs: list[tuple[str, ...]] = []  # Energy history (loaded once at startup if enabled)
         self._energy_data_loaded: bool = False  # Track if energy data was loaded
-        self._wait_time_jobs: list[tuple[str, ...]] = []  # Wait time history for cluster sidebar
-        self._fair_share_entries: list[tuple[str, ...]] = []  # Fair-share priority data from sshare
-        self._job_priority_entries: list[tuple[str, ...]] = []  # Pending job priority data from sprio
+        self._wait_time_store = RollingWaitTimeStore()  # Rolling 1h/24h/7d wait time sketches
+        # Raw output fingerprints: unchanged command output skips parsing, derived caches and UI pushes
+        self._output_fingerprints = OutputFingerprints()
+        self._nodes_fetched_at: float | None = None  # time.monotonic() of the last successful node fetch
+        self._last_running_fetch: list[tuple[str, ...]] | None = None
+        self._last_history_fetch: tuple[list[tuple[str, ...]], int, int, int] | None = None
+        self._all_jobs_failed: bool = False  # Whether this cycle's all-users squeue failed
+        # Per active user job: (state, time.monotonic() of the query, (Reason, SubmitTime, StartTime))
+        self._user_job_schedule: dict[str, tuple[str, float, tuple[str, ...]]] = {}
         self._is_narrow: bool = False
         self._loading_screen: LoadingScreen | None = None
         self._last_history_jobs: list[tuple[str, ...]] = []
@@ -227,28 +478,26 @@ class SlurmMonitor(App[None]):
         # data like nodes, all-users jobs, energy, etc.) has completed.
         self._initial_background_complete: bool = False
         # Job info cache: keyed by job_id, stores (formatted_info, error, stdout_path, stderr_path)
-        # Cleared on each refresh cycle so stale data doesn't persist
-        self._job_info_cache: dict[str, tuple[str, str | None, str | None, str | None]] = {}
-        # Pre-computed data (computed in background worker to avoid UI blocking)
-        self._cached_node_infos: list[NodeInfo] = []
-        self._cached_cluster_stats: ClusterStats | None = None
-        self._cached_running_user_stats: list[UserStats] = []
-        self._cached_pending_user_stats: list[UserPendingStats] = []
-        self._cached_energy_user_stats: list[UserEnergyStats] = []
-        self._cached_user_priorities: list[UserPriority] = []
-        self._cached_account_priorities: list[AccountPriority] = []
-        self._cached_job_priorities: list[JobPriority] = []
-        self._cached_user_priority_rows: list[tuple[str, ...]] = []
-        self._cached_account_priority_rows: list[tuple[str, ...]] = []
-        self._cached_job_priority_rows: list[tuple[str, ...]] = []
-        self._cached_my_job_priority_rows: list[tuple[str, ...]] = []
-        self._cached_priority_summary_markup: str = ""
+        # Finished jobs persist across sessions; active jobs expire on a TTL or state change
+        self._job_info_cache = JobInfoCache(get_cache_dir() / "job_info.json")
+        # Raw data of the last refresh, shown (marked stale) at the next launch until fresh data arrives
+        self._last_snapshot_path = get_cache_dir() / "last_snapshot.json.gz"
+        self._last_snapshot_saved_at: float | None = None  # time.monotonic() of the last save
+        self._showing_stale_data: bool = False
         # Pre-computed job rows from worker thread for fast initial UI population
         self._precomputed_job_rows: list[tuple[str, ...]] = []
         # Dirty flags: True when data has changed but the tab's table hasn't been refreshed
         self._dirty_nodes_tab: bool = False
         self._dirty_users_tab: bool = False
         self._dirty_priority_tab: bool = False
+        # Widgets of the non-default tabs, composed the first time their tab is shown.
+        # Until then their data stays in the derived views and is never turned into rows.
+        self._unmounted_tabs: dict[str, Callable[[], Widget]] = {
+            "nodes": lambda: NodeOverviewTab(id="node-overview"),
+            "users": lambda: UserOverviewTab(id="user-overview"),
+            "priority": lambda: PriorityOverviewTab(current_username=self._current_username, id="priority-overview"),
+            "performance": lambda: PerformanceTab(id="performance-overview"),
+        }
         # Counts how many of the two priority halves (fair_share + job_priority)
         # have arrived so far in the current refresh cycle.  When both arrive the
         # priority tab is recomputed and updated once, avoiding double renders.
@@ -307,30 +556,34 @@ class SlurmMonitor(App[None]):
                         id="jobs-filterable-table",
                     )
 
-                # Nodes tab
-                with Container(id="tab-nodes-content", classes="tab-content"):
-                    yield NodeOverviewTab(id="node-overview")
-
-                # Users tab
-                with Container(id="tab-users-content", classes="tab-content"):
-                    yield UserOverviewTab(id="user-overview")
+                # Nodes, Users and Priority tabs (content mounted on first show)
+                yield Container(id="tab-nodes-content", classes="tab-content")
+                yield Container(id="tab-users-content", classes="tab-content")
+                yield Container(id="tab-priority-content", classes="tab-content")
 
-                # Priority tab
-                with Container(id="tab-priority-content", classes="tab-content"):
-                    yield PriorityOverviewTab(current_username=self._current_username, id="priority-overview")
-
-                # Logs tab
+                # Logs tab (mounted up front: it collects log lines from startup)
                 with Container(id="tab-logs-content", classes="tab-content"):
                     yield LogPane(id="log_pane", max_lines=self._settings.max_log_lines)
 
+                # Performance tab (content mounted on first show)
+                yield Container(id="tab-performance-content", classes="tab-content")
+
             # Sidebar with cluster load (on the right)
             yield ClusterSidebar(id="cluster-sidebar")
 
         yield Footer()
 
     def on__uicallback(self, message: _UICallback) -> None:
-        """Execute a callback posted from a worker thread."""
-        message.callback()
+        """Execute a callback posted from a worker thread, timing named widget updates."""
+        callback = message.callback
+        target = callback.func if isinstance(callback, functools.partial) else callback
+        name = getattr(target, "__name__", "<lambda>")
+        with span(getattr(target, "__qualname__", name), UI_CALLBACK):
+            if name == "<lambda>":
+                callback()
+            else:
+                with get_telemetry().timed(APPLY, name):
+                    callback()
 
     def _post_ui_callback(self, callback: Callable[[], object]) -> None:
         """Schedule *callback* on the main thread without blocking the caller.
@@ -341,6 +594,12 @@ class SlurmMonitor(App[None]):
         """
         self.post_message(_UICallback(callback))
 
+    def run_worker(self, work: WorkType[ResultType], *args: Any, **kwargs: Any) -> Worker[ResultType]:
+        """Run a worker, profiling thread workers while a profiling session is running."""
+        if kwargs.get("thread") and callable(work) and not inspect.iscoroutinefunction(work):
+            work = profiled(work)
+        return super().run_worker(work, *args, **kwargs)
+
     def on_mount(self) -> None:
         """Initialize table and start data loading."""
         logger.info("Mounting application")
@@ -357,6 +616,8 @@ class SlurmMonitor(App[None]):
             priority_tab.display = False
             logs_tab = self.query_one("#tab-logs-content", Container)
             logs_tab.display = False
+            performance_tab = self.query_one("#tab-performance-content", Container)
+            performance_tab.display = False
         except Exception as exc:
             logger.warning(f"Failed to set tab visibility: {exc}")
 
@@ -373,6 +634,27 @@ class SlurmMonitor(App[None]):
         # Start initial load in background worker
         self._start_initial_load_worker()
 
+        # SIGUSR1 starts or stops profiling; handled on the event loop, not in signal context
+        if hasattr(signal, "SIGUSR1"):
+            with contextlib.suppress(NotImplementedError, RuntimeError):
+                asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self._toggle_profiling)
+
+    def on_unmount(self) -> None:
+        """Remove the profiling signal handler."""
+        if hasattr(signal, "SIGUSR1"):
+            with contextlib.suppress(NotImplementedError, RuntimeError):
+                asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+
+    def _toggle_profiling(self) -> None:
+        """Start a profiling session, or stop the running one and write it (main thread only)."""
+        if is_profiling():
+            output_dir = stop_profiling()
+            if output_dir is not None:
+                self.notify(f"Profile written to {output_dir}", timeout=10)
+        else:
+            session = start_profiling()
+            self.notify(f"Profiling started, writing to {session.output_dir}", timeout=5)
+
     def _start_initial_load_worker(self) -> None:
         """Start background worker for initial step-by-step data load."""
         self._refresh_worker = self.run_worker(
@@ -387,30 +669,33 @@ class SlurmMonitor(App[None]):
         """Update loading screen to show step starting."""
         screen = self._loading_screen
         if screen:
-            self._post_ui_callback(lambda: screen.start_step(idx))
+            self._post_ui_callback(functools.partial(screen.start_step, idx))
 
     def _loading_complete_step(self, idx: int, msg: str | None = None) -> None:
         """Update loading screen to show step completed."""
         screen = self._loading_screen
         if screen:
-            self._post_ui_callback(lambda: screen.complete_step(idx, msg))
+            self._post_ui_callback(functools.partial(screen.complete_step, idx, msg))
 
     def _loading_fail_step(self, idx: int, error: str) -> None:
         """Update loading screen to show step failed."""
         screen = self._loading_screen
         if screen:
-            self._post_ui_callback(lambda: screen.fail_step(idx, error))
+            self._post_ui_callback(functools.partial(screen.fail_step, idx, error))
 
     def _loading_skip_step(self, idx: int, reason: str) -> None:
         """Update loading screen to show step skipped."""
         screen = self._loading_screen
         if screen:
-            self._post_ui_callback(lambda: screen.skip_step(idx, reason))
+            self._post_ui_callback(functools.partial(screen.skip_step, idx, reason))
 
     def _initial_load_async(self) -> None:
         """Perform initial data load with step-by-step progress (runs in worker thread)."""
         logger.info("Starting initial data load")
 
+        # Show the previous session's data while the loading steps run
+        self._load_stale_snapshot()
+
         # Execute loading steps and collect results
         load_result = self._execute_loading_steps()
         if load_result is None:
@@ -437,6 +722,96 @@ class SlurmMonitor(App[None]):
         # first background refresh (cluster data) completes.
         self._post_ui_callback(self._finish_initial_load)
 
+    def _load_stale_snapshot(self) -> None:
+        """Render the data saved by the previous session, marked as stale (worker thread).
+
+        The jobs table replaces the loading screen right away; cluster data goes
+        through the normal fetch-result path. Everything is replaced as fresh
+        data arrives, and the stale marker is cleared after the first full
+        refresh cycle.
+        """
+        snapshot = load_last_snapshot(self._last_snapshot_path, username=self._current_username)
+        if snapshot is None:
+            return
+        total_jobs, total_requeues, max_requeues = snapshot.history_stats
+        self._job_cache._build_from_data(
+            snapshot.running_jobs, snapshot.history_jobs, total_jobs, total_requeues, max_requeues
+        )
+        rows = [tuple(self._job_row_values(job)) for job in self._sorted_jobs_for_display(self._job_cache.jobs)]
+        self._showing_stale_data = True
+        age = format_age(snapshot.age())
+        self._post_ui_callback(functools.partial(self._show_stale_data, rows, age))
+
+        self._apply_fetch_result("nodes", snapshot.cluster_nodes)
+        self._apply_fetch_result("all_jobs", snapshot.all_users_jobs)
+        self._apply_fetch_result("fair_share", (snapshot.fair_share_entries, None))
+        self._apply_fetch_result("job_priority", (snapshot.job_priority_entries, None))
+        self._refresh_cluster_sidebar()
+        logger.info(f"Showing stale data from the previous session ({age} old)")
+
+    def _show_stale_data(self, rows: list[tuple[str, ...]], age: str) -> None:
+        """Replace the loading screen with the previous session's jobs (main thread only).
+
+        Args:
+            rows: Job table rows built from the saved data.
+            age: Formatted age of the saved data.
+        """
+        if not self._showing_stale_data:
+            return  # Fresh data already arrived
+        self._populate_jobs_table(rows)
+        if self._loading_screen:
+            with contextlib.suppress(Exception):
+                self.pop_screen()
+            self._loading_screen = None
+        self._initial_load_complete = True
+        with contextlib.suppress(Exception):
+            self.query_one("#jobs_table", DataTable).focus()
+        self.sub_title = f"stale data from {age} ago - refreshing"
+        self._set_loading_indicator(True)
+
+    def _clear_stale_marker(self) -> None:
+        """Remove the stale-data marker once every source has been refreshed (main thread only)."""
+        if self._showing_stale_data:
+            self._showing_stale_data = False
+            self.sub_title = ""
+
+    def _save_last_snapshot(self, *, force: bool = False) -> None:
+        """Persist the raw data of the last successful refresh for the next launch.
+
+        Saves at most every ``_LAST_SNAPSHOT_SAVE_INTERVAL`` seconds unless
+        forced. Cycles where the user's or all-users jobs could not be fetched
+        are skipped, so the file keeps the last complete state.
+
+        Args:
+            force: Save regardless of the time since the last save (e.g. on exit).
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_snapshot_saved_at is not None
+            and now - self._last_snapshot_saved_at < _LAST_SNAPSHOT_SAVE_INTERVAL
+        ):
+            return
+        if self._last_running_fetch is None or self._all_jobs_failed:
+            return
+        current = self._snapshot_store.current
+        saved = save_last_snapshot(
+            self._last_snapshot_path,
+            LastSnapshot(
+                username=self._current_username,
+                saved_at=time.time(),
+                running_jobs=self._last_running_fetch,
+                history_jobs=self._last_history_jobs,
+                history_stats=self._last_history_stats,
+                cluster_nodes=current.cluster_nodes,
+                all_users_jobs=current.all_users_jobs,
+                fair_share_entries=current.fair_share_entries,
+                job_priority_entries=current.job_priority_entries,
+            ),
+        )
+        if saved:
+            self._last_snapshot_saved_at = now
+
     def _execute_loading_steps(
         self,
     ) -> tuple[list[tuple[str, ...]], list[tuple[str, ...]], int, int, int] | None:
@@ -463,7 +838,10 @@ class SlurmMonitor(App[None]):
     def _load_step_check_slurm(self) -> bool:
         """Execute step 0: Check SLURM availability."""
         self._loading_update_step(0)
-        is_available, error_msg = check_slurm_available()
+        if self._startup_fetch is not None:
+            is_available, error_msg = self._startup_fetch.slurm_check.result()
+        else:
+            is_available, error_msg = check_slurm_available()
         if not is_available:
             self._loading_fail_step(0, error_msg or "SLURM not available")
             logger.error(f"SLURM not available: {error_msg}")
@@ -486,9 +864,16 @@ class SlurmMonitor(App[None]):
         max_requeues = 0
         errors: list[str] = []
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_running = executor.submit(get_running_jobs, max_retries=0)
-            future_history = executor.submit(get_job_history, days=job_history_days, max_retries=0)
+        # Reuse the fetches started by the entry point; they are consumed once
+        startup_fetch, self._startup_fetch = self._startup_fetch, None
+        started_running = startup_fetch.running_jobs if startup_fetch else None
+        started_history = startup_fetch.history_for(job_history_days) if startup_fetch else None
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="stoei-initial") as executor:
+            future_running = started_running or executor.submit(profiled(lambda: get_running_jobs(max_retries=0)))
+            future_history = started_history or executor.submit(
+                profiled(lambda: get_job_history(days=job_history_days, max_retries=0))
+            )
 
             rj, rj_error = future_running.result()
             if rj_error:
@@ -509,6 +894,8 @@ class SlurmMonitor(App[None]):
 
         if errors:
             self._loading_fail_step(1, "; ".join(errors))
+            # The previous session's data is replaced by what could be fetched, not refreshed
+            self._post_ui_callback(self._clear_stale_marker)
         else:
             self._loading_complete_step(1, f"{len(running_jobs)} running/pending, {total_jobs} in {job_history_days}d")
 
@@ -519,8 +906,32 @@ class SlurmMonitor(App[None]):
         if self._loading_screen:
             with contextlib.suppress(Exception):
                 self.pop_screen()
+        # Data from the previous session, if shown, will not be refreshed
+        self._clear_stale_marker()
+        self._set_loading_indicator(False)
+        # Rarely shown screens are imported on first use to keep startup imports small
+        from stoei.widgets.slurm_error_screen import SlurmUnavailableScreen  # noqa: PLC0415
+
         self.push_screen(SlurmUnavailableScreen())
 
+    def _populate_jobs_table(self, rows: list[tuple[str, ...]]) -> None:
+        """Fill the jobs table with pre-computed rows (main thread only).
+
+        Args:
+            rows: Job table rows, in display order.
+        """
+        try:
+            jobs_filterable = self.query_one("#jobs-filterable-table", FilterableDataTable)
+            jobs_filterable._all_rows = rows
+            table = jobs_filterable.table
+            table.clear(columns=False)
+            table.add_rows(rows)
+            jobs_filterable.display = len(rows) > 0
+            logger.debug("Jobs table populated: {} jobs", len(rows))
+            self._apply_saved_column_widths("jobs", jobs_filterable)
+        except Exception as exc:
+            logger.debug("Failed to populate jobs table: {}", exc)
+
     def _finish_initial_load(self) -> None:
         """Populate the jobs table, dismiss the loading screen, and start background data loading.
 
@@ -536,23 +947,13 @@ class SlurmMonitor(App[None]):
         except Exception:
             logger.debug("LogPane not mounted yet, skipping sink setup")
 
-        logger.info("Initial load complete, populating UI")
+        logger.info(f"Initial load complete, populating UI ({time.monotonic() - self._launched_at:.2f}s to first data)")
 
         # Use pre-computed rows from worker thread — avoids sorting and
         # tuple creation on the main thread.
-        try:
-            jobs_filterable = self.query_one("#jobs-filterable-table", FilterableDataTable)
-            rows = self._precomputed_job_rows
-            self._precomputed_job_rows = []  # Free memory
-            jobs_filterable._all_rows = rows
-            table = jobs_filterable.table
-            table.clear(columns=False)
-            table.add_rows(rows)
-            jobs_filterable.display = len(rows) > 0
-            logger.debug(f"Jobs table populated: {len(rows)} jobs")
-            self._apply_saved_column_widths("jobs", jobs_filterable)
-        except Exception as exc:
-            logger.debug(f"Failed to populate jobs table: {exc}")
+        rows = self._precomputed_job_rows
+        self._precomputed_job_rows = []  # Free memory
+        self._populate_jobs_table(rows)
 
         # Dismiss loading screen — jobs are ready
         if self._loading_screen:
@@ -602,7 +1003,8 @@ class SlurmMonitor(App[None]):
         self.theme = theme_name
 
     def _apply_log_settings(self) -> None:
-        """Apply log settings to the active log sink."""
+        """Apply log settings to the log file and the active log sink."""
+        set_file_log_level(self._settings.log_level)
         if self._log_sink_id is None:
             return
         try:
@@ -650,12 +1052,14 @@ class SlurmMonitor(App[None]):
         try:
             for table in self.query(FilterableDataTable):
                 table.set_keybind_mode(settings.keybind_mode, self._keybindings)
-            logger.debug(f"Applied keybind mode: {settings.keybind_mode}")
+            logger.debug("Applied keybind mode: {}", settings.keybind_mode)
         except Exception as exc:
-            logger.debug(f"Failed to apply keybind mode: {exc}")
+            logger.debug("Failed to apply keybind mode: {}", exc)
 
     def action_show_settings(self) -> None:
         """Open the settings screen."""
+        from stoei.widgets.settings_screen import SettingsScreen  # noqa: PLC0415
+
         self.push_screen(SettingsScreen(self._settings), self._handle_settings_updated)
 
     def _handle_settings_updated(self, settings: Settings | None) -> None:
@@ -685,7 +1089,7 @@ class SlurmMonitor(App[None]):
             if active_tab == "jobs":
                 return self.query_one("#jobs-filterable-table", FilterableDataTable)
         except Exception as exc:
-            logger.debug(f"Failed to get current filterable table: {exc}")
+            logger.debug("Failed to get current filterable table: {}", exc)
         return None
 
     def action_column_select_next(self) -> None:
@@ -744,7 +1148,7 @@ class SlurmMonitor(App[None]):
             width = self._calculate_sidebar_width()
             sidebar.set_width(width)
         except Exception as exc:
-            logger.debug(f"Failed to apply sidebar width: {exc}")
+            logger.debug("Failed to apply sidebar width: {}", exc)
 
     def action_sidebar_grow(self) -> None:
         """Increase sidebar width by 5%."""
@@ -787,7 +1191,7 @@ class SlurmMonitor(App[None]):
             # Create new settings with updated column_widths using replace()
             self._settings = replace(self._settings, column_widths=tuple(existing_widths.items()))
             self.run_worker(lambda: save_settings(self._settings), thread=True, exclusive=True, group="save_settings")
-            logger.debug(f"Saved column widths for {active_tab}: {widths}")
+            logger.debug("Saved column widths for {}: {}", active_tab, widths)
 
         except Exception as exc:
             logger.warning(f"Failed to save column widths: {exc}")
@@ -811,7 +1215,7 @@ class SlurmMonitor(App[None]):
             target_table = table if table is not None else self._get_current_filterable_table()
             if target_table:
                 target_table.set_column_widths(widths)
-                logger.debug(f"Applied saved column widths for {table_name}: {widths}")
+                logger.debug("Applied saved column widths for {}: {}", table_name, widths)
 
         except Exception as exc:
             logger.warning(f"Failed to apply saved column widths for {table_name}: {exc}")
@@ -832,70 +1236,209 @@ class SlurmMonitor(App[None]):
 
     # --- Parallel fetch helpers (run inside ThreadPoolExecutor threads) ---
 
-    def _fetch_user_jobs(self) -> tuple[list[tuple[str, ...]] | None, list[tuple[str, ...]] | None, int, int, int]:
+    def _fetch_user_jobs(
+        self, all_jobs: Future[list[tuple[str, ...]] | Unchanged] | None = None
+    ) -> _UserJobsResult | Unchanged:
         """Fetch user's running jobs and history.
 
+        Args:
+            all_jobs: Future of this cycle's :meth:`_fetch_all_jobs`; when given, the
+                running jobs are derived from the all-users snapshot if it succeeded.
+
         Returns:
-            Tuple of (running_jobs, history_jobs, total_jobs, total_requeues, max_requeues).
+            Tuple of (running_jobs, history_jobs, total_jobs, total_requeues, max_requeues),
+            or UNCHANGED if neither squeue nor sacct output changed since the last fetch.
         """
+        # History first, so the all-users fetch has usually finished when it is needed
+        job_history_days = self._settings.job_history_days
+        history_raw, total_jobs, total_requeues, max_requeues, h_error = get_job_history(
+            days=job_history_days, fingerprints=self._output_fingerprints
+        )
+        running_raw, r_error = self._fetch_running_jobs(all_jobs)
+        running_unchanged = isinstance(running_raw, Unchanged) and self._last_running_fetch is not None
+        history_unchanged = isinstance(history_raw, Unchanged) and self._last_history_fetch is not None
+        if running_unchanged and history_unchanged:
+            return UNCHANGED
+
+        # Only one side is unchanged: substitute its previously fetched data
         running_jobs: list[tuple[str, ...]] | None
-        running_raw, r_error = get_running_jobs()
         if r_error:
-            logger.warning(f"Failed to refresh running jobs: {r_error}")
+            logger.warning("Failed to refresh running jobs: {}", r_error)
             running_jobs = None
+        elif isinstance(running_raw, Unchanged):
+            running_jobs = self._last_running_fetch
         else:
             running_jobs = running_raw
+            self._last_running_fetch = running_raw
 
         history_jobs: list[tuple[str, ...]] | None
-        job_history_days = self._settings.job_history_days
-        history_raw, total_jobs, total_requeues, max_requeues, h_error = get_job_history(days=job_history_days)
         if h_error:
-            logger.warning(f"Failed to refresh job history: {h_error}")
+            logger.warning("Failed to refresh job history: {}", h_error)
             history_jobs = None
+        elif isinstance(history_raw, Unchanged):
+            if self._last_history_fetch is None:
+                history_jobs = None
+            else:
+                history_jobs, total_jobs, total_requeues, max_requeues = self._last_history_fetch
         else:
             history_jobs = history_raw
+            self._last_history_fetch = (history_raw, total_jobs, total_requeues, max_requeues)
 
         return running_jobs, history_jobs, total_jobs, total_requeues, max_requeues
 
-    def _fetch_nodes(self) -> list[dict[str, str]]:
+    def _fetch_running_jobs(
+        self, all_jobs: Future[list[tuple[str, ...]] | Unchanged] | None
+    ) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]:
+        """Fetch the user's running/pending jobs, preferring the all-users snapshot.
+
+        Args:
+            all_jobs: Future of this cycle's :meth:`_fetch_all_jobs`, or None to query squeue -u.
+
+        Returns:
+            Tuple of (jobs in ``get_running_jobs`` format or UNCHANGED, optional error message).
+        """
+        if all_jobs is not None:
+            derived = self._derive_running_jobs(all_jobs)
+            if derived is not None:
+                # A later squeue -u fallback must not compare against output from before the derived data
+                self._output_fingerprints.forget("squeue-user")
+                return derived, None
+            logger.debug("All-users snapshot unavailable, falling back to squeue -u")
+        return get_running_jobs(fingerprints=self._output_fingerprints)
+
+    def _derive_running_jobs(
+        self, all_jobs: Future[list[tuple[str, ...]] | Unchanged]
+    ) -> list[tuple[str, ...]] | Unchanged | None:
+        """Derive the user's running/pending jobs from this cycle's all-users snapshot.
+
+        The snapshot lacks the pending reason, submit time and start time, so
+        those are queried with one ``squeue -j`` call, only for jobs that are
+        new, changed state, or have been pending longer than
+        ``_SCHEDULE_FIELDS_MAX_AGE`` since their last query.
+
+        Args:
+            all_jobs: Future of this cycle's :meth:`_fetch_all_jobs`.
+
+        Returns:
+            Job tuples in ``get_running_jobs`` format, UNCHANGED if they match the
+            previous fetch, or None if the all-users fetch or the field query failed.
+        """
+        try:
+            snapshot = all_jobs.result()
+        except Exception:
+            logger.debug("All-users fetch raised, cannot derive user jobs")
+            return None
+        if self._all_jobs_failed:
+            return None
+        # Unchanged output means the published snapshot is still current
+        jobs = self._all_users_jobs if isinstance(snapshot, Unchanged) else snapshot
+        my_jobs = select_user_jobs(jobs, self._current_username)
+
+        now = time.monotonic()
+        previous = self._user_job_schedule
+        stale: set[str] = set()
+        for job_id, _, _, _, state, *_ in my_jobs:
+            entry = previous.get(job_id)
+            if (
+                entry is None
+                or entry[0] != state
+                or (state in ("PENDING", "PD") and now - entry[1] > _SCHEDULE_FIELDS_MAX_AGE)
+            ):
+                stale.add(job_id)
+        fetched: dict[str, tuple[str, ...]] = {}
+        if stale:
+            fetched, error = get_job_schedule_fields(sorted(stale))
+            if error:
+                logger.warning("Failed to get schedule fields of user jobs: {}", error)
+                return None
+
+        schedule: dict[str, tuple[str, float, tuple[str, ...]]] = {}
+        rows: list[tuple[str, ...]] = []
+        for job in my_jobs:
+            job_id = job[0]
+            # Jobs missing from the squeue -j output ended in between; they leave the snapshot next cycle
+            entry = (job[4], now, fetched.get(job_id, ("", "", ""))) if job_id in stale else previous[job_id]
+            schedule[job_id] = entry
+            rows.append(to_running_job_row(job, entry[2]))
+        self._user_job_schedule = schedule
+        logger.debug("Derived {} user jobs from the all-users snapshot ({} queried)", len(rows), len(stale))
+
+        if rows == self._last_running_fetch:
+            return UNCHANGED
+        return rows
+
+    def _fetch_nodes(self) -> list[dict[str, str]] | Unchanged:
         """Fetch cluster node data.
 
         Returns:
-            List of node data dicts, empty on error.
+            List of node data dicts, empty on error, or UNCHANGED if the output did not change.
         """
-        nodes, error = get_cluster_nodes()
+        nodes, error = get_cluster_nodes(fingerprints=self._output_fingerprints)
         if error:
-            logger.warning(f"Failed to get cluster nodes: {error}")
+            logger.warning("Failed to get cluster nodes: {}", error)
             return []
-        logger.debug(f"Fetched {len(nodes)} cluster nodes")
+        # Unchanged output also confirms the snapshot is current
+        self._nodes_fetched_at = time.monotonic()
+        if isinstance(nodes, Unchanged):
+            return nodes
+        logger.debug("Fetched {} cluster nodes", len(nodes))
         return nodes
 
-    def _fetch_all_jobs(self) -> list[tuple[str, ...]]:
+    def _fetch_all_jobs(self) -> list[tuple[str, ...]] | Unchanged:
         """Fetch all-users running job data.
 
         Returns:
-            List of job tuples, empty on error.
+            List of job tuples, empty on error, or UNCHANGED if the output did not change.
         """
-        all_jobs, error = get_all_running_jobs()
+        all_jobs, error = get_all_running_jobs(fingerprints=self._output_fingerprints)
+        self._all_jobs_failed = bool(error)
         if error:
-            logger.warning(f"Failed to get all running jobs: {error}")
+            logger.warning("Failed to get all running jobs: {}", error)
             return []
-        logger.debug(f"Fetched {len(all_jobs)} running jobs from all users")
+        if isinstance(all_jobs, Unchanged):
+            return all_jobs
+        logger.debug("Fetched {} running jobs from all users", len(all_jobs))
         return all_jobs
 
     def _fetch_wait_time(self) -> list[tuple[str, ...]]:
-        """Fetch wait-time history.
+        """Fetch wait-time history incrementally and feed the rolling store.
+
+        Only jobs that started since the previous successful query are
+        requested from sacct; longer windows accumulate in the store.
 
         Returns:
-            List of wait-time job tuples, empty on error.
+            List of newly fetched wait-time job tuples, empty on error.
         """
-        wait_time_jobs, error = get_wait_time_job_history(hours=1)
+        now = datetime.now()
+        since = self._wait_time_store.next_query_start(now)
+        wait_time_jobs, error = get_wait_time_job_history(since=since)
         if error:
-            logger.warning(f"Failed to get wait time history: {error}")
+            logger.warning("Failed to get wait time history: {}", error)
             return []
-        logger.debug(f"Fetched {len(wait_time_jobs)} jobs for wait time calculation")
+        self._wait_time_store.ingest(wait_time_jobs, since=since, until=now)
+        logger.debug("Fetched {} jobs for wait time calculation", len(wait_time_jobs))
         return wait_time_jobs
 
+    def _fetch_wait_time_backfill(self) -> list[tuple[str, ...]]:
+        """Load the longer wait-time windows once, up to the first incremental query.
+
+        Retried on later cycles until one succeeds; until then the sidebar
+        labels those windows with the history the store actually holds.
+
+        Returns:
+            List of backfilled wait-time job tuples, empty on error.
+        """
+        window = self._wait_time_store.backfill_window(datetime.now())
+        if window is None:
+            return []
+        since, until = window
+        backfill_jobs, error = get_wait_time_job_history(since=since, until=until, timeout=60)
+        if error:
+            logger.warning("Failed to backfill wait time history: {}", error)
+            return []
+        self._wait_time_store.ingest_backfill(backfill_jobs, since=since, until=until)
+        return backfill_jobs
+
     def _fetch_energy(self) -> tuple[list[tuple[str, ...]], bool]:
         """Fetch energy history data (only used during first background cycle).
 
@@ -909,13 +1452,14 @@ class SlurmMonitor(App[None]):
         months = self._settings.energy_history_months
         energy_jobs, error = get_energy_job_history(months)
         if error:
-            logger.warning(f"Failed to get {months}-month energy history: {error}")
+            logger.warning("Failed to get {}-month energy history: {}", months, error)
             return [], False
-        logger.debug(f"Fetched {len(energy_jobs)} energy history jobs")
+        logger.debug("Fetched {} energy history jobs", len(energy_jobs))
         return energy_jobs, True
 
     # --- Main refresh worker ---
 
+    @traced("refresh cycle", CYCLE)
     def _refresh_data_async(self) -> None:
         """Parallel refresh of SLURM data (runs in background worker thread).
 
@@ -924,43 +1468,73 @@ class SlurmMonitor(App[None]):
         so widgets update incrementally rather than waiting for all fetches.
         """
         is_first_cycle = not self._initial_background_complete
-        logger.debug(f"Background refresh starting (parallel, first_cycle={is_first_cycle})")
-        self._post_ui_callback(lambda: self._set_loading_indicator(True))
+        logger.debug("Background refresh starting (parallel, first_cycle={})", is_first_cycle)
+        self._post_ui_callback(functools.partial(self._set_loading_indicator, True))
         worker = get_current_worker()
 
         try:
-            max_workers = 7 if is_first_cycle else 6
-            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            backfill_wait_time = self._wait_time_store.backfill_pending
+            max_workers = 6 + is_first_cycle + backfill_wait_time
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stoei-refresh") as pool:
+                all_jobs = _submit_fetch(pool, "all_jobs", self._fetch_all_jobs)
+                # The user's active jobs are a subset of the all-users snapshot
+                derive_from = all_jobs if self._settings.derive_user_jobs else None
                 futures: dict[Future[object], str] = {
-                    pool.submit(self._fetch_user_jobs): "user_jobs",
-                    pool.submit(self._fetch_nodes): "nodes",
-                    pool.submit(self._fetch_all_jobs): "all_jobs",
-                    pool.submit(self._fetch_wait_time): "wait_time",
-                    pool.submit(get_fair_share_priority, max_retries=1): "fair_share",
-                    pool.submit(get_pending_job_priority, max_retries=1): "job_priority",
+                    cast(Future[object], all_jobs): "all_jobs",
+                    _submit_fetch(pool, "user_jobs", self._fetch_user_jobs, derive_from): "user_jobs",
+                    _submit_fetch(pool, "nodes", self._fetch_nodes): "nodes",
+                    _submit_fetch(pool, "wait_time", self._fetch_wait_time): "wait_time",
+                    _submit_fetch(
+                        pool,
+                        "fair_share",
+                        get_fair_share_priority,
+                        max_retries=1,
+                        fingerprints=self._output_fingerprints,
+                    ): "fair_share",
+                    _submit_fetch(
+                        pool,
+                        "job_priority",
+                        get_pending_job_priority,
+                        max_retries=1,
+                        fingerprints=self._output_fingerprints,
+                    ): "job_priority",
                 }
                 if is_first_cycle:
-                    futures[pool.submit(self._fetch_energy)] = "energy"
+                    futures[_submit_fetch(pool, "energy", self._fetch_energy)] = "energy"
+                if backfill_wait_time:
+                    futures[_submit_fetch(pool, "wait_time_backfill", self._fetch_wait_time_backfill)] = (
+                        "wait_time_backfill"
+                    )
 
                 for future in as_completed(futures):
                     if worker.is_cancelled:
                         logger.debug("Refresh worker cancelled, aborting")
+                        # Results fetched this cycle may never be applied
+                        self._output_fingerprints.clear()
                         return
                     label = futures[future]
                     try:
                         result = cast(_FetchResult, future.result())
-                        self._apply_fetch_result(label, result)
+                        with span(f"apply {label}", APPLY_RESULT):
+                            self._apply_fetch_result(label, result)
                     except Exception:
-                        logger.exception(f"Failed to fetch {label}")
+                        logger.exception("Failed to fetch {}", label)
+                        # Force the next cycle to re-apply everything rather than report "unchanged"
+                        self._output_fingerprints.clear()
 
             if worker.is_cancelled:
                 return
-            self._post_ui_callback(lambda: self._on_refresh_complete(is_first_cycle))
+            # Node or all-jobs data that arrived after wait-time data still reaches the sidebar
+            self._refresh_cluster_sidebar()
+            self._dataflow.log_counters()
+            self._job_info_cache.save()
+            self._save_last_snapshot()
+            self._post_ui_callback(functools.partial(self._on_refresh_complete, is_first_cycle))
 
         except Exception:
             logger.exception("Error during parallel refresh")
         finally:
-            self._post_ui_callback(lambda: self._set_loading_indicator(False))
+            self._post_ui_callback(functools.partial(self._set_loading_indicator, False))
 
     def _process_refresh_results(self, results: dict[str, object]) -> None:
         """Process a batch of fetch results, updating error-notification state (worker thread).
@@ -986,7 +1560,7 @@ class SlurmMonitor(App[None]):
             if not self._error_notified.get("running_jobs"):
                 self._error_notified["running_jobs"] = True
                 self._post_ui_callback(
-                    lambda: self.notify("Running jobs refresh failed - keeping old data", severity="warning")
+                    functools.partial(self.notify, "Running jobs refresh failed - keeping old data", severity="warning")
                 )
             if history_jobs is not None:
                 self._error_notified["history_jobs"] = False
@@ -1003,6 +1577,10 @@ class SlurmMonitor(App[None]):
             label: Fetch label identifying the data source.
             result: The data returned by the fetch function.
         """
+        if result is UNCHANGED:
+            logger.debug("{}: output unchanged, skipping parse and UI update", label)
+            return
+
         if label == "user_jobs":
             running_jobs, history_jobs, total_jobs, total_requeues, max_requeues = cast(_UserJobsResult, result)
             if running_jobs is not None:
@@ -1014,67 +1592,87 @@ class SlurmMonitor(App[None]):
                 if not self._error_notified.get("running_jobs"):
                     self._error_notified["running_jobs"] = True
                     self._post_ui_callback(
-                        lambda: self.notify("Running jobs refresh failed - keeping old data", severity="warning")
+                        functools.partial(
+                            self.notify, "Running jobs refresh failed - keeping old data", severity="warning"
+                        )
                     )
                 if history_jobs is not None:
                     self._error_notified["history_jobs"] = False
                     self._last_history_jobs = history_jobs
                     self._last_history_stats = (total_jobs, total_requeues, max_requeues)
             job_rows = [tuple(self._job_row_values(j)) for j in self._sorted_jobs_for_display(self._job_cache.jobs)]
-            self._post_ui_callback(lambda: self._update_jobs_table(job_rows))
+            self._post_ui_callback(functools.partial(self._update_jobs_table, job_rows))
 
         elif label == "nodes":
-            self._cluster_nodes = cast(list[dict[str, str]], result)
-            self._cached_node_infos = self._parse_node_infos()
+            # Node infos are parsed lazily, once the nodes tab asks for them
+            nodes = cast(list[dict[str, str]], result)
+            get_node_registry().seed(node.get("NodeName", "").strip() for node in nodes)
+            self._cluster_nodes = nodes
             self._post_ui_callback(self._update_nodes_tab_only)
 
         elif label == "all_jobs":
             self._all_users_jobs = cast(list[tuple[str, ...]], result)
-            self._compute_user_overview_cache()
+            # The My Usage banner on the default Jobs tab always needs the user stats
+            self._user_stats_view.get()
+            # Only the jobs that started, ended or changed touch the index
+            self._job_index_view.get()
             self._post_ui_callback(self._update_all_jobs_widgets)
 
         elif label == "wait_time":
             self._wait_time_jobs = cast(list[tuple[str, ...]], result)
-            stats = self._calculate_cluster_stats()
-            self._cached_cluster_stats = stats
-            self._post_ui_callback(lambda s=stats: self._update_cluster_sidebar_with_stats(s))
+            self._refresh_cluster_sidebar()
+
+        elif label == "wait_time_backfill":
+            # The backfilled jobs only live in the rolling store
+            self._refresh_cluster_sidebar()
 
         elif label == "fair_share":
             entries, error = cast(_PriorityHalfResult, result)
             if error:
-                logger.warning(f"sshare failed: {error}")
-            else:
+                logger.warning("sshare failed: {}", error)
+            elif not isinstance(entries, Unchanged):
                 self._fair_share_entries = entries
             # Only trigger priority tab update once both halves have arrived
             self._priority_halves_received += 1
             if self._priority_halves_received >= _PRIORITY_FETCH_COUNT:
                 self._priority_halves_received = 0
-                self._compute_priority_overview_cache()
-                self._post_ui_callback(self._update_priority_tab)
+                if self._priority_view.is_stale():
+                    self._post_ui_callback(self._update_priority_tab)
 
         elif label == "job_priority":
             entries, error = cast(_PriorityHalfResult, result)
             if error:
-                logger.warning(f"sprio failed: {error}")
-            else:
+                logger.warning("sprio failed: {}", error)
+            elif not isinstance(entries, Unchanged):
                 self._job_priority_entries = entries
             self._priority_halves_received += 1
             if self._priority_halves_received >= _PRIORITY_FETCH_COUNT:
                 self._priority_halves_received = 0
-                self._compute_priority_overview_cache()
-                self._post_ui_callback(self._update_priority_tab)
+                if self._priority_view.is_stale():
+                    self._post_ui_callback(self._update_priority_tab)
 
         elif label == "energy":
             energy_jobs, energy_loaded = cast(_EnergyResult, result)
-            self._energy_history_jobs = energy_jobs
             self._energy_data_loaded = energy_loaded
+            self._energy_history_jobs = energy_jobs
             if energy_loaded:
-                self._cached_energy_user_stats = UserOverviewTab.aggregate_energy_stats(energy_jobs)
                 self._post_ui_callback(self._update_energy_tab)
 
         else:
             logger.warning(f"_apply_fetch_result: unknown label {label!r}")
 
+    def _refresh_cluster_sidebar(self) -> None:
+        """Recompute cluster stats if any input changed and push them to the sidebar (worker thread).
+
+        The sidebar is always visible, so its stats are requested whenever
+        node, all-jobs or wait-time data may have changed.
+        """
+        if not self._cluster_stats_view.is_stale():
+            logger.debug("Cluster stats inputs unchanged, skipping sidebar update")
+            return
+        stats = self._cluster_stats_view.get()
+        self._post_ui_callback(functools.partial(self._update_cluster_sidebar_with_stats, stats))
+
     def _update_nodes_and_sidebar(self) -> None:
         """Update cluster sidebar and node overview tab (main thread only)."""
         self.call_later(self._update_cluster_sidebar)
@@ -1085,7 +1683,7 @@ class SlurmMonitor(App[None]):
             else:
                 self._dirty_nodes_tab = True
         except Exception as exc:
-            logger.debug(f"Failed to update node tab: {exc}")
+            logger.debug("Failed to update node tab: {}", exc)
 
     def _update_nodes_and_sidebar_with_stats(self, stats: ClusterStats) -> None:
         """Update cluster sidebar (with pre-computed stats) and node overview tab (main thread only).
@@ -1115,7 +1713,7 @@ class SlurmMonitor(App[None]):
             logger.exception("Failed to update node tab")
 
     def _update_all_jobs_widgets(self) -> None:
-        """Update user overview and My Usage banner without touching the sidebar (main thread only)."""
+        """Update user overview, node job counts and My Usage banner without touching the sidebar (main thread only)."""
         self.call_later(self._update_my_usage_summary, self._cached_running_user_stats)
         try:
             tab_container = self.query_one("#tab-container", TabContainer)
@@ -1123,6 +1721,11 @@ class SlurmMonitor(App[None]):
                 self.call_later(self._apply_user_overview_from_cache)
             else:
                 self._dirty_users_tab = True
+            # Resident job counts on the nodes tab follow the job index
+            if tab_container.active_tab == "nodes":
+                self.call_later(self._update_node_overview)
+            else:
+                self._dirty_nodes_tab = True
         except Exception:
             logger.exception("Failed to update users tab")
 
@@ -1148,7 +1751,7 @@ class SlurmMonitor(App[None]):
         try:
             tab_container = self.query_one("#tab-container", TabContainer)
             if tab_container.active_tab == "priority":
-                self._apply_priority_overview_from_cache()
+                self._update_priority_overview()
             else:
                 self._dirty_priority_tab = True
         except Exception:
@@ -1157,8 +1760,19 @@ class SlurmMonitor(App[None]):
     def _update_energy_tab(self) -> None:
         """Update energy subtab in user overview (main thread only).
 
+        Energy stats are computed lazily, once the users tab is visible.
         Uses a generation counter to skip stale updates.
         """
+        if self._energy_stats_view.is_stale():
+            try:
+                tc = self.query_one("#tab-container", TabContainer)
+            except Exception:
+                return
+            if tc.active_tab == "users":
+                self._update_user_overview()
+            else:
+                self._dirty_users_tab = True
+            return
         self._energy_update_gen += 1
         gen = self._energy_update_gen
         energy = self._cached_energy_user_stats
@@ -1190,9 +1804,12 @@ class SlurmMonitor(App[None]):
         Args:
             is_first_cycle: Whether this was the first background refresh cycle.
         """
-        self._job_info_cache.clear()
+        self._job_info_cache.invalidate_changed(
+            {normalize_array_job_id(job.job_id): job.state for job in self._job_cache.jobs}
+        )
         if is_first_cycle:
             self._initial_background_complete = True
+            self._clear_stale_marker()
             self.auto_refresh_timer = self.set_interval(self.refresh_interval, self._start_refresh_worker)
             self.notify("Cluster data ready", timeout=3, severity="information")
             logger.info(
@@ -1200,6 +1817,12 @@ class SlurmMonitor(App[None]):
             )
         else:
             logger.debug("Refresh cycle complete - all data sources updated")
+        with contextlib.suppress(Exception):
+            if self.query_one("#tab-container", TabContainer).active_tab == "performance":
+                self._update_performance_tab()
+        profile_dir = record_refresh_cycle()
+        if profile_dir is not None:
+            self.notify(f"Profile written to {profile_dir}", timeout=10)
 
     def _handle_refresh_fallback(
         self,
@@ -1225,7 +1848,7 @@ class SlurmMonitor(App[None]):
             if not self._error_notified.get("history_jobs"):
                 self._error_notified["history_jobs"] = True
                 self._post_ui_callback(
-                    lambda: self.notify("History refresh failed - using cached history", severity="warning")
+                    functools.partial(self.notify, "History refresh failed - using cached history", severity="warning")
                 )
         else:
             # Update cache of raw history data on success
@@ -1255,7 +1878,7 @@ class SlurmMonitor(App[None]):
             msg = f"New job detected: {job.job_id} ({job.name})"
         else:
             msg = f"{len(new_active_jobs)} new jobs detected"
-        self._post_ui_callback(lambda m=msg: self.notify(m, timeout=5, severity="information"))
+        self._post_ui_callback(functools.partial(self.notify, msg, timeout=5, severity="information"))
 
     def _set_loading_indicator(self, active: bool) -> None:
         """Safely toggle the global loading indicator spinner."""
@@ -1263,7 +1886,7 @@ class SlurmMonitor(App[None]):
             indicator = self.query_one(LoadingIndicator)
             indicator.loading = active
         except Exception as exc:
-            logger.debug(f"Failed to toggle loading indicator: {exc}")
+            logger.debug("Failed to toggle loading indicator: {}", exc)
 
     def _update_jobs_table(self, job_rows: list[tuple[str, ...]]) -> None:
         """Push pre-computed job rows into the jobs table widget (main thread only).
@@ -1285,13 +1908,13 @@ class SlurmMonitor(App[None]):
                     return
                 jobs_filterable.set_data(job_rows)
                 jobs_filterable.display = len(job_rows) > 0
-                logger.debug(f"Jobs table updated: {len(job_rows)} jobs")
+                logger.debug("Jobs table updated: {} jobs", len(job_rows))
 
             self.call_later(_apply_jobs)
         except Exception:
             logger.exception("Failed to update jobs table")
 
-    def _sorted_jobs_for_display(self, jobs: list[Job]) -> list[Job]:
+    def _sorted_jobs_for_display(self, jobs: Sequence[Job]) -> list[Job]:
         """Sort jobs for stable, user-friendly display.
 
         Ordering:
@@ -1369,7 +1992,7 @@ class SlurmMonitor(App[None]):
             elif tab_container.active_tab == "priority":
                 self._update_priority_overview()
         except Exception as exc:
-            logger.debug(f"Failed to update tab-specific overview: {exc}")
+            logger.debug("Failed to update tab-specific overview: {}", exc)
 
         # Check window size and adjust layout
         self._check_window_size()
@@ -1409,7 +2032,7 @@ class SlurmMonitor(App[None]):
             sidebar.update_stats(stats)
             is_cached = self._cached_cluster_stats is not None
             logger.debug(
-                f"Updated cluster sidebar: {stats.total_nodes} nodes, {stats.total_cpus} CPUs (cached={is_cached})"
+                "Updated cluster sidebar: {} nodes, {} CPUs (cached={})", stats.total_nodes, stats.total_cpus, is_cached
             )
         except Exception as exc:
             logger.error(f"Failed to update cluster sidebar: {exc}", exc_info=True)
@@ -1426,7 +2049,9 @@ class SlurmMonitor(App[None]):
         try:
             sidebar = self.query_one("#cluster-sidebar", ClusterSidebar)
             sidebar.update_stats(stats)
-            logger.debug(f"Updated cluster sidebar: {stats.total_nodes} nodes, {stats.total_cpus} CPUs (pre-computed)")
+            logger.debug(
+                "Updated cluster sidebar: {} nodes, {} CPUs (pre-computed)", stats.total_nodes, stats.total_cpus
+            )
         except Exception as exc:
             logger.error(f"Failed to update cluster sidebar: {exc}", exc_info=True)
 
@@ -1569,7 +2194,7 @@ class SlurmMonitor(App[None]):
             partition_stats.gpus_by_type[gpu_type] = partition_stats.gpus_by_type.get(gpu_type, 0) + scaled_gpu_count
         return total_gpus
 
-    def _calculate_pending_resources(self, stats: ClusterStats) -> None:
+    def _calculate_pending_resources(self, stats: ClusterStats, snapshot: ClusterSnapshot | None = None) -> None:
         """Calculate resources requested by pending jobs.
 
         Array jobs (e.g., 12345_[0-99]) are expanded so that resources are
@@ -1577,7 +2202,10 @@ class SlurmMonitor(App[None]):
 
         Args:
             stats: ClusterStats object to update with pending resource data.
+            snapshot: Snapshot to read jobs from (default: the current one).
         """
+        if snapshot is None:
+            snapshot = self._snapshot_store.current
         # Job tuple indices
         job_id_index, partition_index, state_index, tres_index = 0, 3, 4, 8
         min_fields_for_tres = 9
@@ -1586,7 +2214,7 @@ class SlurmMonitor(App[None]):
         pending_gpus_by_type: dict[str, int] = {}
         pending_by_partition: dict[str, PendingPartitionStats] = {}
 
-        for job in self._all_users_jobs:
+        for job in snapshot.all_users_jobs:
             if len(job) <= state_index or job[state_index].strip().upper() not in ("PENDING", "PD"):
                 continue
 
@@ -1617,25 +2245,93 @@ class SlurmMonitor(App[None]):
         stats.pending_by_partition = pending_by_partition
 
         logger.debug(
-            f"Pending resources: {pending_jobs_count} jobs, {pending_cpus} CPUs, "
-            f"{pending_memory_gb:.1f} GB memory, {pending_gpus} GPUs"
+            "Pending resources: {} jobs, {} CPUs, {:.1f} GB memory, {} GPUs",
+            pending_jobs_count,
+            pending_cpus,
+            pending_memory_gb,
+            pending_gpus,
         )
 
     def _calculate_cluster_stats(self) -> ClusterStats:
-        """Calculate cluster statistics from node data.
+        """Calculate cluster statistics from node, pending job and wait time data.
+
+        Computes every part from scratch; the refresh cycle uses the memoized
+        ``cluster_stats`` derived view instead.
 
         Returns:
             ClusterStats object with aggregated statistics.
         """
+        # Read every input from one generation so the stats are self-consistent
+        snapshot = self._snapshot_store.current
+        return _merge_cluster_stats(
+            self._calculate_node_stats(snapshot),
+            self._calculate_pending_stats(snapshot),
+            self._calculate_wait_stats(snapshot),
+        )
+
+    def _publish_cluster_stats(self, stats: ClusterStats) -> ClusterStats:
+        """Store freshly combined cluster stats in the snapshot.
+
+        Args:
+            stats: Combined cluster stats.
+
+        Returns:
+            The same stats.
+        """
+        self._cached_cluster_stats = stats
+        return stats
+
+    def _calculate_pending_stats(self, snapshot: ClusterSnapshot) -> ClusterStats:
+        """Calculate the pending job resource part of the cluster stats.
+
+        Args:
+            snapshot: Snapshot to read jobs from.
+
+        Returns:
+            ClusterStats with only the pending job fields filled.
+        """
+        stats = ClusterStats()
+        self._calculate_pending_resources(stats, snapshot)
+        return stats
+
+    def _calculate_wait_stats(self, snapshot: ClusterSnapshot) -> ClusterStats:
+        """Calculate the wait time part of the cluster stats.
+
+        Args:
+            snapshot: Snapshot to read the latest wait time batch from.
+
+        Returns:
+            ClusterStats with only the wait time fields filled.
+        """
         stats = ClusterStats()
+        now = datetime.now()
+        windows = self._wait_time_store.window_stats(now)
+        primary_hours = self._wait_time_store.windows_hours[0]
+        stats.wait_stats_by_window = windows
+        stats.wait_stats_hours = primary_hours
+        stats.wait_stats_covered_seconds = self._wait_time_store.covered_seconds(now)
+        if primary_hours in windows:
+            stats.wait_stats_by_partition = windows[primary_hours]
+        elif snapshot.wait_time_jobs:
+            stats.wait_stats_by_partition = calculate_partition_wait_stats(snapshot.wait_time_jobs)
+        logger.debug("Calculated wait stats for {} partitions", len(stats.wait_stats_by_partition))
+        return stats
+
+    def _calculate_node_stats(self, snapshot: ClusterSnapshot) -> ClusterStats:
+        """Calculate the node, CPU, memory and GPU part of the cluster stats.
+
+        Args:
+            snapshot: Snapshot to read node data from.
 
-        if not self._cluster_nodes:
+        Returns:
+            ClusterStats with only the node fields filled.
+        """
+        stats = ClusterStats()
+        if not snapshot.cluster_nodes:
             logger.debug("No cluster nodes available for stats calculation")
-            # Still calculate pending resources even if no cluster nodes
-            self._calculate_pending_resources(stats)
             return stats
 
-        for node_data in self._cluster_nodes:
+        for node_data in snapshot.cluster_nodes:
             # Parse node information
             state = node_data.get("State", "").upper()
 
@@ -1668,15 +2364,6 @@ class SlurmMonitor(App[None]):
             if not cfg_tres and not alloc_tres:
                 self._parse_gpus_from_gres(node_data, state, stats, include_total=not is_draining)
 
-        # Calculate pending job resources
-        self._calculate_pending_resources(stats)
-
-        # Calculate wait time statistics
-        if self._wait_time_jobs:
-            stats.wait_stats_by_partition = calculate_partition_wait_stats(self._wait_time_jobs)
-            stats.wait_stats_hours = 1  # Currently hardcoded to 1 hour
-            logger.debug(f"Calculated wait stats for {len(stats.wait_stats_by_partition)} partitions")
-
         return stats
 
     def _update_node_overview(self) -> None:
@@ -1685,11 +2372,24 @@ class SlurmMonitor(App[None]):
         Uses a generation counter to skip stale updates and a staleness
         guard to skip work when the user has already switched away.
         """
+        if "nodes" in self._unmounted_tabs:
+            return  # Filled from the node view once the tab is mounted
+        if self._node_infos_view.is_stale():
+            # Parse in the background (never block the UI on tab switch), then apply
+            def compute_and_apply() -> None:
+                self._node_infos_view.get()
+                self._post_ui_callback(self._update_node_overview)
+
+            self.run_worker(
+                compute_and_apply, name="compute_node_infos", group="compute_nodes", exclusive=True, thread=True
+            )
+            return
+
         self._nodes_update_gen += 1
         gen = self._nodes_update_gen
         try:
             node_tab = self.query_one("#node-overview", NodeOverviewTab)
-            node_infos = self._cached_node_infos if self._cached_node_infos else self._parse_node_infos()
+            node_infos = self._cached_node_infos
 
             def _guarded() -> None:
                 if gen != self._nodes_update_gen:
@@ -1707,15 +2407,37 @@ class SlurmMonitor(App[None]):
         except Exception as exc:
             logger.error(f"Failed to update node overview: {exc}", exc_info=True)
 
-    def _parse_node_infos(self) -> list[NodeInfo]:
+    def _compute_node_infos(self, node_infos: list[NodeInfo]) -> None:
+        """Attach resident job counts to parsed node infos and store them in the snapshot.
+
+        Args:
+            node_infos: Node infos parsed from the node data.
+        """
+        job_counts = self._job_index.node_job_counts()
+        self._cached_node_infos = [
+            replace(info, job_count=job_counts[info.name]) if info.name in job_counts else info for info in node_infos
+        ]
+
+    def _update_job_index(self, snapshot: ClusterSnapshot) -> None:
+        """Bring the job index in line with the all-users jobs of a snapshot.
+
+        Args:
+            snapshot: Snapshot to read all-users jobs from.
+        """
+        self._job_index.update(snapshot.all_users_jobs)
+
+    def _parse_node_infos(self, nodes: list[dict[str, str]] | None = None) -> list[NodeInfo]:
         """Parse cluster node data into NodeInfo objects.
 
+        Args:
+            nodes: Node data to parse (default: nodes from the current snapshot).
+
         Returns:
             List of NodeInfo objects.
         """
         node_infos: list[NodeInfo] = []
 
-        for node_data in self._cluster_nodes:
+        for node_data in self._cluster_nodes if nodes is None else nodes:
             node_name = node_data.get("NodeName", "").strip()
             # Skip nodes with empty names
             if not node_name:
@@ -1791,37 +2513,80 @@ class SlurmMonitor(App[None]):
 
         return node_infos
 
-    def _compute_user_overview_cache(self) -> None:
-        """Pre-compute user overview data from cached SLURM results.
+    def _compute_user_overview_cache(self, snapshot: ClusterSnapshot | None = None) -> None:
+        """Pre-compute running and pending user statistics from cached SLURM results.
 
         This method is safe to run in a background worker thread.
-        """
-        # Filter for running jobs only (exclude PENDING/PD for running stats)
-        state_index = 4
-        running_jobs = [
-            j
-            for j in self._all_users_jobs
-            if len(j) > state_index and j[state_index].strip().upper() not in ("PENDING", "PD")
-        ]
 
-        self._cached_running_user_stats = UserOverviewTab.aggregate_user_stats(running_jobs)
-        self._cached_pending_user_stats = UserOverviewTab.aggregate_pending_user_stats(self._all_users_jobs)
-        self._cached_energy_user_stats = (
-            UserOverviewTab.aggregate_energy_stats(self._energy_history_jobs) if self._energy_history_jobs else []
+        Args:
+            snapshot: Snapshot to read jobs from (default: the current one).
+        """
+        if snapshot is None:
+            snapshot = self._snapshot_store.current
+        all_users_jobs = snapshot.all_users_jobs
+        # Suspended, completing or held jobs do not count towards running stats
+        running_jobs = select_running_jobs(all_users_jobs)
+
+        self._snapshot_store.publish(
+            "user_stats",
+            running_user_stats=UserOverviewTab.aggregate_user_stats(running_jobs),
+            pending_user_stats=UserOverviewTab.aggregate_pending_user_stats(all_users_jobs),
         )
 
-    def _compute_priority_overview_cache(self) -> None:
+    def _compute_energy_stats(self, snapshot: ClusterSnapshot) -> None:
+        """Pre-compute per-user energy statistics from the energy job history.
+
+        Args:
+            snapshot: Snapshot to read the energy history from.
+        """
+        jobs = snapshot.energy_history_jobs
+        self._cached_energy_user_stats = UserOverviewTab.aggregate_energy_stats(jobs) if jobs else []
+
+    def _compute_priority_overview_cache(self) -> bool:
         """Pre-compute priority overview data and display rows from cached SLURM results.
 
         Performs all heavy computation (parsing, sorting, ranking, row building)
         so the main thread only needs to push pre-built rows into widgets.
+        The sshare and sprio halves are separate derived views, so a half whose
+        output did not change reuses its previously parsed, ranked and rendered
+        results.
 
         This method is safe to run in a background worker thread.
+
+        Returns:
+            True if any cached priority data changed, False if both halves were reused.
         """
-        colors = get_theme_colors(self)
+        version = self._priority_view.version
+        self._priority_view.get()
+        return self._priority_view.version != version
+
+    def _publish_priority_rows(self, fields: dict[str, Any]) -> None:
+        """Store both priority halves and the 'My Priority' summary as one snapshot generation.
+
+        Args:
+            fields: ClusterSnapshot fields produced by the sshare and sprio halves.
+        """
+        summary = build_my_priority_summary(
+            self._current_username,
+            fields["user_priorities"],
+            fields["account_priorities"],
+            fields["job_priorities"],
+            get_theme_colors(self),
+        )
+        self._snapshot_store.publish("priority", **fields, priority_summary_markup=summary)
+
+    def _compute_fair_share_rows(self, entries: list[tuple[str, ...]], colors: ThemeColors) -> dict[str, Any]:
+        """Parse, rank and build display rows for the sshare half of the priority cache.
+
+        Args:
+            entries: Raw sshare entries.
+            colors: Theme colors used for row markup.
 
-        if self._fair_share_entries:
-            user_data, account_data = parse_sshare_output(self._fair_share_entries)
+        Returns:
+            ClusterSnapshot fields for the sshare half.
+        """
+        if entries:
+            user_data, account_data = parse_sshare_output(entries)
             user_priorities = [
                 UserPriority(
                     username=d["User"],
@@ -1851,8 +2616,41 @@ class SlurmMonitor(App[None]):
             user_priorities = []
             account_priorities = []
 
-        if self._job_priority_entries:
-            job_data = parse_sprio_output(self._job_priority_entries)
+        # Sort, rank, and build display rows (all in background thread)
+        sorted_users, user_rows = build_user_priority_rows(
+            user_priorities,
+            self._current_username,
+            colors,
+        )
+        current_user_account = next(
+            (p.account for p in sorted_users if p.username == self._current_username),
+            "",
+        )
+        sorted_accounts, account_rows = build_account_priority_rows(
+            account_priorities,
+            current_user_account,
+            colors,
+        )
+
+        return {
+            "user_priorities": sorted_users,
+            "account_priorities": sorted_accounts,
+            "user_priority_rows": user_rows,
+            "account_priority_rows": account_rows,
+        }
+
+    def _compute_job_priority_rows(self, entries: list[tuple[str, ...]], colors: ThemeColors) -> dict[str, Any]:
+        """Parse, sort and build display rows for the sprio half of the priority cache.
+
+        Args:
+            entries: Raw sprio entries.
+            colors: Theme colors used for row markup.
+
+        Returns:
+            ClusterSnapshot fields for the sprio half.
+        """
+        if entries:
+            job_data = parse_sprio_output(entries)
             job_priorities = [
                 JobPriority(
                     job_id=d["JobID"],
@@ -1870,43 +2668,17 @@ class SlurmMonitor(App[None]):
         else:
             job_priorities = []
 
-        # Sort, rank, and build display rows (all in background thread)
-        sorted_users, user_rows = build_user_priority_rows(
-            user_priorities,
-            self._current_username,
-            colors,
-        )
-        current_user_account = next(
-            (p.account for p in sorted_users if p.username == self._current_username),
-            "",
-        )
-        sorted_accounts, account_rows = build_account_priority_rows(
-            account_priorities,
-            current_user_account,
-            colors,
-        )
         sorted_jobs, job_rows = build_job_priority_rows(
             job_priorities,
             self._current_username,
             colors,
         )
-        my_job_rows = build_my_job_priority_rows(sorted_jobs, self._current_username)
-        summary_markup = build_my_priority_summary(
-            self._current_username,
-            sorted_users,
-            sorted_accounts,
-            sorted_jobs,
-            colors,
-        )
 
-        self._cached_user_priorities = sorted_users
-        self._cached_account_priorities = sorted_accounts
-        self._cached_job_priorities = sorted_jobs
-        self._cached_user_priority_rows = user_rows
-        self._cached_account_priority_rows = account_rows
-        self._cached_job_priority_rows = job_rows
-        self._cached_my_job_priority_rows = my_job_rows
-        self._cached_priority_summary_markup = summary_markup
+        return {
+            "job_priorities": sorted_jobs,
+            "job_priority_rows": job_rows,
+            "my_job_priority_rows": build_my_job_priority_rows(sorted_jobs, self._current_username),
+        }
 
     def _apply_user_overview_from_cache(self) -> None:
         """Apply cached user overview data to the UI (main thread only).
@@ -1919,12 +2691,13 @@ class SlurmMonitor(App[None]):
         try:
             user_tab = self.query_one("#user-overview", UserOverviewTab)
         except Exception as exc:
-            logger.debug(f"Failed to apply user overview from cache: {exc}")
+            logger.debug("Failed to apply user overview from cache: {}", exc)
             return
 
-        running = self._cached_running_user_stats
-        pending = self._cached_pending_user_stats
-        energy = self._cached_energy_user_stats
+        snapshot = self._snapshot_store.current
+        running = snapshot.running_user_stats
+        pending = snapshot.pending_user_stats
+        energy = snapshot.energy_user_stats
 
         def _guarded_users() -> None:
             if gen != self._users_update_gen:
@@ -2003,37 +2776,32 @@ class SlurmMonitor(App[None]):
             def _guarded() -> None:
                 if gen != self._priority_update_gen:
                     return
+                snapshot = self._snapshot_store.current
                 priority_tab.apply_prebuilt_data(
                     PrebuiltPriorityData(
-                        user_priorities=self._cached_user_priorities,
-                        account_priorities=self._cached_account_priorities,
-                        job_priorities=self._cached_job_priorities,
-                        user_rows=self._cached_user_priority_rows,
-                        account_rows=self._cached_account_priority_rows,
-                        job_rows=self._cached_job_priority_rows,
-                        my_job_rows=self._cached_my_job_priority_rows,
-                        summary_markup=self._cached_priority_summary_markup,
+                        user_priorities=snapshot.user_priorities,
+                        account_priorities=snapshot.account_priorities,
+                        job_priorities=snapshot.job_priorities,
+                        user_rows=snapshot.user_priority_rows,
+                        account_rows=snapshot.account_priority_rows,
+                        job_rows=snapshot.job_priority_rows,
+                        my_job_rows=snapshot.my_job_priority_rows,
+                        summary_markup=snapshot.priority_summary_markup,
                     )
                 )
 
             self.call_later(_guarded)
         except Exception as exc:
-            logger.debug(f"Failed to apply priority overview from cache: {exc}")
+            logger.debug("Failed to apply priority overview from cache: {}", exc)
 
     def _update_user_overview(self) -> None:
         """Update the user overview tab without blocking the UI."""
         try:
-            has_data = bool(self._all_users_jobs) or bool(self._energy_history_jobs)
-            has_cache = (
-                bool(self._cached_running_user_stats)
-                or bool(self._cached_pending_user_stats)
-                or bool(self._cached_energy_user_stats)
-            )
-
-            if has_data and not has_cache:
+            if self._user_stats_view.is_stale() or self._energy_stats_view.is_stale():
                 # Compute in background (never block the UI on tab switch)
                 def compute_and_apply() -> None:
-                    self._compute_user_overview_cache()
+                    self._user_stats_view.get()
+                    self._energy_stats_view.get()
                     self._post_ui_callback(self._apply_user_overview_from_cache)
 
                 self.run_worker(
@@ -2048,14 +2816,7 @@ class SlurmMonitor(App[None]):
     def _update_priority_overview(self) -> None:
         """Update the priority overview tab without blocking the UI."""
         try:
-            has_data = bool(self._fair_share_entries) or bool(self._job_priority_entries)
-            has_cache = (
-                bool(self._cached_user_priorities)
-                or bool(self._cached_account_priorities)
-                or bool(self._cached_job_priorities)
-            )
-
-            if has_data and not has_cache:
+            if self._priority_view.is_stale():
                 # Compute in background (never block the UI on tab switch)
                 def compute_and_apply() -> None:
                     self._compute_priority_overview_cache()
@@ -2081,7 +2842,7 @@ class SlurmMonitor(App[None]):
             jobs_table.focus()
             logger.debug("Focused jobs table for arrow key navigation")
         except Exception as exc:
-            logger.debug(f"Failed to focus jobs table: {exc}")
+            logger.debug("Failed to focus jobs table: {}", exc)
 
     def _handle_tab_nodes_switched(self) -> None:
         """Handle switching to the nodes tab."""
@@ -2094,7 +2855,7 @@ class SlurmMonitor(App[None]):
             nodes_table.focus()
             logger.debug("Focused nodes table for arrow key navigation")
         except Exception as exc:
-            logger.debug(f"Failed to focus nodes table: {exc}")
+            logger.debug("Failed to focus nodes table: {}", exc)
 
     def _handle_tab_users_switched(self) -> None:
         """Handle switching to the users tab."""
@@ -2107,7 +2868,7 @@ class SlurmMonitor(App[None]):
             users_table.focus()
             logger.debug("Focused users table for arrow key navigation")
         except Exception as exc:
-            logger.debug(f"Failed to focus users table: {exc}")
+            logger.debug("Failed to focus users table: {}", exc)
 
     def _handle_tab_priority_switched(self) -> None:
         """Handle switching to the priority tab."""
@@ -2126,9 +2887,9 @@ class SlurmMonitor(App[None]):
             table_id = subtab_table_ids.get(priority_tab.active_subtab, "my_job_priority_table")
             priority_table = priority_tab.query_one(f"#{table_id}", DataTable)
             priority_table.focus()
-            logger.debug(f"Focused priority table {table_id} for arrow key navigation")
+            logger.debug("Focused priority table {} for arrow key navigation", table_id)
         except Exception as exc:
-            logger.debug(f"Failed to focus priority table: {exc}")
+            logger.debug("Failed to focus priority table: {}", exc)
 
     def _handle_tab_logs_switched(self) -> None:
         """Handle switching to the logs tab."""
@@ -2137,9 +2898,56 @@ class SlurmMonitor(App[None]):
             log_pane.focus()
             logger.debug("Focused log pane")
         except Exception as exc:
-            logger.debug(f"Failed to focus log pane: {exc}")
+            logger.debug("Failed to focus log pane: {}", exc)
 
-    def on_tab_switched(self, event: TabSwitched) -> None:
+    def _update_performance_tab(self) -> None:
+        """Show the current pipeline timings and cache counters (main thread only)."""
+        if "performance" in self._unmounted_tabs:
+            return
+        try:
+            performance_tab = self.query_one("#performance-overview", PerformanceTab)
+        except Exception as exc:
+            logger.debug("Failed to find performance tab: {}", exc)
+            return
+        coalesced, memo_hits = command_flight_counters()
+        view_counters = self._dataflow.counters().values()
+        recomputes = sum(counters.recomputes for counters in view_counters)
+        skips = sum(counters.skips for counters in view_counters)
+        performance_tab.update_stats(
+            get_telemetry().summaries(),
+            f"Commands shared by concurrent callers: {coalesced}, served from memo: {memo_hits}  |  "
+            f"Derived views: {recomputes} recomputes, {skips} skips",
+        )
+
+    async def _mount_tab_content(self, tab_name: str) -> None:
+        """Compose a non-default tab the first time it is shown.
+
+        The new widget starts empty, so the tab is marked dirty and filled
+        from the derived views by its switch handler.
+
+        Args:
+            tab_name: Name of the tab being shown.
+        """
+        factory = self._unmounted_tabs.pop(tab_name, None)
+        if factory is None:
+            return
+        started = time.perf_counter()
+        try:
+            await self.query_one(f"#tab-{tab_name}-content", Container).mount(factory())
+        except Exception as exc:
+            logger.warning(f"Failed to mount {tab_name} tab: {exc}")
+            return
+        elapsed = time.perf_counter() - started
+        get_telemetry().record(APPLY, f"mount {tab_name} tab", elapsed)
+        logger.debug("Mounted {} tab in {:.1f}ms", tab_name, elapsed * 1000)
+        if tab_name == "nodes":
+            self._dirty_nodes_tab = True
+        elif tab_name == "users":
+            self._dirty_users_tab = True
+        elif tab_name == "priority":
+            self._dirty_priority_tab = True
+
+    async def on_tab_switched(self, event: TabSwitched) -> None:
         """Handle tab switching events.
 
         Args:
@@ -2151,11 +2959,16 @@ class SlurmMonitor(App[None]):
         try:
             tab_container = self.query_one("TabContainer", TabContainer)
             if tab_container.active_tab != event.tab_name:
-                logger.debug(f"Ignoring stale tab event for {event.tab_name} (active: {tab_container.active_tab})")
+                logger.debug("Ignoring stale tab event for {} (active: {})", event.tab_name, tab_container.active_tab)
                 return
         except Exception:
             return
 
+        if event.tab_name in self._unmounted_tabs:
+            await self._mount_tab_content(event.tab_name)
+            if tab_container.active_tab != event.tab_name:
+                return  # Switched away while mounting; the tab is filled when shown again
+
         # Dispatch to tab-specific handler (focus, lazy data load, etc.)
         tab_handlers = {
             "jobs": self._handle_tab_jobs_switched,
@@ -2163,11 +2976,13 @@ class SlurmMonitor(App[None]):
             "users": self._handle_tab_users_switched,
             "priority": self._handle_tab_priority_switched,
             "logs": self._handle_tab_logs_switched,
+            "performance": self._update_performance_tab,
         }
         handler = tab_handlers.get(event.tab_name)
         if handler:
             try:
-                handler()
+                with span(handler.__qualname__, UI_CALLBACK), get_telemetry().timed(APPLY, handler.__name__):
+                    handler()
             except Exception as exc:
                 logger.warning(f"Failed to handle tab switch to {event.tab_name}: {exc}")
 
@@ -2201,15 +3016,17 @@ class SlurmMonitor(App[None]):
         energy_jobs, error = get_energy_job_history(months)
         if error:
             logger.warning(f"Failed to load energy data: {error}")
-            self._post_ui_callback(lambda: self.notify(f"Failed to load energy data: {error}", severity="error"))
+            self._post_ui_callback(
+                functools.partial(self.notify, f"Failed to load energy data: {error}", severity="error")
+            )
             self._energy_data_loaded = False
             self._energy_history_jobs = []
-            self._cached_energy_user_stats = []
             return
 
         self._energy_history_jobs = energy_jobs
+        # Reloads are user-requested, so compute the stats right away for the notification
+        self._energy_stats_view.get()
         self._energy_data_loaded = True
-        self._cached_energy_user_stats = UserOverviewTab.aggregate_energy_stats(energy_jobs)
         logger.info(f"Loaded {len(energy_jobs)} energy history jobs")
 
         # Update the UI
@@ -2217,14 +3034,16 @@ class SlurmMonitor(App[None]):
 
     def _update_energy_ui(self) -> None:
         """Update the energy UI after data reload."""
+        if not self._cached_energy_user_stats:
+            self.notify("No energy data loaded", severity="warning")
+            return
+        self.notify(f"Loaded {len(self._energy_history_jobs)} energy history jobs", severity="information")
+        if "users" in self._unmounted_tabs:
+            return  # The users tab is filled from the energy view when first shown
         try:
             user_tab = self.query_one("#user-overview", UserOverviewTab)
-            if self._cached_energy_user_stats:
-                self.call_later(user_tab.update_energy_users, self._cached_energy_user_stats)
-                self.call_later(user_tab.update_energy_period_label, self._settings.energy_history_months)
-                self.notify(f"Loaded {len(self._energy_history_jobs)} energy history jobs", severity="information")
-            else:
-                self.notify("No energy data loaded", severity="warning")
+            self.call_later(user_tab.update_energy_users, self._cached_energy_user_stats)
+            self.call_later(user_tab.update_energy_period_label, self._settings.energy_history_months)
         except Exception as exc:
             logger.error(f"Failed to update energy UI: {exc}", exc_info=True)
 
@@ -2257,7 +3076,7 @@ class SlurmMonitor(App[None]):
             tab_container = self.query_one("TabContainer", TabContainer)
             tab_container.switch_tab(tab_name)
         except Exception as exc:
-            logger.debug(f"Failed to switch to {tab_name} tab: {exc}")
+            logger.debug("Failed to switch to {} tab: {}", tab_name, exc)
 
     def action_switch_tab_jobs(self) -> None:
         """Switch to the Jobs tab."""
@@ -2279,6 +3098,10 @@ class SlurmMonitor(App[None]):
         """Switch to the Logs tab."""
         self._switch_tab("logs")
 
+    def action_switch_tab_performance(self) -> None:
+        """Switch to the Performance tab."""
+        self._switch_tab("performance")
+
     def _resolve_base_tab(self) -> str:
         """Return the tab name to use as base for next/previous cycling.
 
@@ -2298,7 +3121,7 @@ class SlurmMonitor(App[None]):
         """Switch to the next tab (cycling)."""
         if not self._initial_load_complete:
             return
-        tab_order = ["jobs", "nodes", "users", "priority", "logs"]
+        tab_order = ["jobs", "nodes", "users", "priority", "logs", "performance"]
         base = self._resolve_base_tab()
         current_index = tab_order.index(base) if base in tab_order else 0
         self._switch_tab(tab_order[(current_index + 1) % len(tab_order)])
@@ -2307,7 +3130,7 @@ class SlurmMonitor(App[None]):
         """Switch to the previous tab (cycling)."""
         if not self._initial_load_complete:
             return
-        tab_order = ["jobs", "nodes", "users", "priority", "logs"]
+        tab_order = ["jobs", "nodes", "users", "priority", "logs", "performance"]
         base = self._resolve_base_tab()
         current_index = tab_order.index(base) if base in tab_order else 0
         self._switch_tab(tab_order[(current_index - 1) % len(tab_order)])
@@ -2345,6 +3168,8 @@ class SlurmMonitor(App[None]):
     def action_show_help(self) -> None:
         """Show help screen with keybindings."""
         logger.debug("Showing help screen")
+        from stoei.widgets.help_screen import HelpScreen  # noqa: PLC0415
+
         self.push_screen(HelpScreen(keybindings=self._keybindings))
 
     def action_show_job_info(self) -> None:
@@ -2377,40 +3202,84 @@ class SlurmMonitor(App[None]):
         # Check cache first
         cached = self._job_info_cache.get(query_id)
         if cached is not None:
-            logger.debug(f"Job info cache hit for {query_id}")
+            logger.debug("Job info cache hit for {}", query_id)
             job_info, error, stdout_path, stderr_path = cached
         else:
-            job_info, error, stdout_path, stderr_path = get_job_info_and_log_paths(query_id)
-            self._job_info_cache[query_id] = (job_info, error, stdout_path, stderr_path)
+            # Terminality is decided from the fetched record, not the possibly older table snapshot
+            states: dict[str, str] = {}
+            job_info, error, stdout_path, stderr_path = get_job_info_and_log_paths(query_id, states=states)
+            self._job_info_cache.put(query_id, (job_info, error, stdout_path, stderr_path), states.get(query_id))
 
         # Schedule UI update on main thread
         self._post_ui_callback(
-            lambda: self.push_screen(JobInfoScreen(job_id, job_info, error, stdout_path, stderr_path))
+            functools.partial(self._display_job_info, job_id, job_info, error, stdout_path, stderr_path)
         )
 
-    def _prefetch_job_info(self, job_id: str) -> None:
-        """Pre-fetch job info into cache in background.
+    def _display_job_info(
+        self, job_id: str, job_info: str, error: str | None, stdout_path: str | None, stderr_path: str | None
+    ) -> None:
+        """Display job information in a modal screen.
+
+        Args:
+            job_id: The job ID as entered or selected.
+            job_info: Formatted job information.
+            error: Optional error message.
+            stdout_path: Path to the job's stdout log, if known.
+            stderr_path: Path to the job's stderr log, if known.
+        """
+        self.push_screen(JobInfoScreen(job_id, job_info, error, stdout_path, stderr_path))
+
+    def _prefetch_job_info(self, job_ids: list[str]) -> None:
+        """Pre-fetch job info for the visible jobs into the cache in background.
 
         Called when the cursor moves to a new row so the info is ready
-        when the user presses Enter/i.
+        when the user presses Enter/i. All uncached jobs are fetched with
+        one batched scontrol call plus one sacct call for finished jobs.
 
         Args:
-            job_id: The SLURM job ID to pre-fetch.
+            job_ids: SLURM job IDs to pre-fetch, highlighted row first.
         """
-        query_id = normalize_array_job_id(job_id)
-        if query_id in self._job_info_cache:
+        query_ids = [
+            query_id
+            for query_id in dict.fromkeys(normalize_array_job_id(job_id) for job_id in job_ids)
+            if query_id not in self._job_info_cache
+        ]
+        if not query_ids:
             return
-        logger.debug(f"Pre-fetching job info for {query_id}")
-        result = get_job_info_and_log_paths(query_id)
+        logger.debug("Pre-fetching job info for {} jobs", len(query_ids))
+        states: dict[str, str] = {}
+        results = get_jobs_info_and_log_paths(query_ids, states=states)
         # Only cache if this worker wasn't cancelled
         worker = get_current_worker()
         if not worker.is_cancelled:
-            self._job_info_cache[query_id] = result
+            for query_id, result in results.items():
+                self._job_info_cache.put(query_id, result, states.get(query_id))
+
+    def _visible_job_ids(self, table: DataTable, cursor_row: int) -> list[str]:
+        """Return the job IDs of the rows in the table's viewport.
+
+        Args:
+            table: The jobs table.
+            cursor_row: Index of the highlighted row, returned first.
+
+        Returns:
+            Non-empty job IDs of the visible rows.
+        """
+        first = max(0, int(table.scroll_offset.y))
+        last = min(table.row_count, first + max(1, table.size.height), first + _PREFETCH_MAX_JOBS)
+        rows = [cursor_row, *(row for row in range(first, last) if row != cursor_row)]
+        job_ids: list[str] = []
+        for row in rows:
+            if 0 <= row < table.row_count:
+                job_id = str(table.get_row_at(row)[0]).strip()
+                if job_id:
+                    job_ids.append(job_id)
+        return job_ids
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        """Pre-fetch job info when cursor moves to a new row.
+        """Pre-fetch job info for the visible rows when the cursor moves.
 
-        Uses an exclusive worker so only the latest cursor position is fetched.
+        Uses an exclusive worker so only the latest viewport is fetched.
 
         Args:
             event: The row highlighted event.
@@ -2420,18 +3289,17 @@ class SlurmMonitor(App[None]):
         if event.data_table.row_count == 0:
             return
         try:
-            row_data = event.data_table.get_row(event.row_key)
-            job_id = str(row_data[0]).strip()
-            if job_id:
+            job_ids = self._visible_job_ids(event.data_table, event.cursor_row)
+            if job_ids:
                 self.run_worker(
-                    lambda: self._prefetch_job_info(job_id),
+                    lambda: self._prefetch_job_info(job_ids),
                     name="prefetch_job_info",
                     group="prefetch_job_info",
                     exclusive=True,
                     thread=True,
                 )
         except Exception:
-            logger.debug(f"Could not pre-fetch job info for highlighted row: {event.row_key}")
+            logger.debug("Could not pre-fetch job info for highlighted row: {}", event.row_key)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in data tables.
@@ -2483,19 +3351,60 @@ class SlurmMonitor(App[None]):
     def _show_node_info(self, node_name: str) -> None:
         """Show detailed information for a node.
 
+        Served from the node snapshot when it is recent enough, otherwise
+        fetched with a targeted scontrol call.
+
         Args:
             node_name: The name of the node to display.
         """
+        node = self._snapshot_node(node_name)
+        if node is not None:
+            logger.info(f"Showing node info for {node_name} from the node snapshot")
+            self._display_node_info(node_name, format_node_info(node) + "\n" + self._node_jobs_section(node_name), None)
+            return
+
         logger.info(f"Fetching node info for {node_name}")
         self.notify("Loading node information...", timeout=2)
 
         # Get node info in a worker to avoid blocking
         def fetch_node_info() -> None:
             node_info, error = get_node_info(node_name)
-            self._post_ui_callback(lambda: self._display_node_info(node_name, node_info, error))
+            if not error:
+                node_info += "\n" + self._node_jobs_section(node_name)
+            self._post_ui_callback(functools.partial(self._display_node_info, node_name, node_info, error))
 
         self.run_worker(fetch_node_info, name="fetch_node_info", thread=True)
 
+    def _snapshot_node(self, node_name: str) -> dict[str, str] | None:
+        """Look up a node in the node snapshot.
+
+        Args:
+            node_name: The node name to look up.
+
+        Returns:
+            The node's data, or None if the node is unknown or the snapshot is
+            older than the ``node_info_max_age`` setting.
+        """
+        if self._nodes_fetched_at is None:
+            return None
+        age = time.monotonic() - self._nodes_fetched_at
+        if age > self._settings.node_info_max_age:
+            logger.debug("Node snapshot is {:.0f}s old, fetching {} with scontrol", age, node_name)
+            return None
+        return self._nodes_by_name_view.get().get(node_name)
+
+    def _node_jobs_section(self, node_name: str) -> str:
+        """Format the jobs resident on a node from the job index.
+
+        Args:
+            node_name: The node name.
+
+        Returns:
+            Formatted Running Jobs section.
+        """
+        self._job_index_view.get()
+        return format_node_jobs(self._job_index.jobs_on_node(node_name))
+
     def _display_node_info(self, node_name: str, node_info: str, error: str | None) -> None:
         """Display node information in a modal screen.
 
@@ -2505,7 +3414,7 @@ class SlurmMonitor(App[None]):
             error: Optional error message.
         """
         self.push_screen(NodeInfoScreen(node_name, node_info, error))
-        logger.debug(f"Displayed node info screen for {node_name}")
+        logger.debug("Displayed node info screen for {}", node_name)
 
     def _show_user_info_for_row(self, table: DataTable, row_key: RowKey) -> None:
         """Show user info for a specific row in the users table.
@@ -2535,49 +3444,37 @@ class SlurmMonitor(App[None]):
     def _show_user_info(self, username: str) -> None:
         """Show detailed information for a user.
 
+        The user's jobs come from the job index over the all-users snapshot;
+        ``squeue -u`` is only run before the first all-users fetch.
+
         Args:
             username: The username to display.
         """
         logger.info(f"Fetching user info for {username}")
         self.notify("Loading user information...", timeout=2)
 
-        # Capture cached data references for use in worker thread
-        all_users_jobs = self._all_users_jobs
-        energy_history_jobs = self._energy_history_jobs
-        fair_share_entries = self._fair_share_entries
-        job_priority_entries = self._job_priority_entries
+        have_all_jobs = self._snapshot_store.current.source_generation("all_jobs") > 0
 
         # Get user info in a worker to avoid blocking
-        def fetch_user_info() -> None:  # noqa: PLR0912
-            jobs, error = get_user_jobs(username)
-            if error:
-                self._post_ui_callback(lambda: self._display_user_info(username, "", error))
-                return
-
-            # Aggregate user stats from the jobs
-            # Build a job list in the format expected by aggregate_user_stats
-            # Jobs from get_user_jobs: (JobID, Name, Partition, State, Time, Nodes, NodeList, TRES)
-            # aggregate_user_stats expects: (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
-            min_user_job_fields = 8  # Minimum fields from get_user_jobs
-            formatted_jobs: list[tuple[str, ...]] = []
-            for job in jobs:
-                if len(job) >= min_user_job_fields:
-                    # Insert username at position 2
-                    formatted_job = (job[0], job[1], username, job[2], job[3], job[4], job[5], job[6], job[7])
-                    formatted_jobs.append(formatted_job)
-
-            user_stats_list = UserOverviewTab.aggregate_user_stats(formatted_jobs)
-
-            # Find stats for this user
-            user_stats: UserStats | None = None
-            for stats in user_stats_list:
-                if stats.username == username:
-                    user_stats = stats
-                    break
-
-            if user_stats is None:
-                # Create default stats if no jobs
-                user_stats = UserStats(
+        def fetch_user_info() -> None:
+            if have_all_jobs:
+                self._job_index_view.get()
+                # All-users format: (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
+                user_jobs = self._job_index.jobs_for_user(username)
+                jobs = [to_user_job_row(job) for job in user_jobs]
+            else:
+                jobs, error = get_user_jobs(username)
+                if error:
+                    self._post_ui_callback(functools.partial(self._display_user_info, username, "", error))
+                    return
+                # get_user_jobs format: (JobID, Name, Partition, State, Time, Nodes, NodeList, TRES)
+                min_user_job_fields = 8
+                user_jobs = [(*job[:2], username, *job[2:8]) for job in jobs if len(job) >= min_user_job_fields]
+
+            # Only this user's jobs are aggregated, so each list has at most one entry
+            user_stats = next(
+                iter(UserOverviewTab.aggregate_user_stats(select_running_jobs(user_jobs))),
+                UserStats(
                     username=username,
                     job_count=0,
                     total_cpus=0,
@@ -2585,73 +3482,20 @@ class SlurmMonitor(App[None]):
                     total_gpus=0,
                     total_nodes=0,
                     gpu_types="",
-                )
-
-            # Gather pending stats from cached all users jobs
-            pending_stats: UserPendingStats | None = None
-            if all_users_jobs:
-                pending_stats_list = UserOverviewTab.aggregate_pending_user_stats(all_users_jobs)
-                for stats in pending_stats_list:
-                    if stats.username == username:
-                        pending_stats = stats
-                        break
-
-            # Gather energy stats from cached energy history
-            energy_stats: UserEnergyStats | None = None
-            if energy_history_jobs:
-                energy_stats_list = UserOverviewTab.aggregate_energy_stats(energy_history_jobs)
-                for stats in energy_stats_list:
-                    if stats.username == username:
-                        energy_stats = stats
-                        break
-
-            # Gather fair-share priority info from cached data
-            # sshare format: (Account, User, RawShares, NormShares, RawUsage, NormUsage, EffectvUsage, FairShare)
-            priority_info: dict[str, str] | None = None
-            if fair_share_entries:
-                min_sshare_fields = 8
-                for entry in fair_share_entries:
-                    if len(entry) >= min_sshare_fields and entry[1] == username:
-                        priority_info = {
-                            "account": entry[0],
-                            "raw_shares": entry[2],
-                            "norm_shares": entry[3],
-                            "raw_usage": entry[4],
-                            "norm_usage": entry[5],
-                            "effective_usage": entry[6],
-                            "fair_share": entry[7],
-                        }
-                        break
-
-            # Gather pending job priorities for this user
-            # sprio format: (JOBID, USER, ACCOUNT, PRIORITY, AGE, FAIRSHARE, JOBSIZE, PARTITION, QOS)
-            job_priorities: list[dict[str, str]] = []
-            if job_priority_entries:
-                min_sprio_fields = 9
-                for entry in job_priority_entries:
-                    if len(entry) >= min_sprio_fields and entry[1] == username:
-                        job_priorities.append(
-                            {
-                                "job_id": entry[0],
-                                "priority": entry[3],
-                                "age": entry[4],
-                                "fair_share": entry[5],
-                                "job_size": entry[6],
-                                "partition": entry[7],
-                                "qos": entry[8],
-                            }
-                        )
+                ),
+            )
+            pending_stats = next(iter(UserOverviewTab.aggregate_pending_user_stats(user_jobs)), None)
 
             formatted_info = format_user_info(
                 username,
                 user_stats,
                 jobs,
                 pending_stats=pending_stats,
-                energy_stats=energy_stats,
-                priority_info=priority_info,
-                job_priorities=job_priorities if job_priorities else None,
+                energy_stats=self._energy_stats_by_user_view.get().get(username),
+                priority_info=self._fair_share_by_user_view.get().get(username),
+                job_priorities=self._job_priorities_by_user_view.get().get(username),
             )
-            self._post_ui_callback(lambda: self._display_user_info(username, formatted_info, None))
+            self._post_ui_callback(functools.partial(self._display_user_info, username, formatted_info, None))
 
         self.run_worker(fetch_user_info, name="fetch_user_info", thread=True)
 
@@ -2664,7 +3508,7 @@ class SlurmMonitor(App[None]):
             error: Optional error message.
         """
         self.push_screen(UserInfoScreen(username, user_info, error))
-        logger.debug(f"Displayed user info screen for {username}")
+        logger.debug("Displayed user info screen for {}", username)
 
     def _show_account_info_for_row(self, table: DataTable, row_key: RowKey) -> None:
         """Show account info for a specific row in the accounts table.
@@ -2694,106 +3538,36 @@ class SlurmMonitor(App[None]):
     def _show_account_info(self, account_name: str) -> None:
         """Show detailed information for an account/institute.
 
+        Members, jobs, resources and pending priorities are rolled up over the
+        account and its sub-accounts from the account tree index.
+
         Args:
             account_name: The account/institute name to display.
         """
         logger.info(f"Fetching account info for {account_name}")
         self.notify("Loading account information...", timeout=2)
 
-        # Capture cached data references for use in worker thread
-        fair_share_entries = self._fair_share_entries
-        all_users_jobs = self._all_users_jobs
-        job_priority_entries = self._job_priority_entries
-
         # Get account info in a worker to avoid blocking
-        def fetch_account_info() -> None:  # noqa: PLR0912
-            # Get account-level priority info from cached sshare data
-            # sshare format: (Account, User, RawShares, NormShares, RawUsage, NormUsage, EffectvUsage, FairShare)
-            account_priority: dict[str, str] = {}
-            users_in_account: list[dict[str, str]] = []
-
-            if fair_share_entries:
-                min_sshare_fields = 8
-                for entry in fair_share_entries:
-                    if len(entry) >= min_sshare_fields and entry[0] == account_name:
-                        if entry[1]:  # Has username - this is a user entry
-                            users_in_account.append(
-                                {
-                                    "username": entry[1],
-                                    "raw_shares": entry[2],
-                                    "norm_shares": entry[3],
-                                    "raw_usage": entry[4],
-                                    "norm_usage": entry[5],
-                                    "effective_usage": entry[6],
-                                    "fair_share": entry[7],
-                                }
-                            )
-                        else:  # No username - this is the account-level entry
-                            account_priority = {
-                                "raw_shares": entry[2],
-                                "norm_shares": entry[3],
-                                "raw_usage": entry[4],
-                                "norm_usage": entry[5],
-                                "effective_usage": entry[6],
-                                "fair_share": entry[7],
-                            }
-
-            # Get usernames in this account for filtering jobs
-            usernames_in_account = {u["username"] for u in users_in_account}
-
-            # Filter running jobs for users in this account
-            # Job format: (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
-            running_jobs: list[tuple[str, ...]] = []
-            pending_jobs: list[tuple[str, ...]] = []
-
-            if all_users_jobs:
-                min_job_fields = 5
-                username_index = 2
-                state_index = 4
-                for job in all_users_jobs:
-                    if len(job) >= min_job_fields:
-                        username = job[username_index].strip()
-                        state = job[state_index].strip().upper()
-                        if username in usernames_in_account:
-                            if state in ("RUNNING", "R"):
-                                running_jobs.append(job)
-                            elif state in ("PENDING", "PD"):
-                                pending_jobs.append(job)
-
-            # Get pending job priorities for users in this account
-            # sprio format: (JOBID, USER, ACCOUNT, PRIORITY, AGE, FAIRSHARE, JOBSIZE, PARTITION, QOS)
-            job_priorities: list[dict[str, str]] = []
-            if job_priority_entries:
-                min_sprio_fields = 9
-                for entry in job_priority_entries:
-                    if len(entry) >= min_sprio_fields:
-                        # Check if account matches or user is in account
-                        entry_account = entry[2]
-                        entry_user = entry[1]
-                        if entry_account == account_name or entry_user in usernames_in_account:
-                            job_priorities.append(
-                                {
-                                    "job_id": entry[0],
-                                    "user": entry[1],
-                                    "account": entry[2],
-                                    "priority": entry[3],
-                                    "age": entry[4],
-                                    "fair_share": entry[5],
-                                    "job_size": entry[6],
-                                    "partition": entry[7],
-                                    "qos": entry[8],
-                                }
-                            )
+        def fetch_account_info() -> None:
+            tree = self._account_tree_view.get()
+            node = tree.get(account_name)
+            users_in_account = [user for name in subtree_accounts(tree, account_name) for user in tree[name].users]
+            # Only this account's members are looked up in the job index
+            self._job_index_view.get()
+            usage = account_usage(tree, account_name, self._job_index.jobs_for_user)
+            job_priorities = self._account_priorities_view.get().get(account_name)
 
             formatted_info = format_account_info(
                 account_name,
-                account_priority,
+                node.priority if node is not None else {},
                 users_in_account,
-                running_jobs,
-                pending_jobs,
-                job_priorities=job_priorities if job_priorities else None,
+                usage.running_jobs,
+                usage.pending_jobs,
+                job_priorities=job_priorities or None,
+                totals=usage.totals,
+                sub_accounts=node.children if node is not None else None,
             )
-            self._post_ui_callback(lambda: self._display_account_info(account_name, formatted_info, None))
+            self._post_ui_callback(functools.partial(self._display_account_info, account_name, formatted_info, None))
 
         self.run_worker(fetch_account_info, name="fetch_account_info", thread=True)
 
@@ -2806,7 +3580,7 @@ class SlurmMonitor(App[None]):
             error: Optional error message.
         """
         self.push_screen(AccountInfoScreen(account_name, account_info, error))
-        logger.debug(f"Displayed account info screen for {account_name}")
+        logger.debug("Displayed account info screen for {}", account_name)
 
     def _show_job_info_for_row(self, table: DataTable, row_key: RowKey) -> None:
         """Show job info for a specific row in a table.
@@ -2920,7 +3694,7 @@ class SlurmMonitor(App[None]):
                 self._update_responsive_layout()
 
         except Exception as exc:
-            logger.debug(f"Failed to check window size: {exc}")
+            logger.debug("Failed to check window size: {}", exc)
 
     def _update_responsive_layout(self) -> None:
         """Update layout based on window size."""
@@ -2937,7 +3711,7 @@ class SlurmMonitor(App[None]):
             tab_container.set_compact(self._is_narrow)
 
         except Exception as exc:
-            logger.debug(f"Failed to update responsive layout: {exc}")
+            logger.debug("Failed to update responsive layout: {}", exc)
 
     def on_resize(self) -> None:
         """Handle window resize events."""
@@ -2954,11 +3728,18 @@ class SlurmMonitor(App[None]):
         if self._log_sink_id is not None:
             remove_tui_sink(self._log_sink_id)
             self._log_sink_id = None
+        self._job_info_cache.save()
+        if self._initial_background_complete:
+            self._save_last_snapshot(force=True)
         self.exit()
 
 
-def main() -> None:
-    """Run the SLURM monitor TUI app."""
-    app = SlurmMonitor()
+def main(startup_fetch: StartupFetch | None = None) -> None:
+    """Run the SLURM monitor TUI app.
+
+    Args:
+        startup_fetch: Critical-path SLURM fetches already started by the entry point.
+    """
+    app = SlurmMonitor(startup_fetch)
     app.run()
     logger.info("Stoei exited")
@@ -0,0 +1,215 @@
+"""Memoized dataflow layer for views derived from the cluster snapshot.
+
+Each :class:`DerivedView` declares the inputs it is computed from: snapshot
+sources (e.g. ``"nodes"``, versioned by
+:meth:`~stoei.snapshot.ClusterSnapshot.source_generation`) and other derived
+views (versioned by how often they were recomputed). Views are computed lazily
+when :meth:`DerivedView.get` is called, and only when an input version or the
+optional extra ``key`` changed since the last computation; otherwise the
+memoized value is returned. Recompute and skip counts are tracked per view.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from stoei.logger import get_logger
+from stoei.telemetry import DERIVE, get_telemetry
+
+if TYPE_CHECKING:
+    from stoei.snapshot import ClusterSnapshot, SnapshotStore
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Input key used before a view's first computation (never equal to a real key)
+_NEVER_COMPUTED: tuple[object, ...] = (object(),)
+
+
+@dataclass
+class ViewCounters:
+    """Recompute/skip counters for one derived view."""
+
+    recomputes: int = 0
+    skips: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Fraction of requests served from the memoized value."""
+        total = self.recomputes + self.skips
+        return self.skips / total if total else 0.0
+
+
+class DerivedView(Generic[T]):
+    """A lazily recomputed, memoized value derived from snapshot inputs.
+
+    Create views with :meth:`Dataflow.view` rather than directly.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        store: SnapshotStore,
+        name: str,
+        inputs: Sequence[str | DerivedView[Any]],
+        compute: Callable[[ClusterSnapshot], T],
+        *,
+        initial: T,
+        key: Callable[[ClusterSnapshot], Hashable] | None = None,
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            store: Snapshot store the view reads from.
+            name: View name (used for counters and logging).
+            inputs: Snapshot source names and views this view depends on.
+            compute: Function computing the value from a snapshot.
+            initial: Value returned before the first computation.
+            key: Optional function returning extra hashable state the value depends on.
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.counters = ViewCounters()
+        self._store = store
+        self._compute = compute
+        self._key = key
+        self._lock = threading.Lock()
+        self._value = initial
+        self._input_key: tuple[object, ...] = _NEVER_COMPUTED
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Number of times the value has been recomputed."""
+        return self._version
+
+    @property
+    def value(self) -> T:
+        """The memoized value, without checking inputs."""
+        return self._value
+
+    def _current_key(self, snapshot: ClusterSnapshot, *, refresh: bool) -> tuple[object, ...]:
+        parts: list[object] = []
+        for dependency in self.inputs:
+            if isinstance(dependency, DerivedView):
+                if refresh:
+                    dependency.get(snapshot)
+                    parts.append(dependency.version)
+                else:
+                    # A stale dependency will bump its version when recomputed
+                    parts.append(-1 if dependency.is_stale(snapshot) else dependency.version)
+            else:
+                parts.append(snapshot.source_generation(dependency))
+        if self._key is not None:
+            parts.append(self._key(snapshot))
+        return tuple(parts)
+
+    def is_stale(self, snapshot: ClusterSnapshot | None = None) -> bool:
+        """Check whether :meth:`get` would recompute the value.
+
+        Args:
+            snapshot: Snapshot to check against (default: the store's current one).
+
+        Returns:
+            True if an input changed since the last computation.
+        """
+        if snapshot is None:
+            snapshot = self._store.current
+        return self._current_key(snapshot, refresh=False) != self._input_key
+
+    def get(self, snapshot: ClusterSnapshot | None = None) -> T:
+        """Return the value, recomputing it first if any input changed.
+
+        Args:
+            snapshot: Snapshot to compute from (default: the store's current one).
+                Dependencies are evaluated against the same snapshot.
+
+        Returns:
+            The up-to-date value.
+        """
+        if snapshot is None:
+            snapshot = self._store.current
+        with self._lock:
+            input_key = self._current_key(snapshot, refresh=True)
+            if input_key == self._input_key:
+                self.counters.skips += 1
+                return self._value
+            with get_telemetry().timed(DERIVE, self.name):
+                self._value = self._compute(snapshot)
+            self._input_key = input_key
+            self._version += 1
+            self.counters.recomputes += 1
+            logger.debug("Recomputed derived view {} (version {})", self.name, self._version)
+            return self._value
+
+    def invalidate(self) -> None:
+        """Force the next :meth:`get` to recompute."""
+        with self._lock:
+            self._input_key = _NEVER_COMPUTED
+
+
+class Dataflow:
+    """Registry of derived views over a snapshot store."""
+
+    def __init__(self, store: SnapshotStore) -> None:
+        """Initialize an empty dataflow graph.
+
+        Args:
+            store: Snapshot store the views read from.
+        """
+        self._store = store
+        self._views: dict[str, DerivedView[Any]] = {}
+
+    def view(
+        self,
+        name: str,
+        inputs: Sequence[str | DerivedView[Any]],
+        compute: Callable[[ClusterSnapshot], T],
+        *,
+        initial: T,
+        key: Callable[[ClusterSnapshot], Hashable] | None = None,
+    ) -> DerivedView[T]:
+        """Define a derived view.
+
+        Args:
+            name: Unique view name.
+            inputs: Snapshot source names and previously defined views the view depends on.
+            compute: Function computing the value from a snapshot.
+            initial: Value returned before the first computation.
+            key: Optional function returning extra hashable state the value depends on.
+
+        Returns:
+            The new view.
+
+        Raises:
+            ValueError: If a view with the same name is already defined.
+        """
+        if name in self._views:
+            msg = f"Derived view {name!r} is already defined"
+            raise ValueError(msg)
+        view = DerivedView(self._store, name, inputs, compute, initial=initial, key=key)
+        self._views[name] = view
+        return view
+
+    def invalidate_all(self) -> None:
+        """Force every view to recompute on its next request."""
+        for view in self._views.values():
+            view.invalidate()
+
+    def counters(self) -> dict[str, ViewCounters]:
+        """Return the recompute/skip counters of every view, keyed by view name."""
+        return {name: view.counters for name, view in self._views.items()}
+
+    def log_counters(self) -> None:
+        """Log recompute and skip rates for every view at debug level."""
+        for name, counters in self.counters().items():
+            logger.debug(
+                "Derived view {}: {} recomputes, {} skips ({:.0%} skipped)",
+                name,
+                counters.recomputes,
+                counters.skips,
+                counters.skip_rate,
+            )
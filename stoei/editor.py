@@ -27,7 +27,7 @@ def get_editor() -> str | None:
     editor = os.environ.get("EDITOR")
     if editor:
         if shutil.which(editor):
-            logger.debug(f"Using $EDITOR: {editor}")
+            logger.debug("Using $EDITOR: {}", editor)
             return editor
         # $EDITOR is set but not found - warn and fall back
         logger.warning(f"$EDITOR is set to '{editor}' but not found, using fallback editor")
@@ -35,7 +35,7 @@ def get_editor() -> str | None:
     # Fall back to common editors
     for ed in DEFAULT_EDITORS:
         if shutil.which(ed):
-            logger.debug(f"Using fallback editor: {ed}")
+            logger.debug("Using fallback editor: {}", ed)
             return ed
 
     logger.warning("No suitable editor found")
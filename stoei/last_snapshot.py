@@ -0,0 +1,199 @@
+"""Last known refresh data, persisted so the next launch can show it immediately.
+
+The app saves the raw inputs of its tables (the user's jobs, nodes, all-users
+jobs and priority rows) after refresh cycles and on exit. At the next launch
+they are rendered right away, marked as stale with their age, while fresh data
+is fetched in the background (stale-while-revalidate). Derived data such as
+cluster stats and user/priority tables is recomputed from the inputs, which
+keeps the file small and independent of widget types.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from stoei.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SNAPSHOT_FORMAT_VERSION = 1
+_HISTORY_STATS_FIELDS = 3
+# Snapshots older than this are not worth showing, even as stale data (seconds)
+DEFAULT_MAX_SNAPSHOT_AGE = 7 * 24 * 3600.0
+
+
+@dataclass(frozen=True)
+class LastSnapshot:
+    """Raw refresh data of one user at one point in time."""
+
+    username: str
+    saved_at: float  # time.time() when the data was saved
+    running_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    history_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    # (total_jobs, total_requeues, max_requeues) of the history
+    history_stats: tuple[int, int, int] = (0, 0, 0)
+    cluster_nodes: list[dict[str, str]] = field(default_factory=list)
+    all_users_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    fair_share_entries: list[tuple[str, ...]] = field(default_factory=list)
+    job_priority_entries: list[tuple[str, ...]] = field(default_factory=list)
+
+    def age(self, now: float | None = None) -> float:
+        """Return the age of the data in seconds.
+
+        Args:
+            now: Current ``time.time()`` (default: now).
+
+        Returns:
+            Seconds since the data was saved, never negative.
+        """
+        return max(0.0, (time.time() if now is None else now) - self.saved_at)
+
+
+def format_age(seconds: float) -> str:
+    """Format an age compactly, e.g. ``"45s"``, ``"12m"``, ``"3h 5m"`` or ``"2d 4h"``.
+
+    Args:
+        seconds: Age in seconds.
+
+    Returns:
+        The age with its two largest units.
+    """
+    total = int(seconds)
+    days, rest = divmod(total, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m"
+    return f"{secs}s"
+
+
+def _rows(value: object) -> list[tuple[str, ...]] | None:
+    if not isinstance(value, list):
+        return None
+    rows: list[tuple[str, ...]] = []
+    for row in value:
+        if not isinstance(row, list) or not all(isinstance(item, str) for item in row):
+            return None
+        rows.append(tuple(row))
+    return rows
+
+
+def _nodes(value: object) -> list[dict[str, str]] | None:
+    if not isinstance(value, list):
+        return None
+    nodes: list[dict[str, str]] = []
+    for node in value:
+        if not isinstance(node, dict) or not all(
+            isinstance(key, str) and isinstance(item, str) for key, item in node.items()
+        ):
+            return None
+        nodes.append(node)
+    return nodes
+
+
+def save_last_snapshot(path: Path, snapshot: LastSnapshot) -> bool:
+    """Write a snapshot atomically as gzip-compressed JSON.
+
+    Args:
+        path: Destination file.
+        snapshot: Data to persist.
+
+    Returns:
+        True if the snapshot was written.
+    """
+    payload = {
+        "version": _SNAPSHOT_FORMAT_VERSION,
+        "username": snapshot.username,
+        "saved_at": snapshot.saved_at,
+        "running_jobs": snapshot.running_jobs,
+        "history_jobs": snapshot.history_jobs,
+        "history_stats": list(snapshot.history_stats),
+        "cluster_nodes": snapshot.cluster_nodes,
+        "all_users_jobs": snapshot.all_users_jobs,
+        "fair_share_entries": snapshot.fair_share_entries,
+        "job_priority_entries": snapshot.job_priority_entries,
+    }
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Fastest compression level: the data is mostly repetitive job fields
+        tmp_path.write_bytes(gzip.compress(json.dumps(payload, separators=(",", ":")).encode(), compresslevel=1))
+        tmp_path.replace(path)
+    except OSError as exc:
+        logger.warning(f"Failed to save last snapshot to {path}: {exc}")
+        return False
+    logger.debug("Saved last snapshot to {}", path)
+    return True
+
+
+def _parse_snapshot(raw: dict[str, object], username: str) -> LastSnapshot | None:
+    saved_at = raw.get("saved_at")
+    history_stats = raw.get("history_stats")
+    rows = {
+        key: _rows(raw.get(key))
+        for key in ("running_jobs", "history_jobs", "all_users_jobs", "fair_share_entries", "job_priority_entries")
+    }
+    cluster_nodes = _nodes(raw.get("cluster_nodes"))
+    if (
+        not isinstance(saved_at, int | float)
+        or cluster_nodes is None
+        or any(value is None for value in rows.values())
+        or not isinstance(history_stats, list)
+        or len(history_stats) != _HISTORY_STATS_FIELDS
+        or not all(isinstance(value, int) for value in history_stats)
+    ):
+        return None
+    return LastSnapshot(
+        username=username,
+        saved_at=float(saved_at),
+        running_jobs=rows["running_jobs"] or [],
+        history_jobs=rows["history_jobs"] or [],
+        history_stats=(history_stats[0], history_stats[1], history_stats[2]),
+        cluster_nodes=cluster_nodes,
+        all_users_jobs=rows["all_users_jobs"] or [],
+        fair_share_entries=rows["fair_share_entries"] or [],
+        job_priority_entries=rows["job_priority_entries"] or [],
+    )
+
+
+def load_last_snapshot(path: Path, *, username: str, max_age: float = DEFAULT_MAX_SNAPSHOT_AGE) -> LastSnapshot | None:
+    """Load the snapshot saved by a previous session.
+
+    Args:
+        path: File written by :func:`save_last_snapshot`.
+        username: Current user; snapshots of other users are ignored.
+        max_age: Maximum age in seconds of a usable snapshot.
+
+    Returns:
+        The snapshot, or None if missing, unreadable, of another user or too old.
+    """
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(gzip.decompress(path.read_bytes()))
+    except (OSError, EOFError, ValueError) as exc:
+        logger.warning(f"Failed to read last snapshot {path}: {exc}")
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != _SNAPSHOT_FORMAT_VERSION:
+        logger.debug("Ignoring last snapshot {} with unknown format", path)
+        return None
+    if raw.get("username") != username:
+        return None
+
+    snapshot = _parse_snapshot(raw, username)
+    if snapshot is None:
+        logger.debug("Ignoring malformed last snapshot {}", path)
+    elif snapshot.age() > max_age:
+        logger.debug("Ignoring last snapshot {} older than {:.0f}s", path, max_age)
+        snapshot = None
+    else:
+        logger.debug("Loaded last snapshot from {} ({:.0f}s old)", path, snapshot.age())
+    return snapshot
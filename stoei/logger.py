@@ -1,14 +1,28 @@
 """Logging configuration using loguru.
 
 Logs are stored in the logs/ folder and kept for 1 week.
-Output goes to file only by default (to avoid interfering with TUI).
+Output goes to file only (to avoid interfering with TUI), once the entry
+point calls :func:`configure_logging`. Importing this module has no side
+effects beyond removing loguru's default stderr handler.
+
+Log lines are written to the file by a background thread, so a slow log
+directory (e.g. an NFS home) never blocks the UI or the SLURM workers.
+Messages below WARNING are rate limited per call site. Debug calls, and the
+calls made on every refresh cycle, pass their values as ``{}`` arguments
+instead of f-strings: loguru only formats them when a sink accepts the level.
 """
 
+import contextlib
+import gzip
 import os
+import queue
+import shutil
+import threading
+import time
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, TextIO
 
 from loguru import logger
 
@@ -54,13 +68,175 @@ class LoguruMessage(Protocol):
         ...
 
 
-# Remove default handler
+# Remove default handler (stderr would interfere with the TUI)
 logger.remove()
 
-# Define log directory (default ~/.local/share/stoei/logs, overridable via STOEI_LOG_DIR)
-_default_log_dir = Path.home() / ".local" / "share" / "stoei" / "logs"
-LOG_DIR = Path(os.environ.get("STOEI_LOG_DIR", str(_default_log_dir))).expanduser().resolve()
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+
+def get_log_dir() -> Path:
+    """Get the directory log files are written to.
+
+    Returns:
+        ``$STOEI_LOG_DIR`` if set, otherwise ``~/.local/share/stoei/logs``.
+    """
+    default_log_dir = Path.home() / ".local" / "share" / "stoei" / "logs"
+    return Path(os.environ.get("STOEI_LOG_DIR", str(default_log_dir))).expanduser().resolve()
+
+
+# Retention of log files (seconds) and the per-call-site budget of messages below WARNING
+_LOG_RETENTION = 7 * 24 * 3600.0
+# Earlier-day log files modified more recently than this (seconds) may still be
+# written by another session that has not rolled over yet, so they stay uncompressed
+_COMPRESS_MIN_AGE = 15 * 60.0
+_RATE_LIMIT_WINDOW = 10.0
+_RATE_LIMIT_MESSAGES = 50
+_WARNING_LEVEL_NO = 30
+_FLUSH_TIMEOUT = 5.0
+
+
+class _LogFileWriter:
+    """Append log lines to daily files from a background thread.
+
+    Callers only put the formatted line on a queue. The thread writes whatever
+    has accumulated in one batch, starts a new ``stoei_YYYY-MM-DD.log`` file
+    when the day changes, compresses the files of earlier days and deletes
+    files older than a week.
+    """
+
+    def __init__(self, log_dir: Path) -> None:
+        """Start the writer thread.
+
+        Args:
+            log_dir: Directory for the log files.
+        """
+        self.log_dir = log_dir
+        self._queue: queue.SimpleQueue[str | threading.Event | None] = queue.SimpleQueue()
+        self._file: TextIO | None = None
+        self._day: str | None = None
+        self._thread = threading.Thread(target=self._run, name="stoei-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queue a formatted log line.
+
+        Args:
+            message: Line including its terminating newline.
+        """
+        self._queue.put(message)
+
+    def flush(self, timeout: float = _FLUSH_TIMEOUT) -> None:
+        """Wait until the lines queued so far are written.
+
+        Args:
+            timeout: Maximum seconds to wait.
+        """
+        if self._thread.is_alive():
+            written = threading.Event()
+            self._queue.put(written)
+            written.wait(timeout)
+
+    def stop(self, timeout: float = _FLUSH_TIMEOUT) -> None:
+        """Write the queued lines, close the file and end the thread.
+
+        Args:
+            timeout: Maximum seconds to wait.
+        """
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    batch.append(self._queue.get_nowait())
+            lines = [item for item in batch if isinstance(item, str)]
+            if lines:
+                self._write(lines)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is None:
+                    running = False
+        if self._file is not None:
+            self._file.close()
+
+    def _write(self, lines: list[str]) -> None:
+        day = datetime.now().strftime("%Y-%m-%d")
+        try:
+            if self._file is None or day != self._day:
+                self._open(day)
+            if self._file is not None:
+                self._file.write("".join(lines))
+                self._file.flush()
+        except OSError:
+            # Nowhere left to report it; drop the lines rather than the thread
+            if self._file is not None:
+                with contextlib.suppress(OSError):
+                    self._file.close()
+            self._file = None
+
+    def _open(self, day: str) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._day = day
+        self._file = (self.log_dir / f"stoei_{day}.log").open("a", encoding="utf-8")
+        self._clean_up(day)
+
+    def _clean_up(self, day: str) -> None:
+        now = time.time()
+        cutoff = now - _LOG_RETENTION
+        for path in self.log_dir.glob("stoei_*.log*"):
+            with contextlib.suppress(OSError):
+                mtime = path.stat().st_mtime
+                if mtime < cutoff:
+                    path.unlink()
+                elif path.suffix == ".log" and path.name != f"stoei_{day}.log" and now - mtime >= _COMPRESS_MIN_AGE:
+                    with path.open("rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+                        shutil.copyfileobj(source, target)
+                    path.unlink()
+
+
+class _CallSiteRateLimit:
+    """Loguru filter that bounds the messages below WARNING per call site.
+
+    Each call site may log a fixed number of messages per time window. The
+    number of dropped messages is reported when the next window opens.
+    """
+
+    def __init__(self, writer: _LogFileWriter) -> None:
+        """Initialize the filter.
+
+        Args:
+            writer: File writer that receives the dropped-message notices.
+        """
+        self._writer = writer
+        self._lock = threading.Lock()
+        # (module, function, line) -> [window start, messages, dropped]
+        self._windows: dict[tuple[str, str, int], list[float]] = {}
+
+    def __call__(self, record: "loguru.Record") -> bool:
+        """Return whether the record is written."""
+        if record["level"].no >= _WARNING_LEVEL_NO:
+            return True
+        site = (record["name"] or "", record["function"], record["line"])
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(site, [now, 0, 0])
+            if now - window[0] >= _RATE_LIMIT_WINDOW:
+                if window[2]:
+                    self._writer.write(
+                        f"{record['time']:YYYY-MM-DD HH:mm:ss} | {'INFO': <8} | {site[0]}:{site[1]}:{site[2]} - "
+                        f"{window[2]:.0f} similar messages dropped by the rate limit\n"
+                    )
+                window[:] = [now, 0, 0]
+            if window[1] >= _RATE_LIMIT_MESSAGES:
+                window[2] += 1
+                return False
+            window[1] += 1
+            return True
 
 
 class _LoggingState:
@@ -71,23 +247,80 @@ class _LoggingState:
     """
 
     def __init__(self) -> None:
-        """Initialize logging state without stdout handler."""
+        """Initialize logging state without stdout or file handler."""
         self.stdout_handler_id: int | None = None
+        self.file_handler_id: int | None = None
+        self.file_writer: _LogFileWriter | None = None
+        self.file_level: str = "DEBUG"
 
 
 _state = _LoggingState()
 
-# Configure file handler with rotation and retention
-logger.add(
-    LOG_DIR / "stoei_{time:YYYY-MM-DD}.log",
-    level="DEBUG",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    rotation="00:00",  # New file at midnight
-    retention="1 week",  # Keep logs for 1 week
-    compression="gz",  # Compress old logs
-    backtrace=True,
-    diagnose=False,
-)
+
+def _add_file_handler(writer: _LogFileWriter, level: str) -> int:
+    return logger.add(
+        writer.write,
+        level=level,
+        format=_LOG_FORMAT,
+        filter=_CallSiteRateLimit(writer),
+        backtrace=True,
+        diagnose=False,
+    )
+
+
+def configure_logging(log_dir: Path | None = None, level: str = "DEBUG") -> Path:
+    """Create the log directory and add the daily rotating file handler.
+
+    Calling it again replaces the previous file handler.
+
+    Args:
+        log_dir: Directory for the log files (default: :func:`get_log_dir`).
+        level: Minimum level written to the file.
+
+    Returns:
+        The directory log files are written to.
+    """
+    if log_dir is None:
+        log_dir = get_log_dir()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    shutdown_logging()
+    _state.file_writer = _LogFileWriter(log_dir)
+    _state.file_level = level
+    _state.file_handler_id = _add_file_handler(_state.file_writer, level)
+    return log_dir
+
+
+def set_file_log_level(level: str) -> None:
+    """Change the minimum level written to the log file.
+
+    Messages below the lowest level of all handlers are dropped by loguru
+    before their arguments are formatted, so the default WARNING level keeps
+    debug calls nearly free.
+
+    Args:
+        level: New minimum level, e.g. ``"WARNING"``.
+    """
+    if _state.file_writer is None or _state.file_handler_id is None or level == _state.file_level:
+        return
+    logger.remove(_state.file_handler_id)
+    _state.file_level = level
+    _state.file_handler_id = _add_file_handler(_state.file_writer, level)
+
+
+def flush_logs() -> None:
+    """Wait until the queued log lines are written to the file."""
+    if _state.file_writer is not None:
+        _state.file_writer.flush()
+
+
+def shutdown_logging() -> None:
+    """Remove the file handler and write the queued log lines."""
+    if _state.file_handler_id is not None:
+        logger.remove(_state.file_handler_id)
+        _state.file_handler_id = None
+    if _state.file_writer is not None:
+        _state.file_writer.stop()
+        _state.file_writer = None
 
 
 def get_logger(name: str) -> "loguru.Logger":
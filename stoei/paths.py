@@ -0,0 +1,43 @@
+"""Per-user directories for configuration and caches.
+
+Kept free of heavy imports so the SLURM layer can use it during startup.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def get_config_dir() -> Path:
+    """Get the directory used for persistent configuration.
+
+    Returns:
+        Path to the configuration directory.
+    """
+    override_dir = os.environ.get("STOEI_CONFIG_DIR")
+    if override_dir:
+        return Path(override_dir).expanduser()
+
+    base_dir = os.environ.get("XDG_CONFIG_HOME")
+    if base_dir:
+        return Path(base_dir).expanduser() / "stoei"
+
+    return Path.home() / ".config" / "stoei"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory used for persistent caches.
+
+    Returns:
+        Path to the cache directory.
+    """
+    override_dir = os.environ.get("STOEI_CACHE_DIR")
+    if override_dir:
+        return Path(override_dir).expanduser()
+
+    base_dir = os.environ.get("XDG_CACHE_HOME")
+    if base_dir:
+        return Path(base_dir).expanduser() / "stoei"
+
+    return Path.home() / ".cache" / "stoei"
@@ -0,0 +1,399 @@
+"""Profiling mode: cProfile per thread plus a sampling profiler.
+
+A session is started by ``stoei --profile DIR`` or by sending the process
+SIGUSR1, and ends after the configured number of refresh cycles, on the next
+SIGUSR1 or when the app exits. The main thread is profiled continuously;
+worker threads are profiled around each unit of work wrapped by
+:func:`profiled`, so profilers are enabled and disabled on their own thread.
+From Python 3.12, cProfile runs on :mod:`sys.monitoring`, which allows one
+active profiler per process but sees every thread, so a single profiler
+covers the whole session and :func:`profiled` only runs the work. That
+profiler keeps a single call stack, so while threads overlap their calls
+interleave on it: call counts stay exact, but times and caller/callee links
+are unreliable. The per-thread costs in ``summary.txt`` are therefore also
+computed from the stack samples.
+A sampler thread additionally records the stacks of every thread, including
+threads started before the session.
+
+Each session writes to its own ``stoei-YYYYmmdd-HHMMSS`` directory:
+
+- ``<thread>.prof``: cProfile statistics, readable with :mod:`pstats` or snakeviz
+  (one ``all-threads.prof`` from Python 3.12)
+- ``<thread>.folded``: collapsed stacks for flamegraph.pl or speedscope
+- ``summary.txt``: the most expensive functions across all threads, and the
+  sampled cost of the busiest functions of each thread
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from types import FrameType
+from typing import ParamSpec, TypeVar
+
+from stoei.logger import get_log_dir, get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_SAMPLE_INTERVAL = 0.01
+_SUMMARY_LINES = 40
+_SAMPLED_LINES_PER_THREAD = 15
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]+")
+
+# One process-wide profiler (sys.monitoring) instead of one per thread
+_SHARED_PROFILER = sys.version_info >= (3, 12)
+_SHARED_PROFILE_NAME = "all-threads"
+
+
+def get_profile_dir() -> Path:
+    """Get the default directory for profiles started by SIGUSR1.
+
+    Returns:
+        Path next to the log directory.
+    """
+    return get_log_dir().parent / "profiles"
+
+
+@dataclass
+class _ProfileSettings:
+    """Where and for how long the next session profiles."""
+
+    directory: Path | None = None  # None: get_profile_dir()
+    cycles: int = 0  # Refresh cycles to profile; 0 profiles until stopped
+
+
+class _StatsSnapshot(cProfile.Profile):
+    """Statistics of a profiler that may still be running on another thread.
+
+    :class:`pstats.Stats` calls ``create_stats()``, which would disable the
+    profiler of the calling thread rather than the profiled one.
+    """
+
+    def __init__(self, profile: cProfile.Profile) -> None:
+        super().__init__()
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self) -> None:
+        """Keep the snapshot taken at construction."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class _StackSampler:
+    """Record the stack of every thread at a fixed interval."""
+
+    def __init__(self, interval: float = _SAMPLE_INTERVAL) -> None:
+        """Start the sampler thread.
+
+        Args:
+            interval: Seconds between samples.
+        """
+        self.interval = interval
+        self.samples: dict[str, Counter[str]] = {}
+        self.sample_count = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stoei-profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                labels: list[str] = []
+                current: FrameType | None = frame
+                while current is not None:
+                    labels.append(_frame_label(current))
+                    current = current.f_back
+                stack = ";".join(reversed(labels))
+                self.samples.setdefault(names.get(ident, f"thread-{ident}"), Counter())[stack] += 1
+            self.sample_count += 1
+
+
+def _sampled_costs(stacks: Counter[str]) -> list[tuple[str, int, int]]:
+    """Count the samples each function was running in, and on top of the stack.
+
+    Args:
+        stacks: Collapsed stacks of one thread and their sample counts.
+
+    Returns:
+        Tuples of (function, cumulative samples, own samples), most cumulative first.
+    """
+    cumulative: Counter[str] = Counter()
+    own: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        # Recursive functions count once per sample
+        for label in set(frames):
+            cumulative[label] += count
+    ranked = sorted(cumulative.items(), key=lambda item: (-item[1], item[0]))
+    return [(label, samples, own[label]) for label, samples in ranked]
+
+
+def _write_sampled_costs(summary: io.StringIO, samples: dict[str, Counter[str]], seconds_per_sample: float) -> None:
+    """Write the busiest functions of each sampled thread to the summary.
+
+    Args:
+        summary: Summary being written.
+        samples: Collapsed stacks per thread name.
+        seconds_per_sample: Wall time represented by one sample.
+    """
+    summary.write("\nSampled time per thread (cumulative / own seconds):\n")
+    by_total = sorted(samples.items(), key=lambda item: (-sum(item[1].values()), item[0]))
+    for thread_name, stacks in by_total:
+        summary.write(f"\n  {thread_name}\n")
+        for label, cumulative, own in _sampled_costs(stacks)[:_SAMPLED_LINES_PER_THREAD]:
+            summary.write(f"  {cumulative * seconds_per_sample:9.3f} {own * seconds_per_sample:9.3f}  {label}\n")
+
+
+class ProfileSession:
+    """One profiling run over the main thread and the profiled worker units."""
+
+    def __init__(self, directory: Path, cycles: int = 0, sample_interval: float = _SAMPLE_INTERVAL) -> None:
+        """Initialize the session without starting it.
+
+        Args:
+            directory: Parent directory of the session's output directory.
+            cycles: Refresh cycles after which the session ends (0: until stopped).
+            sample_interval: Seconds between stack samples.
+        """
+        self.cycles = cycles
+        self.completed_cycles = 0
+        self.output_dir = directory / f"stoei-{datetime.now():%Y%m%d-%H%M%S}"
+        self._sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self._profiles: list[tuple[str, cProfile.Profile]] = []
+        self._local = threading.local()
+        self._main_profile: cProfile.Profile | None = None
+        self._sampler: _StackSampler | None = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Start profiling the calling (main) thread and sampling all threads."""
+        self._started = time.perf_counter()
+        if _SHARED_PROFILER:
+            self._main_profile = cProfile.Profile()
+            self._profiles.append((_SHARED_PROFILE_NAME, self._main_profile))
+        else:
+            self._main_profile = self._thread_profile()
+            self._local.depth = 1
+        self._sampler = _StackSampler(self._sample_interval)
+        self._main_profile.enable()
+
+    def _thread_profile(self) -> cProfile.Profile:
+        profile: cProfile.Profile | None = getattr(self._local, "profile", None)
+        if profile is None:
+            profile = self._local.profile = cProfile.Profile()
+            self._local.depth = 0
+            with self._lock:
+                self._profiles.append((threading.current_thread().name, profile))
+        return profile
+
+    def run(self, work: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a unit of work with the calling thread's profiler enabled.
+
+        Args:
+            work: Callable to run.
+            *args: Positional arguments for ``work``.
+            **kwargs: Keyword arguments for ``work``.
+
+        Returns:
+            The result of ``work``.
+        """
+        if _SHARED_PROFILER:
+            # The session's profiler already sees this thread
+            return work(*args, **kwargs)
+        profile = self._thread_profile()
+        self._local.depth += 1
+        if self._local.depth > 1:
+            # Already profiled by an enclosing unit on this thread
+            try:
+                return work(*args, **kwargs)
+            finally:
+                self._local.depth -= 1
+        profile.enable()
+        try:
+            return work(*args, **kwargs)
+        finally:
+            profile.disable()
+            self._local.depth -= 1
+
+    def record_refresh_cycle(self) -> bool:
+        """Count a completed refresh cycle.
+
+        Returns:
+            True once the configured number of cycles has been profiled.
+        """
+        self.completed_cycles += 1
+        return 0 < self.cycles <= self.completed_cycles
+
+    def stop(self) -> Path:
+        """Stop profiling and write the profiles and the summary (main thread only).
+
+        Returns:
+            The directory the session was written to.
+        """
+        if self._main_profile is not None:
+            self._main_profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        duration = time.perf_counter() - self._started
+        with self._lock:
+            profiles = list(self._profiles)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        by_thread: dict[str, list[_StatsSnapshot]] = {}
+        for thread_name, profile in profiles:
+            snapshot = _StatsSnapshot(profile)
+            if snapshot.stats:
+                by_thread.setdefault(thread_name, []).append(snapshot)
+        thread_stats = [pstats.Stats(*snapshots) for snapshots in by_thread.values()]
+        for thread_name, stats in zip(by_thread, thread_stats, strict=True):
+            stats.dump_stats(self.output_dir / f"{_filename(thread_name)}.prof")
+
+        samples = self._sampler.samples if self._sampler is not None else {}
+        for thread_name, stacks in samples.items():
+            lines = [f"{stack} {count}\n" for stack, count in sorted(stacks.items())]
+            (self.output_dir / f"{_filename(thread_name)}.folded").write_text("".join(lines), encoding="utf-8")
+
+        sample_count = self._sampler.sample_count if self._sampler is not None else 0
+        header = (
+            f"stoei profile: {duration:.1f}s, {self.completed_cycles} refresh cycles, "
+            f"{len(by_thread)} profiled threads, {sample_count} stack samples\n"
+        )
+        summary = io.StringIO()
+        summary.write(header)
+        if _SHARED_PROFILER:
+            summary.write(
+                "\nNote: all threads share one cProfile call stack (Python 3.12+), so the cProfile times and\n"
+                "caller/callee links below are unreliable while threads overlap; call counts are exact.\n"
+                "See the sampled time per thread at the end for per-thread costs.\n"
+            )
+        if thread_stats:
+            stats = pstats.Stats(stream=summary).add(*thread_stats)
+            summary.write("\nAll profiled threads, by cumulative time:\n")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_SUMMARY_LINES)
+            summary.write("\nAll profiled threads, by own time:\n")
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(_SUMMARY_LINES)
+        if samples and sample_count:
+            # Sampling a stack takes time too, so samples are spread over the whole session
+            _write_sampled_costs(summary, samples, duration / sample_count)
+        (self.output_dir / "summary.txt").write_text(summary.getvalue(), encoding="utf-8")
+        logger.info(f"Profile written to {self.output_dir}: {header.strip()}")
+        return self.output_dir
+
+
+def _filename(thread_name: str) -> str:
+    return _UNSAFE_FILENAME_CHARS.sub("_", thread_name) or "thread"
+
+
+# Using lists as mutable containers so functions can update state without `global`.
+_settings = _ProfileSettings()
+_session: list[ProfileSession | None] = [None]
+
+
+def configure_profiling(directory: Path | None = None, cycles: int = 0) -> None:
+    """Set where and for how long later sessions profile.
+
+    Args:
+        directory: Parent directory for profiles (default: :func:`get_profile_dir`).
+        cycles: Refresh cycles per session; 0 profiles until stopped.
+    """
+    _settings.directory = directory
+    _settings.cycles = cycles
+
+
+def is_profiling() -> bool:
+    """Return whether a profiling session is running."""
+    return _session[0] is not None
+
+
+def start_profiling() -> ProfileSession:
+    """Start a session with the configured settings (main thread only).
+
+    Returns:
+        The running session (the existing one if already profiling).
+    """
+    session = _session[0]
+    if session is None:
+        session = ProfileSession(_settings.directory or get_profile_dir(), _settings.cycles)
+        session.start()
+        _session[0] = session
+        logger.info(f"Profiling started, writing to {session.output_dir}")
+    return session
+
+
+def stop_profiling() -> Path | None:
+    """Stop the running session and write its output (main thread only).
+
+    Returns:
+        The session's output directory, or None if nothing was profiling or
+        the output could not be written.
+    """
+    session = _session[0]
+    if session is None:
+        return None
+    _session[0] = None
+    try:
+        return session.stop()
+    except OSError as exc:
+        logger.warning(f"Failed to write profile to {session.output_dir}: {exc}")
+        return None
+
+
+def record_refresh_cycle() -> Path | None:
+    """Count a completed refresh cycle, ending the session after the configured number.
+
+    Returns:
+        The output directory if this cycle ended the session, else None.
+    """
+    session = _session[0]
+    if session is not None and session.record_refresh_cycle():
+        return stop_profiling()
+    return None
+
+
+def profiled(work: Callable[P, R]) -> Callable[P, R]:
+    """Wrap worker-thread work so it is profiled while a session is running.
+
+    Args:
+        work: Callable run on a worker thread.
+
+    Returns:
+        A wrapper that runs ``work`` directly when no session is running.
+    """
+
+    @wraps(work)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        session = _session[0]
+        if session is None:
+            return work(*args, **kwargs)
+        return session.run(work, *args, **kwargs)
+
+    return wrapper
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import json
-import os
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
 from stoei.keybindings import DEFAULT_PRESET, KeybindingConfig
 from stoei.logger import get_logger
+from stoei.paths import get_config_dir
 from stoei.themes import DEFAULT_THEME_NAME, THEME_LABELS
 
 logger = get_logger(__name__)
@@ -35,6 +35,11 @@ MIN_JOB_HISTORY_DAYS = 1
 MAX_JOB_HISTORY_DAYS = 90
 DEFAULT_JOB_HISTORY_DAYS = 7
 
+# Node details served from the node snapshot up to this age (in seconds)
+MIN_NODE_INFO_MAX_AGE = 0.0
+MAX_NODE_INFO_MAX_AGE = 3600.0
+DEFAULT_NODE_INFO_MAX_AGE = 60.0
+
 # Energy loading settings
 DEFAULT_ENERGY_HISTORY_MONTHS = 6
 
@@ -64,6 +69,10 @@ class Settings:
     column_widths: tuple[tuple[str, tuple[tuple[str, int], ...]], ...] = ()
     # Sidebar width as percentage of terminal width (default 33% = 1/3)
     sidebar_width_percent: int = DEFAULT_SIDEBAR_WIDTH_PERCENT
+    # Max age of the node snapshot before node details fall back to scontrol show node
+    node_info_max_age: float = DEFAULT_NODE_INFO_MAX_AGE
+    # Derive the user's active jobs from the all-users squeue snapshot instead of running squeue -u
+    derive_user_jobs: bool = True
 
     def get_keybindings(self) -> KeybindingConfig:
         """Get the keybinding configuration.
@@ -158,6 +167,18 @@ class Settings:
         ):
             sidebar_width_percent = DEFAULT_SIDEBAR_WIDTH_PERCENT
 
+        node_info_max_age = _coerce_float(data.get("node_info_max_age"))
+        if (
+            node_info_max_age is None
+            or node_info_max_age < MIN_NODE_INFO_MAX_AGE
+            or node_info_max_age > MAX_NODE_INFO_MAX_AGE
+        ):
+            node_info_max_age = DEFAULT_NODE_INFO_MAX_AGE
+
+        derive_user_jobs = _coerce_bool(data.get("derive_user_jobs"))
+        if derive_user_jobs is None:
+            derive_user_jobs = True
+
         return cls(
             theme=theme,
             log_level=log_level,
@@ -171,6 +192,8 @@ class Settings:
             energy_history_months=energy_history_months,
             column_widths=column_widths,
             sidebar_width_percent=sidebar_width_percent,
+            node_info_max_age=node_info_max_age,
+            derive_user_jobs=derive_user_jobs,
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -197,26 +220,11 @@ class Settings:
             "energy_history_months": self.energy_history_months,
             "column_widths": column_widths_dict,
             "sidebar_width_percent": self.sidebar_width_percent,
+            "node_info_max_age": self.node_info_max_age,
+            "derive_user_jobs": self.derive_user_jobs,
         }
 
 
-def get_config_dir() -> Path:
-    """Get the directory used for persistent configuration.
-
-    Returns:
-        Path to the configuration directory.
-    """
-    override_dir = os.environ.get("STOEI_CONFIG_DIR")
-    if override_dir:
-        return Path(override_dir).expanduser()
-
-    base_dir = os.environ.get("XDG_CONFIG_HOME")
-    if base_dir:
-        return Path(base_dir).expanduser() / "stoei"
-
-    return Path.home() / ".config" / "stoei"
-
-
 def get_settings_path() -> Path:
     """Get the full path to the settings file.
 
@@ -0,0 +1,250 @@
+"""Account hierarchy index with per-account rollups for the account info modal.
+
+``sshare -a`` lists associations depth-first, with account names indented by
+one space per level below ``root``. :func:`build_account_tree` turns those
+rows into an account tree (parent, children, account-level fair-share and
+member users). :func:`account_usage` aggregates the running/pending jobs and
+resources of one account's subtree from the job index, and
+:func:`rollup_account_priorities` the pending priorities of every account, so
+opening an account does not scan every sshare, squeue and sprio row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from stoei.slurm.gpu_parser import calculate_total_gpus
+from stoei.slurm.nodelist import get_node_registry
+from stoei.slurm.parser import parse_tres_resources
+
+# sshare format: (Account, User, RawShares, NormShares, RawUsage, NormUsage, EffectvUsage, FairShare)
+_MIN_SSHARE_FIELDS = 8
+# sprio format: (JOBID, USER, ACCOUNT, PRIORITY, AGE, FAIRSHARE, JOBSIZE, PARTITION, QOS)
+_MIN_SPRIO_FIELDS = 9
+# All-users squeue format: (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
+_MIN_JOB_FIELDS = 5
+_STATE_INDEX = 4
+_NODELIST_INDEX = 7
+_TRES_INDEX = 8
+
+
+@dataclass
+class AccountNode:
+    """One account of the sshare association tree."""
+
+    name: str
+    parent: str | None = None
+    children: list[str] = field(default_factory=list)
+    # Account-level fair-share info (raw_shares, norm_shares, ..., fair_share)
+    priority: dict[str, str] = field(default_factory=dict)
+    # Users associated directly with this account, with their fair-share info
+    users: list[dict[str, str]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ResourceTotals:
+    """Resources allocated to a set of running jobs."""
+
+    cpus: int = 0
+    memory_gb: float = 0.0
+    gpus: int = 0
+    nodes: int = 0
+
+
+@dataclass(frozen=True)
+class AccountUsage:
+    """Jobs and resources of an account's member users, including sub-accounts."""
+
+    running_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    pending_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    totals: ResourceTotals = field(default_factory=ResourceTotals)
+
+
+def _fair_share_fields(entry: tuple[str, ...]) -> dict[str, str]:
+    return {
+        "raw_shares": entry[2],
+        "norm_shares": entry[3],
+        "raw_usage": entry[4],
+        "norm_usage": entry[5],
+        "effective_usage": entry[6],
+        "fair_share": entry[7],
+    }
+
+
+def build_account_tree(entries: list[tuple[str, ...]]) -> dict[str, AccountNode]:
+    """Build the account tree from ``sshare -a`` rows.
+
+    Args:
+        entries: Parsed sshare rows, in sshare's depth-first order.
+
+    Returns:
+        Mapping of account name to its node. Accounts without indentation
+        (flat sshare output) have no parent.
+    """
+    tree: dict[str, AccountNode] = {}
+    # (indent, name) of the accounts on the path from the root to the current row
+    path: list[tuple[int, str]] = []
+
+    for entry in entries:
+        if len(entry) < _MIN_SSHARE_FIELDS:
+            continue
+        name = entry[0].strip()
+        if not name:
+            continue
+        node = tree.get(name)
+        if node is None:
+            node = tree[name] = AccountNode(name=name)
+
+        user = entry[1].strip()
+        if user:
+            node.users.append({"username": user, **_fair_share_fields(entry)})
+            continue
+
+        node.priority = _fair_share_fields(entry)
+        indent = len(entry[0]) - len(entry[0].lstrip())
+        while path and path[-1][0] >= indent:
+            path.pop()
+        if path and node.parent is None and path[-1][1] != name:
+            node.parent = path[-1][1]
+            tree[node.parent].children.append(name)
+        path.append((indent, name))
+
+    return tree
+
+
+def subtree_accounts(tree: dict[str, AccountNode], account: str) -> list[str]:
+    """Return an account and all of its descendants.
+
+    Args:
+        tree: Account tree from :func:`build_account_tree`.
+        account: Account name.
+
+    Returns:
+        Account names in depth-first order (empty if the account is unknown).
+    """
+    if account not in tree:
+        return []
+    accounts: list[str] = []
+    seen: set[str] = set()
+    stack = [account]
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        accounts.append(name)
+        stack.extend(reversed(tree[name].children))
+    return accounts
+
+
+def subtree_users(tree: dict[str, AccountNode], account: str) -> set[str]:
+    """Return the users associated with an account or any of its descendants.
+
+    Args:
+        tree: Account tree from :func:`build_account_tree`.
+        account: Account name.
+
+    Returns:
+        Set of usernames.
+    """
+    return {user["username"] for name in subtree_accounts(tree, account) for user in tree[name].users}
+
+
+def account_usage(
+    tree: dict[str, AccountNode],
+    account: str,
+    jobs_for_user: Callable[[str], list[tuple[str, ...]]],
+) -> AccountUsage:
+    """Aggregate the jobs and resources of an account's member users, including sub-accounts.
+
+    Only the users of the account's subtree are looked up, so opening an
+    account costs a few index lookups however large the cluster is.
+
+    Args:
+        tree: Account tree from :func:`build_account_tree`.
+        account: Account name.
+        jobs_for_user: Returns a user's all-users squeue job tuples
+            (e.g. :meth:`~stoei.slurm.job_index.JobIndex.jobs_for_user`).
+
+    Returns:
+        The account's usage (empty if the account is unknown).
+    """
+    registry = get_node_registry()
+    running_jobs: list[tuple[str, ...]] = []
+    pending_jobs: list[tuple[str, ...]] = []
+    cpus = gpus = node_bits = 0
+    memory_gb = 0.0
+    for user in sorted(subtree_users(tree, account)):
+        for job in jobs_for_user(user):
+            if len(job) < _MIN_JOB_FIELDS:
+                continue
+            state = job[_STATE_INDEX].strip().upper()
+            if state in ("PENDING", "PD"):
+                pending_jobs.append(job)
+            elif state in ("RUNNING", "R"):
+                running_jobs.append(job)
+                if len(job) > _TRES_INDEX:
+                    job_cpus, job_memory_gb, gpu_entries = parse_tres_resources(job[_TRES_INDEX].strip())
+                    cpus += job_cpus
+                    memory_gb += job_memory_gb
+                    gpus += calculate_total_gpus(gpu_entries)
+                    node_bits |= registry.bits(job[_NODELIST_INDEX])
+    return AccountUsage(
+        running_jobs=running_jobs,
+        pending_jobs=pending_jobs,
+        totals=ResourceTotals(cpus=cpus, memory_gb=memory_gb, gpus=gpus, nodes=node_bits.bit_count()),
+    )
+
+
+def rollup_account_priorities(
+    tree: dict[str, AccountNode], entries: list[tuple[str, ...]]
+) -> dict[str, list[dict[str, str]]]:
+    """Collect the pending job priorities of every account.
+
+    A job belongs to an account when it is charged to the account or one of
+    its sub-accounts, or when its user is a member of that subtree.
+
+    Args:
+        tree: Account tree from :func:`build_account_tree`.
+        entries: Parsed sprio rows.
+
+    Returns:
+        Mapping of account name to its pending job priority rows, in sprio order.
+        Accounts missing from the tree only get the jobs charged to them.
+    """
+    by_account: dict[str, list[int]] = {}
+    by_user: dict[str, list[int]] = {}
+    rows: list[dict[str, str]] = []
+    for entry in entries:
+        if len(entry) < _MIN_SPRIO_FIELDS:
+            continue
+        by_account.setdefault(entry[2].strip(), []).append(len(rows))
+        by_user.setdefault(entry[1].strip(), []).append(len(rows))
+        rows.append(
+            {
+                "job_id": entry[0],
+                "user": entry[1],
+                "account": entry[2],
+                "priority": entry[3],
+                "age": entry[4],
+                "fair_share": entry[5],
+                "job_size": entry[6],
+                "partition": entry[7],
+                "qos": entry[8],
+            }
+        )
+
+    priorities: dict[str, list[dict[str, str]]] = {}
+    for account in tree:
+        row_ids: set[int] = set()
+        for name in subtree_accounts(tree, account):
+            row_ids.update(by_account.get(name, ()))
+        for user in subtree_users(tree, account):
+            row_ids.update(by_user.get(user, ()))
+        priorities[account] = [rows[row_id] for row_id in sorted(row_ids)]
+    # Accounts only seen in sprio still get their own jobs
+    for account, row_ids_list in by_account.items():
+        if account not in priorities:
+            priorities[account] = [rows[row_id] for row_id in row_ids_list]
+    return priorities
@@ -50,9 +50,13 @@ class JobState(Enum):
     OTHER = "OTHER"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Job:
-    """Unified job representation combining squeue and sacct data."""
+    """Unified job representation combining squeue and sacct data.
+
+    Jobs are immutable so the cached job tuple can be shared with readers
+    without copying.
+    """
 
     job_id: str
     name: str
@@ -129,7 +133,7 @@ class JobCache:
             return
         self._initialized = True
         self._data_lock = Lock()
-        self._jobs: list[Job] = []
+        self._jobs: tuple[Job, ...] = ()
         self._jobs_by_id: dict[str, Job] = {}  # O(1) lookup index
         self._total_jobs: int = 0
         self._total_requeues: int = 0
@@ -242,7 +246,7 @@ class JobCache:
 
         # Update cache atomically
         with self._data_lock:
-            self._jobs = jobs
+            self._jobs = tuple(jobs)
             self._jobs_by_id = jobs_by_id
             self._total_jobs = total_jobs
             self._total_requeues = total_requeues
@@ -250,13 +254,16 @@ class JobCache:
             self._running_count = running_count
             self._pending_count = pending_count
 
-        logger.debug(f"Cache built: {len(jobs)} jobs ({running_count} running, {pending_count} pending)")
+        logger.debug("Cache built: {} jobs ({} running, {} pending)", len(jobs), running_count, pending_count)
 
     @property
-    def jobs(self) -> list[Job]:
-        """Get cached jobs (thread-safe copy)."""
-        with self._data_lock:
-            return list(self._jobs)
+    def jobs(self) -> tuple[Job, ...]:
+        """Get cached jobs.
+
+        The tuple is replaced wholesale on refresh and never mutated, so it is
+        returned without copying or locking.
+        """
+        return self._jobs
 
     @property
     def running_count(self) -> int:
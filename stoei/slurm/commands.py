@@ -1,11 +1,17 @@
 """SLURM command execution."""
 
+import functools
+import operator
 import subprocess
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from typing import overload
 
 from stoei.logger import get_logger
+from stoei.slurm.environment import get_executable, get_slurm_environment, get_username, record_squeue_delimited
+from stoei.slurm.fingerprint import UNCHANGED, OutputFingerprints, Unchanged
 from stoei.slurm.formatters import format_job_info, format_node_info, format_sacct_job_info
 from stoei.slurm.parser import (
     parse_sacct_job_output,
@@ -14,12 +20,10 @@ from stoei.slurm.parser import (
     parse_scontrol_output,
     parse_squeue_output,
 )
-from stoei.slurm.validation import (
-    ValidationError,
-    get_current_username,
-    resolve_executable,
-    validate_job_id,
-)
+from stoei.slurm.resilience import SingleFlight
+from stoei.slurm.validation import ValidationError, validate_job_id
+from stoei.telemetry import COMMAND, PARSE, get_telemetry
+from stoei.tracing import RETRY, SUBPROCESS, span
 
 # Default retry configuration
 DEFAULT_MAX_RETRIES = 3
@@ -105,27 +109,84 @@ SACCT_JOB_FIELDS = [
 ]
 
 
+_CommandOutcome = tuple[subprocess.CompletedProcess[str] | None, str | None]
+
+# Identical commands in flight at the same time (prefetch workers, modals, periodic
+# and manual refreshes) share one subprocess and its retries instead of each
+# hitting slurmctld/slurmdbd.
+_command_flight: SingleFlight[_CommandOutcome] = SingleFlight()
+
+# Seconds an interactive lookup (user modal, node details) reuses a successful result
+_INTERACTIVE_MEMO_TTL = 5.0
+
+
+def _command_succeeded(outcome: _CommandOutcome) -> bool:
+    result, error = outcome
+    return error is None and result is not None and result.returncode == 0
+
+
+def clear_command_memo() -> None:
+    """Forget memoized command results, so the next lookups hit SLURM again."""
+    _command_flight.clear()
+
+
+def command_flight_counters() -> tuple[int, int]:
+    """Return how many command calls were served without a new subprocess.
+
+    Returns:
+        Tuple of (calls that joined an identical command in flight, calls
+        answered from the interactive memo).
+    """
+    return _command_flight.coalesced, _command_flight.memo_hits
+
+
 def _run_subprocess_command(
-    command: list[str], timeout: int, command_name: str
+    command: list[str], timeout: int, command_name: str, *, memo_ttl: float = 0.0
 ) -> tuple[subprocess.CompletedProcess[str] | None, str | None]:
     """Run a subprocess command and handle common errors.
 
+    Identical commands running concurrently share a single subprocess.
+
     Args:
         command: The command to run.
         timeout: Command timeout in seconds.
         command_name: Name of the command for error messages.
+        memo_ttl: Seconds a successful result is reused by identical commands (0 disables).
 
     Returns:
         Tuple of (result, optional error message). Result is None on error.
     """
+    return _command_flight.do(
+        ("run", *command),
+        lambda: _execute_subprocess_command(command, timeout, command_name),
+        ttl=memo_ttl,
+        memoize=_command_succeeded,
+    )
+
+
+def _execute_subprocess_command(
+    command: list[str], timeout: int, command_name: str
+) -> tuple[subprocess.CompletedProcess[str] | None, str | None]:
+    """Run a subprocess command once, mapping common errors to messages.
+
+    Args:
+        command: The command to run.
+        timeout: Command timeout in seconds.
+        command_name: Name of the command for error messages.
+
+    Returns:
+        Tuple of (result, optional error message). Result is None on error.
+    """
+    started = time.perf_counter()
     try:
-        result = subprocess.run(  # noqa: S603
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
+        with span(command_name, SUBPROCESS):
+            result = subprocess.run(  # noqa: S603
+                command,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
     except FileNotFoundError:
         logger.exception(f"{command_name} not found")
         return None, f"{command_name} not found"
@@ -136,6 +197,10 @@ def _run_subprocess_command(
         logger.exception(f"Error running {command_name}")
         return None, f"Error running {command_name}"
     else:
+        # SLURM output is ASCII, so its length in characters is its size in bytes
+        get_telemetry().record(
+            COMMAND, command_name, time.perf_counter() - started, output_bytes=len(result.stdout or "")
+        )
         return result, None
 
 
@@ -146,9 +211,14 @@ def _run_with_retry(  # noqa: PLR0913
     max_retries: int = DEFAULT_MAX_RETRIES,
     backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     initial_delay: float = DEFAULT_INITIAL_DELAY,
+    *,
+    memo_ttl: float = 0.0,
 ) -> tuple[subprocess.CompletedProcess[str] | None, str | None]:
     """Run a subprocess command with exponential backoff retry.
 
+    Identical commands running concurrently share one retry loop and its
+    result, whatever retry settings each caller asked for.
+
     Args:
         command: The command to run.
         timeout: Command timeout in seconds.
@@ -156,6 +226,44 @@ def _run_with_retry(  # noqa: PLR0913
         max_retries: Maximum number of retry attempts (default: 3).
         backoff_factor: Factor to multiply delay by after each retry (default: 1.5).
         initial_delay: Initial delay in seconds before first retry (default: 0.5).
+        memo_ttl: Seconds a successful result is reused by identical commands (0 disables).
+
+    Returns:
+        Tuple of (result, optional error message). Result is None on error.
+    """
+    return _command_flight.do(
+        ("retry", *command),
+        lambda: _retry_command(
+            command,
+            timeout,
+            command_name,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            initial_delay=initial_delay,
+        ),
+        ttl=memo_ttl,
+        memoize=_command_succeeded,
+    )
+
+
+def _retry_command(  # noqa: PLR0913
+    command: list[str],
+    timeout: int,
+    command_name: str,
+    *,
+    max_retries: int,
+    backoff_factor: float,
+    initial_delay: float,
+) -> tuple[subprocess.CompletedProcess[str] | None, str | None]:
+    """Run a subprocess command, retrying transient failures with exponential backoff.
+
+    Args:
+        command: The command to run.
+        timeout: Command timeout in seconds.
+        command_name: Name of the command for error messages.
+        max_retries: Maximum number of retry attempts.
+        backoff_factor: Factor to multiply delay by after each retry.
+        initial_delay: Initial delay in seconds before first retry.
 
     Returns:
         Tuple of (result, optional error message). Result is None on error.
@@ -164,11 +272,12 @@ def _run_with_retry(  # noqa: PLR0913
     delay = initial_delay
 
     for attempt in range(max_retries + 1):
-        result, error = _run_subprocess_command(command, timeout, command_name)
+        with span(f"{command_name} attempt {attempt + 1}", RETRY):
+            result, error = _run_subprocess_command(command, timeout, command_name)
 
         if result is not None and result.returncode == 0:
             if attempt > 0:
-                logger.debug(f"{command_name} succeeded on attempt {attempt + 1}")
+                logger.debug("{} succeeded on attempt {}", command_name, attempt + 1)
             return result, None
 
         # Check if error is retryable (from _run_subprocess_command)
@@ -181,7 +290,7 @@ def _run_with_retry(  # noqa: PLR0913
             stderr_lower = (result.stderr or "").lower()
             if "connection refused" in stderr_lower:
                 msg = f"{command_name} failed: connection refused"
-                logger.debug(f"{command_name}: non-retryable stderr error, skipping retries")
+                logger.debug("{}: non-retryable stderr error, skipping retries", command_name)
                 return result, msg
 
         last_error = (
@@ -189,14 +298,45 @@ def _run_with_retry(  # noqa: PLR0913
         )
 
         if attempt < max_retries:
-            logger.debug(f"{command_name} failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay:.1f}s")
-            time.sleep(delay)
+            logger.debug(
+                "{} failed (attempt {}/{}), retrying in {:.1f}s", command_name, attempt + 1, max_retries + 1, delay
+            )
+            with span(f"{command_name} backoff", RETRY, delay=delay):
+                time.sleep(delay)
             delay *= backoff_factor
 
-    logger.warning(f"{command_name} failed after {max_retries + 1} attempts: {last_error}")
+    logger.warning("{} failed after {} attempts: {}", command_name, max_retries + 1, last_error)
     return None, last_error
 
 
+def _output_unchanged(
+    fingerprints: OutputFingerprints | None,
+    key: str,
+    result: subprocess.CompletedProcess[str] | None,
+    error: str | None,
+) -> bool:
+    """Check a command result against the caller's output fingerprints.
+
+    Failed runs forget the fingerprint, so the next successful output is
+    always treated as new.
+
+    Args:
+        fingerprints: Caller's fingerprint registry, or None to disable the check.
+        key: Command key identifying the output source.
+        result: Result from :func:`_run_with_retry`.
+        error: Error message from :func:`_run_with_retry`.
+
+    Returns:
+        True if the command succeeded with exactly the same stdout as last time.
+    """
+    if fingerprints is None:
+        return False
+    if error or result is None or result.returncode != 0:
+        fingerprints.forget(key)
+        return False
+    return fingerprints.unchanged(key, result.stdout)
+
+
 def _run_scontrol_for_job(job_id: str) -> tuple[str, str | None]:
     """Run scontrol show jobid and return raw output.
 
@@ -211,9 +351,9 @@ def _run_scontrol_for_job(job_id: str) -> tuple[str, str | None]:
     except ValidationError as exc:
         return "", str(exc)
 
-    scontrol = resolve_executable("scontrol")
+    scontrol = get_executable("scontrol")
     command = [scontrol, "show", "jobid", job_id]
-    logger.debug(f"Running command: {' '.join(command)}")
+    logger.debug("Running command: {}", " ".join(command))
 
     result, error = _run_subprocess_command(command, timeout=10, command_name="scontrol")
     if error or result is None:
@@ -247,7 +387,7 @@ def _run_sacct_for_job(job_id: str) -> tuple[str, str | None]:
     except ValidationError as exc:
         return "", str(exc)
 
-    sacct = resolve_executable("sacct")
+    sacct = get_executable("sacct")
     format_str = ",".join(SACCT_JOB_FIELDS)
     command = [
         sacct,
@@ -257,7 +397,7 @@ def _run_sacct_for_job(job_id: str) -> tuple[str, str | None]:
         "-P",  # Parseable output with | delimiter
         "--noheader",
     ]
-    logger.debug(f"Running sacct command: {' '.join(command)}")
+    logger.debug("Running sacct command: {}", " ".join(command))
 
     result, error = _run_subprocess_command(command, timeout=10, command_name="sacct")
     if error or result is None:
@@ -294,7 +434,7 @@ def get_job_info(job_id: str) -> tuple[str, str | None]:
         return format_job_info(raw_output), None
 
     # Fall back to sacct for completed jobs
-    logger.debug(f"scontrol failed for {job_id}, trying sacct: {scontrol_error}")
+    logger.debug("scontrol failed for {}, trying sacct: {}", job_id, scontrol_error)
     raw_output, sacct_error = _run_sacct_for_job(job_id)
     if not sacct_error:
         parsed = parse_sacct_job_output(raw_output, SACCT_JOB_FIELDS)
@@ -327,7 +467,7 @@ def get_job_info_parsed(job_id: str) -> tuple[dict[str, str], str | None]:
         return parsed, None
 
     # Fall back to sacct
-    logger.debug(f"scontrol failed for {job_id}, trying sacct")
+    logger.debug("scontrol failed for {}, trying sacct", job_id)
     raw_output, sacct_error = _run_sacct_for_job(job_id)
     if not sacct_error:
         parsed = parse_sacct_job_output(raw_output, SACCT_JOB_FIELDS)
@@ -409,11 +549,13 @@ def get_job_log_paths(job_id: str) -> tuple[str | None, str | None, str | None]:
     else:
         stderr = None
 
-    logger.debug(f"Log paths for job {job_id}: stdout={stdout}, stderr={stderr}")
+    logger.debug("Log paths for job {}: stdout={}, stderr={}", job_id, stdout, stderr)
     return stdout, stderr, None
 
 
-def get_job_info_and_log_paths(job_id: str) -> tuple[str, str | None, str | None, str | None]:
+def get_job_info_and_log_paths(
+    job_id: str, *, states: dict[str, str] | None = None
+) -> tuple[str, str | None, str | None, str | None]:
     """Get formatted job info and log paths in a single fetch.
 
     Combines get_job_info() and get_job_log_paths() to avoid redundant
@@ -421,6 +563,8 @@ def get_job_info_and_log_paths(job_id: str) -> tuple[str, str | None, str | None
 
     Args:
         job_id: The SLURM job ID to query.
+        states: Optional mapping that receives the job state of the fetched
+            scontrol/sacct record, keyed by ``job_id``.
 
     Returns:
         Tuple of (formatted_info, error, stdout_path, stderr_path).
@@ -437,17 +581,19 @@ def get_job_info_and_log_paths(job_id: str) -> tuple[str, str | None, str | None
         formatted = format_job_info(raw_output)
         # Parse the same raw output for log paths (avoids second scontrol call)
         parsed = parse_scontrol_output(raw_output)
+        _record_state(states, job_id, parsed.get("JobState"))
         stdout, stderr = _extract_log_paths(parsed, job_id)
         return formatted, None, stdout, stderr
 
     # Fall back to sacct for completed jobs
-    logger.debug(f"scontrol failed for {job_id}, trying sacct: {scontrol_error}")
+    logger.debug("scontrol failed for {}, trying sacct: {}", job_id, scontrol_error)
     raw_output, sacct_error = _run_sacct_for_job(job_id)
     if not sacct_error:
         parsed = parse_sacct_job_output(raw_output, SACCT_JOB_FIELDS)
         if parsed:
             logger.info(f"Successfully retrieved info for job {job_id} via sacct")
             formatted = format_sacct_job_info(parsed)
+            _record_state(states, job_id, parsed.get("State"))
             stdout, stderr = _extract_log_paths(parsed, job_id)
             return formatted, None, stdout, stderr
         return "", "Could not parse sacct output", None, None
@@ -457,6 +603,18 @@ def get_job_info_and_log_paths(job_id: str) -> tuple[str, str | None, str | None
     return "", f"Job not found. scontrol: {scontrol_error}", None, None
 
 
+def _record_state(states: dict[str, str] | None, job_id: str, state: str | None) -> None:
+    """Store the state of a fetched job record, if requested.
+
+    Args:
+        states: Mapping receiving the state, or None.
+        job_id: Requested job ID.
+        state: State from the scontrol/sacct record.
+    """
+    if states is not None and state:
+        states[job_id] = state.strip()
+
+
 def _extract_log_paths(parsed: dict[str, str], job_id: str) -> tuple[str | None, str | None]:
     """Extract and expand log paths from parsed job info.
 
@@ -484,24 +642,207 @@ def _extract_log_paths(parsed: dict[str, str], job_id: str) -> tuple[str | None,
     else:
         stderr = None
 
-    logger.debug(f"Log paths for job {job_id}: stdout={stdout}, stderr={stderr}")
+    logger.debug("Log paths for job {}: stdout={}, stderr={}", job_id, stdout, stderr)
     return stdout, stderr
 
 
-def get_running_jobs(*, max_retries: int = DEFAULT_MAX_RETRIES) -> tuple[list[tuple[str, ...]], str | None]:
+def _scontrol_job_keys(parsed: dict[str, str]) -> list[str]:
+    """Return the job IDs a parsed scontrol job record can be looked up by.
+
+    Args:
+        parsed: Parsed ``scontrol show job`` record.
+
+    Returns:
+        The plain JobId and, for array tasks, the ``<ArrayJobId>_<ArrayTaskId>`` form.
+    """
+    keys = [parsed["JobId"]] if parsed.get("JobId") else []
+    array_job_id = parsed.get("ArrayJobId")
+    array_task_id = parsed.get("ArrayTaskId")
+    if array_job_id and array_task_id:
+        # Pending array remainders ("1-99%10") are shown under the base array job ID
+        keys.append(f"{array_job_id}_{array_task_id}" if array_task_id.isdigit() else array_job_id)
+    return keys
+
+
+def _scontrol_field(line: str, key: str) -> str:
+    """Return one field of a one-line scontrol record without parsing the whole line.
+
+    Args:
+        line: One ``scontrol show ... -o`` record.
+        key: Field name, e.g. ``"JobId"``.
+
+    Returns:
+        The field value, or an empty string if the record has no such field.
+    """
+    marker = f"{key}="
+    if line.startswith(marker):
+        start = len(marker)
+    else:
+        index = line.find(f" {marker}")
+        if index < 0:
+            return ""
+        start = index + 1 + len(marker)
+    end = line.find(" ", start)
+    return line[start:] if end < 0 else line[start:end]
+
+
+def _run_scontrol_for_jobs(job_ids: set[str]) -> dict[str, str]:
+    """Run ``scontrol show job -o`` once and keep the records of the requested jobs.
+
+    The output lists every job on the cluster, so only records whose JobId or
+    ArrayJobId was requested are parsed.
+
+    Args:
+        job_ids: Job IDs to keep.
+
+    Returns:
+        Mapping of requested job ID to its one-line scontrol record.
+    """
+    scontrol = get_executable("scontrol")
+    command = [scontrol, "show", "job", "-o"]
+    logger.debug("Running command: {}", " ".join(command))
+
+    result, error = _run_subprocess_command(command, timeout=15, command_name="scontrol")
+    if error or result is None:
+        logger.warning(f"Batched scontrol failed: {error or 'Unknown error'}")
+        return {}
+    if result.returncode != 0:
+        logger.warning(f"Batched scontrol returned error: {result.stderr.strip()}")
+        return {}
+
+    # Array tasks are requested as "<ArrayJobId>_<ArrayTaskId>", pending remainders by ArrayJobId
+    array_job_ids = {job_id.split("_", 1)[0] for job_id in job_ids}
+    records: dict[str, str] = {}
+    for raw_line in result.stdout.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if _scontrol_field(line, "JobId") not in job_ids and _scontrol_field(line, "ArrayJobId") not in array_job_ids:
+            continue
+        for key in _scontrol_job_keys(parse_scontrol_output(line)):
+            if key in job_ids:
+                records[key] = line
+    return records
+
+
+def _run_sacct_for_jobs(job_ids: list[str]) -> dict[str, str]:
+    """Run ``sacct -j id1,id2,...`` once and group its lines by job.
+
+    Args:
+        job_ids: Job IDs to query.
+
+    Returns:
+        Mapping of job ID to its raw sacct lines (the job and its steps).
+    """
+    if not _sacct_is_available():
+        logger.debug("Skipping batched sacct: slurmdbd unavailable (in cooldown)")
+        return {}
+
+    sacct = get_executable("sacct")
+    format_str = ",".join(SACCT_JOB_FIELDS)
+    command = [
+        sacct,
+        "-j",
+        ",".join(job_ids),
+        f"--format={format_str}",
+        "-P",  # Parseable output with | delimiter
+        "--noheader",
+    ]
+    logger.debug("Running batched sacct for {} jobs", len(job_ids))
+
+    result, error = _run_subprocess_command(command, timeout=15, command_name="sacct")
+    if error or result is None:
+        logger.warning(f"Batched sacct failed: {error or 'Unknown error'}")
+        return {}
+    if result.returncode != 0:
+        logger.warning(f"Batched sacct returned error: {result.stderr.strip()}")
+        return {}
+
+    wanted = set(job_ids)
+    lines_by_job: dict[str, list[str]] = {}
+    for line in result.stdout.splitlines():
+        # Step lines ("12345.batch") belong to their job
+        job_id = line.split("|", 1)[0].split(".", 1)[0]
+        if job_id in wanted:
+            lines_by_job.setdefault(job_id, []).append(line)
+    return {job_id: "\n".join(lines) for job_id, lines in lines_by_job.items()}
+
+
+def get_jobs_info_and_log_paths(
+    job_ids: list[str], *, states: dict[str, str] | None = None
+) -> dict[str, tuple[str, str | None, str | None, str | None]]:
+    """Get formatted job info and log paths for several jobs with at most two commands.
+
+    Active jobs come from a single ``scontrol show job -o`` call; jobs it does
+    not list are looked up with a single ``sacct -j id1,id2,...`` call.
+
+    Args:
+        job_ids: SLURM job IDs to query. Invalid IDs are skipped.
+        states: Optional mapping that receives the job state of each fetched
+            scontrol/sacct record, by job ID.
+
+    Returns:
+        Mapping of job ID to (formatted_info, error, stdout_path, stderr_path),
+        the same shape as :func:`get_job_info_and_log_paths`. Jobs found by
+        neither command are omitted so callers can fetch them individually.
+    """
+    valid_ids: list[str] = []
+    for job_id in dict.fromkeys(job_ids):
+        try:
+            validate_job_id(job_id)
+        except ValidationError:
+            logger.debug("Skipping invalid job ID in batch: {!r}", job_id)
+            continue
+        valid_ids.append(job_id)
+    if not valid_ids:
+        return {}
+
+    results: dict[str, tuple[str, str | None, str | None, str | None]] = {}
+    for job_id, raw_output in _run_scontrol_for_jobs(set(valid_ids)).items():
+        parsed = parse_scontrol_output(raw_output)
+        _record_state(states, job_id, parsed.get("JobState"))
+        stdout, stderr = _extract_log_paths(parsed, job_id)
+        results[job_id] = (format_job_info(raw_output), None, stdout, stderr)
+
+    finished_ids = [job_id for job_id in valid_ids if job_id not in results]
+    if finished_ids:
+        for job_id, raw_output in _run_sacct_for_jobs(finished_ids).items():
+            parsed = parse_sacct_job_output(raw_output, SACCT_JOB_FIELDS)
+            if parsed:
+                _record_state(states, job_id, parsed.get("State"))
+                stdout, stderr = _extract_log_paths(parsed, job_id)
+                results[job_id] = (format_sacct_job_info(parsed), None, stdout, stderr)
+
+    logger.debug("Batched job info: {}/{} jobs found", len(results), len(valid_ids))
+    return results
+
+
+@overload
+def get_running_jobs(
+    *, max_retries: int = ..., fingerprints: None = None
+) -> tuple[list[tuple[str, ...]], str | None]: ...
+@overload
+def get_running_jobs(
+    *, max_retries: int = ..., fingerprints: OutputFingerprints
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]: ...
+def get_running_jobs(
+    *, max_retries: int = DEFAULT_MAX_RETRIES, fingerprints: OutputFingerprints | None = None
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]:
     """Return running/pending jobs from squeue.
 
     Uses retry logic with exponential backoff for transient failures.
 
     Args:
         max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES).
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned instead of parsed jobs.
 
     Returns:
         Tuple of (List of tuples containing job information, optional error message).
     """
     try:
-        username = get_current_username()
-        squeue = resolve_executable("squeue")
+        username = get_username()
+        squeue = get_executable("squeue")
     except (FileNotFoundError, ValidationError):
         logger.exception("Error setting up squeue command")
         return [], "Error setting up squeue"
@@ -513,24 +854,35 @@ def get_running_jobs(*, max_retries: int = DEFAULT_MAX_RETRIES) -> tuple[list[tu
         "-o",
         "%.30i|%.50j|%.8T|%.10M|%.4D|%.12R|%.19V|%.19S",
     ]
-    logger.debug(f"Running squeue command for user {username}")
+    logger.debug("Running squeue command for user {}", username)
 
     result, error = _run_with_retry(command, timeout=5, command_name="squeue", max_retries=max_retries)
+    if _output_unchanged(fingerprints, "squeue-user", result, error):
+        return UNCHANGED, None
     if error or result is None:
         return [], error or "Unknown error"
 
     if result.returncode != 0:
-        logger.warning(f"squeue returned non-zero exit code: {result.returncode}")
+        logger.warning("squeue returned non-zero exit code: {}", result.returncode)
         return [], f"squeue error: {result.stderr}"
 
-    jobs = parse_squeue_output(result.stdout)
-    logger.debug(f"Found {len(jobs)} running/pending jobs")
+    with get_telemetry().timed(PARSE, "squeue"):
+        jobs = parse_squeue_output(result.stdout)
+    logger.debug("Found {} running/pending jobs", len(jobs))
     return jobs, None
 
 
+@overload
+def get_job_history(
+    days: int = ..., *, max_retries: int = ..., fingerprints: None = None
+) -> tuple[list[tuple[str, ...]], int, int, int, str | None]: ...
+@overload
+def get_job_history(
+    days: int = ..., *, max_retries: int = ..., fingerprints: OutputFingerprints
+) -> tuple[list[tuple[str, ...]] | Unchanged, int, int, int, str | None]: ...
 def get_job_history(
-    days: int = 7, *, max_retries: int = DEFAULT_MAX_RETRIES
-) -> tuple[list[tuple[str, ...]], int, int, int, str | None]:
+    days: int = 7, *, max_retries: int = DEFAULT_MAX_RETRIES, fingerprints: OutputFingerprints | None = None
+) -> tuple[list[tuple[str, ...]] | Unchanged, int, int, int, str | None]:
     """Return job history for the last N days (sacct).
 
     Uses retry logic with exponential backoff for transient failures.
@@ -539,6 +891,8 @@ def get_job_history(
     Args:
         days: Number of days to look back for job history (default: 7).
         max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES).
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned (with zeroed counts) instead of parsed jobs.
 
     Returns:
         Tuple of (jobs list, total jobs count, total requeues, max requeues, optional error message).
@@ -548,8 +902,8 @@ def get_job_history(
         return [], 0, 0, 0, "sacct unavailable: connection refused (will retry automatically)"
 
     try:
-        username = get_current_username()
-        sacct = resolve_executable("sacct")
+        username = get_username()
+        sacct = get_executable("sacct")
     except (FileNotFoundError, ValidationError):
         logger.exception("Error setting up sacct command")
         return [], 0, 0, 0, "Error setting up sacct"
@@ -564,21 +918,25 @@ def get_job_history(
         "-X",
         "-P",
     ]
-    logger.debug(f"Running sacct command for user {username} (last {days} days)")
+    logger.debug("Running sacct command for user {} (last {} days)", username, days)
 
     result, error = _run_with_retry(command, timeout=10, command_name="sacct", max_retries=max_retries)
+    if _output_unchanged(fingerprints, f"sacct-history-{days}", result, error):
+        _sacct_mark_success()
+        return UNCHANGED, 0, 0, 0, None
     if error or result is None:
         if error and "connection refused" in error.lower():
             _sacct_mark_failure()
         return [], 0, 0, 0, error or "Unknown error"
 
     if result.returncode != 0:
-        logger.warning(f"sacct returned non-zero exit code: {result.returncode}")
+        logger.warning("sacct returned non-zero exit code: {}", result.returncode)
         return [], 0, 0, 0, f"sacct error: {result.stderr}"
 
     _sacct_mark_success()
-    jobs, total_jobs, total_requeues, max_requeues = parse_sacct_output(result.stdout)
-    logger.debug(f"Found {total_jobs} jobs in history (last {days} days) with {total_requeues} total requeues")
+    with get_telemetry().timed(PARSE, "sacct"):
+        jobs, total_jobs, total_requeues, max_requeues = parse_sacct_output(result.stdout)
+    logger.debug("Found {} jobs in history (last {} days) with {} total requeues", total_jobs, days, total_requeues)
     return jobs, total_jobs, total_requeues, max_requeues, None
 
 
@@ -597,9 +955,9 @@ def cancel_job(job_id: str) -> tuple[bool, str | None]:
         return False, str(exc)
 
     try:
-        scancel = resolve_executable("scancel")
+        scancel = get_executable("scancel")
         command = [scancel, job_id]
-        logger.debug(f"Running command: {' '.join(command)}")
+        logger.debug("Running command: {}", " ".join(command))
 
         result = subprocess.run(  # noqa: S603
             command,
@@ -624,27 +982,41 @@ def cancel_job(job_id: str) -> tuple[bool, str | None]:
         return False, f"scancel error: {error_msg}"
 
     logger.info(f"Successfully cancelled job {job_id}")
+    # Memoized squeue/scontrol output no longer reflects the cancelled job
+    clear_command_memo()
     return True, None
 
 
-def get_cluster_nodes() -> tuple[list[dict[str, str]], str | None]:
+@overload
+def get_cluster_nodes(*, fingerprints: None = None) -> tuple[list[dict[str, str]], str | None]: ...
+@overload
+def get_cluster_nodes(*, fingerprints: OutputFingerprints) -> tuple[list[dict[str, str]] | Unchanged, str | None]: ...
+def get_cluster_nodes(
+    *, fingerprints: OutputFingerprints | None = None
+) -> tuple[list[dict[str, str]] | Unchanged, str | None]:
     """Get information about all cluster nodes.
 
     Uses retry logic with exponential backoff for transient failures.
 
+    Args:
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned instead of parsed nodes.
+
     Returns:
         Tuple of (list of node info dictionaries, optional error message).
     """
     try:
-        scontrol = resolve_executable("scontrol")
+        scontrol = get_executable("scontrol")
     except (FileNotFoundError, ValidationError):
         logger.exception("scontrol not found")
         return [], "scontrol not found"
 
     command = [scontrol, "show", "nodes"]
-    logger.debug(f"Running command: {' '.join(command)}")
+    logger.debug("Running command: {}", " ".join(command))
 
     result, error = _run_with_retry(command, timeout=15, command_name="scontrol show nodes")
+    if _output_unchanged(fingerprints, "scontrol-nodes", result, error):
+        return UNCHANGED, None
     if error or result is None:
         return [], error or "Unknown error"
 
@@ -657,8 +1029,9 @@ def get_cluster_nodes() -> tuple[list[dict[str, str]], str | None]:
     if not raw_output:
         return [], "No node information available"
 
-    nodes = parse_scontrol_nodes_output(raw_output)
-    logger.debug(f"Found {len(nodes)} cluster nodes")
+    with get_telemetry().timed(PARSE, "scontrol nodes"):
+        nodes = parse_scontrol_nodes_output(raw_output)
+    logger.debug("Found {} cluster nodes", len(nodes))
     return nodes, None
 
 
@@ -672,11 +1045,13 @@ def get_node_info(node_name: str) -> tuple[str, str | None]:
         Tuple of (formatted node info, optional error message).
     """
     try:
-        scontrol = resolve_executable("scontrol")
+        scontrol = get_executable("scontrol")
         command = [scontrol, "show", "node", node_name]
-        logger.debug(f"Running command: {' '.join(command)}")
+        logger.debug("Running command: {}", " ".join(command))
 
-        result, error = _run_subprocess_command(command, timeout=10, command_name="scontrol")
+        result, error = _run_subprocess_command(
+            command, timeout=10, command_name="scontrol", memo_ttl=_INTERACTIVE_MEMO_TTL
+        )
         if error or result is None:
             return "", error or "Unknown error"
 
@@ -697,134 +1072,309 @@ def get_node_info(node_name: str) -> tuple[str, str | None]:
         return "", f"Error: {exc}"
 
 
-# Fixed-width column positions for squeue -O format (all users, includes UserName)
-# Must match format string in get_all_running_jobs():
-#   "JobID:30,Name:50,UserName:15,Partition:15,StateCompact:10,TimeUsed:12,NumNodes:6,NodeList:80,tres:80"
-_SQUEUE_ALL_COL_JOBID_END = 30
-_SQUEUE_ALL_COL_NAME_END = 80
-_SQUEUE_ALL_COL_USER_END = 95
-_SQUEUE_ALL_COL_PARTITION_END = 110
-_SQUEUE_ALL_COL_STATE_END = 120
-_SQUEUE_ALL_COL_TIME_END = 132
-_SQUEUE_ALL_COL_NODES_END = 138
-_SQUEUE_ALL_COL_NODELIST_END = 218
-
-# Fixed-width column positions for squeue -O format (single user, no UserName)
-# Must match format string in get_user_jobs():
-#   "JobID:30,Name:50,Partition:15,StateCompact:10,TimeUsed:12,NumNodes:6,NodeList:80,tres:80"
-_SQUEUE_USER_COL_JOBID_END = 30
-_SQUEUE_USER_COL_NAME_END = 80
-_SQUEUE_USER_COL_PARTITION_END = 95
-_SQUEUE_USER_COL_STATE_END = 105
-_SQUEUE_USER_COL_TIME_END = 117
-_SQUEUE_USER_COL_NODES_END = 123
-_SQUEUE_USER_COL_NODELIST_END = 203
-
-
-def _parse_fixed_width_squeue_line(line: str) -> tuple[str, ...] | None:
-    """Parse a fixed-width squeue output line into a tuple.
+# squeue -O field types with the column widths used by the fixed-width fallback
+_SQUEUE_FIELD_WIDTHS: dict[str, int] = {
+    "JobID": 30,
+    "Name": 50,
+    "UserName": 15,
+    "Partition": 15,
+    "StateCompact": 10,
+    "TimeUsed": 12,
+    "NumNodes": 6,
+    "NodeList": 80,
+    "tres": 80,
+    "Reason": 30,
+    "SubmitTime": 20,
+    "StartTime": 20,
+}
+# Field order of the job tuples returned by get_all_running_jobs() and get_user_jobs()
+_SQUEUE_ALL_FIELDS = (
+    "JobID",
+    "Name",
+    "UserName",
+    "Partition",
+    "StateCompact",
+    "TimeUsed",
+    "NumNodes",
+    "NodeList",
+    "tres",
+)
+_SQUEUE_USER_FIELDS = ("JobID", "Name", "Partition", "StateCompact", "TimeUsed", "NumNodes", "NodeList", "tres")
+# Fields of the user's job list that the all-users snapshot lacks, returned by get_job_schedule_fields()
+_SQUEUE_SCHEDULE_FIELDS = ("JobID", "Reason", "SubmitTime", "StartTime")
+# "Field:|" asks squeue for the unpadded value followed by this suffix
+_SQUEUE_DELIMITER = "|"
+
+
+def _squeue_query_order(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the order in which squeue prints the fields.
+
+    Name is the only free-text field and may contain the delimiter, so it is
+    queried last and absorbs everything after the other fields.
 
     Args:
-        line: Single line from squeue -O output.
+        fields: Field types in job tuple order.
 
     Returns:
-        Tuple of (job_id, name, user, partition, state, time_used, num_nodes, node_list, tres) or None.
+        Field types in output order.
     """
-    if len(line) < _SQUEUE_ALL_COL_JOBID_END:
-        return None
+    if "Name" not in fields:
+        return fields
+    return (*(field for field in fields if field != "Name"), "Name")
 
-    job_id = line[0:_SQUEUE_ALL_COL_JOBID_END].strip()
-    if not job_id:
-        return None
 
-    name = (
-        line[_SQUEUE_ALL_COL_JOBID_END:_SQUEUE_ALL_COL_NAME_END].strip()
-        if len(line) > _SQUEUE_ALL_COL_JOBID_END
-        else ""
-    )
-    user = (
-        line[_SQUEUE_ALL_COL_NAME_END:_SQUEUE_ALL_COL_USER_END].strip() if len(line) > _SQUEUE_ALL_COL_NAME_END else ""
-    )
-    partition = (
-        line[_SQUEUE_ALL_COL_USER_END:_SQUEUE_ALL_COL_PARTITION_END].strip()
-        if len(line) > _SQUEUE_ALL_COL_USER_END
-        else ""
-    )
-    state = (
-        line[_SQUEUE_ALL_COL_PARTITION_END:_SQUEUE_ALL_COL_STATE_END].strip()
-        if len(line) > _SQUEUE_ALL_COL_PARTITION_END
-        else ""
-    )
-    time_used = (
-        line[_SQUEUE_ALL_COL_STATE_END:_SQUEUE_ALL_COL_TIME_END].strip()
-        if len(line) > _SQUEUE_ALL_COL_STATE_END
-        else ""
-    )
-    num_nodes = (
-        line[_SQUEUE_ALL_COL_TIME_END:_SQUEUE_ALL_COL_NODES_END].strip() if len(line) > _SQUEUE_ALL_COL_TIME_END else ""
-    )
-    node_list = (
-        line[_SQUEUE_ALL_COL_NODES_END:_SQUEUE_ALL_COL_NODELIST_END].strip()
-        if len(line) > _SQUEUE_ALL_COL_NODES_END
-        else ""
-    )
-    tres = line[_SQUEUE_ALL_COL_NODELIST_END:].strip() if len(line) > _SQUEUE_ALL_COL_NODELIST_END else ""
+@functools.cache
+def _squeue_picker(fields: tuple[str, ...]) -> Callable[[list[str]], tuple[str, ...]]:
+    """Return a function reordering squeue output columns into job tuple order.
 
-    return (job_id, name, user, partition, state, time_used, num_nodes, node_list, tres)
+    Args:
+        fields: Field types in job tuple order (at least two).
+
+    Returns:
+        An ``itemgetter`` over the output columns.
+    """
+    order = _squeue_query_order(fields)
+    return operator.itemgetter(*(order.index(field) for field in fields))
+
+
+@functools.cache
+def _squeue_fixed_width_slices(fields: tuple[str, ...]) -> tuple[slice, ...]:
+    """Return the fixed-width fallback column of each field, in job tuple order.
+
+    Args:
+        fields: Field types in job tuple order.
 
+    Returns:
+        One slice per field; the last output column runs to the end of the line.
+    """
+    order = _squeue_query_order(fields)
+    columns: dict[str, slice] = {}
+    start = 0
+    for index, field in enumerate(order):
+        end = None if index == len(order) - 1 else start + _SQUEUE_FIELD_WIDTHS[field]
+        columns[field] = slice(start, end)
+        start = end or 0
+    return tuple(columns[field] for field in fields)
+
+
+def _squeue_format(fields: tuple[str, ...], *, delimited: bool) -> str:
+    """Build the ``squeue -O`` format string for the given fields.
 
-def get_all_running_jobs() -> tuple[list[tuple[str, ...]], str | None]:
-    """Return all RUNNING and PENDING jobs from squeue (all users) - single command, no loops.
+    Args:
+        fields: Field types in job tuple order.
+        delimited: Whether to request delimiter-separated instead of fixed-width columns.
+
+    Returns:
+        The format string, e.g. ``"JobID:|,NodeList:|,Name:|"``.
+    """
+    if delimited:
+        return ",".join(f"{field}:{_SQUEUE_DELIMITER}" for field in _squeue_query_order(fields))
+    return ",".join(f"{field}:{_SQUEUE_FIELD_WIDTHS[field]}" for field in _squeue_query_order(fields))
 
-    Uses squeue's -O format with Tres field to get all data in one call.
-    Fetches both RUNNING and PENDING jobs so queued jobs are included.
+
+def _parse_squeue_output(stdout: str, fields: tuple[str, ...], *, delimited: bool) -> list[tuple[str, ...]]:
+    """Parse ``squeue -O`` output built with :func:`_squeue_format`.
+
+    Args:
+        stdout: squeue output, one job per line.
+        fields: Field types in job tuple order.
+        delimited: Whether the output uses delimiter-separated columns.
+
+    Returns:
+        Job tuples with the field values in ``fields`` order. Lines without a
+        job ID or with too few columns are skipped.
+    """
+    jobs: list[tuple[str, ...]] = []
+    if delimited:
+        count = len(fields)
+        pick = _squeue_picker(fields)
+        padded: bool | None = None
+        for line in stdout.splitlines():
+            parts = line.split(_SQUEUE_DELIMITER, count - 1)
+            if len(parts) < count:
+                continue
+            parts[-1] = parts[-1].rstrip().removesuffix(_SQUEUE_DELIMITER)
+            if padded is None:
+                # Unpadded values need no stripping; some Slurm versions pad suffixed fields anyway
+                padded = parts[0] != parts[0].strip()
+            job = tuple(map(str.strip, pick(parts))) if padded else pick(parts)
+            if job[0]:
+                jobs.append(job)
+    else:
+        columns = _squeue_fixed_width_slices(fields)
+        for line in stdout.splitlines():
+            job = tuple(line[column].strip() for column in columns)
+            if job[0]:
+                jobs.append(job)
+    return jobs
+
+
+def _is_delimited_output(stdout: str, fields: tuple[str, ...]) -> bool:
+    """Check whether squeue honoured the field suffixes of a delimited query.
+
+    Args:
+        stdout: squeue output.
+        fields: Field types of the query.
+
+    Returns:
+        True if the first job line carries one delimiter per field (or there are no jobs).
+    """
+    for line in stdout.splitlines():
+        if line.strip():
+            return line.count(_SQUEUE_DELIMITER) >= len(fields)
+    return True
+
+
+def _run_squeue_fields(
+    arguments: list[str],
+    fields: tuple[str, ...],
+    *,
+    timeout: int,
+    command_name: str,
+    memo_ttl: float = 0.0,
+) -> tuple[subprocess.CompletedProcess[str] | None, str | None, bool]:
+    """Run an ``squeue -O`` query for the given fields.
+
+    Delimiter-separated columns are requested first. If squeue prints them
+    without the delimiters (Slurm versions that ignore field suffixes), the
+    query is repeated with fixed-width columns, which are then used for the
+    rest of the session.
+
+    Args:
+        arguments: squeue command without the ``-O`` option.
+        fields: Field types in job tuple order.
+        timeout: Command timeout in seconds.
+        command_name: Name of the command for error messages.
+        memo_ttl: Seconds a successful result is reused by identical commands (0 disables).
+
+    Returns:
+        Tuple of (result, optional error message, whether the output is delimited).
+    """
+    delimited = get_slurm_environment().squeue_delimited
+    command = [*arguments, "-O", _squeue_format(fields, delimited=delimited)]
+    result, error = _run_with_retry(command, timeout=timeout, command_name=command_name, memo_ttl=memo_ttl)
+    if (
+        delimited
+        and not error
+        and result is not None
+        and result.returncode == 0
+        and not _is_delimited_output(result.stdout, fields)
+    ):
+        logger.warning("squeue ignored -O field suffixes, falling back to fixed-width columns")
+        record_squeue_delimited(delimited=False)
+        delimited = False
+        command = [*arguments, "-O", _squeue_format(fields, delimited=False)]
+        result, error = _run_with_retry(command, timeout=timeout, command_name=command_name, memo_ttl=memo_ttl)
+    return result, error, delimited
+
+
+@overload
+def get_all_running_jobs(*, fingerprints: None = None) -> tuple[list[tuple[str, ...]], str | None]: ...
+@overload
+def get_all_running_jobs(
+    *, fingerprints: OutputFingerprints
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]: ...
+def get_all_running_jobs(
+    *, fingerprints: OutputFingerprints | None = None
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]:
+    """Return all active jobs from squeue (all users) - single command, no loops.
+
+    Uses squeue's -O format with Tres field to get all data in one call, with
+    delimiter-separated columns so lines carry no padding.
+    Fetches every state squeue lists by default (PENDING, RUNNING, COMPLETING,
+    CONFIGURING, SUSPENDED, ...), the same jobs as :func:`get_running_jobs`
+    shows for the current user, so the user's jobs can be derived from it.
     Uses retry logic with exponential backoff for transient failures.
 
+    Args:
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned instead of parsed jobs.
+
     Returns:
         Tuple of (List of tuples containing job information, optional error message).
     """
     try:
-        squeue = resolve_executable("squeue")
+        squeue = get_executable("squeue")
     except FileNotFoundError:
         logger.exception("Error setting up squeue command")
         return [], "squeue not found"
 
-    # Use -O format which supports Tres field directly
-    # This eliminates the need for per-job scontrol calls
-    # Column widths must match _SQUEUE_ALL_COL_* constants
-    command = [
+    # -O supports the Tres field directly, which avoids per-job scontrol calls
+    arguments = [
         squeue,
-        "-O",
-        "JobID:30,Name:50,UserName:15,Partition:15,StateCompact:10,TimeUsed:12,NumNodes:6,NodeList:80,tres:80",
         "-a",  # Show all partitions
-        "-t",
-        "RUNNING,PENDING",
         "--noheader",
     ]
-    logger.debug("Running squeue command for all active jobs (running+pending) (single command)")
+    logger.debug("Running squeue command for all active jobs (single command)")
 
-    result, error = _run_with_retry(command, timeout=15, command_name="squeue")
+    result, error, delimited = _run_squeue_fields(arguments, _SQUEUE_ALL_FIELDS, timeout=15, command_name="squeue")
+    if _output_unchanged(fingerprints, "squeue-all", result, error):
+        return UNCHANGED, None
     if error or result is None:
         return [], error or "Unknown error"
 
     if result.returncode != 0:
-        logger.warning(f"squeue returned non-zero exit code: {result.returncode}")
+        logger.warning("squeue returned non-zero exit code: {}", result.returncode)
         return [], f"squeue error: {result.stderr}"
 
-    # Parse fixed-width format output from -O option
-    jobs: list[tuple[str, ...]] = []
-    lines = result.stdout.strip().split("\n")
+    with get_telemetry().timed(PARSE, "squeue all users"):
+        jobs = _parse_squeue_output(result.stdout, _SQUEUE_ALL_FIELDS, delimited=delimited)
 
-    for line in lines:
-        if not line.strip():
+    logger.debug("Found {} active jobs (all users) with TRES in single command", len(jobs))
+    return jobs, None
+
+
+def get_job_schedule_fields(job_ids: list[str]) -> tuple[dict[str, tuple[str, ...]], str | None]:
+    """Return the pending reason, submit time and start time of active jobs.
+
+    These are the fields the user's job list needs beyond the all-users
+    snapshot of :func:`get_all_running_jobs`. All jobs are queried with a
+    single ``squeue -j`` call; array job ranges are queried by their parent ID.
+
+    Args:
+        job_ids: Job IDs as listed by squeue (e.g. ``"123"``, ``"123_4"``, ``"123_[5-9]"``).
+
+    Returns:
+        Tuple of (mapping of job ID to (Reason, SubmitTime, StartTime), optional error message).
+        Jobs that ended since the snapshot are omitted.
+    """
+    query_ids: list[str] = []
+    for job_id in job_ids:
+        query_id = job_id.split("_", 1)[0] if "[" in job_id else job_id
+        try:
+            validate_job_id(query_id)
+        except ValidationError:
+            logger.debug("Skipping invalid job ID in schedule query: {!r}", job_id)
             continue
+        query_ids.append(query_id)
+    if not query_ids:
+        return {}, None
 
-        parsed = _parse_fixed_width_squeue_line(line)
-        if parsed:
-            jobs.append(parsed)
+    try:
+        squeue = get_executable("squeue")
+    except FileNotFoundError:
+        logger.exception("squeue not found")
+        return {}, "squeue not found"
 
-    logger.debug(f"Found {len(jobs)} active jobs (all users) with TRES in single command")
-    return jobs, None
+    arguments = [squeue, "-j", ",".join(dict.fromkeys(query_ids)), "--noheader"]
+    logger.debug("Running squeue command for schedule fields of {} jobs", len(query_ids))
+
+    result, error, delimited = _run_squeue_fields(
+        arguments, _SQUEUE_SCHEDULE_FIELDS, timeout=10, command_name="squeue jobs"
+    )
+    if error or result is None:
+        return {}, error or "Unknown error"
+
+    if result.returncode != 0:
+        # squeue fails instead of printing nothing when every requested job has ended
+        if "invalid job id" in result.stderr.lower():
+            return {}, None
+        logger.warning("squeue returned non-zero exit code: {}", result.returncode)
+        return {}, f"squeue error: {result.stderr}"
+
+    with get_telemetry().timed(PARSE, "squeue schedule fields"):
+        jobs = _parse_squeue_output(result.stdout, _SQUEUE_SCHEDULE_FIELDS, delimited=delimited)
+    return {job[0]: job[1:] for job in jobs}, None
 
 
 def get_all_users_jobs() -> tuple[list[tuple[str, ...]], str | None]:
@@ -877,83 +1427,35 @@ def get_user_jobs(username: str) -> tuple[list[tuple[str, ...]], str | None]:
     username = username.strip()
 
     try:
-        squeue = resolve_executable("squeue")
+        squeue = get_executable("squeue")
     except FileNotFoundError:
         logger.exception("squeue not found")
         return [], "squeue not found"
 
-    # Use -O format which supports Tres field directly
-    # Column widths must match _SQUEUE_USER_COL_* constants
-    command = [
+    arguments = [
         squeue,
         "-u",
         username,
-        "-O",
-        "JobID:30,Name:50,Partition:15,StateCompact:10,TimeUsed:12,NumNodes:6,NodeList:80,tres:80",
         "-t",
         "RUNNING,PENDING",
         "--noheader",
     ]
-    logger.debug(f"Running squeue command for user {username}")
+    logger.debug("Running squeue command for user {}", username)
 
-    result, error = _run_with_retry(command, timeout=10, command_name="squeue user")
+    result, error, delimited = _run_squeue_fields(
+        arguments, _SQUEUE_USER_FIELDS, timeout=10, command_name="squeue user", memo_ttl=_INTERACTIVE_MEMO_TTL
+    )
     if error or result is None:
         return [], error or "Unknown error"
 
     if result.returncode != 0:
-        logger.warning(f"squeue returned non-zero exit code: {result.returncode}")
+        logger.warning("squeue returned non-zero exit code: {}", result.returncode)
         return [], f"squeue error: {result.stderr}"
 
-    # Parse fixed-width format output
-    jobs: list[tuple[str, ...]] = []
-    lines = result.stdout.strip().split("\n")
-
-    for line in lines:
-        if not line.strip():
-            continue
-
-        if len(line) < _SQUEUE_USER_COL_JOBID_END:
-            continue
-
-        job_id = line[0:_SQUEUE_USER_COL_JOBID_END].strip()
-        if not job_id:
-            continue
-
-        name = (
-            line[_SQUEUE_USER_COL_JOBID_END:_SQUEUE_USER_COL_NAME_END].strip()
-            if len(line) > _SQUEUE_USER_COL_JOBID_END
-            else ""
-        )
-        partition = (
-            line[_SQUEUE_USER_COL_NAME_END:_SQUEUE_USER_COL_PARTITION_END].strip()
-            if len(line) > _SQUEUE_USER_COL_NAME_END
-            else ""
-        )
-        state = (
-            line[_SQUEUE_USER_COL_PARTITION_END:_SQUEUE_USER_COL_STATE_END].strip()
-            if len(line) > _SQUEUE_USER_COL_PARTITION_END
-            else ""
-        )
-        time_used = (
-            line[_SQUEUE_USER_COL_STATE_END:_SQUEUE_USER_COL_TIME_END].strip()
-            if len(line) > _SQUEUE_USER_COL_STATE_END
-            else ""
-        )
-        num_nodes = (
-            line[_SQUEUE_USER_COL_TIME_END:_SQUEUE_USER_COL_NODES_END].strip()
-            if len(line) > _SQUEUE_USER_COL_TIME_END
-            else ""
-        )
-        node_list = (
-            line[_SQUEUE_USER_COL_NODES_END:_SQUEUE_USER_COL_NODELIST_END].strip()
-            if len(line) > _SQUEUE_USER_COL_NODES_END
-            else ""
-        )
-        tres = line[_SQUEUE_USER_COL_NODELIST_END:].strip() if len(line) > _SQUEUE_USER_COL_NODELIST_END else ""
-
-        jobs.append((job_id, name, partition, state, time_used, num_nodes, node_list, tres))
+    with get_telemetry().timed(PARSE, "squeue user"):
+        jobs = _parse_squeue_output(result.stdout, _SQUEUE_USER_FIELDS, delimited=delimited)
 
-    logger.debug(f"Found {len(jobs)} jobs for user {username}")
+    logger.debug("Found {} jobs for user {}", len(jobs), username)
     return jobs, None
 
 
@@ -1001,7 +1503,7 @@ def get_energy_job_history(months: int = 6) -> tuple[list[tuple[str, ...]], str
         return [], "sacct unavailable: connection refused (will retry automatically)"
 
     try:
-        sacct = resolve_executable("sacct")
+        sacct = get_executable("sacct")
     except FileNotFoundError:
         logger.exception("sacct not found")
         return [], "sacct not found"
@@ -1025,7 +1527,7 @@ def get_energy_job_history(months: int = 6) -> tuple[list[tuple[str, ...]], str
         "-P",  # Parseable output with | delimiter
         "--noheader",
     ]
-    logger.debug(f"Running sacct command for {months}-month energy history (since {start_date_str})")
+    logger.debug("Running sacct command for {}-month energy history (since {})", months, start_date_str)
 
     # Use longer timeout for potentially large query, with retry
     result, error = _run_with_retry(command, timeout=60, command_name="sacct energy")
@@ -1036,7 +1538,7 @@ def get_energy_job_history(months: int = 6) -> tuple[list[tuple[str, ...]], str
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() or "Unknown error"
-        logger.warning(f"sacct returned non-zero exit code: {result.returncode}, error: {error_msg}")
+        logger.warning("sacct returned non-zero exit code: {}, error: {}", result.returncode, error_msg)
         return [], f"sacct error: {error_msg}"
 
     # Parse pipe-delimited output
@@ -1076,7 +1578,13 @@ SSHARE_FIELDS = ["Account", "User", "RawShares", "NormShares", "RawUsage", "Norm
 SPRIO_FIELDS = ["JOBID", "USER", "ACCOUNT", "PRIORITY", "AGE", "FAIRSHARE", "JOBSIZE", "PARTITION", "QOS"]
 
 
-def get_wait_time_job_history(hours: int = 1) -> tuple[list[tuple[str, ...]], str | None]:
+def get_wait_time_job_history(
+    hours: int = 1,
+    since: datetime | None = None,
+    *,
+    until: datetime | None = None,
+    timeout: int = 30,
+) -> tuple[list[tuple[str, ...]], str | None]:
     """Get job history for all users with submit/start times from the last N hours.
 
     Uses sacct with --allusers to fetch jobs that started within the time window.
@@ -1085,6 +1593,11 @@ def get_wait_time_job_history(hours: int = 1) -> tuple[list[tuple[str, ...]], st
 
     Args:
         hours: Number of hours to look back (default: 1).
+        since: Absolute start of the window. When given, takes precedence over
+            ``hours`` so callers can fetch only jobs since their last query.
+        until: Optional end of the window (``-E``), used by the one-off backfill
+            of the longer windows.
+        timeout: Timeout of the sacct command in seconds.
 
     Returns:
         Tuple of (jobs list, optional error message).
@@ -1095,26 +1608,29 @@ def get_wait_time_job_history(hours: int = 1) -> tuple[list[tuple[str, ...]], st
         return [], "sacct unavailable: connection refused (will retry automatically)"
 
     try:
-        sacct = resolve_executable("sacct")
+        sacct = get_executable("sacct")
     except FileNotFoundError:
         logger.exception("sacct not found")
         return [], "sacct not found"
 
     format_str = ",".join(WAIT_TIME_FIELDS)
+    start_arg = since.strftime("%Y-%m-%dT%H:%M:%S") if since is not None else f"now-{hours}hours"
 
     command = [
         sacct,
         "--allusers",
         f"--format={format_str}",
         "-S",
-        f"now-{hours}hours",
+        start_arg,
         "-X",  # No job steps, only main job entries
         "-P",  # Parseable output with | delimiter
         "--noheader",
     ]
-    logger.debug(f"Running sacct command for {hours}-hour wait time history")
+    if until is not None:
+        command.extend(["-E", until.strftime("%Y-%m-%dT%H:%M:%S")])
+    logger.debug("Running sacct command for wait time history since {}", start_arg)
 
-    result, error = _run_with_retry(command, timeout=30, command_name="sacct wait-time")
+    result, error = _run_with_retry(command, timeout=timeout, command_name="sacct wait-time")
     if error or result is None:
         if error and "connection refused" in error.lower():
             _sacct_mark_failure()
@@ -1122,7 +1638,7 @@ def get_wait_time_job_history(hours: int = 1) -> tuple[list[tuple[str, ...]], st
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() or "Unknown error"
-        logger.warning(f"sacct returned non-zero exit code: {result.returncode}, error: {error_msg}")
+        logger.warning("sacct returned non-zero exit code: {}, error: {}", result.returncode, error_msg)
         return [], f"sacct error: {error_msg}"
 
     # Parse pipe-delimited output
@@ -1145,13 +1661,23 @@ def get_wait_time_job_history(hours: int = 1) -> tuple[list[tuple[str, ...]], st
                 jobs.append(tuple(parts[: len(WAIT_TIME_FIELDS)]))
 
     _sacct_mark_success()
-    logger.info(f"Fetched {len(jobs)} jobs from {hours}-hour history for wait time calculation")
+    logger.info("Fetched {} jobs since {} for wait time calculation", len(jobs), start_arg)
     return jobs, None
 
 
+@overload
+def get_fair_share_priority(
+    max_retries: int = ..., *, fingerprints: None = None
+) -> tuple[list[tuple[str, ...]], str | None]: ...
+@overload
+def get_fair_share_priority(
+    max_retries: int = ..., *, fingerprints: OutputFingerprints
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]: ...
 def get_fair_share_priority(
     max_retries: int = DEFAULT_MAX_RETRIES,
-) -> tuple[list[tuple[str, ...]], str | None]:
+    *,
+    fingerprints: OutputFingerprints | None = None,
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]:
     """Get fair-share priority information for all users and accounts.
 
     Uses sshare to fetch fair-share data including raw shares, normalized shares,
@@ -1160,6 +1686,8 @@ def get_fair_share_priority(
 
     Args:
         max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES).
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned instead of parsed entries.
 
     Returns:
         Tuple of (list of priority tuples, optional error message).
@@ -1167,7 +1695,7 @@ def get_fair_share_priority(
         NormUsage, EffectvUsage, FairShare).
     """
     try:
-        sshare = resolve_executable("sshare")
+        sshare = get_executable("sshare")
     except FileNotFoundError:
         logger.exception("sshare not found")
         return [], "sshare not found"
@@ -1183,33 +1711,46 @@ def get_fair_share_priority(
     logger.debug("Running sshare command for fair-share priority")
 
     result, error = _run_with_retry(command, timeout=30, command_name="sshare", max_retries=max_retries)
+    if _output_unchanged(fingerprints, "sshare", result, error):
+        return UNCHANGED, None
     if error or result is None:
         return [], error or "Unknown error"
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() or "Unknown error"
-        logger.warning(f"sshare returned non-zero exit code: {result.returncode}, error: {error_msg}")
+        logger.warning("sshare returned non-zero exit code: {}, error: {}", result.returncode, error_msg)
         return [], f"sshare error: {error_msg}"
 
     # Parse pipe-delimited output
-    entries: list[tuple[str, ...]] = []
-    lines = result.stdout.strip().split("\n")
+    with get_telemetry().timed(PARSE, "sshare"):
+        entries: list[tuple[str, ...]] = []
+        lines = result.stdout.strip().split("\n")
 
-    for line in lines:
-        if not line.strip():
-            continue
+        for line in lines:
+            if not line.strip():
+                continue
 
-        parts = line.split("|")
-        if len(parts) >= len(SSHARE_FIELDS):
-            entries.append(tuple(parts[: len(SSHARE_FIELDS)]))
+            parts = line.split("|")
+            if len(parts) >= len(SSHARE_FIELDS):
+                entries.append(tuple(parts[: len(SSHARE_FIELDS)]))
 
-    logger.info(f"Fetched {len(entries)} fair-share entries")
+    logger.info("Fetched {} fair-share entries", len(entries))
     return entries, None
 
 
+@overload
+def get_pending_job_priority(
+    max_retries: int = ..., *, fingerprints: None = None
+) -> tuple[list[tuple[str, ...]], str | None]: ...
+@overload
+def get_pending_job_priority(
+    max_retries: int = ..., *, fingerprints: OutputFingerprints
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]: ...
 def get_pending_job_priority(
     max_retries: int = DEFAULT_MAX_RETRIES,
-) -> tuple[list[tuple[str, ...]], str | None]:
+    *,
+    fingerprints: OutputFingerprints | None = None,
+) -> tuple[list[tuple[str, ...]] | Unchanged, str | None]:
     """Get priority factors for all pending jobs.
 
     Uses sprio to fetch priority breakdown including age, fair-share,
@@ -1218,6 +1759,8 @@ def get_pending_job_priority(
 
     Args:
         max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES).
+        fingerprints: Optional output fingerprints; when the output matches the
+            previous one, UNCHANGED is returned instead of parsed entries.
 
     Returns:
         Tuple of (list of job priority tuples, optional error message).
@@ -1225,7 +1768,7 @@ def get_pending_job_priority(
         JobSize, Partition, QOS).
     """
     try:
-        sprio = resolve_executable("sprio")
+        sprio = get_executable("sprio")
     except FileNotFoundError:
         logger.exception("sprio not found")
         return [], "sprio not found"
@@ -1241,6 +1784,8 @@ def get_pending_job_priority(
     logger.debug("Running sprio command for pending job priority")
 
     result, error = _run_with_retry(command, timeout=30, command_name="sprio", max_retries=max_retries)
+    if _output_unchanged(fingerprints, "sprio", result, error):
+        return UNCHANGED, None
     if error or result is None:
         return [], error or "Unknown error"
 
@@ -1250,22 +1795,23 @@ def get_pending_job_priority(
         if "no pending jobs" in error_msg.lower() or not error_msg:
             logger.debug("No pending jobs found for priority calculation")
             return [], None
-        logger.warning(f"sprio returned non-zero exit code: {result.returncode}, error: {error_msg}")
+        logger.warning("sprio returned non-zero exit code: {}, error: {}", result.returncode, error_msg)
         return [], f"sprio error: {error_msg}"
 
     # Parse pipe-delimited output
-    entries: list[tuple[str, ...]] = []
-    lines = result.stdout.strip().split("\n")
+    with get_telemetry().timed(PARSE, "sprio"):
+        entries: list[tuple[str, ...]] = []
+        lines = result.stdout.strip().split("\n")
 
-    for line in lines:
-        if not line.strip():
-            continue
+        for line in lines:
+            if not line.strip():
+                continue
 
-        parts = line.split("|")
-        # Clean up whitespace in each field
-        cleaned_parts = [p.strip() for p in parts]
-        if len(cleaned_parts) >= len(SPRIO_FIELDS):
-            entries.append(tuple(cleaned_parts[: len(SPRIO_FIELDS)]))
+            parts = line.split("|")
+            # Clean up whitespace in each field
+            cleaned_parts = [p.strip() for p in parts]
+            if len(cleaned_parts) >= len(SPRIO_FIELDS):
+                entries.append(tuple(cleaned_parts[: len(SPRIO_FIELDS)]))
 
-    logger.info(f"Fetched {len(entries)} pending job priority entries")
+    logger.info("Fetched {} pending job priority entries", len(entries))
     return entries, None
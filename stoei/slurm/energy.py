@@ -75,7 +75,7 @@ def _load_tdp_values() -> tuple[dict[str, int], int, int]:
         cpu_tdp_per_core = cpu_data.get("_default_per_core", _FALLBACK_CPU_TDP_PER_CORE)
 
         logger.debug(
-            f"Loaded TDP values: {len(gpu_tdp)} GPUs, default GPU={default_gpu_tdp}W, CPU={cpu_tdp_per_core}W/core"
+            "Loaded TDP values: {} GPUs, default GPU={}W, CPU={}W/core", len(gpu_tdp), default_gpu_tdp, cpu_tdp_per_core
         )
 
     except FileNotFoundError:
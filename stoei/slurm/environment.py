@@ -0,0 +1,293 @@
+"""SLURM environment probed once per session.
+
+Every command used to walk PATH for its executable and look up the username
+again, and nothing recorded which query forms the installed Slurm accepts. The
+environment is probed once instead: executable paths, their modification
+times, the Slurm version and the query forms learned at runtime. It is
+persisted in the cache directory, keyed by PATH and the binaries' mtimes, so
+the next session reuses it unless PATH changed or Slurm was reinstalled.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from stoei.logger import get_logger
+from stoei.paths import get_cache_dir
+from stoei.slurm.validation import get_current_username, resolve_executable
+
+logger = get_logger(__name__)
+
+SLURM_EXECUTABLES: tuple[str, ...] = ("squeue", "sacct", "scontrol", "scancel", "sshare", "sprio")
+
+_ENVIRONMENT_FORMAT_VERSION = 1
+_VERSION_TIMEOUT = 5
+_VERSION_PATTERN = re.compile(r"slurm\S*\s+(\d+(?:\.\d+)*)", re.IGNORECASE)
+
+# Using lists as mutable containers so functions can update state without `global`.
+_lock = threading.Lock()
+_environment: list[SlurmEnvironment | None] = [None]
+_username: list[str | None] = [None]
+
+
+@dataclass(frozen=True)
+class SlurmEnvironment:
+    """SLURM installation as seen from one PATH."""
+
+    path: str  # PATH the executables were resolved from
+    executables: dict[str, str] = field(default_factory=dict)  # name -> absolute path
+    mtimes: dict[str, int] = field(default_factory=dict)  # absolute path -> st_mtime_ns
+    version: tuple[int, ...] | None = None
+    # False once squeue was seen ignoring -O field suffixes (old Slurm)
+    squeue_delimited: bool = True
+
+    @property
+    def version_string(self) -> str:
+        """Return the Slurm version as text, or ``"unknown"``."""
+        return ".".join(str(part) for part in self.version) if self.version else "unknown"
+
+
+def parse_slurm_version(output: str) -> tuple[int, ...] | None:
+    """Parse the output of ``squeue --version``.
+
+    Args:
+        output: Command output, e.g. ``"slurm 23.02.7"`` or ``"slurm-wlm 21.08.5"``.
+
+    Returns:
+        The version numbers, or None if the output has no version.
+    """
+    match = _VERSION_PATTERN.search(output)
+    if match is None:
+        return None
+    return tuple(int(part) for part in match.group(1).split("."))
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _probe_version(squeue: str | None) -> tuple[int, ...] | None:
+    if squeue is None:
+        return None
+    try:
+        result = subprocess.run(  # noqa: S603
+            [squeue, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=_VERSION_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Could not run {} --version: {}", squeue, exc)
+        return None
+    if result.returncode != 0:
+        return None
+    return parse_slurm_version(result.stdout)
+
+
+def probe_slurm_environment() -> SlurmEnvironment:
+    """Resolve the SLURM executables on PATH and detect the Slurm version.
+
+    Returns:
+        The probed environment.
+    """
+    executables = {name: found for name in SLURM_EXECUTABLES if (found := shutil.which(name)) is not None}
+    mtimes = {path: mtime for path in executables.values() if (mtime := _mtime_ns(path)) is not None}
+    environment = SlurmEnvironment(
+        path=os.environ.get("PATH", ""),
+        executables=executables,
+        mtimes=mtimes,
+        version=_probe_version(executables.get("squeue")),
+    )
+    logger.info("Probed SLURM environment: Slurm {}, {} executables", environment.version_string, len(executables))
+    return environment
+
+
+def save_slurm_environment(path: Path, environment: SlurmEnvironment) -> bool:
+    """Write the environment atomically as JSON.
+
+    Args:
+        path: Destination file.
+        environment: Environment to persist.
+
+    Returns:
+        True if the environment was written.
+    """
+    payload = {
+        "version": _ENVIRONMENT_FORMAT_VERSION,
+        "path": environment.path,
+        "executables": environment.executables,
+        "mtimes": environment.mtimes,
+        "slurm_version": list(environment.version) if environment.version else None,
+        "squeue_delimited": environment.squeue_delimited,
+    }
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as exc:
+        logger.warning(f"Failed to save SLURM environment to {path}: {exc}")
+        return False
+    return True
+
+
+def _parse_environment(raw: dict[str, object]) -> SlurmEnvironment | None:
+    path = raw.get("path")
+    executables = raw.get("executables")
+    mtimes = raw.get("mtimes")
+    version = raw.get("slurm_version")
+    squeue_delimited = raw.get("squeue_delimited")
+    if (
+        not isinstance(path, str)
+        or not isinstance(executables, dict)
+        or not all(isinstance(key, str) and isinstance(value, str) for key, value in executables.items())
+        or not isinstance(mtimes, dict)
+        or not all(isinstance(key, str) and isinstance(value, int) for key, value in mtimes.items())
+        or not (version is None or (isinstance(version, list) and all(isinstance(part, int) for part in version)))
+        or not isinstance(squeue_delimited, bool)
+    ):
+        return None
+    return SlurmEnvironment(
+        path=path,
+        executables=executables,
+        mtimes=mtimes,
+        version=tuple(version) if version else None,
+        squeue_delimited=squeue_delimited,
+    )
+
+
+def load_slurm_environment(path: Path) -> SlurmEnvironment | None:
+    """Load the environment saved by a previous session if it is still current.
+
+    Args:
+        path: File written by :func:`save_slurm_environment`.
+
+    Returns:
+        The environment, or None if missing, unreadable, probed with another
+        PATH or if any executable was replaced since.
+    """
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Failed to read SLURM environment {path}: {exc}")
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != _ENVIRONMENT_FORMAT_VERSION:
+        return None
+
+    environment = _parse_environment(raw)
+    if environment is None or environment.path != os.environ.get("PATH", ""):
+        return None
+    if any(
+        _mtime_ns(executable) != environment.mtimes.get(executable) for executable in environment.executables.values()
+    ):
+        logger.debug("SLURM executables changed since the environment was saved")
+        return None
+    return environment
+
+
+def _environment_path() -> Path:
+    return get_cache_dir() / "slurm_environment.json"
+
+
+def get_slurm_environment() -> SlurmEnvironment:
+    """Return the session's SLURM environment, probing it on first use.
+
+    The environment is probed again if PATH changes during the session.
+
+    Returns:
+        The current environment.
+    """
+    path = os.environ.get("PATH", "")
+    with _lock:
+        environment = _environment[0]
+        if environment is not None and environment.path == path:
+            return environment
+        environment = load_slurm_environment(_environment_path())
+        if environment is None:
+            environment = probe_slurm_environment()
+            save_slurm_environment(_environment_path(), environment)
+        else:
+            logger.debug("Reusing SLURM environment: Slurm {}", environment.version_string)
+        _environment[0] = environment
+        return environment
+
+
+def _update_environment(**changes: object) -> None:
+    with _lock:
+        environment = _environment[0]
+        if environment is None:
+            return
+        environment = replace(environment, **changes)
+        _environment[0] = environment
+        save_slurm_environment(_environment_path(), environment)
+
+
+def get_executable(name: str) -> str:
+    """Return the absolute path to a SLURM executable.
+
+    Args:
+        name: Executable name, e.g. ``"squeue"``.
+
+    Returns:
+        The absolute path from the session's environment.
+
+    Raises:
+        FileNotFoundError: If the executable is not found on PATH.
+    """
+    environment = get_slurm_environment()
+    found = environment.executables.get(name)
+    if found is not None:
+        return found
+    # Not probed or installed since: resolve it now and remember it
+    found = resolve_executable(name)
+    mtime = _mtime_ns(found)
+    _update_environment(
+        executables={**environment.executables, name: found},
+        mtimes={**environment.mtimes, found: mtime} if mtime is not None else environment.mtimes,
+    )
+    return found
+
+
+def get_username() -> str:
+    """Return the current username, looked up once per session.
+
+    Returns:
+        The validated username.
+
+    Raises:
+        ValidationError: If the username cannot be determined or is unsafe.
+    """
+    username = _username[0]
+    if username is None:
+        username = _username[0] = get_current_username()
+    return username
+
+
+def record_squeue_delimited(*, delimited: bool) -> None:
+    """Remember whether squeue honours -O field suffixes, for this and later sessions.
+
+    Args:
+        delimited: False if squeue ignored the suffixes.
+    """
+    if get_slurm_environment().squeue_delimited != delimited:
+        _update_environment(squeue_delimited=delimited)
+
+
+def reset_slurm_environment() -> None:
+    """Forget the session's environment and username (used by tests)."""
+    with _lock:
+        _environment[0] = None
+        _username[0] = None
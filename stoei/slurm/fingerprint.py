@@ -0,0 +1,74 @@
+"""Raw command output fingerprints for skipping unchanged refresh results.
+
+Each refresh cycle re-runs the same SLURM commands. On a quiet cluster most of
+them print exactly what they printed last time, so parsing the output again,
+recomputing derived caches and pushing rows into widgets is wasted work. An
+:class:`OutputFingerprints` registry remembers a digest of the last stdout seen
+for each command; command functions that are given a registry return the
+:data:`UNCHANGED` sentinel instead of parsed data when the digest matches.
+
+A registry belongs to a single consumer (e.g. the app), which is responsible for
+forgetting fingerprints whose results it did not actually apply.
+"""
+
+import hashlib
+import threading
+from typing import Final
+
+from stoei.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Unchanged:
+    """Type of the :data:`UNCHANGED` sentinel (compare with ``is``)."""
+
+    def __repr__(self) -> str:
+        """Return the sentinel name."""
+        return "UNCHANGED"
+
+
+# Returned in place of parsed data when a command's output matches its fingerprint
+UNCHANGED: Final = Unchanged()
+
+
+class OutputFingerprints:
+    """Thread-safe registry of the last output digest per command key."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._digests: dict[str, bytes] = {}
+
+    def unchanged(self, key: str, output: str) -> bool:
+        """Record the fingerprint of ``output`` and report whether it matches the previous one.
+
+        Args:
+            key: Command key identifying the output source.
+            output: Raw command stdout.
+
+        Returns:
+            True if ``output`` is identical to the last output recorded for ``key``.
+        """
+        digest = hashlib.blake2b(output.encode(), digest_size=16).digest()
+        with self._lock:
+            previous = self._digests.get(key)
+            self._digests[key] = digest
+        if previous == digest:
+            logger.debug("Output for {} unchanged since last fetch", key)
+            return True
+        return False
+
+    def forget(self, key: str) -> None:
+        """Drop the fingerprint for ``key`` so its next output is treated as new.
+
+        Args:
+            key: Command key identifying the output source.
+        """
+        with self._lock:
+            self._digests.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all fingerprints."""
+        with self._lock:
+            self._digests.clear()
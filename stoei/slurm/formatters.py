@@ -8,12 +8,15 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from stoei.colors import FALLBACK_COLORS, ThemeColors
+from stoei.slurm.account_index import ResourceTotals
 from stoei.slurm.energy import ENERGY_KWH_THRESHOLD, ENERGY_MWH_THRESHOLD
 from stoei.slurm.gpu_parser import calculate_total_gpus
-from stoei.slurm.nodelist import expand_nodelist
+from stoei.slurm.nodelist import get_node_registry
 from stoei.slurm.parser import parse_scontrol_output, parse_tres_resources
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from stoei.widgets.user_overview import UserEnergyStats, UserPendingStats, UserStats
 
 
@@ -331,16 +334,17 @@ NODE_CATEGORIES: dict[str, tuple[str, list[str]]] = {
 }
 
 
-def format_node_info(raw_output: str) -> str:
+def format_node_info(node: str | Mapping[str, str]) -> str:
     """Format node info with categories and colors.
 
     Args:
-        raw_output: Raw output from scontrol show node command.
+        node: Raw output from scontrol show node command, or an already parsed
+            node dictionary (e.g. from the cluster node snapshot).
 
     Returns:
         Formatted string with Rich markup for display.
     """
-    parsed = parse_scontrol_output(raw_output)
+    parsed = parse_scontrol_output(node) if isinstance(node, str) else node
 
     if not parsed:
         return "[italic]No node information could be parsed.[/italic]"
@@ -372,6 +376,43 @@ def format_node_info(raw_output: str) -> str:
     return "\n".join(lines)
 
 
+def format_node_jobs(jobs: list[tuple[str, ...]]) -> str:
+    """Format the jobs allocated on a node as a section for the node info modal.
+
+    Args:
+        jobs: All-users job tuples (JobID, Name, User, Partition, State, Time, Nodes, ...).
+
+    Returns:
+        Formatted string with Rich markup for display.
+    """
+    if not jobs:
+        return "\n[italic]No jobs running on this node.[/italic]"
+
+    lines = [f"\n[bold reverse] Running Jobs ({len(jobs)}) [/bold reverse]", ""]
+    lines.append(f"  [dim]{'JobID':<12} {'User':<12} {'Name':<15} {'Partition':<12} {'Time':<10} {'Nodes':<6}[/dim]")
+    lines.append(f"  [dim]{'─' * 75}[/dim]")
+
+    for job in jobs[:_NODE_INFO_MAX_JOBS]:
+        if len(job) < _USER_INFO_MIN_JOB_FIELDS:
+            continue
+        job_id = _truncate(job[0], _ACCOUNT_INFO_JOBID_WIDTH)
+        name = _truncate(job[1], _ACCOUNT_INFO_NAME_WIDTH)
+        user = _truncate(job[2], _ACCOUNT_INFO_USER_WIDTH)
+        partition = _truncate(job[3], _ACCOUNT_INFO_PARTITION_WIDTH)
+        time_used = _truncate(job[_ACCOUNT_INFO_TIME_FIELD_INDEX], _ACCOUNT_INFO_TIME_WIDTH)
+        nodes = (
+            _truncate(job[_ACCOUNT_INFO_NODES_FIELD_INDEX], _ACCOUNT_INFO_NODES_WIDTH)
+            if len(job) > _ACCOUNT_INFO_NODES_FIELD_INDEX
+            else ""
+        )
+        lines.append(f"  {job_id:<12} {user:<12} {name:<15} {partition:<12} {time_used:<10} {nodes:<6}")
+
+    if len(jobs) > _NODE_INFO_MAX_JOBS:
+        lines.append(f"  [dim]... and {len(jobs) - _NODE_INFO_MAX_JOBS} more jobs[/dim]")
+
+    return "\n".join(lines)
+
+
 def _format_compact_time(timestamp_str: str) -> str:
     """Format a SLURM timestamp to compact display format.
 
@@ -477,6 +518,7 @@ _USER_INFO_MAX_PRIORITY_JOBS = 10
 _ACCOUNT_INFO_MAX_USERS = 15
 _ACCOUNT_INFO_MAX_PRIORITY_JOBS = 15
 _ACCOUNT_INFO_MAX_RUNNING_JOBS = 20
+_NODE_INFO_MAX_JOBS = 50
 
 # Display widths for account info tables
 _ACCOUNT_INFO_USER_WIDTH = 12
@@ -824,6 +866,42 @@ def format_user_info(  # noqa: PLR0913, PLR0912, PLR0915
     return "\n".join(lines)
 
 
+def _running_job_totals(running_jobs: list[tuple[str, ...]]) -> ResourceTotals:
+    """Aggregate the resources allocated to running jobs.
+
+    Args:
+        running_jobs: All-users job tuples (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES).
+
+    Returns:
+        Total CPUs, memory, GPUs and unique nodes.
+    """
+    min_running_job_fields = 9
+    nodelist_index = 7
+    tres_index = 8
+
+    total_cpus = 0
+    total_memory_gb = 0.0
+    total_gpus = 0
+    registry = get_node_registry()
+    unique_node_bits = 0
+
+    for job in running_jobs:
+        if len(job) < min_running_job_fields:
+            continue
+
+        tres_str = job[tres_index].strip()
+        cpus, memory_gb, gpu_entries = parse_tres_resources(tres_str)
+        total_cpus += cpus
+        total_memory_gb += memory_gb
+        total_gpus += calculate_total_gpus(gpu_entries)
+
+        unique_node_bits |= registry.bits(job[nodelist_index])
+
+    return ResourceTotals(
+        cpus=total_cpus, memory_gb=total_memory_gb, gpus=total_gpus, nodes=unique_node_bits.bit_count()
+    )
+
+
 def format_account_info(  # noqa: PLR0913, PLR0912, PLR0915
     account_name: str,
     account_priority: dict[str, str],
@@ -832,6 +910,9 @@ def format_account_info(  # noqa: PLR0913, PLR0912, PLR0915
     pending_jobs: list[tuple[str, ...]],
     job_priorities: list[dict[str, str]] | None = None,
     colors: ThemeColors | None = None,
+    *,
+    totals: ResourceTotals | None = None,
+    sub_accounts: list[str] | None = None,
 ) -> str:
     """Format account/institute information for display.
 
@@ -843,6 +924,9 @@ def format_account_info(  # noqa: PLR0913, PLR0912, PLR0915
         pending_jobs: List of pending jobs for users in this account.
         job_priorities: Optional list of pending job priority factors.
         colors: Optional theme colors. Uses fallback colors if not provided.
+        totals: Optional precomputed resources of the running jobs. Computed
+            from ``running_jobs`` if not provided.
+        sub_accounts: Optional names of the account's direct sub-accounts.
 
     Returns:
         Formatted string with Rich markup for display.
@@ -867,6 +951,8 @@ def format_account_info(  # noqa: PLR0913, PLR0912, PLR0915
         f"  [bold {c.primary}]{'Pending Jobs':.<24}[/bold {c.primary}] "
         f"[bold {c.warning}]{len(pending_jobs)}[/bold {c.warning}]"
     )
+    if sub_accounts:
+        lines.append(f"  [bold {c.primary}]{'Sub-accounts':.<24}[/bold {c.primary}] {', '.join(sub_accounts)}")
 
     # Account Fair-Share Priority section
     if account_priority:
@@ -888,35 +974,15 @@ def format_account_info(  # noqa: PLR0913, PLR0912, PLR0915
         fair_share_label = f"  [bold {c.primary}]{'Fair-Share Factor':.<24}[/bold {c.primary}] "
         lines.append(f"{fair_share_label}{_format_fair_share_value(fair_share, c)}")
 
-    # Calculate aggregate resource usage from running jobs
-    min_running_job_fields = 9
-    nodelist_index = 7
-    tres_index = 8
-
-    total_cpus = 0
-    total_memory_gb = 0.0
-    total_gpus = 0
-    unique_node_names: set[str] = set()
-
-    for job in running_jobs:
-        if len(job) < min_running_job_fields:
-            continue
-
-        tres_str = job[tres_index].strip()
-        cpus, memory_gb, gpu_entries = parse_tres_resources(tres_str)
-        total_cpus += cpus
-        total_memory_gb += memory_gb
-        total_gpus += calculate_total_gpus(gpu_entries)
-
-        nodelist_str = job[nodelist_index].strip()
-        unique_node_names.update(expand_nodelist(nodelist_str))
+    if totals is None:
+        totals = _running_job_totals(running_jobs)
 
     # Resource Usage section
     lines.append("\n[bold reverse] Current Resource Usage [/bold reverse]")
-    lines.append(f"  [bold {c.primary}]{'Total CPUs':.<24}[/bold {c.primary}] {total_cpus}")
-    lines.append(f"  [bold {c.primary}]{'Total Memory (GB)':.<24}[/bold {c.primary}] {total_memory_gb:.1f}")
-    lines.append(f"  [bold {c.primary}]{'Total GPUs':.<24}[/bold {c.primary}] {total_gpus}")
-    lines.append(f"  [bold {c.primary}]{'Unique Nodes':.<24}[/bold {c.primary}] {len(unique_node_names)}")
+    lines.append(f"  [bold {c.primary}]{'Total CPUs':.<24}[/bold {c.primary}] {totals.cpus}")
+    lines.append(f"  [bold {c.primary}]{'Total Memory (GB)':.<24}[/bold {c.primary}] {totals.memory_gb:.1f}")
+    lines.append(f"  [bold {c.primary}]{'Total GPUs':.<24}[/bold {c.primary}] {totals.gpus}")
+    lines.append(f"  [bold {c.primary}]{'Unique Nodes':.<24}[/bold {c.primary}] {totals.nodes}")
 
     # Users in Account section
     if users_in_account:
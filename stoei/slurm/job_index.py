@@ -0,0 +1,197 @@
+"""Inverted indexes over the all-users squeue snapshot.
+
+:class:`JobIndex` answers "which jobs are on this node / belong to this user /
+are in this partition" without scanning every job tuple and expanding every
+NodeList. It is updated incrementally: each new snapshot is diffed against the
+previous one by job ID, and only added, removed or changed jobs touch the
+indexes, so a refresh where a handful of jobs started or finished costs a
+handful of index updates even on clusters with tens of thousands of jobs.
+A job counts as changed only when its user, partition, state or NodeList
+differs, not when its elapsed time ticks.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from stoei.logger import get_logger
+from stoei.slurm.nodelist import get_node_registry
+
+logger = get_logger(__name__)
+
+# Column indices in the all-users job tuples
+# (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
+_JOB_ID_INDEX = 0
+_USER_INDEX = 2
+_PARTITION_INDEX = 3
+_STATE_INDEX = 4
+_NODELIST_INDEX = 7
+
+
+@dataclass(frozen=True, slots=True)
+class JobIndexDiff:
+    """Number of jobs that changed between two consecutive snapshots."""
+
+    added: int = 0
+    removed: int = 0
+    changed: int = 0
+
+
+def _field(job: tuple[str, ...], index: int) -> str:
+    return job[index].strip() if len(job) > index else ""
+
+
+def _index_key(job: tuple[str, ...]) -> tuple[str, str, str, str]:
+    return (
+        _field(job, _USER_INDEX),
+        _field(job, _PARTITION_INDEX),
+        _field(job, _STATE_INDEX),
+        _field(job, _NODELIST_INDEX),
+    )
+
+
+def _is_running(job: tuple[str, ...]) -> bool:
+    return _field(job, _STATE_INDEX).upper() in ("RUNNING", "R")
+
+
+def _add_to(index: dict[str, set[str]], key: str, job_id: str) -> None:
+    if key:
+        index.setdefault(key, set()).add(job_id)
+
+
+def _remove_from(index: dict[str, set[str]], key: str, job_id: str) -> None:
+    job_ids = index.get(key)
+    if job_ids is None:
+        return
+    job_ids.discard(job_id)
+    if not job_ids:
+        del index[key]
+
+
+class JobIndex:
+    """Thread-safe node/user/partition → job ID indexes over the all-users jobs.
+
+    Node keys come from the shared :class:`~stoei.slurm.nodelist.NodeRegistry`,
+    so NodeList expansion is memoized across refreshes. Only running jobs are
+    indexed by node; pending, suspended, completing and held jobs only appear
+    in the user and partition indexes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self._jobs: dict[str, tuple[str, ...]] = {}
+        self._by_node: dict[str, set[str]] = {}
+        self._by_user: dict[str, set[str]] = {}
+        self._by_partition: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed jobs."""
+        return len(self._jobs)
+
+    def _add(self, job_id: str, job: tuple[str, ...]) -> None:
+        # Caller must hold self._lock
+        if _is_running(job):
+            registry = get_node_registry()
+            for node in registry.names(registry.bits(_field(job, _NODELIST_INDEX))):
+                _add_to(self._by_node, node, job_id)
+        _add_to(self._by_user, _field(job, _USER_INDEX), job_id)
+        # Pending jobs may list several candidate partitions ("gpu,cpu")
+        for partition in _field(job, _PARTITION_INDEX).split(","):
+            _add_to(self._by_partition, partition.strip(), job_id)
+
+    def _remove(self, job_id: str, job: tuple[str, ...]) -> None:
+        # Caller must hold self._lock
+        if _is_running(job):
+            registry = get_node_registry()
+            for node in registry.names(registry.bits(_field(job, _NODELIST_INDEX))):
+                _remove_from(self._by_node, node, job_id)
+        _remove_from(self._by_user, _field(job, _USER_INDEX), job_id)
+        for partition in _field(job, _PARTITION_INDEX).split(","):
+            _remove_from(self._by_partition, partition.strip(), job_id)
+
+    def update(self, jobs: Iterable[tuple[str, ...]]) -> JobIndexDiff:
+        """Bring the indexes in line with a new all-users snapshot.
+
+        Args:
+            jobs: All-users job tuples from squeue.
+
+        Returns:
+            How many jobs were added, removed or changed since the previous update.
+        """
+        current: dict[str, tuple[str, ...]] = {}
+        for job in jobs:
+            job_id = _field(job, _JOB_ID_INDEX)
+            if job_id:
+                current[job_id] = job
+
+        added = removed = changed = 0
+        with self._lock:
+            previous = self._jobs
+            for job_id, job in previous.items():
+                new_job = current.get(job_id)
+                if new_job is None:
+                    self._remove(job_id, job)
+                    removed += 1
+                elif _index_key(new_job) != _index_key(job):
+                    self._remove(job_id, job)
+                    self._add(job_id, new_job)
+                    changed += 1
+            for job_id, job in current.items():
+                if job_id not in previous:
+                    self._add(job_id, job)
+                    added += 1
+            # Jobs whose indexed fields did not change still return the new tuple
+            self._jobs = current
+
+        diff = JobIndexDiff(added=added, removed=removed, changed=changed)
+        logger.debug(
+            "Job index updated: {} added, {} removed, {} changed ({} jobs)", added, removed, changed, len(current)
+        )
+        return diff
+
+    def _lookup(self, index: dict[str, set[str]], key: str) -> list[tuple[str, ...]]:
+        with self._lock:
+            # Shorter numeric IDs first, so "9" sorts before "10"
+            job_ids = sorted(index.get(key, ()), key=lambda job_id: (len(job_id), job_id))
+            return [self._jobs[job_id] for job_id in job_ids]
+
+    def jobs_on_node(self, node: str) -> list[tuple[str, ...]]:
+        """Return the jobs running on a node.
+
+        Args:
+            node: Node name.
+
+        Returns:
+            Job tuples sorted by job ID.
+        """
+        return self._lookup(self._by_node, node)
+
+    def jobs_for_user(self, user: str) -> list[tuple[str, ...]]:
+        """Return the active (running, pending, suspended, ...) jobs of a user.
+
+        Args:
+            user: Username.
+
+        Returns:
+            Job tuples sorted by job ID.
+        """
+        return self._lookup(self._by_user, user)
+
+    def jobs_in_partition(self, partition: str) -> list[tuple[str, ...]]:
+        """Return the jobs running in, or queued for, a partition.
+
+        Args:
+            partition: Partition name.
+
+        Returns:
+            Job tuples sorted by job ID.
+        """
+        return self._lookup(self._by_partition, partition)
+
+    def node_job_counts(self) -> dict[str, int]:
+        """Return the number of running jobs on each node that has at least one."""
+        with self._lock:
+            return {node: len(job_ids) for node, job_ids in self._by_node.items()}
@@ -0,0 +1,264 @@
+"""Bounded, state-aware cache of job details shown in the job info modal.
+
+Details of a job whose scontrol/sacct record shows a terminal state
+(COMPLETED, FAILED, TIMEOUT, ...) never change again, so they are kept until
+evicted by the LRU bound and persisted to the user cache directory across
+sessions. Details of active or unknown-state jobs expire after a short TTL, or
+as soon as the next squeue snapshot reports a different state for the job.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from stoei.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (formatted_info, error, stdout_path, stderr_path), as returned by get_job_info_and_log_paths
+JobInfo = tuple[str, str | None, str | None, str | None]
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_ACTIVE_TTL = 30.0  # seconds
+_CACHE_FORMAT_VERSION = 1
+_JOB_INFO_FIELDS = 4
+
+# Job states after which a job's details are final. PREEMPTED and NODE_FAIL
+# jobs may be requeued, so they expire like active jobs.
+TERMINAL_JOB_STATES = frozenset(
+    {
+        "BOOT_FAIL",
+        "CANCELLED",
+        "COMPLETED",
+        "DEADLINE",
+        "FAILED",
+        "OUT_OF_MEMORY",
+        "TIMEOUT",
+    }
+)
+
+
+def is_terminal_state(state: str | None) -> bool:
+    """Return whether a SLURM job state is final.
+
+    Args:
+        state: Job state as shown by squeue/sacct (e.g. ``"CANCELLED by 1000"``).
+
+    Returns:
+        True for terminal states, False for active or unknown ones.
+    """
+    if not state:
+        return False
+    words = state.strip().upper().split()
+    return bool(words) and words[0].rstrip("+") in TERMINAL_JOB_STATES
+
+
+@dataclass(slots=True)
+class _Entry:
+    info: JobInfo
+    state: str | None
+    fetched_at: float
+
+    @property
+    def terminal(self) -> bool:
+        return is_terminal_state(self.state)
+
+
+class JobInfoCache:
+    """Thread-safe LRU cache of job details keyed by (normalized) job ID.
+
+    Terminal-state entries are loaded from and saved to ``path`` when one is
+    given. Loading happens lazily on first access, so constructing the cache
+    does no I/O.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        active_ttl: float = DEFAULT_ACTIVE_TTL,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            path: JSON file persisting terminal-state entries, or None to keep them in memory only.
+            max_entries: Maximum number of entries before least recently used ones are evicted.
+            active_ttl: Seconds before an active or unknown-state entry expires.
+        """
+        self._path = path
+        self._max_entries = max_entries
+        self._active_ttl = active_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._loaded = path is None
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def __contains__(self, job_id: object) -> bool:
+        """Return whether a fresh entry exists for a job."""
+        return isinstance(job_id, str) and self.get(job_id) is not None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether terminal-state entries changed since the last load or save."""
+        return self._dirty
+
+    def get(self, job_id: str) -> JobInfo | None:
+        """Return the cached details of a job.
+
+        Args:
+            job_id: Normalized job ID.
+
+        Returns:
+            The cached details, or None if missing or expired.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return None
+            if not entry.terminal and time.monotonic() - entry.fetched_at > self._active_ttl:
+                del self._entries[job_id]
+                return None
+            self._entries.move_to_end(job_id)
+            return entry.info
+
+    def put(self, job_id: str, info: JobInfo, state: str | None = None) -> None:
+        """Cache the details of a job.
+
+        Lookups that failed (non-empty error) are cached like active jobs, so
+        they are retried after the TTL.
+
+        Args:
+            job_id: Normalized job ID.
+            info: Job details.
+            state: Job state in the fetched scontrol/sacct record, or None if unknown.
+        """
+        if info[1] is not None:
+            state = None
+        entry = _Entry(info=info, state=state, fetched_at=time.monotonic())
+        with self._lock:
+            self._ensure_loaded()
+            previous = self._entries.pop(job_id, None)
+            self._entries[job_id] = entry
+            if entry.terminal or (previous is not None and previous.terminal):
+                self._dirty = True
+            self._evict()
+
+    def invalidate_changed(self, states: Mapping[str, str]) -> int:
+        """Drop active entries whose job changed state in the latest snapshot.
+
+        Args:
+            states: Current state of each job in the squeue/sacct snapshot, by normalized job ID.
+
+        Returns:
+            Number of dropped entries.
+        """
+        with self._lock:
+            stale = [
+                job_id
+                for job_id, entry in self._entries.items()
+                if not entry.terminal and entry.state is not None and states.get(job_id) != entry.state
+            ]
+            for job_id in stale:
+                del self._entries[job_id]
+        if stale:
+            logger.debug("Dropped {} job info entries after state changes", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry, including persisted ones on the next save."""
+        with self._lock:
+            self._dirty = self._dirty or any(entry.terminal for entry in self._entries.values())
+            self._entries.clear()
+            self._loaded = True
+
+    def _evict(self) -> None:
+        # Caller must hold self._lock
+        while len(self._entries) > self._max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            if evicted.terminal:
+                self._dirty = True
+
+    def _ensure_loaded(self) -> None:
+        # Caller must hold self._lock
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Failed to read job info cache {self._path}: {exc}")
+            return
+        if not isinstance(raw, dict) or raw.get("version") != _CACHE_FORMAT_VERSION:
+            logger.debug("Ignoring job info cache {} with unknown format", self._path)
+            return
+
+        jobs = raw.get("jobs")
+        if not isinstance(jobs, list):
+            return
+        loaded = 0
+        now = time.monotonic()
+        # Walk most recently used first, prepending each entry, to keep the saved LRU order
+        for item in reversed(jobs):
+            if not isinstance(item, dict):
+                continue
+            job_id, state, info = item.get("job_id"), item.get("state"), item.get("info")
+            if (
+                not isinstance(job_id, str)
+                or not isinstance(state, str)
+                or not is_terminal_state(state)
+                or not isinstance(info, list)
+                or len(info) != _JOB_INFO_FIELDS
+                or not isinstance(info[0], str)
+            ):
+                continue
+            # Entries cached in this session take precedence over persisted ones
+            if job_id not in self._entries:
+                stdout = info[2] if isinstance(info[2], str) else None
+                stderr = info[3] if isinstance(info[3], str) else None
+                self._entries[job_id] = _Entry(info=(info[0], None, stdout, stderr), state=state, fetched_at=now)
+                # Persisted entries are older than anything cached this session
+                self._entries.move_to_end(job_id, last=False)
+                loaded += 1
+        self._evict()
+        logger.debug("Loaded {} job info entries from {}", loaded, self._path)
+
+    def save(self) -> None:
+        """Persist the terminal-state entries, least recently used first."""
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            jobs = [
+                {"job_id": job_id, "state": entry.state, "info": list(entry.info)}
+                for job_id, entry in self._entries.items()
+                if entry.terminal
+            ]
+            self._dirty = False
+        tmp_path = self._path.with_suffix(".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"version": _CACHE_FORMAT_VERSION, "jobs": jobs}), encoding="utf-8")
+            tmp_path.replace(self._path)
+        except OSError as exc:
+            logger.warning(f"Failed to save job info cache to {self._path}: {exc}")
+            with self._lock:
+                self._dirty = True
+            return
+        logger.debug("Saved {} job info entries to {}", len(jobs), self._path)
@@ -1,9 +1,23 @@
-"""Slurm NodeList expression parser for expanding bracket notation to hostnames."""
+"""Slurm NodeList expression parser for expanding bracket notation to hostnames.
+
+Besides expanding to hostname sets, NodeLists can be represented as bitsets
+over a :class:`NodeRegistry` that maps every node name to a small integer ID.
+Unions of bitsets are a single ``|`` and unique-node counts a popcount, so
+aggregating many large multi-node jobs no longer builds sets of hostname
+strings on every refresh.
+"""
+
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
 
 from stoei.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Distinct NodeList strings whose expansions are kept in memory
+EXPANSION_CACHE_SIZE = 4096
+
 
 def _split_nodelist(s: str) -> list[str]:
     """Split a NodeList string on commas that are not inside brackets.
@@ -76,6 +90,37 @@ def _expand_bracket_expr(expr: str) -> set[str]:
     return result
 
 
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _expand_nodelist_cached(nodelist: str) -> frozenset[str]:
+    """Expand a stripped NodeList string, caching the result per distinct string.
+
+    Args:
+        nodelist: A stripped Slurm NodeList string.
+
+    Returns:
+        Frozen set of individual hostnames.
+    """
+    if not nodelist or nodelist.startswith("("):
+        return frozenset()
+
+    try:
+        tokens = _split_nodelist(nodelist)
+    except Exception as exc:
+        logger.warning(f"Failed to parse NodeList {nodelist!r}: {exc}")
+        return frozenset()
+
+    result: set[str] = set()
+    for token in tokens:
+        if not token:
+            continue
+        if "[" in token:
+            result.update(_expand_bracket_expr(token))
+        else:
+            result.add(token)
+
+    return frozenset(result)
+
+
 def expand_nodelist(nodelist: str) -> set[str]:
     """Expand a Slurm NodeList expression to a set of individual hostnames.
 
@@ -102,24 +147,105 @@ def expand_nodelist(nodelist: str) -> set[str]:
         >>> expand_nodelist("")
         set()
     """
-    nodelist = nodelist.strip()
+    return set(_expand_nodelist_cached(nodelist.strip()))
 
-    if not nodelist or nodelist.startswith("("):
-        return set()
 
-    try:
-        tokens = _split_nodelist(nodelist)
-    except Exception as exc:
-        logger.warning(f"Failed to parse NodeList {nodelist!r}: {exc}")
-        return set()
+class NodeRegistry:
+    """Thread-safe mapping of node names to dense integer IDs for NodeList bitsets.
 
-    result: set[str] = set()
-    for token in tokens:
-        if not token:
-            continue
-        if "[" in token:
-            result.update(_expand_bracket_expr(token))
-        else:
-            result.add(token)
+    Bit ``i`` of a NodeList bitset is set when the node with ID ``i`` is in the
+    list. IDs are assigned on first sight and never change, so bitsets stay
+    valid for the lifetime of the registry.
+    """
 
-    return result
+    # Distinct NodeList strings whose bitsets are memoized before the memo is reset
+    BITS_CACHE_SIZE = 8192
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._bits_cache: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of registered nodes."""
+        return len(self._names)
+
+    def _register(self, name: str) -> int:
+        # Caller must hold self._lock
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[name] = node_id
+            self._names.append(name)
+        return node_id
+
+    def seed(self, names: Iterable[str]) -> None:
+        """Register cluster node names (e.g. from ``scontrol show nodes``) in sorted order.
+
+        Args:
+            names: Node names; blanks and already registered names are skipped.
+        """
+        with self._lock:
+            for name in sorted(n for n in names if n and n not in self._ids):
+                self._register(name)
+
+    def id_of(self, name: str) -> int:
+        """Return the ID of a node, registering it if needed.
+
+        Args:
+            name: Node name.
+
+        Returns:
+            The node's integer ID.
+        """
+        with self._lock:
+            return self._register(name)
+
+    def bits(self, nodelist: str) -> int:
+        """Return the bitset of a Slurm NodeList expression.
+
+        Args:
+            nodelist: A Slurm NodeList string, e.g. "gpu[001-512]" or "(None)".
+
+        Returns:
+            Integer bitset of the listed nodes (0 for pending placeholders or empty input).
+        """
+        nodelist = nodelist.strip()
+        cached = self._bits_cache.get(nodelist)
+        if cached is not None:
+            return cached
+        names = _expand_nodelist_cached(nodelist)
+        bits = 0
+        with self._lock:
+            for name in names:
+                bits |= 1 << self._register(name)
+            if len(self._bits_cache) >= self.BITS_CACHE_SIZE:
+                self._bits_cache.clear()
+            self._bits_cache[nodelist] = bits
+        return bits
+
+    def names(self, bits: int) -> list[str]:
+        """Decode a bitset back to node names, in ID order.
+
+        Args:
+            bits: Integer bitset from :meth:`bits`.
+
+        Returns:
+            Names of the nodes in the bitset.
+        """
+        names: list[str] = []
+        while bits:
+            lowest = bits & -bits
+            names.append(self._names[lowest.bit_length() - 1])
+            bits ^= lowest
+        return names
+
+
+_node_registry = NodeRegistry()
+
+
+def get_node_registry() -> NodeRegistry:
+    """Return the process-wide node registry shared by all NodeList bitsets."""
+    return _node_registry
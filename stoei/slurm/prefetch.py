@@ -0,0 +1,75 @@
+"""Critical-path SLURM fetches started from the entry point.
+
+The jobs table needs three things before it can show real data: the SLURM
+executables, the user's squeue jobs and the user's sacct history. The entry
+point starts them right after parsing arguments, so the subprocesses run while
+Textual is imported, the app is constructed and its CSS is parsed. The app
+then waits on the futures instead of starting the commands itself.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from stoei.logger import get_logger
+from stoei.slurm.commands import get_job_history, get_running_jobs
+from stoei.slurm.validation import check_slurm_available
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+RunningJobsResult = tuple[list[tuple[str, ...]], str | None]
+HistoryResult = tuple[list[tuple[str, ...]], int, int, int, str | None]
+
+
+class StartupFetch:
+    """One-shot SLURM fetches for the first paint of the jobs table.
+
+    The executable check and the user's squeue start on construction; sacct
+    starts with :meth:`start_history` once the history window is known from the
+    settings. Fetches run without retries, like the app's own initial load.
+    """
+
+    def __init__(self) -> None:
+        """Start the executable check and the user's squeue fetch."""
+        self.started_at = time.monotonic()
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="stoei-startup")
+        self.slurm_check: Future[tuple[bool, str | None]] = self._submit("slurm check", check_slurm_available)
+        self.running_jobs: Future[RunningJobsResult] = self._submit("squeue", lambda: get_running_jobs(max_retries=0))
+        self.history: Future[HistoryResult] | None = None
+        self.job_history_days: int | None = None
+
+    def start_history(self, days: int) -> None:
+        """Start the user's sacct fetch.
+
+        Args:
+            days: History window, as configured in the settings.
+        """
+        self.job_history_days = days
+        self.history = self._submit("sacct", lambda: get_job_history(days=days, max_retries=0))
+        # No more work: let the threads exit as soon as the fetches finish
+        self._executor.shutdown(wait=False)
+
+    def history_for(self, days: int) -> Future[HistoryResult] | None:
+        """Return the sacct fetch if it covers the requested history window.
+
+        Args:
+            days: History window the caller needs.
+
+        Returns:
+            The started fetch, or None if none was started for this window.
+        """
+        return self.history if self.job_history_days == days else None
+
+    def elapsed(self) -> float:
+        """Return the seconds since the fetches were started."""
+        return time.monotonic() - self.started_at
+
+    def _submit(self, label: str, fn: Callable[[], T]) -> Future[T]:
+        future = self._executor.submit(fn)
+        future.add_done_callback(lambda _: logger.debug("Startup {} finished after {:.3f}s", label, self.elapsed()))
+        return future
@@ -1,14 +1,16 @@
 """Resilience decorators for SLURM command execution.
 
-Provides decorators for adding timeout and retry functionality to functions.
+Provides decorators for adding timeout and retry functionality to functions,
+and :class:`SingleFlight` for coalescing identical concurrent calls.
 """
 
 import functools
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
-from typing import ParamSpec, TypeVar
+from typing import Generic, ParamSpec, TypeVar
 
 from stoei.logger import get_logger
 
@@ -101,8 +103,12 @@ def with_retry(
                     last_exception = exc
                     if attempt < max_attempts - 1:
                         logger.debug(
-                            f"{func_name} failed (attempt {attempt + 1}/{max_attempts}), "
-                            f"retrying in {delay:.1f}s: {exc}"
+                            "{} failed (attempt {}/{}), retrying in {:.1f}s: {}",
+                            func_name,
+                            attempt + 1,
+                            max_attempts,
+                            delay,
+                            exc,
                         )
                         time.sleep(delay)
                         delay *= backoff_factor
@@ -110,7 +116,7 @@ def with_retry(
                         logger.warning(f"{func_name} failed after {max_attempts} attempts: {exc}")
                 else:
                     if attempt > 0:
-                        logger.debug(f"{func_name} succeeded on attempt {attempt + 1}")
+                        logger.debug("{} succeeded on attempt {}", func_name, attempt + 1)
                     return result
 
             # If we get here, all attempts failed
@@ -166,17 +172,17 @@ def resilient(
                     try:
                         result = future.result(timeout=timeout)
                     except FuturesTimeoutError:
-                        logger.debug(f"{func_name} timed out (attempt {attempt + 1}/{total_attempts})")
+                        logger.debug("{} timed out (attempt {}/{})", func_name, attempt + 1, total_attempts)
                     except Exception as exc:
-                        logger.debug(f"{func_name} failed (attempt {attempt + 1}/{total_attempts}): {exc}")
+                        logger.debug("{} failed (attempt {}/{}): {}", func_name, attempt + 1, total_attempts, exc)
                     else:
                         if attempt > 0:
-                            logger.debug(f"{func_name} succeeded on attempt {attempt + 1}")
+                            logger.debug("{} succeeded on attempt {}", func_name, attempt + 1)
                         return result
 
                 # Wait before retry (except on last attempt)
                 if attempt < total_attempts - 1:
-                    logger.debug(f"{func_name} retrying in {delay:.1f}s")
+                    logger.debug("{} retrying in {:.1f}s", func_name, delay)
                     time.sleep(delay)
                     delay *= backoff_factor
 
@@ -186,3 +192,91 @@ def resilient(
         return wrapper
 
     return decorator
+
+
+class _Call(Generic[T]):
+    """An in-flight call whose result is shared by every caller of the same key."""
+
+    __slots__ = ("done", "error", "result")
+
+    result: T  # Set by the leader before ``done`` is set, unless ``error`` is
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent identical calls, with an optional short-TTL memo.
+
+    While a call for a key is running, other callers of the same key wait for
+    it and receive its result (or exception) instead of starting their own.
+    With ``ttl > 0``, successful results are also reused for ``ttl`` seconds
+    after the call finished.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no in-flight calls and an empty memo."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._memo: dict[Hashable, tuple[float, T]] = {}  # key -> (expires_at, result)
+        self.coalesced = 0
+        self.memo_hits = 0
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], T],
+        *,
+        ttl: float = 0.0,
+        memoize: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Run ``func`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Identity of the call (e.g. the command argv).
+            func: Function computing the result.
+            ttl: Seconds a finished result is reused by later callers (0 disables the memo).
+            memoize: Predicate selecting which results may be memoized (default: all).
+
+        Returns:
+            The result of ``func``, possibly shared with other callers.
+        """
+        with self._lock:
+            if ttl > 0:
+                memo = self._memo.get(key)
+                if memo is not None and memo[0] > time.monotonic():
+                    self.memo_hits += 1
+                    return memo[1]
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if ttl > 0 and call.error is None and (memoize is None or memoize(call.result)):
+                    now = time.monotonic()
+                    self._memo = {k: memo for k, memo in self._memo.items() if memo[0] > now}
+                    self._memo[key] = (now + ttl, call.result)
+            call.done.set()
+        return call.result
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        with self._lock:
+            self._memo.clear()
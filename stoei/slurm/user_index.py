@@ -0,0 +1,163 @@
+"""Per-user lookups over cluster-wide SLURM data.
+
+Each function turns one cluster-wide result (sshare rows, sprio rows, the
+all-users squeue jobs) into the per-user shape the user info modal or the
+Jobs tab displays, so neither needs its own per-user SLURM query.
+"""
+
+from __future__ import annotations
+
+# sshare format: (Account, User, RawShares, NormShares, RawUsage, NormUsage, EffectvUsage, FairShare)
+_MIN_SSHARE_FIELDS = 8
+# sprio format: (JOBID, USER, ACCOUNT, PRIORITY, AGE, FAIRSHARE, JOBSIZE, PARTITION, QOS)
+_MIN_SPRIO_FIELDS = 9
+# All-users squeue format: (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES)
+_ALL_USERS_USER_INDEX = 2
+_ALL_USERS_STATE_INDEX = 4
+_ALL_USERS_NODELIST_INDEX = 7
+_MIN_ALL_USERS_FIELDS = 8
+
+# squeue compact state codes (%t / StateCompact) and the long names printed by %T
+COMPACT_JOB_STATES: dict[str, str] = {
+    "BF": "BOOT_FAIL",
+    "CA": "CANCELLED",
+    "CD": "COMPLETED",
+    "CF": "CONFIGURING",
+    "CG": "COMPLETING",
+    "DL": "DEADLINE",
+    "F": "FAILED",
+    "NF": "NODE_FAIL",
+    "OOM": "OUT_OF_MEMORY",
+    "PD": "PENDING",
+    "PR": "PREEMPTED",
+    "R": "RUNNING",
+    "RD": "RESV_DEL_HOLD",
+    "RF": "REQUEUE_FED",
+    "RH": "REQUEUE_HOLD",
+    "RQ": "REQUEUED",
+    "RS": "RESIZING",
+    "RV": "REVOKED",
+    "S": "SUSPENDED",
+    "SE": "SPECIAL_EXIT",
+    "SI": "SIGNALING",
+    "SO": "STAGE_OUT",
+    "ST": "STOPPED",
+    "TO": "TIMEOUT",
+}
+
+
+def index_fair_share_by_user(entries: list[tuple[str, ...]]) -> dict[str, dict[str, str]]:
+    """Index sshare rows by user.
+
+    Args:
+        entries: Parsed sshare rows.
+
+    Returns:
+        Mapping of username to the fair-share info of the user's first sshare row.
+    """
+    by_user: dict[str, dict[str, str]] = {}
+    for entry in entries:
+        if len(entry) < _MIN_SSHARE_FIELDS or entry[1] in by_user:
+            continue
+        by_user[entry[1]] = {
+            "account": entry[0],
+            "raw_shares": entry[2],
+            "norm_shares": entry[3],
+            "raw_usage": entry[4],
+            "norm_usage": entry[5],
+            "effective_usage": entry[6],
+            "fair_share": entry[7],
+        }
+    return by_user
+
+
+def index_job_priorities_by_user(entries: list[tuple[str, ...]]) -> dict[str, list[dict[str, str]]]:
+    """Index sprio rows by user.
+
+    Args:
+        entries: Parsed sprio rows.
+
+    Returns:
+        Mapping of username to the priority factors of the user's pending jobs, in sprio order.
+    """
+    by_user: dict[str, list[dict[str, str]]] = {}
+    for entry in entries:
+        if len(entry) < _MIN_SPRIO_FIELDS:
+            continue
+        by_user.setdefault(entry[1], []).append(
+            {
+                "job_id": entry[0],
+                "priority": entry[3],
+                "age": entry[4],
+                "fair_share": entry[5],
+                "job_size": entry[6],
+                "partition": entry[7],
+                "qos": entry[8],
+            }
+        )
+    return by_user
+
+
+def to_user_job_row(job: tuple[str, ...]) -> tuple[str, ...]:
+    """Convert an all-users squeue job to the per-user format of ``get_user_jobs``.
+
+    Args:
+        job: All-users job tuple (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES).
+
+    Returns:
+        Job tuple without the User field (JobID, Name, Partition, State, Time, Nodes, NodeList, TRES).
+    """
+    return job[:_ALL_USERS_USER_INDEX] + job[_ALL_USERS_USER_INDEX + 1 :]
+
+
+def select_user_jobs(jobs: list[tuple[str, ...]], username: str) -> list[tuple[str, ...]]:
+    """Return one user's jobs from the all-users squeue jobs.
+
+    Args:
+        jobs: All-users job tuples (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES).
+        username: User whose jobs to keep.
+
+    Returns:
+        The user's job tuples, in snapshot order.
+    """
+    return [job for job in jobs if len(job) >= _MIN_ALL_USERS_FIELDS and job[_ALL_USERS_USER_INDEX].strip() == username]
+
+
+def select_running_jobs(jobs: list[tuple[str, ...]]) -> list[tuple[str, ...]]:
+    """Return the RUNNING jobs of the all-users squeue jobs.
+
+    The snapshot also lists COMPLETING, CONFIGURING, SUSPENDED and held jobs,
+    which must not count as allocated resources.
+
+    Args:
+        jobs: All-users job tuples (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES).
+
+    Returns:
+        The running job tuples, in snapshot order.
+    """
+    return [
+        job
+        for job in jobs
+        if len(job) > _ALL_USERS_STATE_INDEX and job[_ALL_USERS_STATE_INDEX].strip().upper() in ("RUNNING", "R")
+    ]
+
+
+def to_running_job_row(job: tuple[str, ...], schedule: tuple[str, ...] | None) -> tuple[str, ...]:
+    """Convert an all-users squeue job to the format of ``get_running_jobs``.
+
+    Args:
+        job: All-users job tuple (JobID, Name, User, Partition, State, Time, Nodes, NodeList, TRES).
+        schedule: The job's (Reason, SubmitTime, StartTime) from ``get_job_schedule_fields``,
+            or None if unknown.
+
+    Returns:
+        Job tuple (JobID, Name, State, Time, Nodes, NodeList(Reason), SubmitTime, StartTime),
+        with the long state name and, for pending jobs, the reason in parentheses.
+    """
+    reason, submit_time, start_time = schedule if schedule is not None else ("", "", "")
+    state = job[_ALL_USERS_STATE_INDEX].strip()
+    state = COMPACT_JOB_STATES.get(state, state)
+    node_list = job[_ALL_USERS_NODELIST_INDEX].strip()
+    if state == "PENDING" and not node_list and reason:
+        node_list = f"({reason})"
+    return (job[0], job[1], state, job[5], job[6], node_list, submit_time, start_time)
@@ -1,7 +1,9 @@
 """Wait time calculation utilities for SLURM jobs."""
 
+import math
+import threading
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from statistics import mean, median
 
 from stoei.logger import get_logger
@@ -20,6 +22,22 @@ MINUTES_PER_HOUR = 60
 HOURS_PER_DAY = 24
 THRESHOLD_FOR_INTEGER_DISPLAY = 10
 
+# Rolling wait-time windows shown in the sidebar (hours)
+WAIT_TIME_WINDOWS_HOURS: tuple[int, ...] = (1, 24, 168)
+
+# Width of the time buckets used by the rolling store (seconds)
+WAIT_TIME_BUCKET_SECONDS = 300
+
+# Overlap between consecutive incremental sacct queries (seconds), so jobs that
+# start while a query is in flight are picked up by the next one
+WAIT_TIME_QUERY_OVERLAP_SECONDS = 60
+
+# Relative accuracy of the quantile sketch (2% => p99 of 1h is reported within ~1.2m)
+SKETCH_RELATIVE_ACCURACY = 0.02
+
+# Waits at or below this many seconds are collapsed into a single zero bucket
+SKETCH_MIN_VALUE = 1.0
+
 
 @dataclass
 class PartitionWaitStats:
@@ -31,6 +49,8 @@ class PartitionWaitStats:
     median_seconds: float
     min_seconds: float
     max_seconds: float
+    p90_seconds: float = 0.0
+    p99_seconds: float = 0.0
 
 
 def parse_slurm_timestamp(timestamp_str: str) -> datetime | None:
@@ -48,7 +68,7 @@ def parse_slurm_timestamp(timestamp_str: str) -> datetime | None:
     try:
         return datetime.strptime(timestamp_str.strip(), SLURM_TIMESTAMP_FORMAT)
     except ValueError:
-        logger.debug(f"Failed to parse SLURM timestamp: {timestamp_str}")
+        logger.debug("Failed to parse SLURM timestamp: {}", timestamp_str)
         return None
 
 
@@ -74,7 +94,7 @@ def calculate_wait_time_seconds(submit_time: str, start_time: str) -> float | No
 
     # Negative wait time indicates data issue (start before submit)
     if wait_seconds < 0:
-        logger.debug(f"Negative wait time detected: submit={submit_time}, start={start_time}")
+        logger.debug("Negative wait time detected: submit={}, start={}", submit_time, start_time)
         return None
 
     return wait_seconds
@@ -150,14 +170,392 @@ def calculate_partition_wait_stats(jobs: list[tuple[str, ...]]) -> dict[str, Par
         if not wait_times:
             continue
 
+        sorted_times = sorted(wait_times)
         result[partition] = PartitionWaitStats(
             partition=partition,
-            job_count=len(wait_times),
-            mean_seconds=mean(wait_times),
-            median_seconds=median(wait_times),
-            min_seconds=min(wait_times),
-            max_seconds=max(wait_times),
+            job_count=len(sorted_times),
+            mean_seconds=mean(sorted_times),
+            median_seconds=median(sorted_times),
+            min_seconds=sorted_times[0],
+            max_seconds=sorted_times[-1],
+            p90_seconds=_nearest_rank(sorted_times, 0.90),
+            p99_seconds=_nearest_rank(sorted_times, 0.99),
         )
 
-    logger.debug(f"Calculated wait stats for {len(result)} partitions from {len(jobs)} jobs")
+    logger.debug("Calculated wait stats for {} partitions from {} jobs", len(result), len(jobs))
     return result
+
+
+def _nearest_rank(sorted_values: list[float], quantile: float) -> float:
+    """Return the nearest-rank quantile of an already sorted list.
+
+    Args:
+        sorted_values: Non-empty list of values in ascending order.
+        quantile: Quantile in the range [0, 1].
+
+    Returns:
+        The value at the requested quantile.
+    """
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class WaitTimeSketch:
+    """Mergeable quantile sketch for wait times.
+
+    Values are counted in logarithmic buckets (DDSketch-style), so every
+    quantile is reported within ``SKETCH_RELATIVE_ACCURACY`` of the true value
+    and two sketches merge by adding their bucket counts. Count, sum, min and
+    max are tracked exactly.
+    """
+
+    __slots__ = ("_bins", "_zero_count", "count", "max_seconds", "min_seconds", "sum_seconds")
+
+    _GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    def __init__(self) -> None:
+        """Initialize an empty sketch."""
+        self._bins: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum_seconds = 0.0
+        self.min_seconds = math.inf
+        self.max_seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add a single wait time to the sketch.
+
+        Args:
+            seconds: Wait time in seconds (negative values are clamped to 0).
+        """
+        seconds = max(0.0, seconds)
+        if seconds <= SKETCH_MIN_VALUE:
+            self._zero_count += 1
+        else:
+            key = math.ceil(math.log(seconds) / self._LOG_GAMMA)
+            self._bins[key] = self._bins.get(key, 0) + 1
+        self.count += 1
+        self.sum_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, other: "WaitTimeSketch") -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch whose counts are added to this sketch.
+        """
+        if other.count == 0:
+            return
+        for key, bin_count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + bin_count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum_seconds += other.sum_seconds
+        self.min_seconds = min(self.min_seconds, other.min_seconds)
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate a quantile of the recorded wait times.
+
+        Args:
+            quantile: Quantile in the range [0, 1].
+
+        Returns:
+            Estimated wait time in seconds (0.0 for an empty sketch).
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        if rank <= self._zero_count:
+            return self.min_seconds
+        seen = self._zero_count
+        value = self.max_seconds
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen >= rank:
+                value = 2 * self._GAMMA**key / (self._GAMMA + 1)
+                break
+        return min(max(value, self.min_seconds), self.max_seconds)
+
+    def to_stats(self, partition: str) -> PartitionWaitStats:
+        """Summarize the sketch as PartitionWaitStats.
+
+        Args:
+            partition: Partition name to attach to the stats.
+
+        Returns:
+            Stats with exact count/mean/min/max and estimated quantiles.
+        """
+        return PartitionWaitStats(
+            partition=partition,
+            job_count=self.count,
+            mean_seconds=self.sum_seconds / self.count if self.count else 0.0,
+            median_seconds=self.quantile(0.50),
+            min_seconds=self.min_seconds if self.count else 0.0,
+            max_seconds=self.max_seconds,
+            p90_seconds=self.quantile(0.90),
+            p99_seconds=self.quantile(0.99),
+        )
+
+
+class RollingWaitTimeStore:
+    """Per-partition wait times over rolling windows, fed incrementally.
+
+    Jobs are bucketed by start time into ``WAIT_TIME_BUCKET_SECONDS`` buckets,
+    each holding one WaitTimeSketch per partition. Window statistics merge the
+    buckets that overlap the window, so refreshes never repeat a 7-day sacct
+    query: each refresh only asks for jobs that started since the previous one
+    (see :meth:`next_query_start`). The history before the first incremental
+    query is loaded once by a separate backfill (see :meth:`backfill_window`).
+    """
+
+    def __init__(
+        self,
+        windows_hours: tuple[int, ...] = WAIT_TIME_WINDOWS_HOURS,
+        bucket_seconds: int = WAIT_TIME_BUCKET_SECONDS,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            windows_hours: Window lengths (hours) reported by :meth:`window_stats`.
+            bucket_seconds: Width of the start-time buckets in seconds.
+        """
+        self.windows_hours = tuple(sorted(windows_hours))
+        self._bucket_seconds = bucket_seconds
+        self._lock = threading.Lock()
+        self._buckets: dict[int, dict[str, WaitTimeSketch]] = {}
+        # Job IDs ingested inside the query overlap, used to drop duplicates
+        self._recent_ids: dict[str, float] = {}
+        self._last_query_end: datetime | None = None
+        # Start of the first incremental query; the backfill stops right before it
+        self._first_query_start: datetime | None = None
+        self._backfilled = False
+        # Earliest start time from which every started job has been ingested
+        self._covered_since: datetime | None = None
+        self._version = 0
+        self._window_cache: tuple[tuple[int, int], dict[int, dict[str, PartitionWaitStats]]] | None = None
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever new jobs are ingested."""
+        return self._version
+
+    @property
+    def backfill_pending(self) -> bool:
+        """Whether the history before the first incremental query is still missing."""
+        return not self._backfilled
+
+    def _anchor(self, now: datetime) -> datetime:
+        # Caller must hold self._lock
+        if self._first_query_start is None:
+            self._first_query_start = now - timedelta(hours=self.windows_hours[0])
+        return self._first_query_start
+
+    def next_query_start(self, now: datetime) -> datetime:
+        """Return the ``-S`` start time for the next incremental sacct query.
+
+        The first query covers the shortest window (retries of a failed first
+        query keep its start, so it never overlaps the backfill); later queries
+        start where the previous one ended (minus a small overlap), capped at
+        24 hours after a long outage.
+
+        Args:
+            now: Current local time.
+
+        Returns:
+            Start time for the next query.
+        """
+        with self._lock:
+            last_end = self._last_query_end
+            if last_end is None:
+                start = self._anchor(now)
+            else:
+                start = last_end - timedelta(seconds=WAIT_TIME_QUERY_OVERLAP_SECONDS)
+        return max(start, now - timedelta(hours=24))
+
+    def backfill_window(self, now: datetime) -> tuple[datetime, datetime] | None:
+        """Return the ``-S``/``-E`` range of the one-off backfill query.
+
+        The backfill covers the longest window up to the start of the first
+        incremental query, so the two never ingest the same job.
+
+        Args:
+            now: Current local time.
+
+        Returns:
+            Tuple of (since, until), or None once the backfill was ingested.
+        """
+        with self._lock:
+            if self._backfilled:
+                return None
+            until = self._anchor(now)
+        since = now - timedelta(hours=max(self.windows_hours))
+        return min(since, until), until
+
+    def _bucket_job(self, job: tuple[str, ...], since_ts: float, until_ts: float) -> tuple[str, float] | None:
+        """Add one job to its start-time bucket if it started within the range.
+
+        Caller must hold ``self._lock``.
+
+        Args:
+            job: Job tuple (JobID, Partition, State, Submit, Start).
+            since_ts: Earliest accepted start timestamp.
+            until_ts: Start timestamps at or after this are rejected.
+
+        Returns:
+            Tuple of (job ID, start timestamp) for an added job, otherwise None.
+        """
+        min_fields = 5
+        if len(job) < min_fields:
+            return None
+        job_id = job[0].strip()
+        start_dt = parse_slurm_timestamp(job[4])
+        if start_dt is None:
+            return None
+        start_ts = start_dt.timestamp()
+        if start_ts < since_ts or start_ts >= until_ts or job_id in self._recent_ids:
+            return None
+        wait_seconds = calculate_wait_time_seconds(job[3], job[4])
+        if wait_seconds is None:
+            return None
+        partition = job[1].strip() or "unknown"
+        bucket = self._buckets.setdefault(int(start_ts // self._bucket_seconds), {})
+        bucket.setdefault(partition, WaitTimeSketch()).add(wait_seconds)
+        return job_id, start_ts
+
+    def ingest(self, jobs: list[tuple[str, ...]], since: datetime, until: datetime) -> int:
+        """Add jobs that started within ``[since, until]`` to the store.
+
+        Jobs that started before ``since`` (sacct also reports jobs that were
+        merely running during the window) and jobs already ingested in the
+        overlap are skipped.
+
+        Args:
+            jobs: Job tuples (JobID, Partition, State, Submit, Start).
+            since: Start of the sacct query window.
+            until: Time the sacct query was issued.
+
+        Returns:
+            Number of newly ingested jobs.
+        """
+        horizon_ts = until.timestamp() - max(self.windows_hours) * 3600
+        since_ts = max(since.timestamp(), horizon_ts)
+        added = 0
+        with self._lock:
+            for job in jobs:
+                ingested = self._bucket_job(job, since_ts, math.inf)
+                if ingested is None:
+                    continue
+                job_id, start_ts = ingested
+                self._recent_ids[job_id] = start_ts
+                added += 1
+
+            # Only IDs that can reappear in the next query's overlap are kept
+            keep_after = until.timestamp() - 2 * WAIT_TIME_QUERY_OVERLAP_SECONDS
+            self._recent_ids = {jid: ts for jid, ts in self._recent_ids.items() if ts >= keep_after}
+            oldest_bucket = int(horizon_ts // self._bucket_seconds)
+            for key in [k for k in self._buckets if k < oldest_bucket]:
+                del self._buckets[key]
+            self._last_query_end = until
+            if self._covered_since is None or since < self._covered_since:
+                self._covered_since = since
+            if added:
+                self._version += 1
+
+        logger.debug("Wait-time store ingested {}/{} jobs ({} buckets)", added, len(jobs), len(self._buckets))
+        return added
+
+    def ingest_backfill(self, jobs: list[tuple[str, ...]], since: datetime, until: datetime) -> int:
+        """Add the jobs of the backfill query returned by :meth:`backfill_window`.
+
+        Only jobs that started within ``[since, until)`` are added; the
+        incremental queries own everything from ``until`` on.
+
+        Args:
+            jobs: Job tuples (JobID, Partition, State, Submit, Start).
+            since: Start of the backfill window.
+            until: End of the backfill window.
+
+        Returns:
+            Number of newly ingested jobs.
+        """
+        since_ts = since.timestamp()
+        until_ts = until.timestamp()
+        added = 0
+        with self._lock:
+            for job in jobs:
+                if self._bucket_job(job, since_ts, until_ts) is not None:
+                    added += 1
+            self._backfilled = True
+            if self._covered_since is None or since < self._covered_since:
+                self._covered_since = since
+            self._version += 1
+
+        logger.debug("Wait-time store backfilled {}/{} jobs ({} buckets)", added, len(jobs), len(self._buckets))
+        return added
+
+    def covered_seconds(self, now: datetime) -> float:
+        """Return how far back the store holds every started job.
+
+        Windows longer than this only reflect the covered part, e.g. while the
+        backfill has not been ingested yet.
+
+        Args:
+            now: Current local time.
+
+        Returns:
+            Covered history in seconds, capped at the longest window (0.0 before
+            the first ingest).
+        """
+        with self._lock:
+            covered_since = self._covered_since
+        if covered_since is None:
+            return 0.0
+        return max(0.0, min((now - covered_since).total_seconds(), max(self.windows_hours) * 3600.0))
+
+    def stats_key(self, now: datetime) -> tuple[int, int]:
+        """Return a key that changes whenever :meth:`window_stats` may change.
+
+        Args:
+            now: Current local time.
+
+        Returns:
+            Tuple of (store version, current bucket index).
+        """
+        return self._version, int(now.timestamp() // self._bucket_seconds)
+
+    def window_stats(self, now: datetime) -> dict[int, dict[str, PartitionWaitStats]]:
+        """Return per-partition statistics for every configured window.
+
+        Results are memoized until new jobs arrive or the current bucket rolls
+        over, so repeated calls within a refresh cycle are cheap.
+
+        Args:
+            now: Current local time.
+
+        Returns:
+            Dict mapping window length (hours) to per-partition stats. Windows
+            without any jobs are omitted.
+        """
+        current_bucket = int(now.timestamp() // self._bucket_seconds)
+        with self._lock:
+            cache_key = (self._version, current_bucket)
+            if self._window_cache is not None and self._window_cache[0] == cache_key:
+                return self._window_cache[1]
+
+            result: dict[int, dict[str, PartitionWaitStats]] = {}
+            for hours in self.windows_hours:
+                first_bucket = current_bucket - (hours * 3600) // self._bucket_seconds
+                merged: dict[str, WaitTimeSketch] = {}
+                for key, partitions in self._buckets.items():
+                    if key < first_bucket:
+                        continue
+                    for partition, sketch in partitions.items():
+                        merged.setdefault(partition, WaitTimeSketch()).merge(sketch)
+                if merged:
+                    result[hours] = {partition: sketch.to_stats(partition) for partition, sketch in merged.items()}
+
+            self._window_cache = (cache_key, result)
+            return result
@@ -0,0 +1,149 @@
+"""Immutable, versioned snapshot of refresh data shared by worker and UI threads.
+
+The background refresh worker publishes each data source (and the caches
+derived from it) as a new :class:`ClusterSnapshot`, swapping a single reference
+in a :class:`SnapshotStore`. Readers take ``store.current`` once and get a
+consistent, zero-copy view of every source at that generation; nothing in a
+published snapshot is mutated afterwards, so no locks or defensive copies are
+needed on the read side.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, Protocol, Self, TypeVar, overload
+
+from stoei.logger import get_logger
+
+if TYPE_CHECKING:
+    from stoei.widgets.cluster_sidebar import ClusterStats
+    from stoei.widgets.node_overview import NodeInfo
+    from stoei.widgets.priority_overview import AccountPriority, JobPriority, UserPriority
+    from stoei.widgets.user_overview import UserEnergyStats, UserPendingStats, UserStats
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _empty_generations() -> Mapping[str, int]:
+    return MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class ClusterSnapshot:
+    """One immutable generation of refresh data.
+
+    Lists are handed over by the publisher and must not be mutated once
+    published; replace them by publishing a new generation instead.
+    ``source_generations`` records the generation at which each source was
+    last published, so consumers can tell which inputs changed.
+    """
+
+    generation: int = 0
+    source_generations: Mapping[str, int] = field(default_factory=_empty_generations)
+    # nodes
+    cluster_nodes: list[dict[str, str]] = field(default_factory=list)
+    node_infos: list[NodeInfo] = field(default_factory=list)
+    # all_jobs
+    all_users_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    running_user_stats: list[UserStats] = field(default_factory=list)
+    pending_user_stats: list[UserPendingStats] = field(default_factory=list)
+    # energy
+    energy_history_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    energy_user_stats: list[UserEnergyStats] = field(default_factory=list)
+    # wait_time
+    wait_time_jobs: list[tuple[str, ...]] = field(default_factory=list)
+    cluster_stats: ClusterStats | None = None
+    # fair_share / job_priority (raw) and priority (derived)
+    fair_share_entries: list[tuple[str, ...]] = field(default_factory=list)
+    job_priority_entries: list[tuple[str, ...]] = field(default_factory=list)
+    user_priorities: list[UserPriority] = field(default_factory=list)
+    account_priorities: list[AccountPriority] = field(default_factory=list)
+    job_priorities: list[JobPriority] = field(default_factory=list)
+    user_priority_rows: list[tuple[str, ...]] = field(default_factory=list)
+    account_priority_rows: list[tuple[str, ...]] = field(default_factory=list)
+    job_priority_rows: list[tuple[str, ...]] = field(default_factory=list)
+    my_job_priority_rows: list[tuple[str, ...]] = field(default_factory=list)
+    priority_summary_markup: str = ""
+
+    def source_generation(self, source: str) -> int:
+        """Return the generation at which ``source`` was last published (0 if never)."""
+        return self.source_generations.get(source, 0)
+
+
+class SnapshotStore:
+    """Holds the current ClusterSnapshot and publishes new generations.
+
+    Publishing is serialized with a lock so concurrent writers never lose each
+    other's updates; reading ``current`` is a single attribute load.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store with an empty generation-0 snapshot."""
+        self._lock = threading.Lock()
+        self._current = ClusterSnapshot()
+
+    @property
+    def current(self) -> ClusterSnapshot:
+        """The latest published snapshot."""
+        return self._current
+
+    def publish(self, source: str, **changes: Any) -> ClusterSnapshot:
+        """Publish a new snapshot with ``changes`` applied for ``source``.
+
+        Args:
+            source: Name of the data source being updated (e.g. ``"nodes"``).
+            **changes: ClusterSnapshot fields to replace.
+
+        Returns:
+            The newly published snapshot.
+        """
+        with self._lock:
+            previous = self._current
+            generation = previous.generation + 1
+            source_generations = MappingProxyType({**previous.source_generations, source: generation})
+            snapshot = replace(previous, generation=generation, source_generations=source_generations, **changes)
+            self._current = snapshot
+        logger.debug("Published snapshot generation {} ({}: {})", generation, source, ", ".join(changes))
+        return snapshot
+
+
+class _HasSnapshotStore(Protocol):
+    _snapshot_store: SnapshotStore
+
+
+class SnapshotAttribute(Generic[T]):
+    """Descriptor exposing one ClusterSnapshot field as an instance attribute.
+
+    Reading returns the field from the owner's current snapshot; assigning
+    publishes a new snapshot for the field's source. The owner must provide a
+    ``_snapshot_store`` attribute.
+    """
+
+    def __init__(self, field_name: str, source: str) -> None:
+        """Initialize the descriptor.
+
+        Args:
+            field_name: ClusterSnapshot field to expose.
+            source: Source name to publish under when the attribute is assigned.
+        """
+        self._field_name = field_name
+        self._source = source
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Self: ...
+    @overload
+    def __get__(self, instance: _HasSnapshotStore, owner: type) -> T: ...
+    def __get__(self, instance: _HasSnapshotStore | None, owner: type) -> Self | T:
+        """Return the field from the owner's current snapshot."""
+        if instance is None:
+            return self
+        return getattr(instance._snapshot_store.current, self._field_name)
+
+    def __set__(self, instance: _HasSnapshotStore, value: T) -> None:
+        """Publish a new snapshot with the field replaced."""
+        instance._snapshot_store.publish(self._source, **{self._field_name: value})
@@ -0,0 +1,168 @@
+"""Per-stage timings of the refresh pipeline.
+
+Stages are grouped by kind: SLURM command latency (with output size), output
+parsing, derived-view computation and main-thread widget updates. Each stage
+keeps a fixed-size histogram, so memory stays bounded however long the
+session runs, and p50/p95 are read from the bucket bounds. The Performance tab
+shows the summaries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+COMMAND = "command"
+PARSE = "parse"
+DERIVE = "derive"
+APPLY = "apply"
+STAGE_KINDS: tuple[str, ...] = (COMMAND, PARSE, DERIVE, APPLY)
+
+# Upper bounds of the histogram buckets in seconds: 0.1ms doubling up to ~105s
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(0.0001 * 2**index for index in range(21))
+
+
+class Histogram:
+    """Fixed-size histogram of durations with exponential buckets."""
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # One count per bucket plus one for durations beyond the last bound
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration.
+
+        Args:
+            seconds: Duration in seconds.
+        """
+        index = 0
+        while index < len(_BUCKET_BOUNDS) and seconds > _BUCKET_BOUNDS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Return an upper estimate of a percentile.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            The upper bound of the bucket holding the percentile (capped at the
+            maximum seen), or 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass(frozen=True)
+class StageSummary:
+    """Timing summary of one pipeline stage."""
+
+    kind: str
+    name: str
+    count: int
+    p50: float
+    p95: float
+    max: float
+    total: float
+    output_bytes: int  # Total command output; 0 for other stage kinds
+
+
+class Telemetry:
+    """Thread-safe registry of stage histograms."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded stages."""
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._output_bytes: dict[tuple[str, str], int] = {}
+
+    def record(self, kind: str, name: str, seconds: float, *, output_bytes: int = 0) -> None:
+        """Record one run of a stage.
+
+        Args:
+            kind: Stage kind (:data:`COMMAND`, :data:`PARSE`, :data:`DERIVE` or :data:`APPLY`).
+            name: Stage name, e.g. the command or view name.
+            seconds: Duration in seconds.
+            output_bytes: Size of the command output, for command stages.
+        """
+        key = (kind, name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.record(seconds)
+            if output_bytes:
+                self._output_bytes[key] = self._output_bytes.get(key, 0) + output_bytes
+
+    @contextmanager
+    def timed(self, kind: str, name: str) -> Generator[None]:
+        """Record the duration of the ``with`` block as one run of a stage.
+
+        Args:
+            kind: Stage kind.
+            name: Stage name.
+
+        Yields:
+            Nothing.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, name, time.perf_counter() - started)
+
+    def summaries(self) -> list[StageSummary]:
+        """Return a summary per stage, ordered by kind and then by total time.
+
+        Returns:
+            One summary per recorded stage.
+        """
+        with self._lock:
+            summaries = [
+                StageSummary(
+                    kind=kind,
+                    name=name,
+                    count=histogram.count,
+                    p50=histogram.percentile(0.5),
+                    p95=histogram.percentile(0.95),
+                    max=histogram.max,
+                    total=histogram.total,
+                    output_bytes=self._output_bytes.get((kind, name), 0),
+                )
+                for (kind, name), histogram in self._histograms.items()
+            ]
+        order = {kind: index for index, kind in enumerate(STAGE_KINDS)}
+        return sorted(summaries, key=lambda summary: (order.get(summary.kind, len(order)), -summary.total))
+
+    def clear(self) -> None:
+        """Forget all recorded stages."""
+        with self._lock:
+            self._histograms.clear()
+            self._output_bytes.clear()
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """Return the process-wide telemetry registry."""
+    return _telemetry
@@ -0,0 +1,254 @@
+"""Span tracing of refresh cycles, exported as a Chrome trace.
+
+When enabled with ``stoei --trace FILE``, each refresh cycle is recorded as
+spans: the cycle itself, each fetcher on the refresh pool, retry attempts and
+backoff sleeps, subprocess executions, the application of each fetch result
+and every callback run on the UI thread. Spans nest per thread; spans
+recorded while a cycle is open carry its number in their ``cycle`` argument.
+The file is written on exit in the Chrome trace event format, which
+``chrome://tracing`` and https://ui.perfetto.dev open directly.
+
+Disabled tracing costs one list lookup per span.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from functools import wraps
+from pathlib import Path
+from types import TracebackType
+from typing import ParamSpec, TypeVar
+
+from stoei.logger import get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CYCLE = "cycle"
+FETCH = "fetch"
+RETRY = "retry"
+SUBPROCESS = "subprocess"
+APPLY_RESULT = "apply"
+UI_CALLBACK = "ui"
+
+# Oldest spans are dropped beyond this; a cycle records a few dozen spans
+MAX_EVENTS = 200_000
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+# Recorded span: (name, category, start µs, duration µs, native thread id, args)
+_Event = tuple[str, str, int, int, int, dict[str, object]]
+
+
+class Tracer:
+    """Thread-safe buffer of completed spans."""
+
+    def __init__(self, path: Path, max_events: int = MAX_EVENTS) -> None:
+        """Initialize an empty trace.
+
+        Args:
+            path: File the trace is written to.
+            max_events: Maximum number of spans kept.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._events: deque[_Event] = deque(maxlen=max_events)
+        self._recorded = 0
+        self._thread_names: dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+        self._cycle = 0
+        self._cycle_open = False
+
+    def now_us(self) -> int:
+        """Return microseconds since the trace started."""
+        return (time.perf_counter_ns() - self._origin_ns) // 1000
+
+    def begin_cycle(self) -> int:
+        """Open a refresh cycle, so that spans recorded until it ends carry its number.
+
+        Returns:
+            The cycle number.
+        """
+        with self._lock:
+            self._cycle += 1
+            self._cycle_open = True
+            return self._cycle
+
+    def end_cycle(self) -> None:
+        """Close the open refresh cycle."""
+        with self._lock:
+            self._cycle_open = False
+
+    def current_cycle(self) -> int | None:
+        """Return the number of the open refresh cycle, if any."""
+        return self._cycle if self._cycle_open else None
+
+    def record(self, name: str, category: str, start_us: int, args: dict[str, object]) -> None:
+        """Record a span that started at ``start_us`` and ends now on the calling thread.
+
+        Args:
+            name: Span name.
+            category: Span category, e.g. :data:`FETCH`.
+            start_us: Start time from :meth:`now_us`.
+            args: Extra values shown with the span.
+        """
+        duration = self.now_us() - start_us
+        thread_id = threading.get_native_id()
+        with self._lock:
+            if thread_id not in self._thread_names:
+                self._thread_names[thread_id] = threading.current_thread().name
+            self._events.append((name, category, start_us, duration, thread_id, args))
+            self._recorded += 1
+
+    def write(self) -> Path:
+        """Write the spans as a Chrome trace.
+
+        Returns:
+            The path written to.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+            dropped = self._recorded - len(events)
+        trace_events: list[dict[str, object]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in thread_names.items()
+        ]
+        trace_events.extend(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": duration,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, category, start, duration, tid, args in events
+        )
+        payload = {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"droppedSpans": dropped}}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(self.path)
+        logger.info(f"Trace written to {self.path}: {len(events)} spans, {dropped} dropped")
+        return self.path
+
+
+class _Span:
+    """Context manager recording one span on exit."""
+
+    __slots__ = ("_args", "_category", "_name", "_start", "_tracer")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, object]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> None:
+        if self._category == CYCLE:
+            self._args["cycle"] = self._tracer.begin_cycle()
+        else:
+            cycle = self._tracer.current_cycle()
+            if cycle is not None:
+                self._args["cycle"] = cycle
+        self._start = self._tracer.now_us()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.record(self._name, self._category, self._start, self._args)
+        if self._category == CYCLE:
+            self._tracer.end_cycle()
+
+
+# Using lists as mutable containers so functions can update state without `global`.
+_tracer: list[Tracer | None] = [None]
+
+
+def configure_tracing(path: Path | None) -> None:
+    """Start recording spans for the file at ``path``, or stop recording if None.
+
+    Args:
+        path: Trace file written by :func:`write_trace`.
+    """
+    _tracer[0] = Tracer(path) if path is not None else None
+
+
+def span(name: str, category: str, **args: object) -> AbstractContextManager[None]:
+    """Return a context manager recording the ``with`` block as a span.
+
+    A :data:`CYCLE` span opens a refresh cycle: spans recorded on any thread
+    until it ends carry the cycle number.
+
+    Args:
+        name: Span name.
+        category: Span category.
+        **args: Extra values shown with the span.
+
+    Returns:
+        The span, or a no-op context manager when tracing is disabled.
+    """
+    tracer = _tracer[0]
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args)
+
+
+def traced(name: str, category: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Return a decorator recording each call as a span.
+
+    Args:
+        name: Span name.
+        category: Span category.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorate(work: Callable[P, R]) -> Callable[P, R]:
+        @wraps(work)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name, category):
+                return work(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def write_trace() -> Path | None:
+    """Write the recorded spans, if tracing is enabled.
+
+    Returns:
+        The trace file, or None if tracing is disabled or the file could not
+        be written.
+    """
+    tracer = _tracer[0]
+    if tracer is None:
+        return None
+    try:
+        return tracer.write()
+    except OSError as exc:
+        logger.warning(f"Failed to write trace to {tracer.path}: {exc}")
+        return None
@@ -5,6 +5,7 @@ from stoei.widgets.job_stats import JobStats
 from stoei.widgets.loading_screen import LoadingScreen, LoadingStep
 from stoei.widgets.log_pane import LogPane
 from stoei.widgets.node_overview import NodeInfo, NodeOverviewTab
+from stoei.widgets.performance_tab import PerformanceTab
 from stoei.widgets.priority_overview import PriorityOverviewTab
 from stoei.widgets.screens import CancelConfirmScreen, JobInfoScreen, JobInputScreen
 from stoei.widgets.tabs import TabContainer, TabSwitched
@@ -22,6 +23,7 @@ __all__ = [
     "LogPane",
     "NodeInfo",
     "NodeOverviewTab",
+    "PerformanceTab",
     "PriorityOverviewTab",
     "TabContainer",
     "TabSwitched",
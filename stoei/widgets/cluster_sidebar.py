@@ -12,6 +12,8 @@ from stoei.slurm.wait_time import PartitionWaitStats, format_wait_time
 
 # Conversion constant: 1 TB = 1024 GB
 GB_PER_TB = 1024
+HOURS_PER_DAY = 24
+SECONDS_PER_HOUR = 3600
 
 
 def format_memory_gb(memory_gb: float) -> str:
@@ -65,6 +67,10 @@ class ClusterStats:
     # Wait time statistics per partition (from last N hours)
     wait_stats_by_partition: dict[str, PartitionWaitStats] = field(default_factory=dict)
     wait_stats_hours: int = 1  # Time window used for stats
+    # Rolling wait time statistics: window length (hours) -> per-partition stats
+    wait_stats_by_window: dict[int, dict[str, PartitionWaitStats]] = field(default_factory=dict)
+    # History the rolling windows actually hold (None: every window is complete)
+    wait_stats_covered_seconds: float | None = None
 
     @property
     def free_nodes_pct(self) -> float:
@@ -279,6 +285,60 @@ class ClusterSidebar(VerticalScroll):
             max_str = format_wait_time(wstats.max_seconds)
             lines.append(f"  {partition}: {mean_str}/{median_str}/{min_str}-{max_str}")
 
+    @staticmethod
+    def _format_window(hours: int) -> str:
+        """Format a window length as a short label (e.g. ``1h``, ``7d``)."""
+        if hours >= HOURS_PER_DAY and hours % HOURS_PER_DAY == 0 and hours > HOURS_PER_DAY:
+            return f"{hours // HOURS_PER_DAY}d"
+        return f"{hours}h"
+
+    def _append_wait_percentile_section(self, lines: list[str], stats: ClusterStats) -> None:
+        """Append rolling wait time percentiles for each window.
+
+        A window is skipped when it holds exactly as many jobs as the previous
+        one, i.e. the longer history has not accumulated yet. A window longer
+        than the history loaded so far is labelled with the covered span.
+
+        Example output::
+
+            Wait Percentiles
+            (p50/p90/p99, jobs)
+             Last 1h
+              cpu: 3m/10m/30m (42)
+             Last 3.5h (of 24h)
+              cpu: 5m/20m/1.0h (150)
+        """
+        if not stats.wait_stats_by_window:
+            return
+
+        section: list[str] = []
+        previous_total: int | None = None
+        for hours in sorted(stats.wait_stats_by_window):
+            by_partition = stats.wait_stats_by_window[hours]
+            total = sum(wstats.job_count for wstats in by_partition.values())
+            if not by_partition or total == previous_total:
+                continue
+            previous_total = total
+            label = self._format_window(hours)
+            covered = stats.wait_stats_covered_seconds
+            if covered is not None and covered < hours * SECONDS_PER_HOUR:
+                label = f"{format_wait_time(covered)} (of {label})"
+            section.append(f" [bright_black]Last {label}[/bright_black]")
+            for partition in sorted(by_partition.keys(), key=lambda p: p.casefold()):
+                wstats = by_partition[partition]
+                p50_str = format_wait_time(wstats.median_seconds)
+                p90_str = format_wait_time(wstats.p90_seconds)
+                p99_str = format_wait_time(wstats.p99_seconds)
+                section.append(f"  {partition}: {p50_str}/{p90_str}/{p99_str} ({wstats.job_count})")
+
+        if not section:
+            return
+
+        lines.append("")
+        lines.append("[bold]Wait Percentiles[/bold]")
+        lines.append("[bright_black](p50/p90/p99, jobs)[/bright_black]")
+        lines.extend(section)
+
     def _render_stats(self) -> str:
         """Render the statistics as a string.
 
@@ -321,6 +381,7 @@ class ClusterSidebar(VerticalScroll):
 
         self._append_gpu_section(lines, stats, gpus_pct=gpus_pct)
         self._append_wait_time_section(lines, stats)
+        self._append_wait_percentile_section(lines, stats)
         self._append_pending_queue_section(lines, stats)
 
         return "\n".join(lines)
@@ -294,7 +294,7 @@ class FilterableDataTable(Vertical):
                 filter_bar.remove_class("visible")
                 filter_bar.remove_class("always-visible")
         except Exception as exc:
-            logger.debug(f"Failed to update filter bar visibility: {exc}")
+            logger.debug("Failed to update filter bar visibility: {}", exc)
 
     def watch_filter_visible(self, visible: bool) -> None:
         """React to filter visibility changes."""
@@ -304,7 +304,7 @@ class FilterableDataTable(Vertical):
                 filter_input = self.query_one("#filter-input", Input)
                 filter_input.focus()
             except Exception as exc:
-                logger.debug(f"Failed to focus filter input: {exc}")
+                logger.debug("Failed to focus filter input: {}", exc)
 
     def action_show_filter(self) -> None:
         """Show the filter bar and focus the input."""
@@ -319,7 +319,7 @@ class FilterableDataTable(Vertical):
             filter_input = self.query_one("#filter-input", Input)
             filter_input.value = ""
         except Exception as exc:
-            logger.debug(f"Failed to clear filter input: {exc}")
+            logger.debug("Failed to clear filter input: {}", exc)
         self._apply_filter("")
         # Focus the table
         self.table.focus()
@@ -680,7 +680,7 @@ class FilterableDataTable(Vertical):
             else:
                 help_text.update("[dim]Enter to apply, Escape to clear[/dim]")
         except Exception as exc:
-            logger.debug(f"Failed to update filter status: {exc}")
+            logger.debug("Failed to update filter status: {}", exc)
 
     def set_data(self, rows: list[tuple[Any, ...]]) -> None:
         """Set the table data.
@@ -731,7 +731,7 @@ class FilterableDataTable(Vertical):
         # is more efficient than many individual DOM operations.
         max_visible = max(len(old_visible), len(new_visible), 1)
         if delta > max_visible // 2 and delta > self._INCREMENTAL_DELTA_FLOOR:
-            logger.debug(f"Large delta ({delta}/{max_visible}); full rebuild")
+            logger.debug("Large delta ({}/{}); full rebuild", delta, max_visible)
             self._rows_by_key = new_rows_by_key
             self._refresh_table_data()
             return
@@ -742,7 +742,7 @@ class FilterableDataTable(Vertical):
         # (e.g. pending/newest-first).  Removals also warrant a rebuild to
         # keep the visual order consistent with the data order.
         if added or removed:
-            logger.debug(f"Row membership changed (+{len(added)} -{len(removed)}); full rebuild for order")
+            logger.debug("Row membership changed (+{} -{}); full rebuild for order", len(added), len(removed))
             self._rows_by_key = new_rows_by_key
             self._refresh_table_data()
             return
@@ -765,7 +765,7 @@ class FilterableDataTable(Vertical):
         # Update filter status
         self._update_filter_status(len(new_visible), len(self._all_rows))
 
-        logger.debug(f"Incremental update: {updated_cells} cells updated, {len(kept)} rows kept")
+        logger.debug("Incremental update: {} cells updated, {} rows kept", updated_cells, len(kept))
 
     def add_row(self, *cells: CellType, key: str | None = None) -> RowKey:
         """Add a row to the table.
@@ -816,7 +816,7 @@ class FilterableDataTable(Vertical):
                     self.action_hide_filter()
                     return
             except Exception as exc:
-                logger.debug(f"Failed to handle escape key in filter input: {exc}")
+                logger.debug("Failed to handle escape key in filter input: {}", exc)
 
         # Handle emacs-mode keybindings
         if self._keybind_mode == "emacs":
@@ -895,14 +895,14 @@ class FilterableDataTable(Vertical):
         if not self._columns:
             return
         self._selected_column_index = (self._selected_column_index + 1) % len(self._columns)
-        logger.debug(f"Selected column: {self._columns[self._selected_column_index].key}")
+        logger.debug("Selected column: {}", self._columns[self._selected_column_index].key)
 
     def select_previous_column(self) -> None:
         """Select the previous column for resizing."""
         if not self._columns:
             return
         self._selected_column_index = (self._selected_column_index - 1) % len(self._columns)
-        logger.debug(f"Selected column: {self._columns[self._selected_column_index].key}")
+        logger.debug("Selected column: {}", self._columns[self._selected_column_index].key)
 
     def get_selected_column_key(self) -> str | None:
         """Get the key of the currently selected column."""
@@ -948,7 +948,7 @@ class FilterableDataTable(Vertical):
             column.width = new_width
             table.refresh()
 
-            logger.debug(f"Resized column {col_config.key}: {current_width} -> {new_width}")
+            logger.debug("Resized column {}: {} -> {}", col_config.key, current_width, new_width)
         except Exception as exc:
             logger.warning(f"Failed to resize column {col_config.key}: {exc}")
             return False
@@ -977,7 +977,7 @@ class FilterableDataTable(Vertical):
             column.width = col_config.width if col_config.width is not None else 0
             table.refresh()
 
-            logger.debug(f"Reset column {col_config.key} to width {col_config.width}")
+            logger.debug("Reset column {} to width {}", col_config.key, col_config.width)
         except Exception as exc:
             logger.warning(f"Failed to reset column {col_config.key}: {exc}")
             return False
@@ -999,7 +999,7 @@ class FilterableDataTable(Vertical):
                 if column is not None and column.width is not None:
                     widths[col_config.key] = column.width
             except Exception:
-                logger.debug(f"Could not get width for column {col_config.key}")
+                logger.debug("Could not get width for column {}", col_config.key)
 
         return widths
 
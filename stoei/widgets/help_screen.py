@@ -114,7 +114,9 @@ class HelpScreen(Screen[None]):
                     ("1", "Switch to Jobs tab"),
                     ("2", "Switch to Nodes tab"),
                     ("3", "Switch to Users tab"),
-                    ("4", "Switch to Logs tab"),
+                    ("4", "Switch to Priority tab"),
+                    ("5", "Switch to Logs tab"),
+                    ("6", "Switch to Performance tab"),
                     ("←/→", "Previous/Next tab"),
                     ("Tab", "Next tab"),
                     ("Shift+Tab", "Previous tab"),
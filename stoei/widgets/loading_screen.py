@@ -197,7 +197,7 @@ class LoadingScreen(Screen[None]):
                 f"[bold {colors.accent}]{self.SPINNER_FRAMES[self._spinner_frame]}[/bold {colors.accent}] Loading..."
             )
         except Exception as exc:
-            logger.debug(f"Spinner update failed: {exc}")
+            logger.debug("Spinner update failed: {}", exc)
 
     def start_step(self, step_index: int) -> None:
         """Mark a step as starting.
@@ -223,7 +223,7 @@ class LoadingScreen(Screen[None]):
             # Add to log
             self._add_log_entry(f"[{colors.warning}]▶[/{colors.warning}] {step.name}...")
         except Exception as exc:
-            logger.debug(f"Failed to update loading UI: {exc}")
+            logger.debug("Failed to update loading UI: {}", exc)
 
     def complete_step(self, step_index: int, message: str | None = None) -> None:
         """Mark a step as completed.
@@ -260,7 +260,7 @@ class LoadingScreen(Screen[None]):
             detail_str = f" - [{colors.text_muted}]{message}[/{colors.text_muted}]" if message else ""
             self._add_log_entry(f"[{colors.success}]✓[/{colors.success}] {step.name}{detail_str} {time_str}")
         except Exception as exc:
-            logger.debug(f"Failed to update loading UI: {exc}")
+            logger.debug("Failed to update loading UI: {}", exc)
 
     def fail_step(self, step_index: int, error: str) -> None:
         """Mark a step as failed.
@@ -282,7 +282,7 @@ class LoadingScreen(Screen[None]):
                 f"[{colors.error}]✗[/{colors.error}] {step.name}: [{colors.error}]{error}[/{colors.error}]"
             )
         except Exception as exc:
-            logger.debug(f"Failed to update loading UI: {exc}")
+            logger.debug("Failed to update loading UI: {}", exc)
 
     def skip_step(self, step_index: int, reason: str) -> None:
         """Mark a step as skipped.
@@ -317,7 +317,7 @@ class LoadingScreen(Screen[None]):
                 f"[{colors.text_muted}]{reason}[/{colors.text_muted}]"
             )
         except Exception as exc:
-            logger.debug(f"Failed to update loading UI: {exc}")
+            logger.debug("Failed to update loading UI: {}", exc)
 
     def _add_log_entry(self, entry: str) -> None:
         """Add an entry to the step log.
@@ -335,7 +335,7 @@ class LoadingScreen(Screen[None]):
             scroll_container = self.query_one("#step-log-container", VerticalScroll)
             scroll_container.scroll_end(animate=False)
         except Exception as exc:
-            logger.debug(f"Failed to update step log: {exc}")
+            logger.debug("Failed to update step log: {}", exc)
 
     def set_complete(self) -> None:
         """Mark loading as fully complete."""
@@ -356,7 +356,7 @@ class LoadingScreen(Screen[None]):
             spinner = self.query_one("#spinner", Static)
             spinner.update(f"[bold {colors.success}]✓[/bold {colors.success}] Ready!")
         except Exception as exc:
-            logger.debug(f"Failed to update loading UI: {exc}")
+            logger.debug("Failed to update loading UI: {}", exc)
 
         # Stop spinner
         if self._spinner_timer:
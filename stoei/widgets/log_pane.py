@@ -1,6 +1,8 @@
 """Log pane widget for displaying application logs in the TUI."""
 
-import contextlib
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from typing import ClassVar
 
@@ -12,15 +14,15 @@ from textual.widgets import RichLog
 from stoei.colors import get_theme_colors
 from stoei.settings import DEFAULT_MAX_LOG_LINES
 
+# (level, message, timestamp) of one log record
+LogEntry = tuple[str, str, datetime]
 
-class _LogEntry(Message, bubble=False):
-    """Non-blocking log entry posted from worker threads."""
+# Shortest time between two writes to the pane: one frame at Textual's default 60 fps
+_FLUSH_INTERVAL = 1 / 60
 
-    def __init__(self, level: str, msg: str, timestamp: datetime) -> None:
-        super().__init__()
-        self.level = level
-        self.msg = msg
-        self.timestamp = timestamp
+
+class _FlushLogs(Message, bubble=False):
+    """Posted from the logging thread when the first record of a batch is buffered."""
 
 
 class LogPane(RichLog):
@@ -35,6 +37,8 @@ class LogPane(RichLog):
     """
 
     DEFAULT_MAX_LINES: ClassVar[int] = DEFAULT_MAX_LOG_LINES
+    # Records buffered between flushes; older ones are dropped (and counted) beyond this
+    MAX_PENDING_ENTRIES: ClassVar[int] = 1000
 
     def __init__(
         self,
@@ -65,10 +69,43 @@ class LogPane(RichLog):
             classes=classes,
             disabled=disabled,
         )
-
-    def on__log_entry(self, message: _LogEntry) -> None:
-        """Handle a log entry posted from a worker thread."""
-        self.add_log(message.level, message.msg, message.timestamp)
+        # Records from the logging threads, written to the pane at most once per frame
+        self._pending: deque[LogEntry] = deque(maxlen=self.MAX_PENDING_ENTRIES)
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._dropped = 0
+        self._last_flush = 0.0
+        self._visible = False
+
+    def on__flush_logs(self, _message: _FlushLogs) -> None:
+        """Write the buffered records, waiting for the next frame if one was just written."""
+        wait = self._last_flush + _FLUSH_INTERVAL - time.monotonic()
+        if wait > 0:
+            self.set_timer(wait, self._flush_pending)
+        else:
+            self._flush_pending()
+
+    def on_show(self) -> None:
+        """Write the records buffered while the pane was hidden."""
+        self._visible = True
+        self._flush_pending()
+
+    def on_hide(self) -> None:
+        """Buffer records instead of rendering them while the pane is hidden."""
+        self._visible = False
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            if not self._visible:
+                # Keep buffering without posting more flushes; on_show writes the batch
+                return
+            self._flush_scheduled = False
+            entries = list(self._pending)
+            self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+        if entries or dropped:
+            self._last_flush = time.monotonic()
+            self._write_entries(entries, dropped)
 
     def add_log(self, level: str, message: str, timestamp: datetime | None = None) -> None:
         """Add a log entry to the pane.
@@ -78,12 +115,15 @@ class LogPane(RichLog):
             message: The log message.
             timestamp: Optional timestamp (defaults to now).
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        self._write_entries([(level, message, timestamp or datetime.now())])
 
-        time_str = timestamp.strftime("%H:%M:%S")
-        level_upper = level.upper()
+    def _write_entries(self, entries: list[LogEntry], dropped: int = 0) -> None:
+        """Write log entries to the pane with a single render.
 
+        Args:
+            entries: Entries in logging order.
+            dropped: Number of records dropped before these entries.
+        """
         # Get theme colors, with app access check
         try:
             app = self.app
@@ -91,15 +131,19 @@ class LogPane(RichLog):
         except (LookupError, RuntimeError, NoActiveAppError):
             return
 
-        color = colors.level_color(level_upper)
+        # Build one styled text for the batch: RichLog renders each write separately
+        lines: list[Text] = []
+        if dropped:
+            lines.append(Text(f"{dropped} log messages dropped while the pane was busy or hidden", style="dim italic"))
+        for level, message, timestamp in entries:
+            level_upper = level.upper()
+            line = Text()
+            line.append(f"{timestamp.strftime('%H:%M:%S')} ", style="dim")
+            line.append(f"[{level_upper:^8}] ", style=colors.level_color(level_upper))
+            line.append(message)
+            lines.append(line)
 
-        # Build styled text
-        log_text = Text()
-        log_text.append(f"{time_str} ", style="dim")
-        log_text.append(f"[{level_upper:^8}] ", style=color)
-        log_text.append(message)
-
-        self.write(log_text)
+        self.write(Text("\n").join(lines))
 
     def sink(self, message: object) -> None:
         """Loguru sink function to receive log messages.
@@ -120,6 +164,18 @@ class LogPane(RichLog):
         timestamp_obj = record["time"]  # type: ignore[index]
         timestamp = timestamp_obj.replace(tzinfo=None)
 
-        # Post non-blocking message to the main thread
-        with contextlib.suppress(LookupError, RuntimeError, NoActiveAppError):
-            self.post_message(_LogEntry(level, str(msg), timestamp))
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                # The oldest record falls out of the buffer
+                self._dropped += 1
+            self._pending.append((level, str(msg), timestamp))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        # Post one non-blocking message per batch to the main thread
+        try:
+            self.post_message(_FlushLogs())
+        except (LookupError, RuntimeError, NoActiveAppError):
+            with self._pending_lock:
+                self._flush_scheduled = False
@@ -27,6 +27,7 @@ class NodeInfo:
     partitions: str
     reason: str = ""
     gpu_types: str = ""
+    job_count: int = 0
 
     @property
     def cpu_usage_pct(self) -> float:
@@ -63,6 +64,7 @@ class NodeOverviewTab(VerticalScroll):
     NODE_TABLE_COLUMN_CONFIGS: ClassVar[list[ColumnConfig]] = [
         ColumnConfig(name="Node", key="node", sortable=True, filterable=True),
         ColumnConfig(name="State", key="state", sortable=True, filterable=True),
+        ColumnConfig(name="Jobs", key="jobs", sortable=True, filterable=False),
         ColumnConfig(name="CPUs", key="cpus", sortable=True, filterable=True),
         ColumnConfig(name="CPU%", key="cpu_pct", sortable=True, filterable=False),
         ColumnConfig(name="Memory", key="memory", sortable=True, filterable=True),
@@ -158,6 +160,7 @@ class NodeOverviewTab(VerticalScroll):
                 (
                     node_name,
                     state_display,
+                    str(node.job_count),
                     cpu_display,
                     cpu_pct_str,
                     mem_display,
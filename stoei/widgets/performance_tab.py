@@ -0,0 +1,113 @@
+"""Performance tab widget showing where refresh cycles spend their time."""
+
+from typing import ClassVar
+
+from textual.app import ComposeResult
+from textual.containers import VerticalScroll
+from textual.widgets import Static
+
+from stoei.settings import load_settings
+from stoei.telemetry import StageSummary
+from stoei.widgets.filterable_table import ColumnConfig, FilterableDataTable
+
+_STAGE_LABELS: dict[str, str] = {
+    "command": "SLURM command",
+    "parse": "Parse",
+    "derive": "Derived view",
+    "apply": "UI update",
+}
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+def _format_size(size: int) -> str:
+    if not size:
+        return ""
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+class PerformanceTab(VerticalScroll):
+    """Tab widget displaying per-stage timings of the refresh pipeline."""
+
+    DEFAULT_CSS: ClassVar[str] = """
+    PerformanceTab {
+        height: 100%;
+        width: 100%;
+    }
+
+    #performance-counters {
+        padding: 0 1;
+        color: $text-muted;
+    }
+    """
+
+    PERFORMANCE_TABLE_COLUMN_CONFIGS: ClassVar[list[ColumnConfig]] = [
+        ColumnConfig(name="Stage", key="stage", sortable=True, filterable=True),
+        ColumnConfig(name="Name", key="name", sortable=True, filterable=True),
+        ColumnConfig(name="Runs", key="runs", sortable=True, filterable=False),
+        ColumnConfig(name="p50 ms", key="p50", sortable=True, filterable=False),
+        ColumnConfig(name="p95 ms", key="p95", sortable=True, filterable=False),
+        ColumnConfig(name="Max ms", key="max", sortable=True, filterable=False),
+        ColumnConfig(name="Total ms", key="total", sortable=True, filterable=False),
+        ColumnConfig(name="Output", key="output", sortable=True, filterable=False),
+    ]
+
+    def __init__(
+        self,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialize the PerformanceTab widget.
+
+        Args:
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes for the widget.
+            disabled: Whether the widget is disabled.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._settings = load_settings()
+
+    def compose(self) -> ComposeResult:
+        """Create the performance layout."""
+        yield Static(
+            "[bold]Refresh Pipeline[/bold] [dim](p50/p95 are bucket upper bounds; times since startup)[/dim]",
+            id="performance-title",
+        )
+        yield FilterableDataTable(
+            columns=self.PERFORMANCE_TABLE_COLUMN_CONFIGS,
+            keybind_mode=self._settings.keybind_mode,
+            table_id="performance_table",
+            id="performance-filterable-table",
+        )
+        yield Static("", id="performance-counters")
+
+    def update_stats(self, summaries: list[StageSummary], counters: str) -> None:
+        """Show the stage summaries and the cache counters.
+
+        Args:
+            summaries: One summary per pipeline stage.
+            counters: Markup line with command coalescing and derived-view counters.
+        """
+        rows = [
+            (
+                _STAGE_LABELS.get(summary.kind, summary.kind),
+                summary.name,
+                str(summary.count),
+                _format_ms(summary.p50),
+                _format_ms(summary.p95),
+                _format_ms(summary.max),
+                _format_ms(summary.total),
+                _format_size(summary.output_bytes),
+            )
+            for summary in summaries
+        ]
+        self.query_one("#performance-filterable-table", FilterableDataTable).set_data(rows)
+        self.query_one("#performance-counters", Static).update(counters)
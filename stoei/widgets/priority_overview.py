@@ -6,6 +6,8 @@ from typing import ClassVar, Literal
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, VerticalScroll
+from textual.css.query import NoMatches
+from textual.widget import Widget
 from textual.widgets import Static
 
 from stoei.colors import ThemeColors, get_theme_colors
@@ -540,6 +542,73 @@ class PriorityOverviewTab(VerticalScroll):
         self._pending_job_rows: list[tuple[str, ...]] | None = None
         self._pending_my_job_rows: list[tuple[str, ...]] | None = None
         self._pending_summary_markup: str | None = None
+        # Row lists last pushed into each table; an identical list (reused by the
+        # app when its source output was unchanged) is not pushed again
+        self._applied_rows: dict[str, list[tuple[str, ...]]] = {}
+        # Hidden sub-tabs are composed the first time they are shown; rows for
+        # them wait in the pending caches above until then
+        self._mounted_subtabs: set[PrioritySubtabName] = {"mine"}
+
+    def _subtab_widgets(self, subtab: PrioritySubtabName) -> list[Widget]:
+        """Create the widgets of a sub-tab.
+
+        Args:
+            subtab: Sub-tab to create the widgets for.
+
+        Returns:
+            The widgets to mount in the sub-tab container.
+        """
+        keybind_mode = self._settings.keybind_mode
+        if subtab == "mine":
+            return [
+                Static("[dim]Loading priority data...[/dim]", id="my-priority-summary"),
+                Static("[bold]Your Pending Jobs[/bold]", id="my-priority-jobs-header"),
+                FilterableDataTable(
+                    columns=self.MY_JOB_PRIORITY_COLUMNS,
+                    keybind_mode=keybind_mode,
+                    table_id="my_job_priority_table",
+                    id="my-job-priority-filterable-table",
+                ),
+            ]
+        if subtab == "users":
+            return [
+                Static(
+                    "[dim]Fair-share priority per user (higher FairShare = higher scheduling priority)[/dim]",
+                    id="priority-info-text",
+                ),
+                FilterableDataTable(
+                    columns=self.USER_PRIORITY_COLUMNS,
+                    keybind_mode=keybind_mode,
+                    table_id="user_priority_table",
+                    id="user-priority-filterable-table",
+                ),
+            ]
+        if subtab == "accounts":
+            return [
+                Static(
+                    "[dim]Fair-share priority per account/institute "
+                    "(higher FairShare = higher scheduling priority)[/dim]",
+                    id="account-priority-info-text",
+                ),
+                FilterableDataTable(
+                    columns=self.ACCOUNT_PRIORITY_COLUMNS,
+                    keybind_mode=keybind_mode,
+                    table_id="account_priority_table",
+                    id="account-priority-filterable-table",
+                ),
+            ]
+        return [
+            Static(
+                "[dim]Priority factors for pending jobs (higher values = higher scheduling priority)[/dim]",
+                id="job-priority-info-text",
+            ),
+            FilterableDataTable(
+                columns=self.JOB_PRIORITY_COLUMNS,
+                keybind_mode=keybind_mode,
+                table_id="job_priority_table",
+                id="job-priority-filterable-table",
+            ),
+        ]
 
     def compose(self) -> ComposeResult:
         """Create the priority overview layout with sub-tabs."""
@@ -556,71 +625,27 @@ class PriorityOverviewTab(VerticalScroll):
 
         # My Priority sub-tab (default visible)
         with Container(id="priority-subtab-mine", classes="priority-subtab-content"):
-            yield Static(
-                "[dim]Loading priority data...[/dim]",
-                id="my-priority-summary",
-            )
-            yield Static(
-                "[bold]Your Pending Jobs[/bold]",
-                id="my-priority-jobs-header",
-            )
-            yield FilterableDataTable(
-                columns=self.MY_JOB_PRIORITY_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="my_job_priority_table",
-                id="my-job-priority-filterable-table",
-            )
+            yield from self._subtab_widgets("mine")
 
-        # All Users priority sub-tab (hidden by default)
-        with Container(id="priority-subtab-users", classes="priority-subtab-content priority-subtab-hidden"):
-            yield Static(
-                "[dim]Fair-share priority per user (higher FairShare = higher scheduling priority)[/dim]",
-                id="priority-info-text",
-            )
-            yield FilterableDataTable(
-                columns=self.USER_PRIORITY_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="user_priority_table",
-                id="user-priority-filterable-table",
-            )
-
-        # Accounts priority sub-tab (hidden by default)
-        with Container(id="priority-subtab-accounts", classes="priority-subtab-content priority-subtab-hidden"):
-            yield Static(
-                "[dim]Fair-share priority per account/institute (higher FairShare = higher scheduling priority)[/dim]",
-                id="account-priority-info-text",
-            )
-            yield FilterableDataTable(
-                columns=self.ACCOUNT_PRIORITY_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="account_priority_table",
-                id="account-priority-filterable-table",
-            )
-
-        # Jobs priority sub-tab (hidden by default)
-        with Container(id="priority-subtab-jobs", classes="priority-subtab-content priority-subtab-hidden"):
-            yield Static(
-                "[dim]Priority factors for pending jobs (higher values = higher scheduling priority)[/dim]",
-                id="job-priority-info-text",
-            )
-            yield FilterableDataTable(
-                columns=self.JOB_PRIORITY_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="job_priority_table",
-                id="job-priority-filterable-table",
-            )
+        # All Users, Accounts and Jobs sub-tabs (hidden, composed on first show)
+        for subtab in ("users", "accounts", "jobs"):
+            yield Container(id=f"priority-subtab-{subtab}", classes="priority-subtab-content priority-subtab-hidden")
 
     def on_mount(self) -> None:
         """Apply any pre-built row data that arrived before mount."""
+        self._apply_pending_rows()
+
+    def _apply_pending_rows(self) -> None:
+        """Push stored rows into their tables; rows of unmounted sub-tabs stay stored."""
         if self._pending_user_rows is not None:
-            self._apply_user_rows(self._pending_user_rows)
-            self._pending_user_rows = None
+            rows, self._pending_user_rows = self._pending_user_rows, None
+            self._apply_user_rows(rows)
         if self._pending_account_rows is not None:
-            self._apply_account_rows(self._pending_account_rows)
-            self._pending_account_rows = None
+            rows, self._pending_account_rows = self._pending_account_rows, None
+            self._apply_account_rows(rows)
         if self._pending_job_rows is not None:
-            self._apply_job_rows(self._pending_job_rows)
-            self._pending_job_rows = None
+            rows, self._pending_job_rows = self._pending_job_rows, None
+            self._apply_job_rows(rows)
         if self._pending_summary_markup is not None:
             self._apply_summary_markup(self._pending_summary_markup)
             self._pending_summary_markup = None
@@ -642,7 +667,7 @@ class PriorityOverviewTab(VerticalScroll):
         if subtab == self._active_subtab:
             return
 
-        logger.debug(f"Switching priority overview subtab from {self._active_subtab} to {subtab}")
+        logger.debug("Switching priority overview subtab from {} to {}", self._active_subtab, subtab)
 
         # Update header to show active tab
         self._update_subtab_header(subtab)
@@ -653,7 +678,7 @@ class PriorityOverviewTab(VerticalScroll):
                 container = self.query_one(f"#{container_id}", Container)
                 container.add_class("priority-subtab-hidden")
             except Exception as exc:
-                logger.debug(f"Failed to hide container {container_id}: {exc}")
+                logger.debug("Failed to hide container {}: {}", container_id, exc)
 
         # Show the active subtab container
         active_container_id = f"priority-subtab-{subtab}"
@@ -661,20 +686,47 @@ class PriorityOverviewTab(VerticalScroll):
             active_container = self.query_one(f"#{active_container_id}", Container)
             active_container.remove_class("priority-subtab-hidden")
             self._active_subtab = subtab
+            if subtab not in self._mounted_subtabs:
+                self._mount_subtab(subtab, active_container)
+            else:
+                self._focus_subtab_table(subtab)
+        except Exception as exc:
+            logger.debug("Failed to show container {}: {}", active_container_id, exc)
+
+    def _mount_subtab(self, subtab: PrioritySubtabName, container: Container) -> None:
+        """Compose a sub-tab on first show and fill it with the data stored so far.
+
+        Args:
+            subtab: Sub-tab to mount.
+            container: The sub-tab's (empty) container.
+        """
+        self._mounted_subtabs.add(subtab)
+        mounted = container.mount_all(self._subtab_widgets(subtab))
+
+        async def fill_and_focus() -> None:
+            await mounted
+            self._apply_pending_rows()
+            if self._active_subtab == subtab:
+                self._focus_subtab_table(subtab)
 
-            # Focus the appropriate filterable table
-            filterable_ids: dict[PrioritySubtabName, str] = {
-                "mine": "my-job-priority-filterable-table",
-                "users": "user-priority-filterable-table",
-                "accounts": "account-priority-filterable-table",
-                "jobs": "job-priority-filterable-table",
-            }
-            filterable_id = filterable_ids.get(subtab)
-            if filterable_id:
-                filterable_table = self.query_one(f"#{filterable_id}", FilterableDataTable)
-                filterable_table.focus()
+        self.call_later(fill_and_focus)
+
+    def _focus_subtab_table(self, subtab: PrioritySubtabName) -> None:
+        """Focus the filterable table of a sub-tab.
+
+        Args:
+            subtab: Sub-tab whose table to focus.
+        """
+        filterable_ids: dict[PrioritySubtabName, str] = {
+            "mine": "my-job-priority-filterable-table",
+            "users": "user-priority-filterable-table",
+            "accounts": "account-priority-filterable-table",
+            "jobs": "job-priority-filterable-table",
+        }
+        try:
+            self.query_one(f"#{filterable_ids[subtab]}", FilterableDataTable).focus()
         except Exception as exc:
-            logger.debug(f"Failed to show container {active_container_id}: {exc}")
+            logger.debug("Failed to focus {} priority table: {}", subtab, exc)
 
     def _update_subtab_header(self, active: PrioritySubtabName) -> None:
         """Update the sub-tab header to highlight the active tab.
@@ -697,7 +749,7 @@ class PriorityOverviewTab(VerticalScroll):
 
             header.update(f"[bold]Priority[/bold]  {mine}  {users}  {accounts}  {jobs}")
         except Exception as exc:
-            logger.debug(f"Failed to update subtab header: {exc}")
+            logger.debug("Failed to update subtab header: {}", exc)
 
     def action_switch_subtab_mine(self) -> None:
         """Switch to the My Priority sub-tab."""
@@ -723,9 +775,14 @@ class PriorityOverviewTab(VerticalScroll):
         """
         try:
             filterable = self.query_one("#user-priority-filterable-table", FilterableDataTable)
+        except NoMatches:
+            # Sub-tab not shown yet: keep the rows until it is mounted
+            self._pending_user_rows = rows
+            return
+        try:
             filterable.set_data(rows)
         except Exception as exc:
-            logger.debug(f"Failed to apply user priority rows: {exc}")
+            logger.debug("Failed to apply user priority rows: {}", exc)
 
     def _apply_account_rows(self, rows: list[tuple[str, ...]]) -> None:
         """Push pre-built account priority rows into the table widget.
@@ -735,9 +792,14 @@ class PriorityOverviewTab(VerticalScroll):
         """
         try:
             filterable = self.query_one("#account-priority-filterable-table", FilterableDataTable)
+        except NoMatches:
+            # Sub-tab not shown yet: keep the rows until it is mounted
+            self._pending_account_rows = rows
+            return
+        try:
             filterable.set_data(rows)
         except Exception as exc:
-            logger.debug(f"Failed to apply account priority rows: {exc}")
+            logger.debug("Failed to apply account priority rows: {}", exc)
 
     def _apply_job_rows(self, rows: list[tuple[str, ...]]) -> None:
         """Push pre-built job priority rows into the table widget.
@@ -747,9 +809,14 @@ class PriorityOverviewTab(VerticalScroll):
         """
         try:
             filterable = self.query_one("#job-priority-filterable-table", FilterableDataTable)
+        except NoMatches:
+            # Sub-tab not shown yet: keep the rows until it is mounted
+            self._pending_job_rows = rows
+            return
+        try:
             filterable.set_data(rows)
         except Exception as exc:
-            logger.debug(f"Failed to apply job priority rows: {exc}")
+            logger.debug("Failed to apply job priority rows: {}", exc)
 
     def _apply_my_job_rows(self, rows: list[tuple[str, ...]]) -> None:
         """Push pre-built 'my jobs' rows into the My Priority sub-tab table.
@@ -761,13 +828,13 @@ class PriorityOverviewTab(VerticalScroll):
             filterable = self.query_one("#my-job-priority-filterable-table", FilterableDataTable)
             filterable.set_data(rows)
         except Exception as exc:
-            logger.debug(f"Failed to apply my job priority rows: {exc}")
+            logger.debug("Failed to apply my job priority rows: {}", exc)
 
         try:
             header = self.query_one("#my-priority-jobs-header", Static)
             header.update(f"[bold]Your Pending Jobs ({len(rows)})[/bold]")
         except Exception as exc:
-            logger.debug(f"Failed to update my-priority jobs header: {exc}")
+            logger.debug("Failed to update my-priority jobs header: {}", exc)
 
     def _apply_summary_markup(self, markup: str) -> None:
         """Push pre-built summary markup into the My Priority summary widget.
@@ -779,7 +846,7 @@ class PriorityOverviewTab(VerticalScroll):
             summary = self.query_one("#my-priority-summary", Static)
             summary.update(markup)
         except Exception as exc:
-            logger.debug(f"Failed to apply priority summary: {exc}")
+            logger.debug("Failed to apply priority summary: {}", exc)
 
     def apply_prebuilt_data(self, data: PrebuiltPriorityData) -> None:
         """Apply pre-built priority data and rows to the widget.
@@ -798,7 +865,7 @@ class PriorityOverviewTab(VerticalScroll):
 
         # Try to apply directly; if not mounted yet, store for on_mount
         try:
-            self.query_one("#user-priority-filterable-table", FilterableDataTable)
+            self.query_one("#my-job-priority-filterable-table", FilterableDataTable)
         except Exception:
             # Not yet mounted — store for deferred application
             self._pending_user_rows = data.user_rows
@@ -810,11 +877,31 @@ class PriorityOverviewTab(VerticalScroll):
 
         # Schedule each table update separately so the event loop can
         # process key events between them, keeping the UI responsive.
-        self.call_later(self._apply_user_rows, data.user_rows)
-        self.call_later(self._apply_account_rows, data.account_rows)
-        self.call_later(self._apply_job_rows, data.job_rows)
+        # Tables whose rows are unchanged since the last push are skipped.
+        if self._rows_changed("user", data.user_rows):
+            self.call_later(self._apply_user_rows, data.user_rows)
+        if self._rows_changed("account", data.account_rows):
+            self.call_later(self._apply_account_rows, data.account_rows)
+        if self._rows_changed("job", data.job_rows):
+            self.call_later(self._apply_job_rows, data.job_rows)
         self.call_later(self._apply_summary_markup, data.summary_markup)
-        self.call_later(self._apply_my_job_rows, data.my_job_rows)
+        if self._rows_changed("my_job", data.my_job_rows):
+            self.call_later(self._apply_my_job_rows, data.my_job_rows)
+
+    def _rows_changed(self, table: str, rows: list[tuple[str, ...]]) -> bool:
+        """Record a row list for a table and report whether it differs from the last one.
+
+        Args:
+            table: Short table name.
+            rows: Row list about to be applied.
+
+        Returns:
+            False if the very same row list was already applied to the table.
+        """
+        if self._applied_rows.get(table) is rows:
+            return False
+        self._applied_rows[table] = rows
+        return True
 
     def update_user_priorities(self, priorities: list[UserPriority]) -> None:
         """Update the user priority data table (with on-main-thread computation).
@@ -825,10 +912,8 @@ class PriorityOverviewTab(VerticalScroll):
         Args:
             priorities: List of user priority statistics to display.
         """
-        try:
-            self.query_one("#user-priority-filterable-table", FilterableDataTable)
-        except Exception as exc:
-            logger.debug(f"User priority table not mounted yet, storing data: {exc}")
+        if not self.is_mounted:
+            logger.debug("Priority overview not mounted yet, storing user priorities")
             self.user_priorities = priorities
             return
 
@@ -846,10 +931,8 @@ class PriorityOverviewTab(VerticalScroll):
         Args:
             priorities: List of account priority statistics to display.
         """
-        try:
-            self.query_one("#account-priority-filterable-table", FilterableDataTable)
-        except Exception as exc:
-            logger.debug(f"Account priority table not mounted yet, storing data: {exc}")
+        if not self.is_mounted:
+            logger.debug("Priority overview not mounted yet, storing account priorities")
             self.account_priorities = priorities
             return
 
@@ -871,10 +954,8 @@ class PriorityOverviewTab(VerticalScroll):
         Args:
             priorities: List of job priority factors to display.
         """
-        try:
-            self.query_one("#job-priority-filterable-table", FilterableDataTable)
-        except Exception as exc:
-            logger.debug(f"Job priority table not mounted yet, storing data: {exc}")
+        if not self.is_mounted:
+            logger.debug("Priority overview not mounted yet, storing job priorities")
             self.job_priorities = priorities
             return
 
@@ -935,7 +1016,7 @@ class PriorityOverviewTab(VerticalScroll):
             my_job_rows = build_my_job_priority_rows(self.job_priorities, self._current_username)
             self._apply_my_job_rows(my_job_rows)
         except Exception as exc:
-            logger.debug(f"Failed to update summary after sshare data: {exc}")
+            logger.debug("Failed to update summary after sshare data: {}", exc)
 
     def update_from_sprio_data(self, entries: list[tuple[str, ...]]) -> None:
         """Update job priorities from raw sprio data.
@@ -967,4 +1048,4 @@ class PriorityOverviewTab(VerticalScroll):
             my_job_rows = build_my_job_priority_rows(self.job_priorities, self._current_username)
             self._apply_my_job_rows(my_job_rows)
         except Exception as exc:
-            logger.debug(f"Failed to update my-jobs after sprio data: {exc}")
+            logger.debug("Failed to update my-jobs after sprio data: {}", exc)
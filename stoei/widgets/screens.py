@@ -274,17 +274,17 @@ class LogViewerScreen(Screen[None]):
             Tuple of (content, use_markup) where use_markup indicates
             whether the content should be rendered with markup=True.
         """
-        logger.debug(f"Getting safe display content for {self.filepath}")
+        logger.debug("Getting safe display content for {}", self.filepath)
 
         if not self._raw_contents:
             logger.debug("Raw contents empty, returning placeholder")
             return "[bright_black](empty)[/bright_black]", True
 
-        logger.debug(f"Raw content size: {len(self._raw_contents)} bytes")
+        logger.debug("Raw content size: {} bytes", len(self._raw_contents))
 
         # Generate content with markup (escaped)
         content_with_markup = self._get_display_content(use_markup=True)
-        logger.debug(f"Generated markup content size: {len(content_with_markup)} bytes")
+        logger.debug("Generated markup content size: {} bytes", len(content_with_markup))
 
         # Add truncation header if needed
         if self.truncated:
@@ -309,7 +309,7 @@ class LogViewerScreen(Screen[None]):
         Returns:
             Plain text content with line numbers (if enabled).
         """
-        logger.debug(f"Getting plain display content for {self.filepath}")
+        logger.debug("Getting plain display content for {}", self.filepath)
 
         if not self._raw_contents:
             return "(empty)"
@@ -352,12 +352,12 @@ class LogViewerScreen(Screen[None]):
             path: Path to the file.
             total_lines: Total number of lines in the file.
         """
-        logger.debug(f"Loading truncated file: {path} (total lines: {total_lines})")
+        logger.debug("Loading truncated file: {} (total lines: {})", path, total_lines)
         self.truncated = True
         self._total_lines = total_lines
 
         # Read last N lines using deque for memory efficiency
-        logger.debug(f"Reading last {self._max_lines} lines")
+        logger.debug("Reading last {} lines", self._max_lines)
         last_lines: deque[str] = deque(maxlen=self._max_lines)
         with path.open(encoding="utf-8", errors="replace") as f:
             for line in f:
@@ -365,15 +365,15 @@ class LogViewerScreen(Screen[None]):
 
         tail_line_count = len(last_lines)
         self._start_line = max(1, total_lines - tail_line_count + 1)
-        logger.debug(f"Tail contains {tail_line_count} lines, starting at line {self._start_line}")
+        logger.debug("Tail contains {} lines, starting at line {}", tail_line_count, self._start_line)
 
         self._raw_contents = "\n".join(last_lines)
-        logger.debug(f"Raw contents: {len(self._raw_contents)} characters")
+        logger.debug("Raw contents: {} characters", len(self._raw_contents))
 
         # Use the safe display content method
         logger.debug("Generating display content for truncated file")
         self.file_contents, self._use_markup = self._get_safe_display_content()
-        logger.debug(f"Display content: {len(self.file_contents)} chars, markup={self._use_markup}")
+        logger.debug("Display content: {} chars, markup={}", len(self.file_contents), self._use_markup)
 
         logger.info(
             f"Loaded log file (truncated): {self.filepath} "
@@ -387,7 +387,7 @@ class LogViewerScreen(Screen[None]):
         For large files (exceeding max_lines), only the last N lines are loaded
         to maintain UI responsiveness.
         """
-        logger.debug(f"Loading file: {self.filepath}")
+        logger.debug("Loading file: {}", self.filepath)
         path = Path(self.filepath)
         self.truncated = False
         self._start_line = 1
@@ -405,7 +405,7 @@ class LogViewerScreen(Screen[None]):
 
         try:
             file_size = path.stat().st_size
-            logger.debug(f"File size: {file_size} bytes")
+            logger.debug("File size: {} bytes", file_size)
 
             if file_size == 0:
                 logger.debug("File is empty")
@@ -418,21 +418,23 @@ class LogViewerScreen(Screen[None]):
             # Count total lines first to determine if truncation is needed
             logger.debug("Counting total lines in file")
             total_lines = self._count_total_lines(path)
-            logger.debug(f"Total lines: {total_lines}, max_lines: {self._max_lines}")
+            logger.debug("Total lines: {}, max_lines: {}", total_lines, self._max_lines)
 
             if total_lines <= self._max_lines:
-                logger.debug(f"File within line limit ({self._max_lines} lines), reading entire file")
+                logger.debug("File within line limit ({} lines), reading entire file", self._max_lines)
                 # Read raw file content - this may contain markup-like text
                 self._raw_contents = path.read_text(encoding="utf-8", errors="replace")
-                logger.debug(f"Read {len(self._raw_contents)} characters from file")
+                logger.debug("Read {} characters from file", len(self._raw_contents))
                 self._start_line = 1
                 self._total_lines = total_lines
                 # Generate display content
                 logger.debug("Generating display content")
                 self.file_contents, self._use_markup = self._get_safe_display_content()
-                logger.debug(f"Display content generated: {len(self.file_contents)} chars, markup={self._use_markup}")
+                logger.debug(
+                    "Display content generated: {} chars, markup={}", len(self.file_contents), self._use_markup
+                )
             else:
-                logger.debug(f"File exceeds line limit ({total_lines} > {self._max_lines}), loading truncated")
+                logger.debug("File exceeds line limit ({} > {}), loading truncated", total_lines, self._max_lines)
                 self._load_truncated_file(path, total_lines)
                 return
 
@@ -449,7 +451,7 @@ class LogViewerScreen(Screen[None]):
 
     def on_mount(self) -> None:
         """Start loading the file asynchronously with a spinner."""
-        logger.debug(f"LogViewerScreen mounted for {self.filepath}")
+        logger.debug("LogViewerScreen mounted for {}", self.filepath)
         # Start spinner animation
         self._spinner_timer = self.set_interval(0.1, self._animate_spinner)
         # Start async file loading
@@ -464,11 +466,11 @@ class LogViewerScreen(Screen[None]):
             spinner = self.query_one("#log-loading-spinner", Static)
             spinner.update(f"{self.SPINNER_FRAMES[self._spinner_frame]} Loading file...")
         except Exception as exc:
-            logger.debug(f"Spinner update failed: {exc}")
+            logger.debug("Spinner update failed: {}", exc)
 
     async def _async_load_file(self) -> None:
         """Load file asynchronously with timeout."""
-        logger.debug(f"Starting async file load for {self.filepath}")
+        logger.debug("Starting async file load for {}", self.filepath)
         loop = asyncio.get_running_loop()
 
         try:
@@ -479,7 +481,7 @@ class LogViewerScreen(Screen[None]):
                         loop.run_in_executor(executor, self._load_file),
                         timeout=FILE_LOAD_TIMEOUT,
                     )
-                    logger.debug(f"File loaded successfully: {self.filepath}")
+                    logger.debug("File loaded successfully: {}", self.filepath)
                 except TimeoutError:
                     self._load_timed_out = True
                     self.load_error = (
@@ -503,7 +505,7 @@ class LogViewerScreen(Screen[None]):
 
     def _on_load_complete(self) -> None:
         """Called when file loading completes (success or failure)."""
-        logger.debug(f"Load complete for {self.filepath}, error={self.load_error}")
+        logger.debug("Load complete for {}, error={}", self.filepath, self.load_error)
 
         try:
             # Hide loading indicator
@@ -563,7 +565,7 @@ class LogViewerScreen(Screen[None]):
             content_widget = self.query_one("#log-content-text", Static)
             content_widget._render_markup = False
             plain_content = self._get_plain_display_content()
-            logger.debug(f"Plain content size: {len(plain_content)} chars")
+            logger.debug("Plain content size: {} chars", len(plain_content))
             content_widget.update(plain_content)
             self.file_contents = plain_content
             self.app.notify("Switched to plain text mode due to markup error", severity="warning")
@@ -635,7 +637,7 @@ class LogViewerScreen(Screen[None]):
 
     def action_reload(self) -> None:
         """Reload the file contents asynchronously."""
-        logger.debug(f"Reloading file: {self.filepath}")
+        logger.debug("Reloading file: {}", self.filepath)
         # Reset state for reload
         self._is_loading = True
         self._load_timed_out = False
@@ -651,7 +653,7 @@ class LogViewerScreen(Screen[None]):
             error_container = self.query_one("#log-error-container", Container)
             error_container.add_class("hidden")
         except Exception as exc:
-            logger.debug(f"Failed to update UI state for reload: {exc}")
+            logger.debug("Failed to update UI state for reload: {}", exc)
 
         # Restart spinner
         if self._spinner_timer:
@@ -664,7 +666,7 @@ class LogViewerScreen(Screen[None]):
 
     async def _async_reload_file(self) -> None:
         """Reload file asynchronously with timeout."""
-        logger.debug(f"Starting async reload for {self.filepath}")
+        logger.debug("Starting async reload for {}", self.filepath)
         loop = asyncio.get_running_loop()
 
         try:
@@ -674,7 +676,7 @@ class LogViewerScreen(Screen[None]):
                         loop.run_in_executor(executor, self._load_file),
                         timeout=FILE_LOAD_TIMEOUT,
                     )
-                    logger.debug(f"File reloaded successfully: {self.filepath}")
+                    logger.debug("File reloaded successfully: {}", self.filepath)
                 except TimeoutError:
                     self._load_timed_out = True
                     self.load_error = (
@@ -695,7 +697,7 @@ class LogViewerScreen(Screen[None]):
 
     def _on_reload_complete(self) -> None:
         """Called when file reload completes."""
-        logger.debug(f"Reload complete for {self.filepath}, error={self.load_error}")
+        logger.debug("Reload complete for {}, error={}", self.filepath, self.load_error)
 
         try:
             # Hide loading indicator
@@ -739,7 +741,7 @@ class LogViewerScreen(Screen[None]):
         """Toggle line number display."""
         self._show_line_numbers = not self._show_line_numbers
         state = "on" if self._show_line_numbers else "off"
-        logger.debug(f"Toggling line numbers: {state}")
+        logger.debug("Toggling line numbers: {}", state)
 
         try:
             content_widget = self.query_one("#log-content-text", Static)
@@ -751,11 +753,11 @@ class LogViewerScreen(Screen[None]):
             logger.debug("Regenerating display content")
             self.file_contents, self._use_markup = self._get_safe_display_content()
             content_widget._render_markup = self._use_markup
-            logger.debug(f"Updating widget with {len(self.file_contents)} chars, markup={self._use_markup}")
+            logger.debug("Updating widget with {} chars, markup={}", len(self.file_contents), self._use_markup)
             content_widget.update(self.file_contents)
 
             self.app.notify(f"Line numbers {state}")
-            logger.debug(f"Line numbers toggled: {state}")
+            logger.debug("Line numbers toggled: {}", state)
         except MarkupError as exc:
             self._handle_markup_error(exc)
         except Exception:
@@ -773,7 +775,7 @@ class LogViewerScreen(Screen[None]):
             success = _copy_to_clipboard(filepath)
             if success:
                 self.app.call_from_thread(lambda: self.app.notify(f"Copied: {filepath}", timeout=3))
-                logger.debug(f"Copied filepath to clipboard: {filepath}")
+                logger.debug("Copied filepath to clipboard: {}", filepath)
             else:
                 self.app.call_from_thread(
                     lambda: self.app.notify(
@@ -871,7 +873,7 @@ class LogViewerScreen(Screen[None]):
 
     def _highlight_matches(self) -> None:
         """Highlight search matches in the display."""
-        logger.debug(f"Highlighting matches for search term: {self._search_term}")
+        logger.debug("Highlighting matches for search term: {}", self._search_term)
 
         if not self._search_term:
             logger.debug("No search term, skipping highlight")
@@ -897,7 +899,7 @@ class LogViewerScreen(Screen[None]):
             # since we're looking for literal text
             search_escaped = self._escape_markup(self._search_term)
             pattern = re.compile(re.escape(search_escaped), re.IGNORECASE)
-            logger.debug(f"Searching for pattern: {pattern.pattern}")
+            logger.debug("Searching for pattern: {}", pattern.pattern)
 
             def highlight_match(match: re.Match[str]) -> str:
                 # The matched text is already escaped, just wrap it
@@ -921,7 +923,7 @@ class LogViewerScreen(Screen[None]):
                 )
                 display_content = truncate_header + display_content
 
-            logger.debug(f"Updating widget with highlighted content ({len(display_content)} chars)")
+            logger.debug("Updating widget with highlighted content ({} chars)", len(display_content))
             content_widget.update(display_content)
             self.file_contents = display_content
         except MarkupError as exc:
@@ -938,7 +940,7 @@ class LogViewerScreen(Screen[None]):
         try:
             content_widget = self.query_one("#log-content-text", Static)
             self.file_contents, self._use_markup = self._get_safe_display_content()
-            logger.debug(f"Got content: {len(self.file_contents)} chars, markup={self._use_markup}")
+            logger.debug("Got content: {} chars, markup={}", len(self.file_contents), self._use_markup)
             content_widget._render_markup = self._use_markup
             content_widget.update(self.file_contents)
             logger.debug("Display refreshed")
@@ -959,7 +961,7 @@ class LogViewerScreen(Screen[None]):
             # Scroll to line position (rough approximation)
             scroll.scroll_to(y=match_line, animate=False)
         except Exception as exc:
-            logger.debug(f"Failed to scroll to match: {exc}")
+            logger.debug("Failed to scroll to match: {}", exc)
 
     def _update_search_status(self) -> None:
         """Update the search status display."""
@@ -972,7 +974,7 @@ class LogViewerScreen(Screen[None]):
             else:
                 status.update("")
         except Exception as exc:
-            logger.debug(f"Failed to update search status: {exc}")
+            logger.debug("Failed to update search status: {}", exc)
 
     def action_next_match(self) -> None:
         """Go to the next search match."""
@@ -1321,7 +1323,7 @@ class CancelConfirmScreen(Screen[bool]):
             self.query_one("#abort-cancel-btn", Button).focus()
         except Exception as exc:
             # Widget may not be ready yet, ignore
-            logger.debug(f"Could not focus abort button on mount: {exc}")
+            logger.debug("Could not focus abort button on mount: {}", exc)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
@@ -1349,7 +1351,7 @@ class CancelConfirmScreen(Screen[bool]):
                 self.dismiss(False)
         except Exception as exc:
             # Screen may be dismissing or button may not exist
-            logger.debug(f"Could not activate focused button - screen may be dismissing: {exc}")
+            logger.debug("Could not activate focused button - screen may be dismissing: {}", exc)
             # Default to abort (safer option)
             with contextlib.suppress(Exception):
                 self.dismiss(False)
@@ -1377,7 +1379,7 @@ class CancelConfirmScreen(Screen[bool]):
                 buttons[next_idx].focus()
         except Exception as exc:
             # Screen may be dismissing or widgets may not exist
-            logger.debug(f"Could not focus next button - screen may be dismissing: {exc}")
+            logger.debug("Could not focus next button - screen may be dismissing: {}", exc)
 
     def action_focus_previous(self) -> None:
         """Focus the previous button (left arrow or shift+tab)."""
@@ -1402,7 +1404,7 @@ class CancelConfirmScreen(Screen[bool]):
                 buttons[prev_idx].focus()
         except Exception as exc:
             # Screen may be dismissing or widgets may not exist
-            logger.debug(f"Could not focus previous button - screen may be dismissing: {exc}")
+            logger.debug("Could not focus previous button - screen may be dismissing: {}", exc)
 
 
 class GenericInfoScreen(Screen[None]):
@@ -1614,7 +1616,7 @@ class EnergyEnableModal(Screen[str]):
         try:
             self.query_one("#energy-go-settings", Button).focus()
         except Exception as exc:
-            logger.debug(f"Could not focus settings button on mount: {exc}")
+            logger.debug("Could not focus settings button on mount: {}", exc)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press.
@@ -1641,6 +1643,6 @@ class EnergyEnableModal(Screen[str]):
                 # Fallback: if nothing is focused, dismiss
                 self.dismiss("dismiss")
         except Exception as exc:
-            logger.debug(f"Could not activate focused button: {exc}")
+            logger.debug("Could not activate focused button: {}", exc)
             with contextlib.suppress(Exception):
                 self.dismiss("dismiss")
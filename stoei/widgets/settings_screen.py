@@ -245,7 +245,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one(button_ids[new_index], Button).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus button: {exc}")
+            logger.debug("Failed to focus button: {}", exc)
 
     def _get_focus_index(self) -> int:
         """Get the index of the currently focused widget in FOCUS_ORDER.
@@ -263,7 +263,7 @@ class SettingsScreen(Screen[Settings | None]):
                 if widget is focused:
                     return i
             except Exception as exc:
-                logger.debug(f"Failed to query widget {selector}: {exc}")
+                logger.debug("Failed to query widget {}: {}", selector, exc)
                 continue
         return -1
 
@@ -284,7 +284,7 @@ class SettingsScreen(Screen[Settings | None]):
             widget = self.query_one(selector)
             widget.focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus widget {selector}: {exc}")
+            logger.debug("Failed to focus widget {}: {}", selector, exc)
 
     def action_focus_next(self) -> None:
         """Focus the next widget in the focus order."""
@@ -315,7 +315,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-theme", Select).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus theme selector: {exc}")
+            logger.debug("Failed to focus theme selector: {}", exc)
 
     def action_jump_log_level(self) -> None:
         """Jump focus to the log level selector."""
@@ -325,7 +325,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-log-level", Select).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus log level selector: {exc}")
+            logger.debug("Failed to focus log level selector: {}", exc)
 
     def action_jump_max_lines(self) -> None:
         """Jump focus to the max lines input."""
@@ -335,7 +335,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-max-lines", Input).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus max lines input: {exc}")
+            logger.debug("Failed to focus max lines input: {}", exc)
 
     def action_jump_refresh(self) -> None:
         """Jump focus to the refresh interval input."""
@@ -345,7 +345,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-refresh-interval", Input).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus refresh interval input: {exc}")
+            logger.debug("Failed to focus refresh interval input: {}", exc)
 
     def action_jump_history(self) -> None:
         """Jump focus to the job history days input."""
@@ -355,7 +355,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-job-history-days", Input).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus job history days input: {exc}")
+            logger.debug("Failed to focus job history days input: {}", exc)
 
     def action_cancel(self) -> None:
         """Cancel and close the settings screen."""
@@ -499,7 +499,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-keybind-mode", Select).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus keybind mode selector: {exc}")
+            logger.debug("Failed to focus keybind mode selector: {}", exc)
 
     def action_jump_energy_enabled(self) -> None:
         """Jump focus to the energy enabled switch."""
@@ -509,7 +509,7 @@ class SettingsScreen(Screen[Settings | None]):
         try:
             self.query_one("#settings-energy-enabled", Switch).focus()
         except Exception as exc:
-            logger.debug(f"Failed to focus energy enabled switch: {exc}")
+            logger.debug("Failed to focus energy enabled switch: {}", exc)
 
     def _validate_energy_enabled(self) -> bool:
         """Validate and return energy enabled value."""
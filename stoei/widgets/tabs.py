@@ -88,6 +88,7 @@ class TabContainer(Container):
             "tab-users": ("Users", "Users"),
             "tab-priority": ("Priority", "Prior"),
             "tab-logs": ("Logs", "Logs"),
+            "tab-performance": ("Performance", "Perf"),
         }
 
     def compose(self) -> ComposeResult:
@@ -98,6 +99,7 @@ class TabContainer(Container):
             yield Button("Users", id="tab-users", classes="tab-button")
             yield Button("Priority", id="tab-priority", classes="tab-button")
             yield Button("Logs", id="tab-logs", classes="tab-button")
+            yield Button("Performance", id="tab-performance", classes="tab-button")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle tab button presses.
@@ -115,18 +117,20 @@ class TabContainer(Container):
             self.switch_tab("priority")
         elif event.button.id == "tab-logs":
             self.switch_tab("logs")
+        elif event.button.id == "tab-performance":
+            self.switch_tab("performance")
 
     def switch_tab(self, tab_name: str) -> None:
         """Switch to a different tab.
 
         Args:
-            tab_name: Name of the tab to switch to ('jobs', 'nodes', 'users', 'priority', or 'logs').
+            tab_name: Name of the tab to switch to ('jobs', 'nodes', 'users', 'priority', 'logs', or 'performance').
         """
         if tab_name == self._active_tab:
             return
 
         # Update button states
-        for btn_id in ["tab-jobs", "tab-nodes", "tab-users", "tab-priority", "tab-logs"]:
+        for btn_id in ["tab-jobs", "tab-nodes", "tab-users", "tab-priority", "tab-logs", "tab-performance"]:
             btn = self.query_one(f"#{btn_id}", Button)
             if btn_id == f"tab-{tab_name}":
                 btn.add_class("active")
@@ -144,13 +148,14 @@ class TabContainer(Container):
                 "tab-users-content",
                 "tab-priority-content",
                 "tab-logs-content",
+                "tab-performance-content",
             ]
             for tab_id in tab_content_ids:
                 try:
                     tab_content = screen.query_one(f"#{tab_id}", Container)
                     tab_content.display = False
                 except Exception as exc:
-                    logger.debug(f"Failed to hide tab {tab_id}: {exc}")
+                    logger.debug("Failed to hide tab {}: {}", tab_id, exc)
 
             # Show the active tab content
             active_tab_id = f"tab-{tab_name}-content"
@@ -158,9 +163,9 @@ class TabContainer(Container):
                 active_tab = screen.query_one(f"#{active_tab_id}", Container)
                 active_tab.display = True
             except Exception as exc:
-                logger.debug(f"Failed to show tab {active_tab_id}: {exc}")
+                logger.debug("Failed to show tab {}: {}", active_tab_id, exc)
         except Exception as exc:
-            logger.debug(f"Failed to switch tab UI: {exc}")
+            logger.debug("Failed to switch tab UI: {}", exc)
 
         # Post message for app to handle additional updates
         self.post_message(TabSwitched(tab_name))
@@ -191,4 +196,4 @@ class TabContainer(Container):
                     btn.label = full_label
                     btn.remove_class("compact")
         except Exception as exc:
-            logger.debug(f"Failed to update tab labels: {exc}")
+            logger.debug("Failed to update tab labels: {}", exc)
@@ -8,6 +8,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.message import Message
+from textual.widget import Widget
 from textual.widgets import Static
 
 from stoei.logger import get_logger
@@ -26,7 +27,7 @@ from stoei.slurm.gpu_parser import (
     format_gpu_types,
     has_specific_gpu_types,
 )
-from stoei.slurm.nodelist import expand_nodelist
+from stoei.slurm.nodelist import get_node_registry
 from stoei.slurm.parser import parse_tres_resources
 from stoei.widgets.filterable_table import ColumnConfig, FilterableDataTable
 from stoei.widgets.screens import EnergyEnableModal
@@ -58,7 +59,7 @@ class _UserDataDict(TypedDict):
     total_memory_gb: float
     total_gpus: int
     gpu_types: dict[str, int]
-    node_names: set[str]
+    node_bits: int  # Bitset of node IDs from the shared NodeRegistry
     array_base_ids: set[str]
     plain_job_count: int
 
@@ -217,6 +218,49 @@ class UserOverviewTab(VerticalScroll):
         self.energy_users: list[UserEnergyStats] = []
         self._active_subtab: SubtabName = "running"
         self._settings = load_settings()
+        self._energy_months = self._settings.energy_history_months
+        # Hidden sub-tabs are composed the first time they are shown
+        self._mounted_subtabs: set[SubtabName] = {"running"}
+
+    def _subtab_widgets(self, subtab: SubtabName) -> list[Widget]:
+        """Create the widgets of a sub-tab.
+
+        Args:
+            subtab: Sub-tab to create the widgets for.
+
+        Returns:
+            The widgets to mount in the sub-tab container.
+        """
+        if subtab == "running":
+            return [
+                FilterableDataTable(
+                    columns=self.RUNNING_USERS_COLUMNS,
+                    keybind_mode=self._settings.keybind_mode,
+                    table_id="users_table",
+                    id="users-filterable-table",
+                )
+            ]
+        if subtab == "pending":
+            return [
+                FilterableDataTable(
+                    columns=self.PENDING_USERS_COLUMNS,
+                    keybind_mode=self._settings.keybind_mode,
+                    table_id="pending_users_table",
+                    id="pending-users-filterable-table",
+                )
+            ]
+        return [
+            Static(self._energy_period_markup(), id="energy-period-info"),
+            FilterableDataTable(
+                columns=self.ENERGY_USERS_COLUMNS,
+                keybind_mode=self._settings.keybind_mode,
+                table_id="energy_users_table",
+                id="energy-users-filterable-table",
+            ),
+        ]
+
+    def _energy_period_markup(self) -> str:
+        return f"[dim]Energy usage over the last {self._energy_months} months (100% utilization estimate)[/dim]"
 
     def compose(self) -> ComposeResult:
         """Create the user overview layout with sub-tabs."""
@@ -232,35 +276,11 @@ class UserOverviewTab(VerticalScroll):
 
         # Running users sub-tab (default visible)
         with Container(id="subtab-running", classes="subtab-content"):
-            yield FilterableDataTable(
-                columns=self.RUNNING_USERS_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="users_table",
-                id="users-filterable-table",
-            )
+            yield from self._subtab_widgets("running")
 
-        # Pending users sub-tab (hidden by default)
-        with Container(id="subtab-pending", classes="subtab-content subtab-hidden"):
-            yield FilterableDataTable(
-                columns=self.PENDING_USERS_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="pending_users_table",
-                id="pending-users-filterable-table",
-            )
-
-        # Energy usage sub-tab (hidden by default)
-        months = self._settings.energy_history_months
-        with Container(id="subtab-energy", classes="subtab-content subtab-hidden"):
-            yield Static(
-                f"[dim]Energy usage over the last {months} months (100% utilization estimate)[/dim]",
-                id="energy-period-info",
-            )
-            yield FilterableDataTable(
-                columns=self.ENERGY_USERS_COLUMNS,
-                keybind_mode=self._settings.keybind_mode,
-                table_id="energy_users_table",
-                id="energy-users-filterable-table",
-            )
+        # Pending users and energy sub-tabs (hidden, composed on first show)
+        yield Container(id="subtab-pending", classes="subtab-content subtab-hidden")
+        yield Container(id="subtab-energy", classes="subtab-content subtab-hidden")
 
     def on_mount(self) -> None:
         """Initialize the data tables."""
@@ -295,7 +315,7 @@ class UserOverviewTab(VerticalScroll):
                 self.app.push_screen(EnergyEnableModal(), self._on_energy_modal_result)
                 return
 
-        logger.debug(f"Switching user overview subtab from {self._active_subtab} to {subtab}")
+        logger.debug("Switching user overview subtab from {} to {}", self._active_subtab, subtab)
 
         # Update header to show active tab
         self._update_subtab_header(subtab)
@@ -306,30 +326,60 @@ class UserOverviewTab(VerticalScroll):
                 container = self.query_one(f"#{container_id}", Container)
                 container.add_class("subtab-hidden")
             except Exception as exc:
-                logger.debug(f"Failed to hide container {container_id}: {exc}")
+                logger.debug("Failed to hide container {}: {}", container_id, exc)
 
         # Show the active subtab container
         active_container_id = f"subtab-{subtab}"
         try:
             active_container = self.query_one(f"#{active_container_id}", Container)
             active_container.remove_class("subtab-hidden")
-
-            # Focus the appropriate filterable table
-            filterable_ids = {
-                "running": "users-filterable-table",
-                "pending": "pending-users-filterable-table",
-                "energy": "energy-users-filterable-table",
-            }
-            filterable_id = filterable_ids.get(subtab)
-            if filterable_id:
-                filterable_table = self.query_one(f"#{filterable_id}", FilterableDataTable)
-                filterable_table.focus()
+            if subtab not in self._mounted_subtabs:
+                self._mount_subtab(subtab, active_container)
+            else:
+                self._focus_subtab_table(subtab)
         except Exception as exc:
-            logger.debug(f"Failed to show container {active_container_id}: {exc}")
+            logger.debug("Failed to show container {}: {}", active_container_id, exc)
 
         self._active_subtab = subtab
         self.post_message(SubtabSwitched(subtab))
 
+    def _mount_subtab(self, subtab: SubtabName, container: Container) -> None:
+        """Compose a sub-tab on first show and fill it with the data stored so far.
+
+        Args:
+            subtab: Sub-tab to mount.
+            container: The sub-tab's (empty) container.
+        """
+        self._mounted_subtabs.add(subtab)
+        mounted = container.mount_all(self._subtab_widgets(subtab))
+
+        async def fill_and_focus() -> None:
+            await mounted
+            if subtab == "pending" and self.pending_users:
+                self.update_pending_users(self.pending_users)
+            elif subtab == "energy" and self.energy_users:
+                self.update_energy_users(self.energy_users)
+            if self._active_subtab == subtab:
+                self._focus_subtab_table(subtab)
+
+        self.call_later(fill_and_focus)
+
+    def _focus_subtab_table(self, subtab: SubtabName) -> None:
+        """Focus the filterable table of a sub-tab.
+
+        Args:
+            subtab: Sub-tab whose table to focus.
+        """
+        filterable_ids = {
+            "running": "users-filterable-table",
+            "pending": "pending-users-filterable-table",
+            "energy": "energy-users-filterable-table",
+        }
+        try:
+            self.query_one(f"#{filterable_ids[subtab]}", FilterableDataTable).focus()
+        except Exception as exc:
+            logger.debug("Failed to focus {} users table: {}", subtab, exc)
+
     def _update_subtab_header(self, active: SubtabName) -> None:
         """Update the sub-tab header to highlight the active tab.
 
@@ -346,7 +396,7 @@ class UserOverviewTab(VerticalScroll):
 
             header.update(f"[bold]User Overview[/bold]  {running_style}  {pending_style}  {energy_style}")
         except Exception as exc:
-            logger.debug(f"Failed to update subtab header: {exc}")
+            logger.debug("Failed to update subtab header: {}", exc)
 
     def action_switch_subtab_running(self) -> None:
         """Switch to the Running sub-tab."""
@@ -477,11 +527,12 @@ class UserOverviewTab(VerticalScroll):
         Args:
             months: Number of months of energy history.
         """
+        self._energy_months = months
         try:
             period_info = self.query_one("#energy-period-info", Static)
-            period_info.update(f"[dim]Energy usage over the last {months} months (100% utilization estimate)[/dim]")
+            period_info.update(self._energy_period_markup())
         except Exception as exc:
-            logger.debug(f"Failed to update energy period label: {exc}")
+            logger.debug("Failed to update energy period label: {}", exc)
 
     @staticmethod
     def _parse_node_count(nodes_str: str) -> int:
@@ -558,9 +609,9 @@ class UserOverviewTab(VerticalScroll):
         nodes_str = job[nodes_index].strip() if len(job) > nodes_index else "0"
         node_count = UserOverviewTab._parse_node_count(nodes_str)
 
-        # Expand NodeList to individual hostnames and collect unique nodes
-        nodelist_str = job[nodelist_index].strip() if len(job) > nodelist_index else ""
-        user_data["node_names"].update(expand_nodelist(nodelist_str))
+        # Collect unique nodes as a bitset (union without expanding to hostnames)
+        nodelist_str = job[nodelist_index] if len(job) > nodelist_index else ""
+        user_data["node_bits"] |= get_node_registry().bits(nodelist_str)
 
         # Parse TRES for CPU, memory, and GPU information
         tres_str = job[tres_index].strip() if len(job) > tres_index else ""
@@ -601,10 +652,11 @@ class UserOverviewTab(VerticalScroll):
         Returns:
             List of UserStats objects.
         """
+        registry = get_node_registry()
         user_stats: list[UserStats] = []
         for username, data in user_data.items():
             gpu_types_str = UserOverviewTab._format_gpu_types(data["gpu_types"])
-            node_names_str = ",".join(sorted(data["node_names"]))
+            node_names_str = ",".join(sorted(registry.names(data["node_bits"])))
             user_stats.append(
                 UserStats(
                     username=username,
@@ -612,7 +664,7 @@ class UserOverviewTab(VerticalScroll):
                     total_cpus=int(data["total_cpus"]),
                     total_memory_gb=data["total_memory_gb"],
                     total_gpus=int(data["total_gpus"]),
-                    total_nodes=len(data["node_names"]),
+                    total_nodes=data["node_bits"].bit_count(),
                     gpu_types=gpu_types_str,
                     node_names=node_names_str,
                     array_count=len(data["array_base_ids"]),
@@ -648,7 +700,7 @@ class UserOverviewTab(VerticalScroll):
                 "total_memory_gb": 0.0,
                 "total_gpus": 0,
                 "gpu_types": defaultdict(int),
-                "node_names": set(),
+                "node_bits": 0,
                 "array_base_ids": set(),
                 "plain_job_count": 0,
             }
@@ -1,13 +1,71 @@
 """Shared test fixtures for stoei."""
 
 import os
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
+import stoei.logger
+from stoei.profiling import configure_profiling, stop_profiling
+from stoei.slurm.commands import clear_command_memo
+from stoei.slurm.environment import reset_slurm_environment
+from stoei.tracing import configure_tracing
 
 from tests.mocks import MOCKS_DIR
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep persistent caches out of the user's cache directory.
+
+    Returns:
+        Path to the per-test cache directory.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("STOEI_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_log_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Keep log files of tests that configure logging out of the user's log directory.
+
+    Yields:
+        Path to the per-test log directory.
+    """
+    log_dir = tmp_path / "logs"
+    monkeypatch.setenv("STOEI_LOG_DIR", str(log_dir))
+    yield log_dir
+    stoei.logger.shutdown_logging()
+
+
+@pytest.fixture(autouse=True)
+def reset_command_memo() -> None:
+    """Forget SLURM command results memoized by earlier tests."""
+    clear_command_memo()
+
+
+@pytest.fixture(autouse=True)
+def reset_slurm_environment_probe() -> None:
+    """Probe the SLURM environment again in each test, against its own PATH and cache dir."""
+    reset_slurm_environment()
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling() -> Generator[None]:
+    """End profiling sessions a test left running and restore the default settings."""
+    yield
+    stop_profiling()
+    configure_profiling()
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing() -> Generator[None]:
+    """Disable span tracing a test enabled."""
+    yield
+    configure_tracing(None)
+
+
 @pytest.fixture
 def mock_slurm_path(monkeypatch: pytest.MonkeyPatch) -> Path:
     """Add mock SLURM executables to PATH.
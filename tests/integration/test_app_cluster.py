@@ -5,7 +5,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 from stoei.app import SlurmMonitor
 from stoei.slurm.cache import JobCache
+from stoei.telemetry import COMMAND, get_telemetry
 from stoei.widgets.cluster_sidebar import ClusterSidebar
+from stoei.widgets.filterable_table import FilterableDataTable
 from stoei.widgets.tabs import TabContainer
 
 
@@ -177,6 +179,27 @@ class TestAppClusterIntegration:
                 assert users_tab.display is False
                 assert logs_tab.display is False
 
+    async def test_non_default_tabs_are_mounted_on_first_show(self, app: SlurmMonitor) -> None:
+        """Test that the nodes, users and priority tabs are composed only when first shown."""
+        from stoei.widgets.node_overview import NodeOverviewTab
+
+        with (
+            patch("stoei.app.check_slurm_available", return_value=(True, None)),
+            patch.object(app, "_start_refresh_worker"),
+        ):
+            async with app.run_test(size=(80, 24)) as pilot:
+                for widget_id in ("#node-overview", "#user-overview", "#priority-overview"):
+                    assert not app.query(widget_id)
+
+                app.query_one("TabContainer", TabContainer).switch_tab("nodes")
+                await pilot.pause()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+                assert app.query_one("#node-overview", NodeOverviewTab).is_mounted
+                assert "nodes" not in app._unmounted_tabs
+                assert not app.query("#user-overview")
+
     def test_app_refresh_fetches_cluster_data(self, app: SlurmMonitor) -> None:
         """Test that app refresh posts messages for cluster data."""
         posted_messages: list[object] = []
@@ -352,6 +375,23 @@ class TestAppClusterIntegration:
                 logs_tab = app.query_one("#tab-logs-content")
                 assert logs_tab.display is True
 
+    async def test_action_switch_tab_performance(self, app: SlurmMonitor) -> None:
+        """Test that action_switch_tab_performance mounts and fills the performance tab."""
+        get_telemetry().record(COMMAND, "squeue", 0.05, output_bytes=100)
+        with (
+            patch("stoei.app.check_slurm_available", return_value=(True, None)),
+            patch.object(app, "_start_refresh_worker"),
+        ):
+            async with app.run_test(size=(80, 24)) as pilot:
+                app.action_switch_tab_performance()
+                await pilot.pause()
+
+                tab_container = app.query_one("TabContainer", TabContainer)
+                assert tab_container.active_tab == "performance"
+                assert app.query_one("#tab-performance-content").display is True
+                table = app.query_one("#performance-filterable-table", FilterableDataTable)
+                assert table.table.row_count >= 1
+
     def test_bindings_include_tab_shortcuts(self, app: SlurmMonitor) -> None:
         """Test that keyboard bindings include tab switching shortcuts."""
         binding_keys = [b.key for b in app.BINDINGS]
@@ -371,6 +411,7 @@ class TestAppClusterIntegration:
         assert bindings_dict["3"] == "switch_tab_users"
         assert bindings_dict["4"] == "switch_tab_priority"
         assert bindings_dict["5"] == "switch_tab_logs"
+        assert bindings_dict["6"] == "switch_tab_performance"
         assert bindings_dict["left"] == "previous_tab"
         assert bindings_dict["right"] == "next_tab"
         assert bindings_dict["shift+tab"] == "previous_tab"
@@ -410,7 +451,12 @@ class TestAppClusterIntegration:
                 await pilot.pause()
                 assert tab_container.active_tab == "logs"
 
-                # Cycle forward: logs -> jobs (wraps around)
+                # Cycle forward: logs -> performance
+                app.action_next_tab()
+                await pilot.pause()
+                assert tab_container.active_tab == "performance"
+
+                # Cycle forward: performance -> jobs (wraps around)
                 app.action_next_tab()
                 await pilot.pause()
                 assert tab_container.active_tab == "jobs"
@@ -425,7 +471,12 @@ class TestAppClusterIntegration:
                 tab_container = app.query_one("TabContainer", TabContainer)
                 assert tab_container.active_tab == "jobs"
 
-                # Cycle backward: jobs -> logs (wraps around)
+                # Cycle backward: jobs -> performance (wraps around)
+                app.action_previous_tab()
+                await pilot.pause()
+                assert tab_container.active_tab == "performance"
+
+                # Cycle backward: performance -> logs
                 app.action_previous_tab()
                 await pilot.pause()
                 assert tab_container.active_tab == "logs"
@@ -476,7 +527,11 @@ class TestAppClusterIntegration:
                 await pilot.press("tab")
                 assert tab_container.active_tab == "logs"
 
-                # Press Tab: logs -> jobs (wraps around)
+                # Press Tab: logs -> performance
+                await pilot.press("tab")
+                assert tab_container.active_tab == "performance"
+
+                # Press Tab: performance -> jobs (wraps around)
                 await pilot.press("tab")
                 assert tab_container.active_tab == "jobs"
 
@@ -494,4 +549,4 @@ class TestAppClusterIntegration:
                 # Test that the action works directly (binding may work in real usage)
                 app.action_previous_tab()
                 await pilot.pause()
-                assert tab_container.active_tab == "logs"
+                assert tab_container.active_tab == "performance"
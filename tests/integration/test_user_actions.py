@@ -75,15 +75,23 @@ def slurm_monitor_factory(monkeypatch: pytest.MonkeyPatch) -> Callable[[], Slurm
 
     def fake_job_info_and_log_paths(
         _job_id: str,
+        **_kwargs: object,
     ) -> tuple[str, str | None, str | None, str | None]:
         return ("", None, None, None)
 
+    def fake_jobs_info_and_log_paths(
+        _job_ids: list[str],
+        **_kwargs: object,
+    ) -> dict[str, tuple[str, str | None, str | None, str | None]]:
+        return {}
+
     monkeypatch.setattr("stoei.app.check_slurm_available", fake_check)
     monkeypatch.setattr("stoei.app.get_cluster_nodes", fake_nodes)
     monkeypatch.setattr("stoei.app.get_running_jobs", fake_running)
     monkeypatch.setattr("stoei.app.get_job_history", fake_history)
     monkeypatch.setattr("stoei.app.get_all_running_jobs", fake_all_running)
     monkeypatch.setattr("stoei.app.get_job_info_and_log_paths", fake_job_info_and_log_paths)
+    monkeypatch.setattr("stoei.app.get_jobs_info_and_log_paths", fake_jobs_info_and_log_paths)
 
     def factory() -> SlurmMonitor:
         JobCache.reset()
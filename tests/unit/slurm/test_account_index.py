@@ -0,0 +1,111 @@
+"""Tests for the account hierarchy index and its rollups."""
+
+from stoei.slurm.account_index import (
+    account_usage,
+    build_account_tree,
+    rollup_account_priorities,
+    subtree_accounts,
+    subtree_users,
+)
+from stoei.slurm.job_index import JobIndex
+
+# sshare -a -P rows: account names are indented one space per level below root
+SSHARE_ROWS: list[tuple[str, ...]] = [
+    ("root", "", "1", "1.0", "300", "1.0", "1.0", ""),
+    (" physics", "", "10", "0.5", "200", "0.6", "0.6", ""),
+    ("  astro", "", "5", "0.25", "150", "0.5", "0.5", ""),
+    ("  astro", "alice", "1", "0.1", "100", "0.3", "0.3", "0.4"),
+    ("  optics", "", "5", "0.25", "50", "0.1", "0.1", ""),
+    ("  optics", "bob", "1", "0.1", "50", "0.1", "0.1", "0.7"),
+    (" chem", "", "10", "0.5", "100", "0.4", "0.4", ""),
+    (" chem", "carol", "1", "0.2", "100", "0.4", "0.4", "0.5"),
+]
+
+JOBS: list[tuple[str, ...]] = [
+    ("1", "sim", "alice", "gpu", "R", "1:00", "1", "acct01", "cpu=8,mem=16G,gres/gpu=2"),
+    ("2", "sim", "alice", "gpu", "PD", "0:00", "1", "(Priority)", "cpu=8,mem=16G"),
+    ("3", "lens", "bob", "cpu", "R", "2:00", "2", "acct[01-02]", "cpu=4,mem=8G"),
+    ("4", "mol", "carol", "cpu", "R", "3:00", "1", "acct03", "cpu=2,mem=4G"),
+]
+
+
+class TestBuildAccountTree:
+    """Tests for build_account_tree."""
+
+    def test_parents_and_children_follow_indentation(self) -> None:
+        """Test that the tree follows sshare's indentation."""
+        tree = build_account_tree(SSHARE_ROWS)
+        assert tree["root"].parent is None
+        assert tree["root"].children == ["physics", "chem"]
+        assert tree["physics"].children == ["astro", "optics"]
+        assert tree["optics"].parent == "physics"
+        assert tree["chem"].parent == "root"
+
+    def test_users_and_account_priority(self) -> None:
+        """Test that user rows attach to their account and account rows carry fair-share info."""
+        tree = build_account_tree(SSHARE_ROWS)
+        assert [user["username"] for user in tree["astro"].users] == ["alice"]
+        assert tree["astro"].priority["raw_shares"] == "5"
+        assert tree["physics"].users == []
+
+    def test_flat_output_has_no_parents(self) -> None:
+        """Test that unindented accounts are all roots."""
+        rows = [(row[0].strip(), *row[1:]) for row in SSHARE_ROWS]
+        tree = build_account_tree(rows)
+        assert all(node.parent is None for node in tree.values())
+
+    def test_subtree_helpers(self) -> None:
+        """Test subtree account and user lookups."""
+        tree = build_account_tree(SSHARE_ROWS)
+        assert subtree_accounts(tree, "physics") == ["physics", "astro", "optics"]
+        assert subtree_users(tree, "physics") == {"alice", "bob"}
+        assert subtree_accounts(tree, "unknown") == []
+
+
+class TestRollups:
+    """Tests for the per-account rollups."""
+
+    def test_usage_rolls_up_subtree(self) -> None:
+        """Test that parent accounts include the jobs and resources of sub-accounts."""
+        tree = build_account_tree(SSHARE_ROWS)
+        index = JobIndex()
+        index.update(JOBS)
+
+        astro = account_usage(tree, "astro", index.jobs_for_user)
+        assert [job[0] for job in astro.running_jobs] == ["1"]
+        assert [job[0] for job in astro.pending_jobs] == ["2"]
+        assert astro.totals.gpus == 2
+
+        physics = account_usage(tree, "physics", index.jobs_for_user)
+        assert [job[0] for job in physics.running_jobs] == ["1", "3"]
+        assert physics.totals.cpus == 12
+        assert physics.totals.memory_gb == 24.0
+        # acct01 is shared by jobs 1 and 3
+        assert physics.totals.nodes == 2
+        assert account_usage(tree, "root", index.jobs_for_user).totals.nodes == 3
+        assert account_usage(tree, "unknown", index.jobs_for_user).running_jobs == []
+
+    def test_usage_looks_up_only_subtree_members(self) -> None:
+        """Test that an account's usage does not touch users outside its subtree."""
+        tree = build_account_tree(SSHARE_ROWS)
+        looked_up: list[str] = []
+
+        def jobs_for_user(user: str) -> list[tuple[str, ...]]:
+            looked_up.append(user)
+            return []
+
+        account_usage(tree, "physics", jobs_for_user)
+        assert looked_up == ["alice", "bob"]
+
+    def test_priorities_by_subtree_account_or_member(self) -> None:
+        """Test that pending priorities match by charged account or member user."""
+        tree = build_account_tree(SSHARE_ROWS)
+        sprio = [
+            ("2", "alice", "astro", "900", "10", "800", "90", "gpu", "normal"),
+            ("5", "dave", "optics", "500", "10", "400", "90", "cpu", "normal"),
+            ("6", "carol", "other", "300", "10", "200", "90", "cpu", "normal"),
+        ]
+        priorities = rollup_account_priorities(tree, sprio)
+        assert [row["job_id"] for row in priorities["physics"]] == ["2", "5"]
+        assert [row["job_id"] for row in priorities["chem"]] == ["6"]
+        assert [row["job_id"] for row in priorities["other"]] == ["6"]
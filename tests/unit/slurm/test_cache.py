@@ -1,5 +1,6 @@
 """Tests for the JobCache module."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -157,7 +158,7 @@ class TestJobCache:
 
     def test_initial_state(self) -> None:
         cache = JobCache()
-        assert cache.jobs == []
+        assert cache.jobs == ()
         assert cache.running_count == 0
         assert cache.pending_count == 0
         assert cache.active_count == 0
@@ -261,16 +262,24 @@ class TestJobCacheProperties:
         """Reset the singleton cache before each test."""
         JobCache.reset()
 
-    def test_jobs_property_returns_copy(self) -> None:
-        """Test that jobs property returns a copy, not the original list."""
+    def test_jobs_property_returns_shared_tuple(self) -> None:
+        """Test that jobs property returns the immutable cached tuple without copying."""
         cache = JobCache()
 
         jobs1 = cache.jobs
         jobs2 = cache.jobs
 
-        # Should be equal but not the same object
-        assert jobs1 == jobs2
-        assert jobs1 is not jobs2
+        assert isinstance(jobs1, tuple)
+        assert jobs1 is jobs2
+
+    def test_jobs_are_immutable(self, mock_slurm_path: Path) -> None:
+        """Test that cached jobs cannot be mutated by readers."""
+        cache = JobCache()
+        cache.refresh()
+
+        assert cache.jobs
+        with pytest.raises(FrozenInstanceError):
+            cache.jobs[0].state = "COMPLETED"  # type: ignore[misc]
 
     def test_running_count_property(self, mock_slurm_path: Path) -> None:
         """Test running_count property after refresh."""
@@ -1,11 +1,18 @@
 """Tests for SLURM command execution with mock executables."""
 
+import subprocess
 from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from stoei.slurm.commands import _parse_fixed_width_squeue_line, _validate_username
+from stoei.slurm.commands import (
+    _SQUEUE_ALL_FIELDS,
+    _SQUEUE_USER_FIELDS,
+    _parse_squeue_output,
+    _squeue_format,
+    _validate_username,
+)
 
 
 class TestValidateUsername:
@@ -44,54 +51,152 @@ class TestValidateUsername:
         assert result == "Invalid username characters"
 
 
-class TestParseFixedWidthSqueueLine:
-    """Tests for _parse_fixed_width_squeue_line with wider NodeList column."""
+class TestParseSqueueLine:
+    """Tests for _parse_squeue_output with delimited and fixed-width columns."""
+
+    def test_format_puts_name_last(self) -> None:
+        """Test that the free-text Name field is queried last."""
+        assert _squeue_format(_SQUEUE_USER_FIELDS, delimited=True) == (
+            "JobID:|,Partition:|,StateCompact:|,TimeUsed:|,NumNodes:|,NodeList:|,tres:|,Name:|"
+        )
+        assert _squeue_format(("JobID", "Name", "NodeList"), delimited=False) == "JobID:30,NodeList:80,Name:50"
+
+    def test_parses_delimited_line(self) -> None:
+        """Test parsing an unpadded delimited line into job tuple order."""
+        line = "12345|testuser|gpu-a100|R|1:23:45|4|gpu-node[001-004],cpu-node[010-012]|cpu=128,mem=512G|train_model|"
+        [result] = _parse_squeue_output(line + "\n", _SQUEUE_ALL_FIELDS, delimited=True)
+
+        assert result == (
+            "12345",
+            "train_model",
+            "testuser",
+            "gpu-a100",
+            "R",
+            "1:23:45",
+            "4",
+            "gpu-node[001-004],cpu-node[010-012]",
+            "cpu=128,mem=512G",
+        )
+
+    def test_job_name_may_contain_delimiter(self) -> None:
+        """Test that a '|' in the job name does not shift the other fields."""
+        line = "7|gpu|PD|0:00|1|(Priority)|cpu=4|a|b|"
+        [result] = _parse_squeue_output(line, _SQUEUE_USER_FIELDS, delimited=True)
+
+        assert result[0] == "7"
+        assert result[1] == "a|b"
+        assert result[7] == "cpu=4"
+
+    def test_rejects_lines_without_enough_fields(self) -> None:
+        """Test that blank, truncated or undelimited lines and empty job IDs are skipped."""
+        stdout = "\n12345 train R\n|||||||||\n"
+        assert _parse_squeue_output(stdout, _SQUEUE_ALL_FIELDS, delimited=True) == []
+
+    def test_parses_fixed_width_fallback_line(self) -> None:
+        """Test parsing a fixed-width line built from the same field table."""
+        line = (
+            "12345".ljust(30)
+            + "alice".ljust(15)
+            + "cpu".ljust(15)
+            + "R".ljust(10)
+            + "0:05:00".ljust(12)
+            + "1".ljust(6)
+            + "node01".ljust(80)
+            + "cpu=4,mem=16G".ljust(80)
+            + "short_job"
+        )
+        [result] = _parse_squeue_output(line + "\n\n", _SQUEUE_ALL_FIELDS, delimited=False)
+
+        assert result[:3] == ("12345", "short_job", "alice")
+        assert result[7] == "node01"
+        assert result[8] == "cpu=4,mem=16G"
 
-    def test_parses_line_with_wide_nodelist(self) -> None:
-        """Test parsing a fixed-width line with 80-char NodeList field."""
-        # Build a line matching the format:
-        # JobID:30, Name:50, UserName:15, Partition:15, StateCompact:10, TimeUsed:12, NumNodes:6, NodeList:80, tres:80
-        job_id = "12345".ljust(30)
-        name = "train_model".ljust(50)
-        user = "testuser".ljust(15)
-        partition = "gpu-a100".ljust(15)
-        state = "R".ljust(10)
-        time_used = "1:23:45".ljust(12)
-        num_nodes = "4".ljust(6)
-        node_list = "gpu-node[001-004],cpu-node[010-012]".ljust(80)
-        tres = "cpu=128,mem=512G,gres/gpu:a100=16"
 
-        line = job_id + name + user + partition + state + time_used + num_nodes + node_list + tres
-        result = _parse_fixed_width_squeue_line(line)
+class TestSqueueFormatFallback:
+    """Tests for falling back to fixed-width squeue columns."""
 
-        assert result is not None
-        assert result[0] == "12345"
-        assert result[1] == "train_model"
-        assert result[2] == "testuser"
-        assert result[3] == "gpu-a100"
-        assert result[4] == "R"
-        assert result[5] == "1:23:45"
-        assert result[6] == "4"
-        assert result[7] == "gpu-node[001-004],cpu-node[010-012]"
-        assert "cpu=128" in result[8]
-
-    def test_parses_line_with_short_nodelist(self) -> None:
-        """Test parsing a line where NodeList is shorter than 80 chars."""
-        job_id = "99999".ljust(30)
-        name = "short_job".ljust(50)
-        user = "alice".ljust(15)
-        partition = "cpu".ljust(15)
-        state = "R".ljust(10)
-        time_used = "0:05:00".ljust(12)
-        num_nodes = "1".ljust(6)
-        node_list = "node01".ljust(80)
-        tres = "cpu=4,mem=16G"
-
-        line = job_id + name + user + partition + state + time_used + num_nodes + node_list + tres
-        result = _parse_fixed_width_squeue_line(line)
+    def test_falls_back_when_suffixes_are_ignored(self) -> None:
+        """Test that undelimited output triggers one fixed-width query."""
+        from stoei.slurm import commands
+        from stoei.slurm.commands import get_all_running_jobs
+        from stoei.slurm.environment import get_slurm_environment
 
-        assert result is not None
-        assert result[7] == "node01"
+        fields = commands._squeue_query_order(_SQUEUE_ALL_FIELDS)
+        values = {"JobID": "42", "Name": "train", "UserName": "bob", "NodeList": "n1", "tres": "cpu=2"}
+        fixed_line = "".join(values.get(field, "x").ljust(commands._SQUEUE_FIELD_WIDTHS[field]) for field in fields)
+        ignored = MagicMock(returncode=0, stdout="42 train bob\n", stderr="")
+        fixed = MagicMock(returncode=0, stdout=fixed_line + "\n", stderr="")
+
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="squeue"),
+            patch("stoei.slurm.commands._run_with_retry", side_effect=[(ignored, None), (fixed, None)]) as mock_run,
+        ):
+            jobs, error = get_all_running_jobs()
+
+        assert error is None
+        assert jobs[0][:3] == ("42", "train", "bob")
+        assert mock_run.call_args_list[1].args[0][-1].startswith("JobID:30,UserName:15")
+        assert get_slurm_environment().squeue_delimited is False
+
+
+class TestGetAllRunningJobs:
+    """Tests for get_all_running_jobs."""
+
+    def test_lists_every_active_state(self) -> None:
+        """Test that squeue's default states are kept, so COMPLETING jobs are included."""
+        from stoei.slurm import commands
+        from stoei.slurm.commands import get_all_running_jobs
+
+        fields = commands._squeue_query_order(_SQUEUE_ALL_FIELDS)
+        values = {"JobID": "42", "Name": "train", "UserName": "bob", "StateCompact": "CG", "NodeList": "n1"}
+        line = "".join(f"{values.get(field, 'x')}|" for field in fields)
+        result = MagicMock(returncode=0, stdout=line + "\n", stderr="")
+
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="squeue"),
+            patch("stoei.slurm.commands._run_squeue_fields", return_value=(result, None, True)) as mock_run,
+        ):
+            jobs, error = get_all_running_jobs()
+
+        assert error is None
+        assert jobs[0][4] == "CG"
+        assert "-t" not in mock_run.call_args.args[0]
+
+
+class TestGetJobScheduleFields:
+    """Tests for get_job_schedule_fields."""
+
+    def test_queries_all_jobs_in_one_call(self) -> None:
+        """Test that one squeue -j call returns the fields keyed by job ID."""
+        from stoei.slurm.commands import get_job_schedule_fields
+
+        stdout = "12|None|2026-01-01T10:00:00|2026-01-01T10:05:00|\n30_[1-4]|Priority|2026-01-01T11:00:00|N/A|\n"
+        result = MagicMock(returncode=0, stdout=stdout, stderr="")
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="squeue"),
+            patch("stoei.slurm.commands._run_with_retry", return_value=(result, None)) as mock_run,
+        ):
+            fields, error = get_job_schedule_fields(["12", "30_[1-4]", "bad;id"])
+
+        assert error is None
+        assert fields == {
+            "12": ("None", "2026-01-01T10:00:00", "2026-01-01T10:05:00"),
+            "30_[1-4]": ("Priority", "2026-01-01T11:00:00", "N/A"),
+        }
+        command = mock_run.call_args.args[0]
+        assert command[:3] == ["squeue", "-j", "12,30"]
+        assert command[-1] == "JobID:|,Reason:|,SubmitTime:|,StartTime:|"
+
+    def test_ended_jobs_are_not_an_error(self) -> None:
+        """Test that squeue rejecting ended job IDs yields no fields and no error."""
+        from stoei.slurm.commands import get_job_schedule_fields
+
+        result = MagicMock(returncode=1, stdout="", stderr="slurm_load_jobs error: Invalid job id specified")
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="squeue"),
+            patch("stoei.slurm.commands._run_with_retry", return_value=(result, None)),
+        ):
+            assert get_job_schedule_fields(["12"]) == ({}, None)
 
 
 class TestGetUserJobs:
@@ -466,6 +571,110 @@ class TestRunSacctForJob:
         assert output == ""
 
 
+class TestGetJobsInfoAndLogPaths:
+    """Tests for the batched get_jobs_info_and_log_paths."""
+
+    _SCONTROL_OUTPUT = (
+        "JobId=100 JobName=train JobState=RUNNING StdOut=/logs/%j.out StdErr=/logs/%j.err WorkDir=/home/u\n"
+        "JobId=202 ArrayJobId=200 ArrayTaskId=2 JobName=sweep JobState=RUNNING WorkDir=/home/u\n"
+        "JobId=999 JobName=other JobState=PENDING WorkDir=/home/u\n"
+    )
+
+    def _completed(self, stdout: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr="")
+
+    def _sacct_line(self, job_id: str, state: str) -> str:
+        from stoei.slurm.commands import SACCT_JOB_FIELDS
+
+        values = dict.fromkeys(SACCT_JOB_FIELDS, "")
+        values.update({"JobID": job_id, "JobName": "done", "State": state, "StdOut": "/logs/out.txt"})
+        return "|".join(values[field] for field in SACCT_JOB_FIELDS)
+
+    def setup_method(self) -> None:
+        """Make sure sacct is not in its failure cooldown."""
+        from stoei.slurm import commands
+
+        commands._sacct_failure_ts[0] = None
+
+    def test_uses_one_scontrol_and_one_sacct_call(self, mock_slurm_path: Path) -> None:
+        """Test that active jobs come from scontrol and the rest from a single sacct."""
+        from stoei.slurm.commands import get_jobs_info_and_log_paths
+
+        sacct_output = "\n".join([self._sacct_line("300", "COMPLETED"), self._sacct_line("300.batch", "COMPLETED")])
+        with patch(
+            "stoei.slurm.commands._run_subprocess_command",
+            side_effect=[(self._completed(self._SCONTROL_OUTPUT), None), (self._completed(sacct_output), None)],
+        ) as mock_run:
+            states: dict[str, str] = {}
+            results = get_jobs_info_and_log_paths(["100", "200_2", "300", "404"], states=states)
+
+        assert mock_run.call_count == 2
+        scontrol_command = mock_run.call_args_list[0].args[0]
+        sacct_command = mock_run.call_args_list[1].args[0]
+        assert scontrol_command[1:] == ["show", "job", "-o"]
+        assert sacct_command[1:3] == ["-j", "300,404"]
+
+        assert set(results) == {"100", "200_2", "300"}
+        info, error, stdout, stderr = results["100"]
+        assert error is None
+        assert "train" in info
+        assert stdout == "/logs/100.out"
+        assert stderr == "/logs/100.err"
+        assert "sweep" in results["200_2"][0]
+        assert "COMPLETED" in results["300"][0]
+        assert results["300"][2] == "/logs/out.txt"
+        assert states == {"100": "RUNNING", "200_2": "RUNNING", "300": "COMPLETED"}
+
+    def test_skips_sacct_when_all_jobs_are_active(self, mock_slurm_path: Path) -> None:
+        """Test that no sacct call is made when scontrol found every job."""
+        from stoei.slurm.commands import get_jobs_info_and_log_paths
+
+        with patch(
+            "stoei.slurm.commands._run_subprocess_command",
+            return_value=(self._completed(self._SCONTROL_OUTPUT), None),
+        ) as mock_run:
+            results = get_jobs_info_and_log_paths(["100", "999"])
+
+        assert mock_run.call_count == 1
+        assert set(results) == {"100", "999"}
+
+    def test_parses_only_requested_records(self, mock_slurm_path: Path) -> None:
+        """Test that records of other jobs are skipped before parsing."""
+        from stoei.slurm import commands
+
+        with (
+            patch(
+                "stoei.slurm.commands._run_subprocess_command",
+                return_value=(self._completed(self._SCONTROL_OUTPUT), None),
+            ),
+            patch("stoei.slurm.commands.parse_scontrol_output", wraps=commands.parse_scontrol_output) as mock_parse,
+        ):
+            records = commands._run_scontrol_for_jobs({"200_2"})
+
+        assert list(records) == ["200_2"]
+        assert mock_parse.call_count == 1
+
+    def test_invalid_ids_are_skipped(self) -> None:
+        """Test that invalid job IDs never reach a command."""
+        from stoei.slurm.commands import get_jobs_info_and_log_paths
+
+        with patch("stoei.slurm.commands._run_subprocess_command") as mock_run:
+            assert get_jobs_info_and_log_paths(["not-a-job", "1; rm"]) == {}
+        mock_run.assert_not_called()
+
+    def test_command_failures_return_partial_results(self, mock_slurm_path: Path) -> None:
+        """Test that a failing sacct keeps the scontrol results."""
+        from stoei.slurm.commands import get_jobs_info_and_log_paths
+
+        with patch(
+            "stoei.slurm.commands._run_subprocess_command",
+            side_effect=[(self._completed(self._SCONTROL_OUTPUT), None), (None, "Command timed out")],
+        ):
+            results = get_jobs_info_and_log_paths(["100", "300"])
+
+        assert set(results) == {"100"}
+
+
 class TestCommandErrorPaths:
     """Tests for error handling in commands."""
 
@@ -478,7 +687,7 @@ class TestCommandErrorPaths:
     def test_get_running_jobs_handles_missing_squeue(self) -> None:
         from stoei.slurm.commands import get_running_jobs
 
-        with patch("stoei.slurm.commands.resolve_executable", side_effect=FileNotFoundError):
+        with patch("stoei.slurm.commands.get_executable", side_effect=FileNotFoundError):
             jobs, error = get_running_jobs()
             assert jobs == []
             assert error is not None
@@ -487,7 +696,7 @@ class TestCommandErrorPaths:
     def test_get_job_history_handles_missing_sacct(self) -> None:
         from stoei.slurm.commands import get_job_history
 
-        with patch("stoei.slurm.commands.resolve_executable", side_effect=FileNotFoundError):
+        with patch("stoei.slurm.commands.get_executable", side_effect=FileNotFoundError):
             jobs, total, _requeues, _max_req, error = get_job_history()
             assert jobs == []
             assert total == 0
@@ -497,7 +706,7 @@ class TestCommandErrorPaths:
     def test_cancel_job_handles_missing_scancel(self) -> None:
         from stoei.slurm.commands import cancel_job
 
-        with patch("stoei.slurm.commands.resolve_executable", side_effect=FileNotFoundError):
+        with patch("stoei.slurm.commands.get_executable", side_effect=FileNotFoundError):
             success, error = cancel_job("12345")
             assert success is False
             assert error is not None
@@ -529,8 +738,8 @@ class TestCommandErrorPaths:
         from stoei.slurm.commands import get_running_jobs
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/squeue"),
-            patch("stoei.slurm.commands.get_current_username", return_value="testuser"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/squeue"),
+            patch("stoei.slurm.commands.get_username", return_value="testuser"),
             patch("subprocess.run", side_effect=subprocess.SubprocessError("Error")),
         ):
             jobs, error = get_running_jobs()
@@ -545,8 +754,8 @@ class TestCommandErrorPaths:
         from stoei.slurm.commands import get_job_history
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
-            patch("stoei.slurm.commands.get_current_username", return_value="testuser"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_username", return_value="testuser"),
             patch("subprocess.run", side_effect=subprocess.SubprocessError("Error")),
         ):
             jobs, total, _requeues, _max_req, error = get_job_history()
@@ -562,7 +771,7 @@ class TestCommandErrorPaths:
         from stoei.slurm.commands import cancel_job
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/scancel"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/scancel"),
             patch("subprocess.run", side_effect=subprocess.SubprocessError("Error")),
         ):
             success, error = cancel_job("12345")
@@ -576,8 +785,8 @@ class TestCommandErrorPaths:
         from stoei.slurm.commands import get_running_jobs
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/squeue"),
-            patch("stoei.slurm.commands.get_current_username", return_value="testuser"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/squeue"),
+            patch("stoei.slurm.commands.get_username", return_value="testuser"),
             patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 5)),
         ):
             jobs, error = get_running_jobs()
@@ -592,8 +801,8 @@ class TestCommandErrorPaths:
         from stoei.slurm.commands import get_job_history
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
-            patch("stoei.slurm.commands.get_current_username", return_value="testuser"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_username", return_value="testuser"),
             patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 5)),
         ):
             jobs, _total, _requeues, _max_req, error = get_job_history()
@@ -611,7 +820,7 @@ class TestCommandErrorPaths:
         mock_result.stdout = ""
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/scontrol"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/scontrol"),
             patch("subprocess.run", return_value=mock_result),
         ):
             output, error = _run_scontrol_for_job("99999")
@@ -628,7 +837,7 @@ class TestCommandErrorPaths:
         mock_result.stdout = ""
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", return_value=mock_result),
         ):
             output, error = _run_sacct_for_job("99999")
@@ -666,7 +875,7 @@ class TestGetWaitTimeJobHistory:
         mock_result.stderr = ""
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", return_value=mock_result),
         ):
             jobs, error = get_wait_time_job_history(hours=1)
@@ -682,7 +891,7 @@ class TestGetWaitTimeJobHistory:
         from stoei.slurm.commands import get_wait_time_job_history
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 30)),
         ):
             jobs, error = get_wait_time_job_history(hours=1)
@@ -697,7 +906,7 @@ class TestGetWaitTimeJobHistory:
         from stoei.slurm.commands import get_wait_time_job_history
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", side_effect=subprocess.SubprocessError("Error")),
         ):
             jobs, error = get_wait_time_job_history(hours=1)
@@ -715,7 +924,7 @@ class TestGetWaitTimeJobHistory:
         mock_result.stdout = ""
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", return_value=mock_result),
         ):
             jobs, error = get_wait_time_job_history(hours=1)
@@ -732,7 +941,7 @@ class TestGetWaitTimeJobHistory:
         mock_result.stderr = ""
 
         with (
-            patch("stoei.slurm.commands.resolve_executable", return_value="/usr/bin/sacct"),
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
             patch("subprocess.run", return_value=mock_result) as mock_run,
         ):
             get_wait_time_job_history(hours=6)
@@ -740,6 +949,45 @@ class TestGetWaitTimeJobHistory:
             call_args = mock_run.call_args[0][0]
             assert any("now-6hours" in arg for arg in call_args)
 
+    def test_since_parameter(self) -> None:
+        """Test that an absolute start time overrides the hours window."""
+        from datetime import datetime
+
+        from stoei.slurm.commands import get_wait_time_job_history
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            get_wait_time_job_history(since=datetime(2024, 1, 15, 10, 30, 5))
+            call_args = mock_run.call_args[0][0]
+            assert "2024-01-15T10:30:05" in call_args
+            assert not any("now-" in arg for arg in call_args)
+
+    def test_until_parameter(self) -> None:
+        """Test that an end time bounds the backfill query with -E."""
+        from datetime import datetime
+
+        from stoei.slurm.commands import get_wait_time_job_history
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/sacct"),
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+        ):
+            get_wait_time_job_history(since=datetime(2024, 1, 8, 11, 0, 0), until=datetime(2024, 1, 15, 11, 0, 0))
+            call_args = mock_run.call_args[0][0]
+            assert call_args[call_args.index("-E") + 1] == "2024-01-15T11:00:00"
+
 
 class TestRunWithRetry:
     """Tests for _run_with_retry function."""
@@ -831,6 +1079,52 @@ class TestRunWithRetry:
             assert "not found" in error.lower()
 
 
+class TestCommandCoalescing:
+    """Tests for sharing identical SLURM commands between callers."""
+
+    def test_concurrent_identical_commands_run_once(self) -> None:
+        """Test that callers of an in-flight command share its subprocess."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from stoei.slurm.commands import _command_flight, _run_with_retry
+
+        release = threading.Event()
+        success_result = MagicMock(returncode=0, stdout="out", stderr="")
+
+        def slow_run(*_args: object, **_kwargs: object) -> MagicMock:
+            release.wait(timeout=5)
+            return success_result
+
+        coalesced_before = _command_flight.coalesced
+        with (
+            patch("subprocess.run", side_effect=slow_run) as mock_run,
+            ThreadPoolExecutor(max_workers=3) as pool,
+        ):
+            futures = [pool.submit(_run_with_retry, ["squeue", "-u", "me"], 5, "squeue") for _ in range(3)]
+            while _command_flight.coalesced - coalesced_before < 2:
+                threading.Event().wait(0.001)
+            release.set()
+            outcomes = [future.result() for future in futures]
+
+        assert mock_run.call_count == 1
+        assert all(outcome == (success_result, None) for outcome in outcomes)
+
+    def test_memo_ttl_reuses_successful_results_only(self) -> None:
+        """Test that a memoized command is served without a new subprocess."""
+        from stoei.slurm.commands import _run_with_retry
+
+        fail_result = MagicMock(returncode=1, stdout="", stderr="connection refused")
+        success_result = MagicMock(returncode=0, stdout="out", stderr="")
+        with patch("subprocess.run", side_effect=[fail_result, success_result]) as mock_run:
+            _run_with_retry(["sinfo"], 5, "sinfo", max_retries=0, memo_ttl=60.0)
+            second = _run_with_retry(["sinfo"], 5, "sinfo", max_retries=0, memo_ttl=60.0)
+            third = _run_with_retry(["sinfo"], 5, "sinfo", max_retries=0, memo_ttl=60.0)
+
+        assert mock_run.call_count == 2
+        assert second == third == (success_result, None)
+
+
 class TestSacctAvailability:
     """Tests for sacct availability tracking (_sacct_is_available, _sacct_mark_failure, _sacct_mark_success)."""
 
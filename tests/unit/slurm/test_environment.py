@@ -0,0 +1,134 @@
+"""Tests for the per-session SLURM environment probe."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from stoei.slurm.environment import (
+    SlurmEnvironment,
+    get_executable,
+    get_slurm_environment,
+    get_username,
+    load_slurm_environment,
+    parse_slurm_version,
+    probe_slurm_environment,
+    record_squeue_delimited,
+    reset_slurm_environment,
+    save_slurm_environment,
+)
+
+
+class TestParseSlurmVersion:
+    """Tests for parse_slurm_version."""
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            ("slurm 23.02.7\n", (23, 2, 7)),
+            ("slurm-wlm 21.08.5\n", (21, 8, 5)),
+            ("slurm 24.05.0-0rc1\n", (24, 5, 0)),
+            ("squeue: invalid option\n", None),
+            ("", None),
+        ],
+    )
+    def test_parse(self, output: str, expected: tuple[int, ...] | None) -> None:
+        assert parse_slurm_version(output) == expected
+
+
+class TestProbe:
+    """Tests for probing the environment of the mock executables."""
+
+    def test_probe_resolves_executables_and_version(self, mock_slurm_path: Path) -> None:
+        """Test that the probe finds the mocks and reads the squeue version."""
+        environment = probe_slurm_environment()
+
+        assert environment.path == os.environ["PATH"]
+        assert environment.executables["squeue"] == str(mock_slurm_path / "squeue")
+        assert set(environment.mtimes) == set(environment.executables.values())
+        assert environment.version == (23, 2, 7)
+        assert environment.version_string == "23.2.7"
+
+    def test_environment_is_probed_once_per_session(self, mock_slurm_path: Path) -> None:
+        """Test that commands reuse the session's environment instead of walking PATH."""
+        with patch("stoei.slurm.environment.shutil.which", wraps=shutil.which) as mock_which:
+            first = get_executable("squeue")
+            second = get_executable("sacct")
+
+        assert first == str(mock_slurm_path / "squeue")
+        assert second == str(mock_slurm_path / "sacct")
+        assert mock_which.call_count == 6
+
+    def test_environment_is_reprobed_when_path_changes(
+        self, mock_slurm_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a PATH change during the session triggers a new probe."""
+        get_slurm_environment()
+        monkeypatch.setenv("PATH", "/nonexistent")
+        assert get_slurm_environment().executables == {}
+
+    def test_missing_executable_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a missing executable still raises FileNotFoundError."""
+        monkeypatch.setenv("PATH", "/nonexistent")
+        with pytest.raises(FileNotFoundError):
+            get_executable("squeue")
+
+    def test_username_is_looked_up_once(self) -> None:
+        """Test that the username is cached for the session."""
+        with patch("stoei.slurm.environment.get_current_username", return_value="alice") as mock_user:
+            assert get_username() == "alice"
+            assert get_username() == "alice"
+        assert mock_user.call_count == 1
+
+
+class TestPersistence:
+    """Tests for reusing the environment across sessions."""
+
+    def test_next_session_reuses_saved_environment(self, mock_slurm_path: Path, isolated_cache_dir: Path) -> None:
+        """Test that a saved environment skips the probe in the next session."""
+        get_slurm_environment()
+        record_squeue_delimited(delimited=False)
+        reset_slurm_environment()
+
+        with patch("stoei.slurm.environment.probe_slurm_environment") as mock_probe:
+            environment = get_slurm_environment()
+
+        mock_probe.assert_not_called()
+        assert environment.version == (23, 2, 7)
+        assert environment.squeue_delimited is False
+        assert (isolated_cache_dir / "slurm_environment.json").exists()
+
+    def test_changed_binary_invalidates_saved_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a reinstalled executable (new mtime) forces a new probe."""
+        squeue = tmp_path / "squeue"
+        squeue.write_text("", encoding="utf-8")
+        monkeypatch.setenv("PATH", str(tmp_path))
+        path = tmp_path / "environment.json"
+        environment = SlurmEnvironment(
+            path=str(tmp_path),
+            executables={"squeue": str(squeue)},
+            mtimes={str(squeue): squeue.stat().st_mtime_ns},
+            version=(23, 2, 7),
+        )
+        save_slurm_environment(path, environment)
+        assert load_slurm_environment(path) == environment
+
+        os.utime(squeue, ns=(0, squeue.stat().st_mtime_ns + 1))
+        assert load_slurm_environment(path) is None
+
+    def test_other_path_or_invalid_file_is_ignored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that environments of another PATH and corrupt files are ignored."""
+        path = tmp_path / "environment.json"
+        monkeypatch.setenv("PATH", "/usr/bin")
+        save_slurm_environment(path, SlurmEnvironment(path="/opt/slurm/bin"))
+        assert load_slurm_environment(path) is None
+
+        path.write_text("not json", encoding="utf-8")
+        assert load_slurm_environment(path) is None
+
+        path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+        assert load_slurm_environment(path) is None
@@ -0,0 +1,93 @@
+"""Tests for raw command output fingerprints."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from stoei.slurm.commands import get_all_running_jobs, get_cluster_nodes
+from stoei.slurm.fingerprint import UNCHANGED, OutputFingerprints
+
+
+class TestOutputFingerprints:
+    """Tests for the OutputFingerprints registry."""
+
+    def test_first_output_is_new(self) -> None:
+        """Test that the first output for a key is never reported unchanged."""
+        fingerprints = OutputFingerprints()
+        assert fingerprints.unchanged("squeue", "a|b\n") is False
+
+    def test_identical_output_is_unchanged(self) -> None:
+        """Test that repeating the same output is reported unchanged."""
+        fingerprints = OutputFingerprints()
+        fingerprints.unchanged("squeue", "a|b\n")
+        assert fingerprints.unchanged("squeue", "a|b\n") is True
+
+    def test_different_output_is_new(self) -> None:
+        """Test that changed output is reported as new and becomes the reference."""
+        fingerprints = OutputFingerprints()
+        fingerprints.unchanged("squeue", "a|b\n")
+        assert fingerprints.unchanged("squeue", "a|c\n") is False
+        assert fingerprints.unchanged("squeue", "a|c\n") is True
+
+    def test_keys_are_independent(self) -> None:
+        """Test that fingerprints are tracked per key."""
+        fingerprints = OutputFingerprints()
+        fingerprints.unchanged("squeue", "same")
+        assert fingerprints.unchanged("sprio", "same") is False
+
+    def test_forget_and_clear(self) -> None:
+        """Test that forgotten or cleared keys are treated as new again."""
+        fingerprints = OutputFingerprints()
+        fingerprints.unchanged("squeue", "x")
+        fingerprints.unchanged("sshare", "y")
+        fingerprints.forget("squeue")
+        assert fingerprints.unchanged("squeue", "x") is False
+        fingerprints.clear()
+        assert fingerprints.unchanged("sshare", "y") is False
+
+    def test_sentinel_repr(self) -> None:
+        """Test the sentinel's repr."""
+        assert repr(UNCHANGED) == "UNCHANGED"
+
+
+class TestCommandFingerprints:
+    """Tests for fingerprint support in SLURM command functions."""
+
+    def test_cluster_nodes_unchanged_on_repeat(self, mock_slurm_path: Path) -> None:
+        """Test that identical scontrol output is reported as UNCHANGED."""
+        fingerprints = OutputFingerprints()
+        nodes, error = get_cluster_nodes(fingerprints=fingerprints)
+        assert error is None
+        assert isinstance(nodes, list)
+        nodes, error = get_cluster_nodes(fingerprints=fingerprints)
+        assert error is None
+        assert nodes is UNCHANGED
+
+    def test_without_fingerprints_always_parses(self, mock_slurm_path: Path) -> None:
+        """Test that callers without a registry always get parsed data."""
+        get_cluster_nodes()
+        nodes, _error = get_cluster_nodes()
+        assert isinstance(nodes, list)
+
+    def test_failure_forgets_fingerprint(self) -> None:
+        """Test that a failed run makes the next identical output count as new."""
+        fingerprints = OutputFingerprints()
+        ok = MagicMock(returncode=0, stdout="1 job alice\n", stderr="")
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/squeue"),
+            patch("stoei.slurm.commands._run_with_retry", return_value=(ok, None)),
+        ):
+            get_all_running_jobs(fingerprints=fingerprints)
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/squeue"),
+            patch("stoei.slurm.commands._run_with_retry", return_value=(None, "Command timed out")),
+        ):
+            jobs, error = get_all_running_jobs(fingerprints=fingerprints)
+        assert jobs == []
+        assert error == "Command timed out"
+        with (
+            patch("stoei.slurm.commands.get_executable", return_value="/usr/bin/squeue"),
+            patch("stoei.slurm.commands._run_with_retry", return_value=(ok, None)),
+        ):
+            jobs, error = get_all_running_jobs(fingerprints=fingerprints)
+        assert jobs is not UNCHANGED
+        assert error is None
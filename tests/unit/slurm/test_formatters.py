@@ -1,9 +1,13 @@
 """Tests for SLURM output formatters."""
 
 from stoei.colors import FALLBACK_COLORS
+from stoei.slurm.account_index import ResourceTotals
 from stoei.slurm.formatters import (
+    format_account_info,
     format_compact_timeline,
     format_job_info,
+    format_node_info,
+    format_node_jobs,
     format_sacct_job_info,
     format_user_info,
     format_value,
@@ -740,3 +744,47 @@ class TestFormatUserInfo:
         assert "NodeList" in result
         # The job row should contain the node name
         assert "gpu01" in result
+
+
+class TestFormatNodeInfo:
+    """Tests for format_node_info."""
+
+    def test_parsed_dict_matches_raw_output(self) -> None:
+        """Test that a parsed node dict formats like the raw scontrol output."""
+        raw = "NodeName=node01 State=IDLE CPUTot=32 RealMemory=128000"
+        parsed = {"NodeName": "node01", "State": "IDLE", "CPUTot": "32", "RealMemory": "128000"}
+        assert format_node_info(parsed) == format_node_info(raw)
+
+
+class TestFormatNodeJobs:
+    """Tests for format_node_jobs."""
+
+    def test_lists_jobs(self) -> None:
+        """Test that each resident job is listed with its user."""
+        jobs = [("123", "train", "alice", "gpu", "R", "1:00:00", "2", "gpu[01-02]", "cpu=8")]
+        result = format_node_jobs(jobs)
+        assert "Running Jobs (1)" in result
+        assert "123" in result
+        assert "alice" in result
+
+    def test_no_jobs(self) -> None:
+        """Test the message shown for an idle node."""
+        assert "No jobs running on this node" in format_node_jobs([])
+
+
+class TestFormatAccountInfo:
+    """Tests for format_account_info."""
+
+    def test_totals_from_running_jobs(self) -> None:
+        """Test that resource totals are computed from running jobs when not given."""
+        running = [("1", "sim", "alice", "gpu", "R", "1:00", "1", "fmt01", "cpu=8,mem=16G,gres/gpu=2")]
+        result = format_account_info("physics", {}, [], running, [])
+        assert "Total CPUs" in result
+        assert " 8" in result
+
+    def test_precomputed_totals_and_sub_accounts(self) -> None:
+        """Test that precomputed totals are shown and sub-accounts are listed."""
+        totals = ResourceTotals(cpus=123, memory_gb=4.5, gpus=7, nodes=3)
+        result = format_account_info("physics", {}, [], [], [], totals=totals, sub_accounts=["astro", "optics"])
+        assert "123" in result
+        assert "astro, optics" in result
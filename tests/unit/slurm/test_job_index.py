@@ -0,0 +1,81 @@
+"""Tests for the incremental node/user/partition job index."""
+
+from stoei.slurm.job_index import JobIndex, JobIndexDiff
+
+
+def _job(job_id: str, user: str, partition: str, state: str, nodelist: str) -> tuple[str, ...]:
+    return (job_id, f"job{job_id}", user, partition, state, "0:10", "1", nodelist, "cpu=4")
+
+
+class TestJobIndex:
+    """Tests for JobIndex lookups and incremental updates."""
+
+    def test_jobs_on_node_expands_nodelists(self) -> None:
+        """Test that jobs are indexed under every node of their NodeList."""
+        index = JobIndex()
+        index.update([_job("1", "alice", "gpu", "R", "jix[01-02]"), _job("2", "bob", "gpu", "R", "jix02")])
+        assert [job[0] for job in index.jobs_on_node("jix01")] == ["1"]
+        assert [job[0] for job in index.jobs_on_node("jix02")] == ["1", "2"]
+        assert index.jobs_on_node("jix99") == []
+
+    def test_pending_jobs_have_no_nodes(self) -> None:
+        """Test that pending jobs are indexed by user and partition only."""
+        index = JobIndex()
+        index.update([_job("3", "alice", "gpu,cpu", "PD", "(Priority)")])
+        assert index.node_job_counts() == {}
+        assert [job[0] for job in index.jobs_for_user("alice")] == ["3"]
+        assert [job[0] for job in index.jobs_in_partition("cpu")] == ["3"]
+
+    def test_only_running_jobs_are_on_nodes(self) -> None:
+        """Test that suspended and completing jobs are kept off the node index."""
+        index = JobIndex()
+        index.update(
+            [
+                _job("1", "alice", "gpu", "R", "jix01"),
+                _job("2", "alice", "gpu", "S", "jix01"),
+                _job("3", "bob", "gpu", "CG", "jix02"),
+            ]
+        )
+        assert [job[0] for job in index.jobs_on_node("jix01")] == ["1"]
+        assert index.node_job_counts() == {"jix01": 1}
+        assert [job[0] for job in index.jobs_for_user("alice")] == ["1", "2"]
+
+        index.update([_job("1", "alice", "gpu", "CG", "jix01")])
+        assert index.node_job_counts() == {}
+
+    def test_update_diffs_against_previous_snapshot(self) -> None:
+        """Test that only added, removed and changed jobs are reported."""
+        index = JobIndex()
+        index.update([_job("1", "alice", "gpu", "R", "jix01"), _job("2", "bob", "gpu", "PD", "")])
+        diff = index.update(
+            [
+                _job("1", "alice", "gpu", "R", "jix01"),
+                _job("2", "bob", "gpu", "R", "jix03"),
+                _job("4", "carol", "cpu", "R", "jix01"),
+            ]
+        )
+        assert diff == JobIndexDiff(added=1, removed=0, changed=1)
+        assert [job[0] for job in index.jobs_on_node("jix03")] == ["2"]
+        assert index.node_job_counts() == {"jix01": 2, "jix03": 1}
+
+        diff = index.update([_job("4", "carol", "cpu", "R", "jix01")])
+        assert diff == JobIndexDiff(added=0, removed=2, changed=0)
+        assert index.jobs_for_user("alice") == []
+        assert index.jobs_in_partition("gpu") == []
+        assert index.node_job_counts() == {"jix01": 1}
+        assert len(index) == 1
+
+    def test_results_sorted_numerically_by_job_id(self) -> None:
+        """Test that lookups order job IDs numerically."""
+        index = JobIndex()
+        index.update([_job("10", "alice", "gpu", "R", "jix01"), _job("9", "alice", "gpu", "R", "jix01")])
+        assert [job[0] for job in index.jobs_for_user("alice")] == ["9", "10"]
+
+    def test_elapsed_time_alone_is_not_a_change(self) -> None:
+        """Test that jobs differing only in elapsed time keep their entries but return the new tuple."""
+        index = JobIndex()
+        job = _job("1", "alice", "gpu", "R", "jix01")
+        index.update([job])
+        diff = index.update([(*job[:5], "0:40", *job[6:])])
+        assert diff == JobIndexDiff(added=0, removed=0, changed=0)
+        assert [job[5] for job in index.jobs_on_node("jix01")] == ["0:40"]
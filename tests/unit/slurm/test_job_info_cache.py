@@ -0,0 +1,130 @@
+"""Tests for the state-aware job info cache."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from stoei.slurm.job_info_cache import JobInfoCache, is_terminal_state
+
+INFO = ("formatted", None, "/logs/out", "/logs/err")
+
+
+class TestIsTerminalState:
+    """Tests for is_terminal_state."""
+
+    @pytest.mark.parametrize(
+        "state", ["COMPLETED", "FAILED", "TIMEOUT", "CANCELLED by 1000", "CANCELLED+", "OUT_OF_MEMORY"]
+    )
+    def test_terminal_states(self, state: str) -> None:
+        assert is_terminal_state(state)
+
+    @pytest.mark.parametrize("state", ["RUNNING", "PENDING", "COMPLETING", "PREEMPTED", "NODE_FAIL", "", None])
+    def test_active_or_unknown_states(self, state: str | None) -> None:
+        assert not is_terminal_state(state)
+
+
+class TestJobInfoCache:
+    """Tests for JobInfoCache expiry, invalidation and eviction."""
+
+    def test_active_entry_expires_after_ttl(self) -> None:
+        """Test that active jobs are served until the TTL passes."""
+        cache = JobInfoCache(active_ttl=30.0)
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=100.0):
+            cache.put("1", INFO, "RUNNING")
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=120.0):
+            assert cache.get("1") == INFO
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=131.0):
+            assert cache.get("1") is None
+
+    def test_terminal_entry_never_expires(self) -> None:
+        """Test that finished jobs are served regardless of age."""
+        cache = JobInfoCache(active_ttl=30.0)
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=100.0):
+            cache.put("1", INFO, "COMPLETED")
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=100_000.0):
+            assert cache.get("1") == INFO
+
+    def test_failed_lookup_is_not_terminal(self) -> None:
+        """Test that an error result is retried after the TTL even for a finished job."""
+        cache = JobInfoCache(active_ttl=0.0)
+        cache.put("1", ("", "Job not found", None, None), "COMPLETED")
+        assert not cache.dirty
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=1e12):
+            assert cache.get("1") is None
+
+    def test_invalidate_changed_drops_active_jobs_with_new_state(self) -> None:
+        """Test that state changes in the snapshot invalidate active entries only."""
+        cache = JobInfoCache()
+        cache.put("1", INFO, "PENDING")
+        cache.put("2", INFO, "RUNNING")
+        cache.put("3", INFO, "COMPLETED")
+        cache.put("4", INFO)
+
+        dropped = cache.invalidate_changed({"1": "RUNNING", "2": "RUNNING"})
+
+        assert dropped == 1
+        assert cache.get("1") is None
+        assert cache.get("2") == INFO
+        assert cache.get("3") == INFO
+        assert cache.get("4") == INFO
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted beyond the bound."""
+        cache = JobInfoCache(max_entries=2)
+        cache.put("1", INFO, "COMPLETED")
+        cache.put("2", INFO, "COMPLETED")
+        cache.get("1")
+        cache.put("3", INFO, "COMPLETED")
+        assert "1" in cache
+        assert "2" not in cache
+        assert "3" in cache
+
+
+class TestJobInfoCachePersistence:
+    """Tests for persisting finished jobs across sessions."""
+
+    def test_round_trip_keeps_terminal_entries_only(self, tmp_path: Path) -> None:
+        """Test that only finished jobs are saved and loaded back."""
+        path = tmp_path / "job_info.json"
+        cache = JobInfoCache(path)
+        cache.put("1", INFO, "COMPLETED")
+        cache.put("2", INFO, "RUNNING")
+        assert cache.dirty
+        cache.save()
+        assert not cache.dirty
+
+        reloaded = JobInfoCache(path)
+        assert reloaded.get("1") == INFO
+        assert reloaded.get("2") is None
+
+    def test_save_is_noop_when_clean(self, tmp_path: Path) -> None:
+        """Test that a cache without finished jobs writes nothing."""
+        path = tmp_path / "job_info.json"
+        cache = JobInfoCache(path)
+        cache.put("2", INFO, "RUNNING")
+        cache.save()
+        assert not path.exists()
+
+    def test_loaded_entries_keep_lru_order(self, tmp_path: Path) -> None:
+        """Test that persisted entries are evicted before ones cached this session."""
+        path = tmp_path / "job_info.json"
+        cache = JobInfoCache(path)
+        cache.put("1", INFO, "COMPLETED")
+        cache.put("2", INFO, "COMPLETED")
+        cache.save()
+
+        reloaded = JobInfoCache(path, max_entries=2)
+        reloaded.put("3", INFO, "FAILED")
+        assert "1" not in reloaded
+        assert "2" in reloaded
+        assert "3" in reloaded
+
+    def test_invalid_file_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a corrupt or foreign cache file is ignored."""
+        path = tmp_path / "job_info.json"
+        path.write_text("not json", encoding="utf-8")
+        assert JobInfoCache(path).get("1") is None
+
+        path.write_text(json.dumps({"version": 99, "jobs": []}), encoding="utf-8")
+        assert len(JobInfoCache(path)) == 0
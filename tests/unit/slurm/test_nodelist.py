@@ -1,6 +1,6 @@
-"""Unit tests for the expand_nodelist() function in stoei.slurm.nodelist."""
+"""Unit tests for NodeList expansion and bitsets in stoei.slurm.nodelist."""
 
-from stoei.slurm.nodelist import expand_nodelist
+from stoei.slurm.nodelist import NodeRegistry, expand_nodelist
 
 
 class TestExpandNodelist:
@@ -100,3 +100,57 @@ class TestExpandNodelist:
         result = expand_nodelist("node[01-10]")
         expected = {f"node{str(i).zfill(2)}" for i in range(1, 11)}
         assert result == expected
+
+    def test_returns_independent_sets(self) -> None:
+        """Cached expansions are not shared with callers that mutate the result."""
+        first = expand_nodelist("node[01-02]")
+        first.add("other")
+        assert expand_nodelist("node[01-02]") == {"node01", "node02"}
+
+
+class TestNodeRegistry:
+    """Tests for NodeRegistry bitsets."""
+
+    def test_seed_assigns_ids_in_sorted_order(self) -> None:
+        """Seeded names get dense IDs in sorted order; duplicates and blanks are skipped."""
+        registry = NodeRegistry()
+        registry.seed(["gpu02", "gpu01", "", "gpu01"])
+        assert len(registry) == 2
+        assert registry.id_of("gpu01") == 0
+        assert registry.id_of("gpu02") == 1
+
+    def test_bits_for_range(self) -> None:
+        """A bracket range maps to one bit per node."""
+        registry = NodeRegistry()
+        registry.seed(f"gpu{i:03d}" for i in range(1, 513))
+        bits = registry.bits("gpu[001-512]")
+        assert bits.bit_count() == 512
+        assert len(registry) == 512
+
+    def test_union_counts_unique_nodes(self) -> None:
+        """OR-ing bitsets of overlapping NodeLists counts each node once."""
+        registry = NodeRegistry()
+        bits = registry.bits("node[01-03]") | registry.bits("node[02-04]") | registry.bits("node01")
+        assert bits.bit_count() == 4
+        assert sorted(registry.names(bits)) == ["node01", "node02", "node03", "node04"]
+
+    def test_unknown_nodes_are_registered(self) -> None:
+        """Nodes missing from the seed are registered on first sight."""
+        registry = NodeRegistry()
+        registry.seed(["a01"])
+        bits = registry.bits("b01")
+        assert registry.names(bits) == ["b01"]
+        assert len(registry) == 2
+
+    def test_pending_placeholder_is_empty(self) -> None:
+        """Pending placeholders and empty strings map to the empty bitset."""
+        registry = NodeRegistry()
+        assert registry.bits("(Resources)") == 0
+        assert registry.bits("  ") == 0
+        assert registry.names(0) == []
+
+    def test_bits_are_memoized(self) -> None:
+        """Repeated NodeLists return the cached bitset."""
+        registry = NodeRegistry()
+        first = registry.bits("node[01-04]")
+        assert registry.bits(" node[01-04] ") == first
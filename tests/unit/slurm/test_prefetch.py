@@ -0,0 +1,42 @@
+"""Tests for the critical-path SLURM fetches started by the entry point."""
+
+from unittest.mock import patch
+
+from stoei.slurm.prefetch import StartupFetch
+
+RUNNING = ([("1", "train", "RUNNING", "1:00", "1", "gpu01", "", "")], None)
+HISTORY = ([("2", "eval", "COMPLETED", "0:00", "1", "gpu02")], 1, 0, 0, None)
+
+
+class TestStartupFetch:
+    """Tests for StartupFetch."""
+
+    def test_fetches_run_without_retries(self) -> None:
+        """Test that the check, squeue and sacct fetches are started and resolve."""
+        with (
+            patch("stoei.slurm.prefetch.check_slurm_available", return_value=(True, None)),
+            patch("stoei.slurm.prefetch.get_running_jobs", return_value=RUNNING) as mock_running,
+            patch("stoei.slurm.prefetch.get_job_history", return_value=HISTORY) as mock_history,
+        ):
+            fetch = StartupFetch()
+            fetch.start_history(7)
+            assert fetch.slurm_check.result(timeout=5) == (True, None)
+            assert fetch.running_jobs.result(timeout=5) == RUNNING
+            history = fetch.history_for(7)
+            assert history is not None
+            assert history.result(timeout=5) == HISTORY
+
+        mock_running.assert_called_once_with(max_retries=0)
+        mock_history.assert_called_once_with(days=7, max_retries=0)
+
+    def test_history_for_other_window_is_not_reused(self) -> None:
+        """Test that a fetch for a different history window is not handed out."""
+        with (
+            patch("stoei.slurm.prefetch.check_slurm_available", return_value=(True, None)),
+            patch("stoei.slurm.prefetch.get_running_jobs", return_value=RUNNING),
+            patch("stoei.slurm.prefetch.get_job_history", return_value=HISTORY),
+        ):
+            fetch = StartupFetch()
+            assert fetch.history_for(7) is None
+            fetch.start_history(7)
+            assert fetch.history_for(30) is None
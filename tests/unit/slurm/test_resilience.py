@@ -0,0 +1,84 @@
+"""Tests for SingleFlight call coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from stoei.slurm.resilience import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test that callers arriving while a call runs get its result."""
+        flight: SingleFlight[int] = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+
+        def slow() -> int:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            started.wait(timeout=5)
+            followers = [pool.submit(flight.do, "key", slow) for _ in range(3)]
+            # Followers are registered before the leader is released
+            while flight.coalesced < len(followers):
+                threading.Event().wait(0.001)
+            release.set()
+            results = [leader.result(), *(future.result() for future in followers)]
+
+        assert results == [42, 42, 42, 42]
+        assert len(calls) == 1
+        assert flight.coalesced == 3
+
+    def test_exception_is_shared_and_not_memoized(self) -> None:
+        """Test that a failing call raises for the leader and later calls run again."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            flight.do("key", fail, ttl=60.0)
+        assert flight.do("key", lambda: 7, ttl=60.0) == 7
+
+    def test_sequential_calls_run_again_without_ttl(self) -> None:
+        """Test that finished calls are not reused when the memo is disabled."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls: list[int] = []
+        flight.do("key", lambda: calls.append(1) or 1)
+        flight.do("key", lambda: calls.append(1) or 1)
+        assert len(calls) == 2
+
+    def test_memo_reuses_result_until_ttl(self) -> None:
+        """Test that a memoized result is reused only while fresh."""
+        flight: SingleFlight[int] = SingleFlight()
+        with patch("stoei.slurm.resilience.time.monotonic", return_value=100.0):
+            assert flight.do("key", lambda: 1, ttl=5.0) == 1
+        with patch("stoei.slurm.resilience.time.monotonic", return_value=104.0):
+            assert flight.do("key", lambda: 2, ttl=5.0) == 1
+        with patch("stoei.slurm.resilience.time.monotonic", return_value=106.0):
+            assert flight.do("key", lambda: 3, ttl=5.0) == 3
+        assert flight.memo_hits == 1
+
+    def test_memoize_predicate_skips_failures(self) -> None:
+        """Test that results rejected by the predicate are not memoized."""
+        flight: SingleFlight[int] = SingleFlight()
+        assert flight.do("key", lambda: -1, ttl=60.0, memoize=lambda value: value >= 0) == -1
+        assert flight.do("key", lambda: 5, ttl=60.0, memoize=lambda value: value >= 0) == 5
+        assert flight.do("key", lambda: 6, ttl=60.0) == 5
+
+    def test_clear_drops_memo(self) -> None:
+        """Test that clear forces the next call to run."""
+        flight: SingleFlight[int] = SingleFlight()
+        flight.do("key", lambda: 1, ttl=60.0)
+        flight.clear()
+        assert flight.do("key", lambda: 2, ttl=60.0) == 2
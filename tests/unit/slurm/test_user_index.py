@@ -0,0 +1,91 @@
+"""Tests for per-user lookups used by the user info modal."""
+
+from stoei.slurm.user_index import (
+    index_fair_share_by_user,
+    index_job_priorities_by_user,
+    select_running_jobs,
+    select_user_jobs,
+    to_running_job_row,
+    to_user_job_row,
+)
+
+
+class TestIndexFairShareByUser:
+    """Tests for index_fair_share_by_user."""
+
+    def test_first_row_per_user_wins(self) -> None:
+        """Test that the user's first sshare row is kept."""
+        entries = [
+            ("acct1", "alice", "1", "0.5", "100", "0.1", "0.1", "0.8"),
+            ("acct2", "alice", "1", "0.5", "100", "0.1", "0.1", "0.2"),
+            ("acct1", "bob", "1", "0.5", "100", "0.1", "0.1", "0.4"),
+        ]
+        by_user = index_fair_share_by_user(entries)
+        assert by_user["alice"]["account"] == "acct1"
+        assert by_user["alice"]["fair_share"] == "0.8"
+        assert by_user["bob"]["fair_share"] == "0.4"
+
+    def test_short_rows_skipped(self) -> None:
+        """Test that rows without all sshare fields are ignored."""
+        assert index_fair_share_by_user([("acct1", "alice")]) == {}
+
+
+class TestIndexJobPrioritiesByUser:
+    """Tests for index_job_priorities_by_user."""
+
+    def test_groups_rows_by_user(self) -> None:
+        """Test that each user's sprio rows are kept in order."""
+        entries = [
+            ("10", "alice", "acct", "900", "10", "800", "90", "gpu", "normal"),
+            ("11", "bob", "acct", "500", "10", "400", "90", "cpu", "normal"),
+            ("12", "alice", "acct", "700", "10", "600", "90", "gpu", "high"),
+        ]
+        by_user = index_job_priorities_by_user(entries)
+        assert [row["job_id"] for row in by_user["alice"]] == ["10", "12"]
+        assert by_user["alice"][1]["qos"] == "high"
+        assert "carol" not in by_user
+
+
+def test_to_user_job_row_drops_user_field() -> None:
+    """Test conversion from the all-users to the per-user squeue format."""
+    job = ("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4")
+    assert to_user_job_row(job) == ("1", "train", "gpu", "R", "1:00", "1", "gpu01", "cpu=4")
+
+
+def test_select_user_jobs_keeps_one_users_jobs() -> None:
+    """Test that only the given user's complete job tuples are kept."""
+    jobs = [
+        ("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4"),
+        ("2", "eval", "bob", "gpu", "R", "1:00", "1", "gpu02", "cpu=4"),
+        ("3", "short", "alice"),
+    ]
+    assert select_user_jobs(jobs, "alice") == [jobs[0]]
+
+
+def test_select_running_jobs_drops_other_states() -> None:
+    """Test that pending, suspended and completing jobs are not counted as running."""
+    jobs = [
+        ("1", "a", "alice", "gpu", "R", "0:10", "1", "n01", "cpu=4"),
+        ("2", "b", "alice", "gpu", "S", "0:10", "1", "n01", "cpu=4"),
+        ("3", "c", "bob", "gpu", "CG", "0:10", "1", "n02", "cpu=4"),
+        ("4", "d", "bob", "gpu", "PD", "0:00", "1", "(Priority)", "cpu=4"),
+        ("5", "e", "carol", "gpu", "RUNNING", "0:10", "1", "n03", "cpu=4"),
+    ]
+    assert [job[0] for job in select_running_jobs(jobs)] == ["1", "5"]
+
+
+def test_to_running_job_row_expands_state_and_reason() -> None:
+    """Test conversion from the all-users to the get_running_jobs format."""
+    job = ("2", "eval", "alice", "gpu", "PD", "0:00", "1", "", "cpu=4")
+    schedule = ("Resources", "2026-01-01T11:00:00", "2026-01-01T12:00:00")
+    assert to_running_job_row(job, schedule) == (
+        "2",
+        "eval",
+        "PENDING",
+        "0:00",
+        "1",
+        "(Resources)",
+        "2026-01-01T11:00:00",
+        "2026-01-01T12:00:00",
+    )
+    assert to_running_job_row(job, None)[5:] == ("", "", "")
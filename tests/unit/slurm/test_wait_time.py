@@ -1,7 +1,13 @@
 """Tests for wait time calculation utilities."""
 
+from datetime import datetime, timedelta
+
+import pytest
 from stoei.slurm.wait_time import (
+    SKETCH_RELATIVE_ACCURACY,
     PartitionWaitStats,
+    RollingWaitTimeStore,
+    WaitTimeSketch,
     calculate_partition_wait_stats,
     calculate_wait_time_seconds,
     format_wait_time,
@@ -225,3 +231,170 @@ class TestPartitionWaitStatsDataclass:
         assert stats.median_seconds == 250.0
         assert stats.min_seconds == 60.0
         assert stats.max_seconds == 3600.0
+
+
+def _job(job_id: str, partition: str, submit: datetime, start: datetime) -> tuple[str, ...]:
+    fmt = "%Y-%m-%dT%H:%M:%S"
+    return (job_id, partition, "COMPLETED", submit.strftime(fmt), start.strftime(fmt))
+
+
+class TestWaitTimeSketch:
+    """Tests for the mergeable quantile sketch."""
+
+    def test_empty_sketch(self) -> None:
+        """Test that an empty sketch reports zeros."""
+        sketch = WaitTimeSketch()
+        assert sketch.count == 0
+        assert sketch.quantile(0.5) == 0.0
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Test that quantiles stay within the configured relative error."""
+        values = [float(v) for v in range(1, 10001)]
+        sketch = WaitTimeSketch()
+        for value in values:
+            sketch.add(value)
+        for quantile, exact in ((0.5, 5000.0), (0.9, 9000.0), (0.99, 9900.0)):
+            estimate = sketch.quantile(quantile)
+            assert abs(estimate - exact) / exact <= SKETCH_RELATIVE_ACCURACY + 1e-9
+
+    def test_exact_count_min_max_mean(self) -> None:
+        """Test that count, min, max and mean are tracked exactly."""
+        sketch = WaitTimeSketch()
+        for value in (10.0, 20.0, 60.0):
+            sketch.add(value)
+        stats = sketch.to_stats("cpu")
+        assert stats.job_count == 3
+        assert stats.min_seconds == 10.0
+        assert stats.max_seconds == 60.0
+        assert stats.mean_seconds == 30.0
+
+    def test_merge_matches_single_sketch(self) -> None:
+        """Test that merging two sketches equals adding all values to one."""
+        left, right, combined = WaitTimeSketch(), WaitTimeSketch(), WaitTimeSketch()
+        for value in range(1, 500):
+            (left if value % 2 else right).add(float(value))
+            combined.add(float(value))
+        left.merge(right)
+        assert left.count == combined.count
+        for quantile in (0.1, 0.5, 0.9, 0.99):
+            assert left.quantile(quantile) == combined.quantile(quantile)
+
+    def test_zero_waits(self) -> None:
+        """Test that sub-second waits are reported as the minimum."""
+        sketch = WaitTimeSketch()
+        for _ in range(10):
+            sketch.add(0.0)
+        assert sketch.quantile(0.99) == 0.0
+
+
+class TestRollingWaitTimeStore:
+    """Tests for RollingWaitTimeStore."""
+
+    @pytest.fixture
+    def now(self) -> datetime:
+        return datetime(2024, 1, 15, 12, 0, 0)
+
+    def test_first_query_covers_shortest_window(self, now: datetime) -> None:
+        """Test that the initial query starts one shortest window back."""
+        store = RollingWaitTimeStore()
+        assert store.next_query_start(now) == now - timedelta(hours=1)
+
+    def test_next_query_is_incremental(self, now: datetime) -> None:
+        """Test that later queries start at the previous query end minus overlap."""
+        store = RollingWaitTimeStore()
+        store.ingest([], since=now - timedelta(hours=1), until=now)
+        later = now + timedelta(seconds=30)
+        assert now - timedelta(minutes=5) < store.next_query_start(later) < now
+
+    def test_ingest_skips_jobs_started_before_window(self, now: datetime) -> None:
+        """Test that jobs started before the query window are ignored."""
+        store = RollingWaitTimeStore()
+        since = now - timedelta(hours=1)
+        jobs = [
+            _job("1", "cpu", now - timedelta(hours=3), now - timedelta(hours=2)),
+            _job("2", "cpu", now - timedelta(minutes=20), now - timedelta(minutes=10)),
+        ]
+        assert store.ingest(jobs, since=since, until=now) == 1
+
+    def test_ingest_deduplicates_overlap(self, now: datetime) -> None:
+        """Test that jobs seen in the previous query's overlap are not counted twice."""
+        store = RollingWaitTimeStore()
+        job = _job("7", "cpu", now - timedelta(minutes=2), now - timedelta(seconds=20))
+        store.ingest([job], since=now - timedelta(hours=1), until=now)
+        later = now + timedelta(seconds=30)
+        assert store.ingest([job], since=store.next_query_start(later), until=later) == 0
+        assert store.window_stats(later)[1]["cpu"].job_count == 1
+
+    def test_window_stats_per_window(self, now: datetime) -> None:
+        """Test that longer windows include older buckets."""
+        store = RollingWaitTimeStore()
+        day_ago = now - timedelta(hours=20)
+        store.ingest(
+            [_job("1", "gpu", day_ago - timedelta(minutes=30), day_ago)],
+            since=day_ago - timedelta(minutes=1),
+            until=day_ago + timedelta(minutes=1),
+        )
+        store.ingest(
+            [_job("2", "gpu", now - timedelta(minutes=15), now - timedelta(minutes=5))],
+            since=now - timedelta(hours=1),
+            until=now,
+        )
+        windows = store.window_stats(now)
+        assert windows[1]["gpu"].job_count == 1
+        assert windows[24]["gpu"].job_count == 2
+        assert windows[168]["gpu"].job_count == 2
+        assert windows[24]["gpu"].max_seconds == 1800.0
+
+    def test_window_stats_memoized_until_new_data(self, now: datetime) -> None:
+        """Test that window stats are reused until the store changes."""
+        store = RollingWaitTimeStore()
+        job = _job("1", "cpu", now - timedelta(minutes=15), now - timedelta(minutes=5))
+        store.ingest([job], since=now - timedelta(hours=1), until=now)
+        first = store.window_stats(now)
+        assert store.window_stats(now) is first
+        store.ingest(
+            [_job("2", "cpu", now - timedelta(minutes=3), now - timedelta(minutes=1))],
+            since=now - timedelta(minutes=4),
+            until=now,
+        )
+        assert store.window_stats(now) is not first
+
+    def test_backfill_stops_at_first_query(self, now: datetime) -> None:
+        """Test that the backfill and the first incremental query never ingest the same job."""
+        store = RollingWaitTimeStore()
+        first_since = store.next_query_start(now)
+        backfill = store.backfill_window(now + timedelta(seconds=5))
+        assert backfill == (now + timedelta(seconds=5) - timedelta(days=7), first_since)
+        # A failed first query is retried from the same start
+        assert store.next_query_start(now + timedelta(minutes=1)) == first_since
+
+        recent = _job("2", "cpu", now - timedelta(minutes=30), now - timedelta(minutes=20))
+        old = _job("1", "cpu", now - timedelta(days=3, minutes=30), now - timedelta(days=3))
+        store.ingest([recent], since=first_since, until=now)
+        since, until = backfill
+        assert store.ingest_backfill([old, recent], since=since, until=until) == 1
+        assert not store.backfill_pending
+        assert store.backfill_window(now) is None
+        windows = store.window_stats(now)
+        assert windows[24]["cpu"].job_count == 1
+        assert windows[168]["cpu"].job_count == 2
+
+    def test_covered_seconds_tracks_loaded_history(self, now: datetime) -> None:
+        """Test that the covered span grows to the longest window once backfilled."""
+        store = RollingWaitTimeStore()
+        assert store.covered_seconds(now) == 0.0
+        store.ingest([], since=store.next_query_start(now), until=now)
+        later = now + timedelta(hours=2)
+        assert store.covered_seconds(later) == 3 * 3600
+        since, until = store.backfill_window(later) or (later, later)
+        store.ingest_backfill([], since=since, until=until)
+        assert store.covered_seconds(later) == 168 * 3600
+
+    def test_old_buckets_pruned(self, now: datetime) -> None:
+        """Test that buckets older than the longest window are dropped."""
+        store = RollingWaitTimeStore()
+        job = _job("1", "cpu", now - timedelta(minutes=15), now - timedelta(minutes=5))
+        store.ingest([job], since=now - timedelta(hours=1), until=now)
+        much_later = now + timedelta(days=8)
+        store.ingest([], since=much_later - timedelta(hours=1), until=much_later)
+        assert store.window_stats(much_later) == {}
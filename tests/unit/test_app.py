@@ -1,12 +1,19 @@
 """Tests for the main SlurmMonitor app."""
 
-from collections.abc import Generator
+import functools
+import json
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from stoei.app import SlurmMonitor
+from stoei.app import SlurmMonitor, _UICallback
+from stoei.profiling import configure_profiling, is_profiling
 from stoei.settings import DEFAULT_REFRESH_INTERVAL
 from stoei.slurm.cache import JobCache, JobState
+from stoei.telemetry import APPLY, get_telemetry
+from stoei.tracing import configure_tracing, write_trace
 from stoei.widgets.cluster_sidebar import ClusterStats
 
 
@@ -131,6 +138,40 @@ class TestFormatState:
                 assert result == "UNKNOWN_STATE"
 
 
+class TestProfiling:
+    """Tests for starting and stopping profiling from the app."""
+
+    def test_toggle_starts_then_writes_profile(self, tmp_path: Path) -> None:
+        """Test that SIGUSR1's handler starts a session and the next one writes it."""
+        configure_profiling(tmp_path)
+        app = SlurmMonitor()
+
+        with patch.object(app, "notify") as mock_notify:
+            app._toggle_profiling()
+            assert is_profiling()
+            app._toggle_profiling()
+
+        assert not is_profiling()
+        (session_dir,) = tmp_path.iterdir()
+        assert (session_dir / "summary.txt").exists()
+        assert mock_notify.call_args.args[0] == f"Profile written to {session_dir}"
+
+    def test_thread_workers_are_wrapped_for_profiling(self) -> None:
+        """Test that thread work is wrapped, so it is profiled while a session runs."""
+        app = SlurmMonitor()
+
+        def work() -> None:
+            pass
+
+        with patch("textual.app.App.run_worker") as mock_run_worker:
+            app.run_worker(work, name="work", thread=True)
+
+        wrapped = mock_run_worker.call_args.args[0]
+        assert wrapped is not work
+        assert wrapped.__wrapped__ is work
+        assert mock_run_worker.call_args.kwargs == {"name": "work", "thread": True}
+
+
 class TestStartRefreshWorker:
     """Tests for the _start_refresh_worker method."""
 
@@ -242,7 +283,30 @@ class TestRefreshDataAsync:
         ):
             app._refresh_data_async()
 
-        assert app._job_cache.jobs == []
+        assert app._job_cache.jobs == ()
+
+    def test_refresh_cycle_is_traced(self, tmp_path: Path) -> None:
+        """Verify that a traced cycle records each fetcher and each applied result as spans."""
+        configure_tracing(tmp_path / "trace.json")
+        app = SlurmMonitor()
+
+        with (
+            patch("stoei.app.get_running_jobs", return_value=([], None)),
+            patch("stoei.app.get_job_history", return_value=([], 0, 0, 0, None)),
+            patch("stoei.app.get_cluster_nodes", return_value=([], None)),
+            patch("stoei.app.get_all_running_jobs", return_value=([], None)),
+            patch("stoei.app.get_fair_share_priority", return_value=([], None)),
+            patch("stoei.app.get_pending_job_priority", return_value=([], None)),
+            patch("stoei.app.get_wait_time_job_history", return_value=([], None)),
+            patch("stoei.app.get_current_worker", return_value=self._make_mock_worker()),
+            patch.object(app, "_post_ui_callback"),
+        ):
+            app._refresh_data_async()
+        write_trace()
+
+        events = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+        names = {event["name"] for event in events if event["ph"] == "X" and event["args"].get("cycle") == 1}
+        assert {"refresh cycle", "fetch nodes", "apply nodes", "fetch all_jobs", "apply all_jobs"} <= names
 
     def test_refresh_data_stores_cluster_nodes(self) -> None:
         """Verify that _refresh_data_async stores fetched cluster nodes."""
@@ -284,6 +348,37 @@ class TestRefreshDataAsync:
         # Progressive rendering: loading indicator + one call per data source + completion call
         assert len(ui_callback_calls) >= 6
 
+    def test_refresh_callbacks_are_named_and_timed(self) -> None:
+        """Verify that every UI update of a refresh cycle is timed under its function name."""
+        app = SlurmMonitor()
+        ui_callback_calls: list[Callable[[], object]] = []
+
+        with (
+            patch("stoei.app.get_running_jobs", return_value=([], None)),
+            patch("stoei.app.get_job_history", return_value=([], 0, 0, 0, None)),
+            patch("stoei.app.get_cluster_nodes", return_value=([], None)),
+            patch("stoei.app.get_all_running_jobs", return_value=([], None)),
+            patch("stoei.app.get_fair_share_priority", return_value=([], None)),
+            patch("stoei.app.get_pending_job_priority", return_value=([], None)),
+            patch("stoei.app.get_wait_time_job_history", return_value=([], None)),
+            patch("stoei.app.get_current_worker", return_value=self._make_mock_worker()),
+            patch.object(app, "_post_ui_callback", side_effect=ui_callback_calls.append),
+        ):
+            app._refresh_data_async()
+
+        names = {
+            getattr(callback.func if isinstance(callback, functools.partial) else callback, "__name__", "")
+            for callback in ui_callback_calls
+        }
+        assert "<lambda>" not in names
+        assert {"_set_loading_indicator", "_on_refresh_complete"} <= names
+
+        get_telemetry().clear()
+        app.on__uicallback(_UICallback(functools.partial(app._clear_stale_marker)))
+        assert [(summary.kind, summary.name) for summary in get_telemetry().summaries()] == [
+            (APPLY, "_clear_stale_marker")
+        ]
+
     def test_refresh_data_handles_cluster_nodes_error(self) -> None:
         """Verify that _refresh_data_async stores empty nodes on fetch error."""
         app = SlurmMonitor()
@@ -459,6 +554,18 @@ class TestCalculateClusterStats:
         # Generic "gpu" type is not tracked when specific types exist
         assert "gpu" not in stats.gpus_by_type
 
+    def test_node_infos_include_resident_job_counts(self, app: SlurmMonitor) -> None:
+        """Test that node infos carry the number of jobs from the job index."""
+        app._cluster_nodes = [{"NodeName": "cnt01", "State": "MIXED"}, {"NodeName": "cnt02", "State": "IDLE"}]
+        app._all_users_jobs = [
+            ("1", "a", "alice", "cpu", "R", "0:01", "1", "cnt01", ""),
+            ("2", "b", "bob", "cpu", "R", "0:01", "1", "cnt01", ""),
+        ]
+        app._node_infos_view.get()
+        node_infos = {info.name: info for info in app._cached_node_infos}
+        assert node_infos["cnt01"].job_count == 2
+        assert node_infos["cnt02"].job_count == 0
+
     def test_parse_node_infos_with_gpu_types(self, app: SlurmMonitor) -> None:
         """Test parsing node infos with GPU type information."""
         app._cluster_nodes = [
@@ -1486,3 +1593,226 @@ class TestCalculatePendingResourcesWithArrays:
 
         assert stats.pending_gpus == 22  # 5*2 + 3*4 = 10 + 12
         assert stats.pending_gpus_by_type == {"h200": 10, "a100": 12}
+
+
+class TestShowNodeInfo:
+    """Tests for serving node details from the node snapshot."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Create a SlurmMonitor instance with one node in the snapshot."""
+        monitor = SlurmMonitor()
+        monitor._cluster_nodes = [{"NodeName": "snap01", "State": "MIXED", "CPUTot": "32"}]
+        monitor._all_users_jobs = [("42", "train", "alice", "gpu", "R", "1:00", "1", "snap01", "cpu=4")]
+        return monitor
+
+    def test_recent_snapshot_skips_scontrol(self, app: SlurmMonitor) -> None:
+        """Test that a recent snapshot serves node details without scontrol."""
+        app._nodes_fetched_at = time.monotonic()
+        with (
+            patch("stoei.app.get_node_info") as mock_get_node_info,
+            patch.object(app, "_display_node_info") as mock_display,
+        ):
+            app._show_node_info("snap01")
+        mock_get_node_info.assert_not_called()
+        node_name, node_info, error = mock_display.call_args.args
+        assert node_name == "snap01"
+        assert "MIXED" in node_info
+        assert "alice" in node_info
+        assert error is None
+
+    def test_stale_snapshot_falls_back_to_scontrol(self, app: SlurmMonitor) -> None:
+        """Test that a snapshot older than the max age triggers a targeted fetch."""
+        app._nodes_fetched_at = time.monotonic() - app._settings.node_info_max_age - 1
+        with patch.object(app, "run_worker") as mock_run_worker, patch.object(app, "notify"):
+            app._show_node_info("snap01")
+        mock_run_worker.assert_called_once()
+
+    def test_unknown_node_falls_back_to_scontrol(self, app: SlurmMonitor) -> None:
+        """Test that a node missing from the snapshot triggers a targeted fetch."""
+        app._nodes_fetched_at = time.monotonic()
+        with patch.object(app, "run_worker") as mock_run_worker, patch.object(app, "notify"):
+            app._show_node_info("other01")
+        mock_run_worker.assert_called_once()
+
+
+class TestUserOverviewCache:
+    """Tests for the running user stats derived from the all-users snapshot."""
+
+    def test_suspended_and_completing_jobs_are_not_running(self) -> None:
+        """Test that S and CG jobs do not inflate the running user stats."""
+        app = SlurmMonitor()
+        app._all_users_jobs = [
+            ("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4,mem=8G"),
+            ("2", "paused", "alice", "gpu", "S", "1:00", "1", "gpu02", "cpu=8,mem=8G"),
+            ("3", "ending", "bob", "gpu", "CG", "1:00", "1", "gpu03", "cpu=8,mem=8G"),
+        ]
+        app._user_stats_view.get()
+        running = {stats.username: stats for stats in app._cached_running_user_stats}
+        assert list(running) == ["alice"]
+        assert running["alice"].job_count == 1
+        assert running["alice"].total_cpus == 4
+
+
+class TestShowUserInfo:
+    """Tests for answering the user info modal from the per-user indexes."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Create a SlurmMonitor instance whose workers run inline."""
+        monitor = SlurmMonitor()
+        monitor.run_worker = MagicMock(side_effect=lambda fn, **_kwargs: fn())  # type: ignore[method-assign]
+        monitor._post_ui_callback = MagicMock(side_effect=lambda callback: callback())  # type: ignore[method-assign]
+        monitor.notify = MagicMock()  # type: ignore[method-assign]
+        return monitor
+
+    def test_uses_all_users_snapshot(self, app: SlurmMonitor) -> None:
+        """Test that the modal is built from the snapshot without running squeue."""
+        app._all_users_jobs = [
+            ("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4,mem=8G"),
+            ("2", "eval", "alice", "gpu", "PD", "0:00", "1", "(Priority)", "cpu=2,mem=4G"),
+            ("3", "other", "bob", "cpu", "R", "2:00", "1", "cpu01", "cpu=8,mem=8G"),
+        ]
+        app._fair_share_entries = [("acct1", "alice", "1", "0.5", "100", "0.1", "0.1", "0.75")]
+        with (
+            patch("stoei.app.get_user_jobs") as mock_get_user_jobs,
+            patch.object(app, "_display_user_info") as mock_display,
+        ):
+            app._show_user_info("alice")
+        mock_get_user_jobs.assert_not_called()
+        username, user_info, error = mock_display.call_args.args
+        assert username == "alice"
+        assert error is None
+        assert "train" in user_info
+        assert "eval" in user_info
+        assert "other" not in user_info
+        assert "acct1" in user_info
+
+    def test_falls_back_to_squeue_before_first_snapshot(self, app: SlurmMonitor) -> None:
+        """Test that squeue -u is used until the all-users jobs were fetched once."""
+        jobs = [("7", "solo", "gpu", "R", "0:10", "1", "gpu02", "cpu=4")]
+        with (
+            patch("stoei.app.get_user_jobs", return_value=(jobs, None)) as mock_get_user_jobs,
+            patch.object(app, "_display_user_info") as mock_display,
+        ):
+            app._show_user_info("carol")
+        mock_get_user_jobs.assert_called_once_with("carol")
+        assert "solo" in mock_display.call_args.args[1]
+
+
+class TestShowAccountInfo:
+    """Tests for answering the account info modal from the account tree index."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Create a SlurmMonitor instance whose workers run inline."""
+        monitor = SlurmMonitor()
+        monitor.run_worker = MagicMock(side_effect=lambda fn, **_kwargs: fn())  # type: ignore[method-assign]
+        monitor._post_ui_callback = MagicMock(side_effect=lambda callback: callback())  # type: ignore[method-assign]
+        monitor.notify = MagicMock()  # type: ignore[method-assign]
+        return monitor
+
+    def test_parent_account_rolls_up_sub_accounts(self, app: SlurmMonitor) -> None:
+        """Test that a parent account shows its sub-accounts' users and jobs."""
+        app._fair_share_entries = [
+            ("root", "", "1", "1.0", "100", "1.0", "1.0", ""),
+            (" physics", "", "10", "0.5", "100", "0.6", "0.6", ""),
+            ("  astro", "", "5", "0.25", "100", "0.5", "0.5", ""),
+            ("  astro", "alice", "1", "0.1", "100", "0.3", "0.3", "0.4"),
+        ]
+        app._all_users_jobs = [("1", "sim", "alice", "gpu", "R", "1:00", "1", "acc01", "cpu=8,mem=16G")]
+        with patch.object(app, "_display_account_info") as mock_display:
+            app._show_account_info("physics")
+            app._show_account_info("physics")
+        account_name, account_info, error = mock_display.call_args.args
+        assert account_name == "physics"
+        assert error is None
+        assert "alice" in account_info
+        assert "astro" in account_info
+        assert "sim" in account_info
+        # The second open reuses the account tree and the job index
+        counters = app._dataflow.counters()
+        assert counters["account_tree"].recomputes == 1
+        assert counters["job_index"].recomputes == 1
+
+
+class TestPrefetchJobInfo:
+    """Tests for the batched job-info prefetch."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    def test_fetches_uncached_jobs_in_one_batch(self) -> None:
+        """Test that only uncached jobs are requested, with a single batched call."""
+        app = SlurmMonitor()
+        app._job_info_cache.put("1", ("cached", None, None, None))
+        worker = MagicMock(is_cancelled=False)
+        fetched = {"2": ("info 2", None, "/out", None), "3_1": ("info 3", None, None, None)}
+        with (
+            patch("stoei.app.get_current_worker", return_value=worker),
+            patch("stoei.app.get_jobs_info_and_log_paths", return_value=fetched) as mock_fetch,
+        ):
+            app._prefetch_job_info(["1", "2", "3_1", "2"])
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args == (["2", "3_1"],)
+        assert app._job_info_cache.get("2") == ("info 2", None, "/out", None)
+        assert app._job_info_cache.get("1") == ("cached", None, None, None)
+
+    def test_terminality_comes_from_fetched_record(self) -> None:
+        """Test that the record's state, not the jobs table, decides whether an entry is final."""
+        app = SlurmMonitor()
+        worker = MagicMock(is_cancelled=False)
+
+        def fetch(
+            job_ids: list[str], *, states: dict[str, str]
+        ) -> dict[str, tuple[str, str | None, str | None, str | None]]:
+            states.update({"2": "COMPLETED", "3": "PREEMPTED"})
+            return dict.fromkeys(job_ids, ("info", None, None, None))
+
+        with (
+            patch("stoei.app.get_current_worker", return_value=worker),
+            patch("stoei.app.get_jobs_info_and_log_paths", side_effect=fetch),
+        ):
+            app._prefetch_job_info(["2", "3"])
+        # Only the completed job is persisted; the preempted one may be requeued
+        assert app._job_info_cache.dirty
+        with patch("stoei.slurm.job_info_cache.time.monotonic", return_value=1e12):
+            assert app._job_info_cache.get("2") is not None
+            assert app._job_info_cache.get("3") is None
+
+    def test_cancelled_worker_does_not_cache(self) -> None:
+        """Test that results of a superseded prefetch are dropped."""
+        app = SlurmMonitor()
+        worker = MagicMock(is_cancelled=True)
+        with (
+            patch("stoei.app.get_current_worker", return_value=worker),
+            patch("stoei.app.get_jobs_info_and_log_paths", return_value={"2": ("info", None, None, None)}),
+        ):
+            app._prefetch_job_info(["2"])
+        assert len(app._job_info_cache) == 0
+
+    def test_visible_job_ids_cover_viewport_with_cursor_first(self) -> None:
+        """Test that the visible rows are collected with the highlighted row first."""
+        app = SlurmMonitor()
+        table = MagicMock(row_count=50)
+        table.scroll_offset.y = 10
+        table.size.height = 5
+        table.get_row_at.side_effect = lambda row: (f" {row} ", "name")
+        assert app._visible_job_ids(table, 12) == ["12", "10", "11", "13", "14"]
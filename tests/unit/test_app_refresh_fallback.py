@@ -1,10 +1,14 @@
 """Tests for the refresh fallback and error deduplication logic in app.py."""
 
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from stoei.app import SlurmMonitor
 from stoei.slurm.cache import JobCache
+from stoei.slurm.fingerprint import UNCHANGED
 
 
 class TestRefreshFallback:
@@ -541,7 +545,8 @@ class TestOnRefreshComplete:
     def app(self) -> SlurmMonitor:
         """Return a SlurmMonitor instance with a pre-populated job info cache."""
         instance = SlurmMonitor()
-        instance._job_info_cache["123"] = ("formatted", None, None, None)
+        instance._job_info_cache.put("123", ("formatted", None, None, None), "RUNNING")
+        instance._job_info_cache.put("100", ("finished", None, None, None), "COMPLETED")
         return instance
 
     def test_first_cycle_sets_initial_background_complete(self, app: SlurmMonitor) -> None:
@@ -578,12 +583,13 @@ class TestOnRefreshComplete:
         assert app._initial_background_complete is True
         mock_interval.assert_called_once()
 
-    def test_first_cycle_clears_job_info_cache(self, app: SlurmMonitor) -> None:
-        """_on_refresh_complete always clears the job info cache."""
+    def test_first_cycle_drops_changed_active_jobs(self, app: SlurmMonitor) -> None:
+        """_on_refresh_complete drops active jobs that left the snapshot but keeps finished ones."""
         with patch.object(app, "set_interval", return_value=MagicMock()):
             app._on_refresh_complete(is_first_cycle=True)
 
-        assert app._job_info_cache == {}
+        assert app._job_info_cache.get("123") is None
+        assert app._job_info_cache.get("100") == ("finished", None, None, None)
 
     def test_subsequent_cycle_does_not_call_set_interval(self, app: SlurmMonitor) -> None:
         """Subsequent refresh cycles must not re-register the auto-refresh timer."""
@@ -598,9 +604,10 @@ class TestOnRefreshComplete:
         mock_set_interval.assert_not_called()
         mock_notify.assert_not_called()
 
-    def test_subsequent_cycle_clears_job_info_cache(self, app: SlurmMonitor) -> None:
-        """Subsequent refresh cycles still clear the job info cache."""
+    def test_subsequent_cycle_keeps_unchanged_active_jobs(self, app: SlurmMonitor) -> None:
+        """Subsequent refresh cycles keep active jobs whose state did not change."""
         app._initial_background_complete = True
+        app._job_cache._build_from_data([("123", "train", "RUNNING", "1:00", "1", "node01", "", "")], [], 1, 0, 0)
 
         with (
             patch.object(app, "set_interval"),
@@ -608,4 +615,413 @@ class TestOnRefreshComplete:
         ):
             app._on_refresh_complete(is_first_cycle=False)
 
-        assert app._job_info_cache == {}
+        assert app._job_info_cache.get("123") == ("formatted", None, None, None)
+
+
+class TestPriorityCacheReuse:
+    """Tests for digest-keyed reuse in _compute_priority_overview_cache."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Return a SlurmMonitor instance with sshare and sprio entries loaded."""
+        instance = SlurmMonitor()
+        instance._fair_share_entries = [
+            ("acct1", "", "1", "0.5", "100", "0.1", "0.1", "0.0"),
+            ("acct1", "alice", "1", "0.5", "100", "0.1", "0.1", "0.8"),
+        ]
+        instance._job_priority_entries = [("101", "alice", "acct1", "1000", "10", "500", "5", "gpu", "normal")]
+        return instance
+
+    def test_unchanged_output_reuses_results(self, app: SlurmMonitor) -> None:
+        """A second computation with identical entries reuses every cached list."""
+        assert app._compute_priority_overview_cache() is True
+        user_rows = app._cached_user_priority_rows
+        job_rows = app._cached_job_priority_rows
+
+        assert app._compute_priority_overview_cache() is False
+        assert app._cached_user_priority_rows is user_rows
+        assert app._cached_job_priority_rows is job_rows
+
+    def test_only_changed_half_is_rebuilt(self, app: SlurmMonitor) -> None:
+        """Changing sprio output rebuilds job rows but keeps sshare rows."""
+        app._compute_priority_overview_cache()
+        user_rows = app._cached_user_priority_rows
+        job_rows = app._cached_job_priority_rows
+
+        app._job_priority_entries = [("102", "alice", "acct1", "900", "5", "500", "5", "gpu", "normal")]
+        with patch("stoei.app.parse_sshare_output") as mock_parse_sshare:
+            assert app._compute_priority_overview_cache() is True
+        mock_parse_sshare.assert_not_called()
+        assert app._cached_user_priority_rows is user_rows
+        assert app._cached_job_priority_rows is not job_rows
+        assert app._cached_job_priorities[0].job_id == "102"
+
+    def test_unchanged_priority_skips_ui_callback(self, app: SlurmMonitor) -> None:
+        """When neither half changed, the priority tab update is not scheduled."""
+        app._compute_priority_overview_cache()
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._apply_fetch_result("fair_share", (UNCHANGED, None))
+            app._apply_fetch_result("job_priority", (UNCHANGED, None))
+        mock_post.assert_not_called()
+
+    def test_priority_computed_lazily(self, app: SlurmMonitor) -> None:
+        """Fetch results only mark the priority view stale; rows are built when requested."""
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._apply_fetch_result("fair_share", (app._fair_share_entries, None))
+            app._apply_fetch_result("job_priority", (app._job_priority_entries, None))
+        mock_post.assert_called_once_with(app._update_priority_tab)
+        assert app._cached_user_priority_rows == []
+        assert app._priority_view.is_stale()
+
+        assert app._compute_priority_overview_cache() is True
+        assert app._cached_user_priority_rows
+        assert not app._priority_view.is_stale()
+
+
+class TestUnchangedFetchResults:
+    """Tests for skipping work when a fetch reports UNCHANGED output."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Return a bare SlurmMonitor instance with heavy side-effects stubbed out."""
+        instance = SlurmMonitor()
+        instance._parse_node_infos = MagicMock(return_value=[])  # type: ignore[method-assign]
+        instance._compute_user_overview_cache = MagicMock()  # type: ignore[method-assign]
+        instance._calculate_cluster_stats = MagicMock(return_value=None)  # type: ignore[method-assign]
+        return instance
+
+    @pytest.mark.parametrize("label", ["user_jobs", "nodes", "all_jobs"])
+    def test_unchanged_result_skips_all_work(self, app: SlurmMonitor, label: str) -> None:
+        """An UNCHANGED result leaves state alone and schedules no UI update."""
+        app._cluster_nodes = [{"NodeName": "n1"}]
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._apply_fetch_result(label, UNCHANGED)
+        mock_post.assert_not_called()
+        app._parse_node_infos.assert_not_called()  # type: ignore[attr-defined]
+        app._compute_user_overview_cache.assert_not_called()  # type: ignore[attr-defined]
+        assert app._cluster_nodes == [{"NodeName": "n1"}]
+
+    def test_unchanged_priority_half_still_counts(self, app: SlurmMonitor) -> None:
+        """An unchanged priority half keeps its entries and still completes the pair."""
+        app._fair_share_entries = [("acct", "alice", "1", "1", "1", "1", "1", "0.5")]
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._apply_fetch_result("fair_share", (UNCHANGED, None))
+            app._apply_fetch_result("job_priority", ([], None))
+        mock_post.assert_called_once_with(app._update_priority_tab)
+        assert app._fair_share_entries == [("acct", "alice", "1", "1", "1", "1", "1", "0.5")]
+
+    def test_cluster_stats_skipped_when_inputs_unchanged(self, app: SlurmMonitor) -> None:
+        """Wait-time results recompute stats only when some input changed."""
+        counters = app._dataflow.counters()
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._apply_fetch_result("wait_time", [])
+            app._apply_fetch_result("wait_time", [])
+        assert counters["cluster_stats"].recomputes == 1
+        assert mock_post.call_count == 1
+
+        with patch.object(app, "_post_ui_callback"):
+            app._apply_fetch_result("nodes", [{"NodeName": "n2"}])
+            app._apply_fetch_result("wait_time", [])
+        assert counters["cluster_stats"].recomputes == 2
+
+    def test_wait_time_update_reuses_node_and_pending_stats(self, app: SlurmMonitor) -> None:
+        """Only the changed part of the cluster stats is recomputed."""
+        app._cluster_nodes = [{"NodeName": "n1", "State": "IDLE", "CPUTot": "8"}]
+        app._all_users_jobs = [("1", "job", "alice", "gpu", "PENDING", "0:00", "1", "(None)", "cpu=4,mem=8G")]
+        fmt = "%Y-%m-%dT%H:%M:%S"
+        with patch.object(app, "_post_ui_callback"):
+            app._apply_fetch_result("wait_time", [])
+            now = datetime.now()
+            start = now - timedelta(minutes=5)
+            job = ("7", "gpu", "COMPLETED", (start - timedelta(minutes=3)).strftime(fmt), start.strftime(fmt))
+            app._wait_time_store.ingest([job], since=now - timedelta(hours=1), until=now)
+            app._apply_fetch_result("wait_time", [job])
+
+        counters = app._dataflow.counters()
+        assert counters["node_stats"].recomputes == 1
+        assert counters["pending_stats"].recomputes == 1
+        assert counters["wait_stats"].recomputes == 2
+        assert counters["cluster_stats"].recomputes == 2
+        assert app._cached_cluster_stats is not None
+        assert app._cached_cluster_stats.pending_cpus == 4
+
+    def test_node_infos_parsed_only_on_request(self, app: SlurmMonitor) -> None:
+        """Node results do not parse node infos until the nodes tab asks for them."""
+        with patch.object(app, "_post_ui_callback"):
+            app._apply_fetch_result("nodes", [{"NodeName": "n1"}])
+        app._parse_node_infos.assert_not_called()  # type: ignore[attr-defined]
+        assert app._node_infos_view.is_stale()
+
+        app._node_infos_view.get()
+        app._node_infos_view.get()
+        app._parse_node_infos.assert_called_once()  # type: ignore[attr-defined]
+
+    def test_fetch_user_jobs_unchanged_when_both_sources_unchanged(self, app: SlurmMonitor) -> None:
+        """User jobs are UNCHANGED only when squeue and sacct output both match."""
+        running = [("1", "job1", "RUNNING", "1:00", "1", "node1")]
+        history = [("2", "job2", "COMPLETED", "0:00", "1", "node1")]
+        with (
+            patch("stoei.app.get_running_jobs", return_value=(running, None)),
+            patch("stoei.app.get_job_history", return_value=(history, 1, 0, 0, None)),
+        ):
+            app._fetch_user_jobs()
+        with (
+            patch("stoei.app.get_running_jobs", return_value=(UNCHANGED, None)),
+            patch("stoei.app.get_job_history", return_value=(UNCHANGED, 0, 0, 0, None)),
+        ):
+            assert app._fetch_user_jobs() is UNCHANGED
+        new_history = [*history, ("3", "job3", "FAILED", "0:00", "1", "node2")]
+        with (
+            patch("stoei.app.get_running_jobs", return_value=(UNCHANGED, None)),
+            patch("stoei.app.get_job_history", return_value=(new_history, 2, 0, 0, None)),
+        ):
+            assert app._fetch_user_jobs() == (running, new_history, 2, 0, 0)
+
+
+_ALL_JOBS = [
+    ("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4"),
+    ("2", "eval", "alice", "gpu", "PD", "0:00", "1", "", "cpu=4"),
+    ("3", "other", "bob", "cpu", "R", "2:00", "1", "cpu01", "cpu=2"),
+]
+_SCHEDULE = {
+    "1": ("None", "2026-01-01T10:00:00", "2026-01-01T10:05:00"),
+    "2": ("Priority", "2026-01-01T11:00:00", "N/A"),
+}
+
+
+class TestDeriveUserJobs:
+    """Tests for deriving the user's jobs from the all-users snapshot."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self) -> SlurmMonitor:
+        """Return a SlurmMonitor instance with a fixed username."""
+        instance = SlurmMonitor()
+        instance._current_username = "alice"
+        return instance
+
+    @staticmethod
+    def _done(result: object) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(result)
+        return future
+
+    def test_derives_jobs_without_squeue_user(self, app: SlurmMonitor) -> None:
+        """The user's jobs come from the snapshot plus one schedule-field query."""
+        with (
+            patch("stoei.app.get_job_schedule_fields", return_value=(_SCHEDULE, None)) as mock_fields,
+            patch("stoei.app.get_running_jobs") as mock_running,
+        ):
+            jobs, error = app._fetch_running_jobs(self._done(_ALL_JOBS))
+
+        assert error is None
+        mock_running.assert_not_called()
+        mock_fields.assert_called_once_with(["1", "2"])
+        assert jobs == [
+            ("1", "train", "RUNNING", "1:00", "1", "gpu01", "2026-01-01T10:00:00", "2026-01-01T10:05:00"),
+            ("2", "eval", "PENDING", "0:00", "1", "(Priority)", "2026-01-01T11:00:00", "N/A"),
+        ]
+
+    def test_schedule_fields_queried_only_for_new_or_changed_jobs(self, app: SlurmMonitor) -> None:
+        """Known jobs in the same state reuse their schedule fields."""
+        with patch("stoei.app.get_job_schedule_fields", return_value=(_SCHEDULE, None)):
+            app._last_running_fetch = app._fetch_running_jobs(self._done(_ALL_JOBS))[0]  # type: ignore[assignment]
+
+        started = [*_ALL_JOBS[:1], ("2", "eval", "alice", "gpu", "R", "0:01", "1", "gpu02", "cpu=4")]
+        with patch("stoei.app.get_job_schedule_fields", return_value=({}, None)) as mock_fields:
+            jobs, _ = app._fetch_running_jobs(self._done(started))
+            mock_fields.assert_called_once_with(["2"])
+            # Unchanged all-users output reads the published snapshot
+            app._all_users_jobs = started
+            assert app._fetch_running_jobs(self._done(UNCHANGED))[0] == jobs
+            assert mock_fields.call_count == 1
+
+    def test_completing_jobs_are_kept(self, app: SlurmMonitor) -> None:
+        """Jobs in active states other than running/pending stay in the user's table."""
+        completing = [*_ALL_JOBS, ("4", "post", "alice", "gpu", "CG", "3:00", "1", "gpu03", "cpu=4")]
+        with patch("stoei.app.get_job_schedule_fields", return_value=(_SCHEDULE, None)) as mock_fields:
+            jobs, error = app._fetch_running_jobs(self._done(completing))
+
+        assert error is None
+        mock_fields.assert_called_once_with(["1", "2", "4"])
+        assert jobs[-1] == ("4", "post", "COMPLETING", "3:00", "1", "gpu03", "", "")
+
+    def test_falls_back_to_squeue_user_when_all_jobs_failed(self, app: SlurmMonitor) -> None:
+        """A failed all-users fetch falls back to the dedicated squeue -u call."""
+        running = [("1", "train", "RUNNING", "1:00", "1", "gpu01", "", "")]
+        with (
+            patch("stoei.app.get_all_running_jobs", return_value=([], "squeue timed out")),
+            patch("stoei.app.get_running_jobs", return_value=(running, None)) as mock_running,
+        ):
+            all_jobs = self._done(app._fetch_all_jobs())
+            assert app._fetch_running_jobs(all_jobs) == (running, None)
+        mock_running.assert_called_once()
+
+    def test_falls_back_when_schedule_query_fails(self, app: SlurmMonitor) -> None:
+        """A failed schedule-field query falls back to squeue -u."""
+        with (
+            patch("stoei.app.get_job_schedule_fields", return_value=({}, "squeue error")),
+            patch("stoei.app.get_running_jobs", return_value=([], None)) as mock_running,
+        ):
+            app._fetch_running_jobs(self._done(_ALL_JOBS))
+        mock_running.assert_called_once()
+
+
+class TestLastSnapshotPersistence:
+    """Tests for saving the last refresh data and showing it at the next launch."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @pytest.fixture
+    def app(self, tmp_path: Path) -> SlurmMonitor:
+        """Return a SlurmMonitor instance saving its last snapshot under tmp_path."""
+        instance = SlurmMonitor()
+        instance._current_username = "alice"
+        instance._last_snapshot_path = tmp_path / "last_snapshot.json.gz"
+        return instance
+
+    def test_saved_data_is_shown_as_stale_on_next_launch(self, app: SlurmMonitor) -> None:
+        """A saved refresh is rendered by the next session, marked stale until the first cycle."""
+        app._last_running_fetch = [("1", "train", "RUNNING", "1:00", "1", "gpu01", "", "")]
+        app._all_users_jobs = _ALL_JOBS
+        app._save_last_snapshot()
+
+        next_app = SlurmMonitor()
+        next_app._current_username = "alice"
+        next_app._last_snapshot_path = app._last_snapshot_path
+        with (
+            patch.object(next_app, "_post_ui_callback") as mock_post,
+            patch.object(next_app, "_refresh_cluster_sidebar"),
+        ):
+            next_app._load_stale_snapshot()
+
+        assert next_app._showing_stale_data
+        assert [job.job_id for job in next_app._job_cache.jobs] == ["1"]
+        assert next_app._all_users_jobs == _ALL_JOBS
+        mock_post.assert_called()
+        next_app._clear_stale_marker()
+        assert not next_app._showing_stale_data
+
+    def test_saves_are_throttled_unless_forced(self, app: SlurmMonitor) -> None:
+        """Periodic saves wait for the interval; exit saves always write."""
+        app._last_running_fetch = []
+        with patch("stoei.app.save_last_snapshot", return_value=True) as mock_save:
+            app._save_last_snapshot()
+            app._save_last_snapshot()
+            assert mock_save.call_count == 1
+            app._save_last_snapshot(force=True)
+            assert mock_save.call_count == 2
+
+    def test_incomplete_refresh_is_not_saved(self, app: SlurmMonitor) -> None:
+        """Nothing is saved before the user's jobs were fetched or when all-users jobs failed."""
+        with patch("stoei.app.save_last_snapshot") as mock_save:
+            app._save_last_snapshot(force=True)
+            app._last_running_fetch = []
+            app._all_jobs_failed = True
+            app._save_last_snapshot(force=True)
+        mock_save.assert_not_called()
+
+    def test_slurm_check_failure_clears_stale_marker(self, app: SlurmMonitor) -> None:
+        """An unavailable SLURM does not leave the stale data marked as refreshing."""
+        app._showing_stale_data = True
+        app.sub_title = "stale data from 2h ago - refreshing"
+        with (
+            patch("stoei.app.check_slurm_available", return_value=(False, "no slurmctld")),
+            patch.object(app, "_post_ui_callback", side_effect=lambda callback: callback()),
+            patch.object(app, "push_screen"),
+            patch.object(app, "_set_loading_indicator") as mock_indicator,
+        ):
+            assert app._execute_loading_steps() is None
+        assert not app._showing_stale_data
+        assert app.sub_title == ""
+        mock_indicator.assert_called_with(False)
+
+    def test_user_jobs_failure_clears_stale_marker(self, app: SlurmMonitor) -> None:
+        """Failing to fetch fresh user jobs after stale data was shown clears the marker."""
+        app._showing_stale_data = True
+        app.sub_title = "stale data from 2h ago - refreshing"
+        with (
+            patch("stoei.app.get_running_jobs", return_value=([], "squeue timed out")),
+            patch("stoei.app.get_job_history", return_value=([], 0, 0, 0, None)),
+            patch.object(app, "_post_ui_callback", side_effect=lambda callback: callback()),
+        ):
+            app._load_step_user_jobs()
+        assert not app._showing_stale_data
+        assert app.sub_title == ""
+
+    def test_no_snapshot_keeps_loading_screen(self, app: SlurmMonitor) -> None:
+        """Without a saved snapshot the normal loading path is unchanged."""
+        with patch.object(app, "_post_ui_callback") as mock_post:
+            app._load_stale_snapshot()
+        assert not app._showing_stale_data
+        mock_post.assert_not_called()
+
+
+class TestStartupFetchHandoff:
+    """Tests for reusing the SLURM fetches started by the entry point."""
+
+    @pytest.fixture(autouse=True)
+    def reset_job_cache(self) -> None:
+        """Reset JobCache singleton before each test."""
+        JobCache.reset()
+
+    @staticmethod
+    def _done(result: object) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(result)
+        return future
+
+    def test_initial_load_uses_started_fetches_once(self) -> None:
+        """The initial load waits on the started fetches instead of running squeue and sacct."""
+        running = [("1", "train", "RUNNING", "1:00", "1", "gpu01", "", "")]
+        startup_fetch = MagicMock()
+        startup_fetch.started_at = 0.0
+        startup_fetch.slurm_check = self._done((True, None))
+        startup_fetch.running_jobs = self._done((running, None))
+        startup_fetch.history_for.return_value = self._done(([], 0, 0, 0, None))
+        app = SlurmMonitor(startup_fetch)
+
+        with (
+            patch("stoei.app.check_slurm_available") as mock_check,
+            patch("stoei.app.get_running_jobs") as mock_running,
+            patch("stoei.app.get_job_history") as mock_history,
+            patch.object(app, "_post_ui_callback"),
+        ):
+            assert app._execute_loading_steps() == (running, [], 0, 0, 0)
+            mock_check.assert_not_called()
+            mock_running.assert_not_called()
+            mock_history.assert_not_called()
+            startup_fetch.history_for.assert_called_once_with(app._settings.job_history_days)
+            assert app._startup_fetch is None
+
+    def test_history_for_other_window_is_fetched_again(self) -> None:
+        """A started sacct fetch that does not match the settings is not used."""
+        startup_fetch = MagicMock()
+        startup_fetch.started_at = 0.0
+        startup_fetch.running_jobs = self._done(([], None))
+        startup_fetch.history_for.return_value = None
+        app = SlurmMonitor(startup_fetch)
+
+        with (
+            patch("stoei.app.get_job_history", return_value=([], 0, 0, 0, None)) as mock_history,
+            patch.object(app, "_post_ui_callback"),
+        ):
+            app._load_step_user_jobs()
+        mock_history.assert_called_once()
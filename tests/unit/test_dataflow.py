@@ -0,0 +1,115 @@
+"""Tests for the memoized derived-view dataflow layer."""
+
+import pytest
+from stoei.dataflow import Dataflow, ViewCounters
+from stoei.snapshot import ClusterSnapshot, SnapshotStore
+
+
+@pytest.fixture
+def store() -> SnapshotStore:
+    """Return an empty snapshot store."""
+    return SnapshotStore()
+
+
+class TestDerivedView:
+    """Tests for DerivedView recomputation and memoization."""
+
+    def test_initial_value_before_first_get(self, store: SnapshotStore) -> None:
+        """Test that the initial value is returned until the view is requested."""
+        flow = Dataflow(store)
+        view = flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=-1)
+        assert view.value == -1
+        assert view.version == 0
+        assert view.is_stale()
+
+    def test_get_computes_once_until_input_changes(self, store: SnapshotStore) -> None:
+        """Test that repeated requests reuse the memoized value."""
+        calls: list[int] = []
+
+        def count(snapshot: ClusterSnapshot) -> int:
+            calls.append(snapshot.generation)
+            return len(snapshot.cluster_nodes)
+
+        flow = Dataflow(store)
+        view = flow.view("count", ("nodes",), count, initial=0)
+        store.publish("nodes", cluster_nodes=[{"NodeName": "n1"}])
+        assert view.get() == 1
+        assert view.get() == 1
+        assert len(calls) == 1
+        assert not view.is_stale()
+
+        store.publish("nodes", cluster_nodes=[{"NodeName": "n1"}, {"NodeName": "n2"}])
+        assert view.is_stale()
+        assert view.get() == 2
+        assert len(calls) == 2
+
+    def test_unrelated_source_does_not_invalidate(self, store: SnapshotStore) -> None:
+        """Test that publishing a source the view does not use keeps it fresh."""
+        flow = Dataflow(store)
+        view = flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        view.get()
+        store.publish("all_jobs", all_users_jobs=[("1",)])
+        assert not view.is_stale()
+
+    def test_extra_key_triggers_recompute(self, store: SnapshotStore) -> None:
+        """Test that a change in the extra key recomputes the view."""
+        theme = ["dark"]
+        flow = Dataflow(store)
+        view = flow.view("themed", (), lambda _s: theme[0].upper(), initial="", key=lambda _s: theme[0])
+        assert view.get() == "DARK"
+        theme[0] = "light"
+        assert view.is_stale()
+        assert view.get() == "LIGHT"
+
+    def test_dependent_view_recomputes_only_after_dependency_changes(self, store: SnapshotStore) -> None:
+        """Test that a view over other views follows their versions."""
+        flow = Dataflow(store)
+        nodes = flow.view("nodes_count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        jobs = flow.view("jobs_count", ("all_jobs",), lambda s: len(s.all_users_jobs), initial=0)
+        total = flow.view("total", (nodes, jobs), lambda _s: nodes.value + jobs.value, initial=0)
+
+        store.publish("nodes", cluster_nodes=[{"NodeName": "n1"}])
+        assert total.get() == 1
+        store.publish("all_jobs", all_users_jobs=[("1",), ("2",)])
+        assert total.is_stale()
+        assert total.get() == 3
+
+        assert nodes.counters.recomputes == 1
+        assert jobs.counters.recomputes == 2
+        assert total.counters.recomputes == 2
+
+    def test_invalidate_forces_recompute(self, store: SnapshotStore) -> None:
+        """Test that an invalidated view recomputes on the next request."""
+        flow = Dataflow(store)
+        view = flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        view.get()
+        flow.invalidate_all()
+        assert view.is_stale()
+        view.get()
+        assert view.counters.recomputes == 2
+
+
+class TestDataflow:
+    """Tests for the Dataflow registry."""
+
+    def test_duplicate_view_name_raises(self, store: SnapshotStore) -> None:
+        """Test that defining two views with the same name fails."""
+        flow = Dataflow(store)
+        flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        with pytest.raises(ValueError, match="already defined"):
+            flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+
+    def test_counters_track_recomputes_and_skips(self, store: SnapshotStore) -> None:
+        """Test that counters report recompute and skip rates per view."""
+        flow = Dataflow(store)
+        view = flow.view("count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        for _ in range(4):
+            view.get()
+        counters = flow.counters()["count"]
+        assert counters.recomputes == 1
+        assert counters.skips == 3
+        assert counters.skip_rate == pytest.approx(0.75)
+
+    def test_skip_rate_without_requests(self) -> None:
+        """Test that an unused view reports a zero skip rate."""
+        assert ViewCounters().skip_rate == 0.0
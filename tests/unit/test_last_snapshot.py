@@ -0,0 +1,63 @@
+"""Tests for persisting the last known refresh data."""
+
+import gzip
+import json
+import time
+from pathlib import Path
+
+import pytest
+from stoei.last_snapshot import LastSnapshot, format_age, load_last_snapshot, save_last_snapshot
+
+
+def _snapshot(saved_at: float | None = None) -> LastSnapshot:
+    return LastSnapshot(
+        username="alice",
+        saved_at=time.time() if saved_at is None else saved_at,
+        running_jobs=[("1", "train", "RUNNING", "1:00", "1", "gpu01", "", "")],
+        history_jobs=[("2", "eval", "COMPLETED", "0:00", "1", "gpu02")],
+        history_stats=(1, 0, 0),
+        cluster_nodes=[{"NodeName": "gpu01", "State": "MIXED"}],
+        all_users_jobs=[("1", "train", "alice", "gpu", "R", "1:00", "1", "gpu01", "cpu=4")],
+        fair_share_entries=[("alice", "acct", "1.0")],
+        job_priority_entries=[("1", "alice", "100")],
+    )
+
+
+class TestLastSnapshot:
+    """Tests for saving and loading the last snapshot."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a saved snapshot loads back unchanged."""
+        path = tmp_path / "last_snapshot.json.gz"
+        snapshot = _snapshot()
+        assert save_last_snapshot(path, snapshot)
+        assert load_last_snapshot(path, username="alice") == snapshot
+
+    def test_other_user_or_old_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        """Test that snapshots of another user or past the maximum age are not used."""
+        path = tmp_path / "last_snapshot.json.gz"
+        save_last_snapshot(path, _snapshot(saved_at=time.time() - 100))
+        assert load_last_snapshot(path, username="bob") is None
+        assert load_last_snapshot(path, username="alice", max_age=50) is None
+        assert load_last_snapshot(path, username="alice", max_age=500) is not None
+
+    def test_missing_or_malformed_file_is_ignored(self, tmp_path: Path) -> None:
+        """Test that unreadable or malformed files load as None."""
+        path = tmp_path / "last_snapshot.json.gz"
+        assert load_last_snapshot(path, username="alice") is None
+
+        path.write_bytes(b"not gzip")
+        assert load_last_snapshot(path, username="alice") is None
+
+        payload = {"version": 1, "username": "alice", "saved_at": time.time(), "running_jobs": "oops"}
+        path.write_bytes(gzip.compress(json.dumps(payload).encode()))
+        assert load_last_snapshot(path, username="alice") is None
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [(0, "0s"), (45.9, "45s"), (720, "12m"), (3 * 3600 + 300, "3h 5m"), (2 * 86400 + 4 * 3600 + 59, "2d 4h")],
+)
+def test_format_age(seconds: float, expected: str) -> None:
+    """Test that ages keep their two largest units."""
+    assert format_age(seconds) == expected
@@ -1,5 +1,11 @@
 """Tests for the logging module."""
 
+import gzip
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
 
 class TestGetLogger:
     """Tests for get_logger function."""
@@ -116,3 +122,122 @@ class TestLoggingState:
         # stdout handler should be None by default to avoid interfering with TUI
         assert hasattr(_state, "stdout_handler_id")
         assert _state.stdout_handler_id is None
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging function."""
+
+    def test_creates_log_dir_and_writes_file(self, tmp_path: Path) -> None:
+        from stoei.logger import _state, configure_logging, flush_logs, get_logger
+
+        log_dir = configure_logging(tmp_path / "logs")
+        get_logger("test_module").info("Written to file")
+        flush_logs()
+
+        assert log_dir == tmp_path / "logs"
+        assert _state.file_handler_id is not None
+        [log_file] = log_dir.glob("stoei_*.log")
+        assert "Written to file" in log_file.read_text()
+
+    def test_reconfiguring_replaces_file_handler(self, tmp_path: Path) -> None:
+        from stoei.logger import configure_logging, flush_logs, get_logger
+
+        configure_logging(tmp_path / "first")
+        configure_logging(tmp_path / "second")
+        get_logger("test_module").info("Only in the second directory")
+        flush_logs()
+
+        assert not any("Only in" in path.read_text() for path in (tmp_path / "first").glob("*.log"))
+        assert any("Only in" in path.read_text() for path in (tmp_path / "second").glob("*.log"))
+
+    def test_file_level_can_be_raised(self, tmp_path: Path) -> None:
+        from stoei.logger import configure_logging, flush_logs, get_logger, set_file_log_level
+
+        log_dir = configure_logging(tmp_path / "logs")
+        set_file_log_level("WARNING")
+        log = get_logger("test_module")
+        log.debug("Dropped {}", "debug")
+        log.warning("Kept warning")
+        flush_logs()
+
+        [log_file] = log_dir.glob("stoei_*.log")
+        contents = log_file.read_text()
+        assert "Dropped" not in contents
+        assert "Kept warning" in contents
+
+    def test_debug_messages_are_rate_limited_per_call_site(self, tmp_path: Path) -> None:
+        from stoei.logger import _RATE_LIMIT_MESSAGES, configure_logging, flush_logs, get_logger
+
+        log_dir = configure_logging(tmp_path / "logs")
+        log = get_logger("test_module")
+        for index in range(_RATE_LIMIT_MESSAGES + 10):
+            log.debug("Hot path {}", index)
+        log.warning("Warnings are never limited")
+        flush_logs()
+
+        [log_file] = log_dir.glob("stoei_*.log")
+        contents = log_file.read_text()
+        assert contents.count("Hot path") == _RATE_LIMIT_MESSAGES
+        assert "Warnings are never limited" in contents
+
+    def test_earlier_days_are_compressed(self, tmp_path: Path) -> None:
+        from stoei.logger import configure_logging, flush_logs, get_logger
+
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (log_dir / "stoei_2000-01-01.log").write_text("old\n")
+        (log_dir / "stoei_2000-01-02.log").write_text("recent\n")
+        os.utime(log_dir / "stoei_2000-01-01.log", (0, 0))
+        hour_ago = time.time() - 3600
+        os.utime(log_dir / "stoei_2000-01-02.log", (hour_ago, hour_ago))
+
+        configure_logging(log_dir)
+        get_logger("test_module").info("Today")
+        flush_logs()
+
+        names = sorted(path.name for path in log_dir.iterdir())
+        assert names[0] == "stoei_2000-01-02.log.gz"
+        assert len(names) == 2
+        assert gzip.decompress((log_dir / "stoei_2000-01-02.log.gz").read_bytes()) == b"recent\n"
+
+    def test_recently_written_earlier_day_is_not_compressed(self, tmp_path: Path) -> None:
+        from stoei.logger import configure_logging, flush_logs, get_logger
+
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        # Another session may still be appending to yesterday's file around midnight
+        (log_dir / "stoei_2000-01-02.log").write_text("other session\n")
+
+        configure_logging(log_dir)
+        get_logger("test_module").info("Today")
+        flush_logs()
+
+        assert (log_dir / "stoei_2000-01-02.log").read_text() == "other session\n"
+        assert not (log_dir / "stoei_2000-01-02.log.gz").exists()
+
+    def test_write_error_closes_file_and_reopens(self, tmp_path: Path) -> None:
+        from stoei.logger import _LogFileWriter
+
+        writer = _LogFileWriter(tmp_path)
+        try:
+            writer.write("first\n")
+            writer.flush()
+            failing = MagicMock(wraps=writer._file)
+            failing.write.side_effect = OSError("disk full")
+            writer._file = failing
+            writer.write("dropped\n")
+            writer.flush()
+            failing.close.assert_called_once()
+
+            writer.write("second\n")
+            writer.flush()
+        finally:
+            writer.stop()
+        (log_file,) = tmp_path.glob("stoei_*.log")
+        assert log_file.read_text() == "first\nsecond\n"
+
+    def test_uses_stoei_log_dir_env(self, isolated_log_dir: Path) -> None:
+        from stoei.logger import get_log_dir
+
+        assert get_log_dir() == isolated_log_dir.resolve()
+        assert not isolated_log_dir.exists()
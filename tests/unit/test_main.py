@@ -1,9 +1,44 @@
 """Tests for the __main__ entry point."""
 
 import argparse
+import json
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
+import pytest
+from stoei.tracing import CYCLE, span
+
+# Cumulative import time budget for the argparse-only entry point, in microseconds.
+# Generous enough for slow CI machines; pulling in Textual alone exceeds it.
+_MAIN_IMPORT_BUDGET_US = 250_000
+# Modules the entry point must not import before the TUI actually starts
+_LAZY_MODULES = ("textual", "rich", "stoei.app", "stoei.widgets", "stoei.slurm", "importlib.metadata")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run a statement under ``-X importtime`` and return the cumulative time per module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def _args(profile: Path | None = None, profile_cycles: int = 0, trace: Path | None = None) -> argparse.Namespace:
+    """Return parsed arguments as the entry point sees them."""
+    return argparse.Namespace(version=False, profile=profile, profile_cycles=profile_cycles, trace=trace)
+
 
 class TestGetVersion:
     """Tests for the get_version() function."""
@@ -18,7 +53,7 @@ class TestGetVersion:
 
     def test_get_version_handles_error(self) -> None:
         """Test that get_version returns 'unknown' on error."""
-        with patch("stoei.__main__.version", side_effect=Exception("Test error")):
+        with patch("importlib.metadata.version", side_effect=Exception("Test error")):
             from stoei.__main__ import get_version
 
             version = get_version()
@@ -35,6 +70,25 @@ class TestParseArgs:
 
             args = parse_args()
             assert isinstance(args, argparse.Namespace)
+            assert args.profile is None
+            assert args.profile_cycles == 0
+
+    def test_parse_profile_flags(self, tmp_path: Path) -> None:
+        """Test that --profile takes a directory and --profile-cycles a count."""
+        with patch("sys.argv", ["stoei", "--profile", str(tmp_path), "--profile-cycles", "3"]):
+            from stoei.__main__ import parse_args
+
+            args = parse_args()
+        assert args.profile == tmp_path
+        assert args.profile_cycles == 3
+
+    def test_negative_profile_cycles_rejected(self) -> None:
+        """Test that a negative cycle count is a usage error."""
+        with patch("sys.argv", ["stoei", "--profile-cycles", "-1"]), pytest.raises(SystemExit) as exc_info:
+            from stoei.__main__ import parse_args
+
+            parse_args()
+        assert exc_info.value.code == 2
 
 
 class TestRunFunction:
@@ -45,19 +99,70 @@ class TestRunFunction:
         with (
             patch("stoei.__main__.main") as mock_main,
             patch("stoei.__main__._ensure_truecolor"),
-            patch("stoei.__main__.parse_args", return_value=MagicMock()),
+            patch("stoei.__main__.parse_args", return_value=_args()),
         ):
             from stoei.__main__ import run
 
             run()
             mock_main.assert_called_once()
 
+    def test_run_profiles_the_session(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that --profile profiles main() and writes the profile on exit."""
+        with (
+            patch("stoei.__main__.main", side_effect=lambda: sorted(range(1000))),
+            patch("stoei.__main__._ensure_truecolor"),
+            patch("stoei.__main__.parse_args", return_value=_args(profile=tmp_path / "profiles")),
+        ):
+            from stoei.__main__ import run
+
+            run()
+
+        (session_dir,) = (tmp_path / "profiles").iterdir()
+        assert next(session_dir.glob("*.prof"), None) is not None
+        assert (session_dir / "summary.txt").exists()
+        assert f"Profile written to {session_dir}" in capsys.readouterr().err
+
+    def test_run_writes_trace_on_exit(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that --trace writes the recorded spans when the app exits."""
+        trace_path = tmp_path / "trace.json"
+
+        def fake_main() -> None:
+            with span("refresh cycle", CYCLE):
+                pass
+
+        with (
+            patch("stoei.__main__.main", side_effect=fake_main),
+            patch("stoei.__main__._ensure_truecolor"),
+            patch("stoei.__main__.parse_args", return_value=_args(trace=trace_path)),
+        ):
+            from stoei.__main__ import run
+
+            run()
+
+        events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        assert [event["name"] for event in events if event["ph"] == "X"] == ["refresh cycle"]
+        assert f"Trace written to {trace_path}" in capsys.readouterr().err
+
+    def test_main_starts_slurm_fetches_before_the_app(self) -> None:
+        """Test that main() starts the critical-path fetches and hands them to the app."""
+        with (
+            patch("stoei.slurm.prefetch.StartupFetch") as mock_fetch,
+            patch("stoei.settings.load_settings") as mock_settings,
+            patch("stoei.app.main") as mock_app_main,
+        ):
+            from stoei.__main__ import main
+
+            main()
+
+        mock_fetch.return_value.start_history.assert_called_once_with(mock_settings.return_value.job_history_days)
+        mock_app_main.assert_called_once_with(mock_fetch.return_value)
+
     def test_run_handles_exception(self) -> None:
         """Test that run() handles exceptions and exits with code 1."""
         with (
             patch("stoei.__main__.main", side_effect=RuntimeError("Test error")),
             patch("stoei.__main__._ensure_truecolor"),
-            patch("stoei.__main__.parse_args", return_value=MagicMock()),
+            patch("stoei.__main__.parse_args", return_value=_args()),
             patch("stoei.__main__.traceback.print_exc") as mock_traceback,
             patch("stoei.__main__.sys.exit") as mock_exit,
         ):
@@ -72,7 +177,7 @@ class TestRunFunction:
         with (
             patch("stoei.__main__.main", side_effect=ValueError("Another error")),
             patch("stoei.__main__._ensure_truecolor"),
-            patch("stoei.__main__.parse_args", return_value=MagicMock()),
+            patch("stoei.__main__.parse_args", return_value=_args()),
             patch("stoei.__main__.traceback.print_exc") as mock_traceback,
             patch("stoei.__main__.sys.exit"),
         ):
@@ -188,7 +293,7 @@ class TestRunTerminalTitle:
         with (
             patch("stoei.__main__.main"),
             patch("stoei.__main__._ensure_truecolor"),
-            patch("stoei.__main__.parse_args", return_value=MagicMock()),
+            patch("stoei.__main__.parse_args", return_value=_args()),
             patch("stoei.__main__._set_terminal_title") as mock_set,
             patch("stoei.__main__._restore_terminal_title") as mock_restore,
         ):
@@ -203,7 +308,7 @@ class TestRunTerminalTitle:
         with (
             patch("stoei.__main__.main", side_effect=RuntimeError("boom")),
             patch("stoei.__main__._ensure_truecolor"),
-            patch("stoei.__main__.parse_args", return_value=MagicMock()),
+            patch("stoei.__main__.parse_args", return_value=_args()),
             patch("stoei.__main__._set_terminal_title") as mock_set,
             patch("stoei.__main__._restore_terminal_title") as mock_restore,
             patch("stoei.__main__.traceback.print_exc"),
@@ -259,3 +364,43 @@ class TestEnsureTruecolor:
             _ensure_truecolor()
             # Should preserve the original value
             assert os.environ.get("COLORTERM") == "TRUECOLOR"
+
+
+class TestStartupImports:
+    """Import-time regression tests for the lazy startup path."""
+
+    def test_entry_point_stays_within_import_budget(self) -> None:
+        """Test that the argparse-only entry point imports no TUI or SLURM modules."""
+        times = _import_times("import stoei.__main__")
+
+        eager = sorted(name for name in times if name.startswith(_LAZY_MODULES))
+        assert eager == []
+        assert times["stoei.__main__"] < _MAIN_IMPORT_BUDGET_US
+
+    def test_app_defers_rarely_used_screens(self) -> None:
+        """Test that the help, settings and SLURM error screens load on first use."""
+        times = _import_times("import stoei.app")
+
+        assert "stoei.app" in times
+        for module in (
+            "stoei.widgets.help_screen",
+            "stoei.widgets.settings_screen",
+            "stoei.widgets.slurm_error_screen",
+        ):
+            assert module not in times
+
+    def test_version_flag_does_not_start_the_app(self) -> None:
+        """Test that --version exits before logging is configured or the app is imported."""
+        with (
+            patch("sys.argv", ["stoei", "--version"]),
+            patch("stoei.__main__.configure_logging") as mock_configure,
+            patch("stoei.__main__.main") as mock_main,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            from stoei.__main__ import run
+
+            run()
+
+        assert exc_info.value.code == 0
+        mock_configure.assert_not_called()
+        mock_main.assert_not_called()
@@ -0,0 +1,188 @@
+"""Tests for profiling mode."""
+
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from stoei import profiling
+from stoei.profiling import (
+    ProfileSession,
+    configure_profiling,
+    is_profiling,
+    profiled,
+    record_refresh_cycle,
+    start_profiling,
+    stop_profiling,
+)
+
+# From Python 3.12 one process-wide profiler covers every thread
+_SHARED_PROFILER = sys.version_info >= (3, 12)
+_WORKER_PROFILE = "all-threads.prof" if _SHARED_PROFILER else "stoei-refresh_0.prof"
+_MAIN_PROFILE = "all-threads.prof" if _SHARED_PROFILER else "MainThread.prof"
+
+
+def _busy(n: int) -> int:
+    return sum(sorted(range(n)))
+
+
+def _spin_left(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _spin_right(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _sampled_sections(summary: str) -> dict[str, str]:
+    _, _, sampled = summary.partition("Sampled time per thread")
+    sections: dict[str, str] = {}
+    name = ""
+    for line in sampled.splitlines()[1:]:
+        if line.startswith("  ") and not line.startswith("   "):
+            name = line.strip()
+            sections[name] = ""
+        elif name:
+            sections[name] += line + "\n"
+    return sections
+
+
+def _run_in_thread(name: str, work: object) -> None:
+    thread = threading.Thread(target=work, name=name)
+    thread.start()
+    thread.join()
+
+
+class TestProfileSession:
+    """Tests for a single profiling session."""
+
+    def test_writes_profiles_per_thread_and_summary(self, tmp_path: Path) -> None:
+        """Test that the main thread and profiled worker units are written as .prof files."""
+        session = ProfileSession(tmp_path, sample_interval=0.001)
+        session.start()
+        _busy(10_000)
+        _run_in_thread("stoei-refresh_0", lambda: session.run(_busy, 50_000))
+        output_dir = session.stop()
+
+        assert output_dir.parent == tmp_path
+        worker_stats = pstats.Stats(str(output_dir / _WORKER_PROFILE))
+        assert any(name == "_busy" for _, _, name in worker_stats.stats)  # type: ignore[attr-defined]
+        assert (output_dir / _MAIN_PROFILE).exists()
+        summary = (output_dir / "summary.txt").read_text(encoding="utf-8")
+        assert summary.startswith("stoei profile:")
+        assert "by cumulative time" in summary
+
+    def test_sampler_writes_collapsed_stacks(self, tmp_path: Path) -> None:
+        """Test that stack samples are written in the collapsed format, one file per thread."""
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait, name="idle-worker")
+        waiter.start()
+        try:
+            session = ProfileSession(tmp_path, sample_interval=0.001)
+            session.start()
+            threading.Event().wait(0.05)
+            output_dir = session.stop()
+        finally:
+            stop.set()
+            waiter.join()
+
+        lines = (output_dir / "idle-worker.folded").read_text(encoding="utf-8").splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.split(";")[-1].startswith("Condition.wait (threading.py:")
+
+    def test_overlapping_threads_report_their_own_sampled_costs(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that two threads running at once are costed separately from the stack samples."""
+        monkeypatch.setattr(profiling, "_SHARED_PROFILER", True)
+        session = ProfileSession(tmp_path, sample_interval=0.001)
+        session.start()
+        barrier = threading.Barrier(2)
+
+        def work(spin: object) -> None:
+            barrier.wait()
+            session.run(spin, 0.2)  # type: ignore[arg-type]
+
+        threads = [
+            threading.Thread(target=work, args=(_spin_left,), name="left-worker"),
+            threading.Thread(target=work, args=(_spin_right,), name="right-worker"),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        output_dir = session.stop()
+
+        summary = (output_dir / "summary.txt").read_text(encoding="utf-8")
+        assert "caller/callee links below are unreliable" in summary
+        sections = _sampled_sections(summary)
+        assert "_spin_left" in sections["left-worker"]
+        assert "_spin_right" not in sections["left-worker"]
+        assert "_spin_right" in sections["right-worker"]
+        assert "_spin_left" not in sections["right-worker"]
+
+    def test_nested_units_are_profiled_once(self, tmp_path: Path) -> None:
+        """Test that a unit inside another unit on the same thread keeps the profiler enabled."""
+        session = ProfileSession(tmp_path)
+        result: list[int] = []
+        _run_in_thread("worker", lambda: result.append(session.run(session.run, _busy, 100)))
+        assert result == [_busy(100)]
+
+
+class TestSessionControl:
+    """Tests for starting and stopping sessions."""
+
+    def test_profiled_is_transparent_without_session(self) -> None:
+        """Test that wrapped work runs normally when nothing is profiling."""
+        assert not is_profiling()
+        assert profiled(_busy)(10) == _busy(10)
+        assert profiled(_busy).__name__ == "_busy"
+
+    def test_session_ends_after_configured_cycles(self, tmp_path: Path) -> None:
+        """Test that the session is written once the refresh cycle count is reached."""
+        configure_profiling(tmp_path, cycles=2)
+        start_profiling()
+        _run_in_thread("stoei-refresh_0", lambda: profiled(_busy)(1000))
+
+        assert record_refresh_cycle() is None
+        assert is_profiling()
+        output_dir = record_refresh_cycle()
+
+        assert not is_profiling()
+        assert output_dir is not None
+        assert (output_dir / _WORKER_PROFILE).exists()
+        assert "2 refresh cycles" in (output_dir / "summary.txt").read_text(encoding="utf-8")
+
+    def test_profiled_worker_unit_runs_during_session(self, tmp_path: Path) -> None:
+        """Test that profiled work on a worker thread succeeds while the main thread is profiled."""
+        configure_profiling(tmp_path)
+        start_profiling()
+        results: list[int] = []
+        errors: list[BaseException] = []
+
+        def work() -> None:
+            try:
+                results.append(profiled(_busy)(1000))
+            except BaseException as exc:
+                errors.append(exc)
+
+        _run_in_thread("stoei-refresh_0", work)
+        output_dir = stop_profiling()
+
+        assert errors == []
+        assert results == [_busy(1000)]
+        assert output_dir is not None
+        worker_stats = pstats.Stats(str(output_dir / _WORKER_PROFILE))
+        assert any(name == "_busy" for _, _, name in worker_stats.stats)  # type: ignore[attr-defined]
+
+    def test_stop_without_session(self) -> None:
+        """Test that stopping when nothing is profiling is a no-op."""
+        assert stop_profiling() is None
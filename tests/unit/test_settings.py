@@ -3,10 +3,12 @@
 import json
 from pathlib import Path
 
+from stoei.paths import get_cache_dir
 from stoei.settings import (
     DEFAULT_JOB_HISTORY_DAYS,
     DEFAULT_LOG_VIEWER_LINES,
     DEFAULT_MAX_LOG_LINES,
+    DEFAULT_NODE_INFO_MAX_AGE,
     DEFAULT_REFRESH_INTERVAL,
     Settings,
     load_settings,
@@ -136,3 +138,41 @@ def test_load_settings_log_viewer_lines_from_string(tmp_path: Path, monkeypatch)
     settings_path.write_text(json.dumps({"log_viewer_lines": "8000"}))
     settings = load_settings()
     assert settings.log_viewer_lines == 8000
+
+
+def test_load_settings_valid_node_info_max_age(tmp_path: Path, monkeypatch) -> None:
+    """Valid node_info_max_age values are loaded correctly."""
+    monkeypatch.setenv("STOEI_CONFIG_DIR", str(tmp_path))
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"node_info_max_age": 0}))
+    settings = load_settings()
+    assert settings.node_info_max_age == 0.0
+
+
+def test_load_settings_node_info_max_age_out_of_range_defaults(tmp_path: Path, monkeypatch) -> None:
+    """Node info max age outside the allowed range falls back to default."""
+    monkeypatch.setenv("STOEI_CONFIG_DIR", str(tmp_path))
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"node_info_max_age": -5}))
+    settings = load_settings()
+    assert settings.node_info_max_age == DEFAULT_NODE_INFO_MAX_AGE
+
+
+def test_load_settings_derive_user_jobs(tmp_path: Path, monkeypatch) -> None:
+    """Deriving user jobs from the all-users snapshot is on unless disabled."""
+    monkeypatch.setenv("STOEI_CONFIG_DIR", str(tmp_path))
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"derive_user_jobs": "maybe"}))
+    assert load_settings().derive_user_jobs is True
+    settings_path.write_text(json.dumps({"derive_user_jobs": False}))
+    assert load_settings().derive_user_jobs is False
+
+
+def test_get_cache_dir_uses_xdg_cache_home(tmp_path: Path, monkeypatch) -> None:
+    """The cache directory follows XDG_CACHE_HOME unless overridden."""
+    monkeypatch.delenv("STOEI_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == tmp_path / "stoei"
+
+    monkeypatch.setenv("STOEI_CACHE_DIR", str(tmp_path / "override"))
+    assert get_cache_dir() == tmp_path / "override"
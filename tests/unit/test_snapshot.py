@@ -0,0 +1,103 @@
+"""Tests for the immutable cluster snapshot store."""
+
+import threading
+from dataclasses import FrozenInstanceError
+
+import pytest
+from stoei.snapshot import ClusterSnapshot, SnapshotAttribute, SnapshotStore
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore publishing."""
+
+    def test_initial_snapshot_is_empty(self) -> None:
+        """Test that a new store starts at generation 0 with empty data."""
+        store = SnapshotStore()
+        assert store.current.generation == 0
+        assert store.current.cluster_nodes == []
+        assert store.current.cluster_stats is None
+        assert store.current.source_generation("nodes") == 0
+
+    def test_publish_bumps_generation(self) -> None:
+        """Test that publishing creates a new generation with the changes applied."""
+        store = SnapshotStore()
+        nodes = [{"NodeName": "node01"}]
+        snapshot = store.publish("nodes", cluster_nodes=nodes)
+        assert snapshot is store.current
+        assert snapshot.generation == 1
+        assert snapshot.cluster_nodes is nodes
+        assert snapshot.source_generation("nodes") == 1
+
+    def test_publish_keeps_previous_snapshot_intact(self) -> None:
+        """Test that readers holding an older snapshot are unaffected by publishes."""
+        store = SnapshotStore()
+        store.publish("all_jobs", all_users_jobs=[("1",)])
+        before = store.current
+        store.publish("all_jobs", all_users_jobs=[("2",)])
+        assert before.all_users_jobs == [("1",)]
+        assert store.current.all_users_jobs == [("2",)]
+
+    def test_source_generations_track_each_source(self) -> None:
+        """Test that each source records the generation it was last published at."""
+        store = SnapshotStore()
+        store.publish("nodes", cluster_nodes=[])
+        store.publish("all_jobs", all_users_jobs=[])
+        store.publish("nodes", cluster_nodes=[])
+        assert store.current.source_generation("nodes") == 3
+        assert store.current.source_generation("all_jobs") == 2
+        assert store.current.source_generation("energy") == 0
+
+    def test_snapshot_is_frozen(self) -> None:
+        """Test that snapshot fields cannot be reassigned."""
+        snapshot = ClusterSnapshot()
+        with pytest.raises(FrozenInstanceError):
+            snapshot.generation = 5  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            snapshot.source_generations["nodes"] = 1  # type: ignore[index]
+
+    def test_concurrent_publishes_are_not_lost(self) -> None:
+        """Test that concurrent writers each get their own generation."""
+        store = SnapshotStore()
+        publishes_per_thread = 100
+
+        def _publish(source: str) -> None:
+            for _ in range(publishes_per_thread):
+                store.publish(source, priority_summary_markup=source)
+
+        threads = [threading.Thread(target=_publish, args=(f"source-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.current.generation == 4 * publishes_per_thread
+
+
+class _Owner:
+    nodes = SnapshotAttribute[list[dict[str, str]]]("cluster_nodes", "nodes")
+
+    def __init__(self) -> None:
+        self._snapshot_store = SnapshotStore()
+
+
+class TestSnapshotAttribute:
+    """Tests for the SnapshotAttribute descriptor."""
+
+    def test_get_reads_current_snapshot(self) -> None:
+        """Test that reading the attribute returns the current snapshot field."""
+        owner = _Owner()
+        nodes = [{"NodeName": "node01"}]
+        owner._snapshot_store.publish("nodes", cluster_nodes=nodes)
+        assert owner.nodes is nodes
+
+    def test_set_publishes_new_generation(self) -> None:
+        """Test that assigning the attribute publishes under its source."""
+        owner = _Owner()
+        owner.nodes = [{"NodeName": "node02"}]
+        assert owner._snapshot_store.current.generation == 1
+        assert owner._snapshot_store.current.source_generation("nodes") == 1
+        assert owner._snapshot_store.current.cluster_nodes == [{"NodeName": "node02"}]
+
+    def test_class_access_returns_descriptor(self) -> None:
+        """Test that accessing the attribute on the class returns the descriptor."""
+        assert isinstance(_Owner.nodes, SnapshotAttribute)
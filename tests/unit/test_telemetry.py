@@ -0,0 +1,86 @@
+"""Tests for the refresh pipeline telemetry."""
+
+import pytest
+from stoei.dataflow import Dataflow
+from stoei.snapshot import SnapshotStore
+from stoei.telemetry import APPLY, COMMAND, DERIVE, PARSE, Histogram, Telemetry, get_telemetry
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_empty_histogram(self) -> None:
+        """Test that an empty histogram reports zero percentiles."""
+        histogram = Histogram()
+        assert histogram.count == 0
+        assert histogram.percentile(0.5) == 0.0
+
+    def test_percentiles_are_bucket_upper_bounds(self) -> None:
+        """Test that percentiles round up to the bucket bound, capped at the maximum."""
+        histogram = Histogram()
+        for _ in range(90):
+            histogram.record(0.00015)  # 0.1-0.2ms bucket
+        for _ in range(10):
+            histogram.record(0.05)  # 25.6-51.2ms bucket
+
+        assert histogram.count == 100
+        assert histogram.total == pytest.approx(90 * 0.00015 + 10 * 0.05)
+        assert histogram.max == 0.05
+        assert histogram.percentile(0.5) == pytest.approx(0.0002)
+        assert histogram.percentile(0.95) == 0.05
+
+    def test_overflow_bucket_reports_maximum(self) -> None:
+        """Test that durations beyond the last bound are reported as the maximum."""
+        histogram = Histogram()
+        histogram.record(500.0)
+        assert histogram.percentile(0.95) == 500.0
+
+
+class TestTelemetry:
+    """Tests for the stage registry."""
+
+    def test_summaries_ordered_by_stage_then_total(self) -> None:
+        """Test that summaries follow the pipeline order, slowest stage first within a kind."""
+        telemetry = Telemetry()
+        telemetry.record(APPLY, "_update_jobs_table", 0.01)
+        telemetry.record(COMMAND, "squeue", 0.2, output_bytes=1000)
+        telemetry.record(COMMAND, "squeue", 0.4, output_bytes=500)
+        telemetry.record(COMMAND, "sacct", 1.0)
+        telemetry.record(PARSE, "squeue", 0.003)
+
+        summaries = telemetry.summaries()
+
+        assert [(summary.kind, summary.name) for summary in summaries] == [
+            (COMMAND, "sacct"),
+            (COMMAND, "squeue"),
+            (PARSE, "squeue"),
+            (APPLY, "_update_jobs_table"),
+        ]
+        squeue = summaries[1]
+        assert squeue.count == 2
+        assert squeue.total == pytest.approx(0.6)
+        assert squeue.max == 0.4
+        assert squeue.output_bytes == 1500
+
+    def test_timed_records_block_duration_even_on_error(self) -> None:
+        """Test that a failing block is still recorded."""
+        telemetry = Telemetry()
+        with pytest.raises(ValueError, match="boom"), telemetry.timed(PARSE, "sshare"):
+            raise ValueError("boom")
+        (summary,) = telemetry.summaries()
+        assert (summary.kind, summary.name, summary.count) == (PARSE, "sshare", 1)
+
+        telemetry.clear()
+        assert telemetry.summaries() == []
+
+    def test_derived_view_recomputes_are_recorded(self) -> None:
+        """Test that recomputing a derived view records a derive stage, but a skip does not."""
+        get_telemetry().clear()
+        store = SnapshotStore()
+        view = Dataflow(store).view("node_count", ("nodes",), lambda s: len(s.cluster_nodes), initial=0)
+        store.publish("nodes", cluster_nodes=[{"NodeName": "n1"}])
+        view.get()
+        view.get()
+
+        derived = [summary for summary in get_telemetry().summaries() if summary.kind == DERIVE]
+        assert [(summary.name, summary.count) for summary in derived] == [("node_count", 1)]
@@ -0,0 +1,107 @@
+"""Tests for refresh cycle span tracing."""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from stoei.slurm.commands import _run_with_retry
+from stoei.tracing import (
+    CYCLE,
+    FETCH,
+    RETRY,
+    SUBPROCESS,
+    Tracer,
+    configure_tracing,
+    span,
+    traced,
+    write_trace,
+)
+
+
+def _spans(path: Path) -> list[dict[str, object]]:
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    return [event for event in events if event["ph"] == "X"]
+
+
+class TestSpans:
+    """Tests for recording spans."""
+
+    def test_disabled_tracing_records_nothing(self, tmp_path: Path) -> None:
+        """Test that spans are no-ops and nothing is written when tracing is off."""
+        with span("refresh cycle", CYCLE):
+            pass
+        assert write_trace() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cycle_spans_tag_spans_on_other_threads(self, tmp_path: Path) -> None:
+        """Test that fetch spans on pool threads carry the open cycle's number."""
+        trace_path = tmp_path / "trace.json"
+        configure_tracing(trace_path)
+
+        @traced("fetch nodes", FETCH)
+        def fetch_nodes() -> str:
+            return "nodes"
+
+        with span("refresh cycle", CYCLE):
+            thread = threading.Thread(target=fetch_nodes, name="stoei-refresh_0")
+            thread.start()
+            thread.join()
+        with span("outside", FETCH):
+            pass
+        assert write_trace() == trace_path
+
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        thread_names = {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+        assert "stoei-refresh_0" in thread_names
+        spans = {event["name"]: event for event in _spans(trace_path)}
+        assert spans["refresh cycle"]["args"] == {"cycle": 1}
+        assert spans["fetch nodes"]["args"] == {"cycle": 1}
+        assert spans["fetch nodes"]["tid"] != spans["refresh cycle"]["tid"]
+        assert spans["refresh cycle"]["ts"] <= spans["fetch nodes"]["ts"]
+        assert spans["outside"]["args"] == {}
+
+    def test_span_records_errors(self, tmp_path: Path) -> None:
+        """Test that a span ended by an exception names the exception."""
+        configure_tracing(tmp_path / "trace.json")
+        with pytest.raises(ValueError, match="boom"), span("parse", FETCH):
+            raise ValueError("boom")
+        write_trace()
+        (recorded,) = _spans(tmp_path / "trace.json")
+        assert recorded["args"] == {"error": "ValueError"}
+
+    def test_oldest_spans_are_dropped(self, tmp_path: Path) -> None:
+        """Test that the buffer keeps the latest spans and reports the dropped count."""
+        tracer = Tracer(tmp_path / "trace.json", max_events=2)
+        for name in ("a", "b", "c"):
+            tracer.record(name, FETCH, tracer.now_us(), {})
+        tracer.write()
+
+        trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+        assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == ["b", "c"]
+        assert trace["otherData"] == {"droppedSpans": 1}
+
+
+class TestCommandSpans:
+    """Tests for the spans recorded around SLURM commands."""
+
+    def test_retries_record_attempts_backoff_and_subprocess(self, tmp_path: Path) -> None:
+        """Test that each attempt, backoff sleep and subprocess run is a span."""
+        configure_tracing(tmp_path / "trace.json")
+        fail_result = MagicMock(returncode=1, stdout="", stderr="error")
+        success_result = MagicMock(returncode=0, stdout="ok", stderr="")
+
+        with patch("subprocess.run", side_effect=[fail_result, success_result]):
+            _run_with_retry(["squeue"], timeout=5, command_name="squeue", max_retries=1, initial_delay=0.01)
+        write_trace()
+
+        spans = _spans(tmp_path / "trace.json")
+        assert [(event["name"], event["cat"]) for event in spans] == [
+            ("squeue", SUBPROCESS),
+            ("squeue attempt 1", RETRY),
+            ("squeue backoff", RETRY),
+            ("squeue", SUBPROCESS),
+            ("squeue attempt 2", RETRY),
+        ]
+        assert spans[2]["args"] == {"delay": 0.01}
@@ -725,3 +725,43 @@ class TestClusterSidebarWaitTime:
         cluster_sidebar.update_stats(stats)
         rendered = cluster_sidebar._render_stats()
         assert "Jobs started in last 6h" in rendered
+
+    def test_render_wait_percentiles_per_window(self, cluster_sidebar: ClusterSidebar) -> None:
+        """Test that percentiles are shown for windows that add information."""
+
+        def _stats(count: int) -> dict[str, PartitionWaitStats]:
+            return {
+                "cpu": PartitionWaitStats(
+                    partition="cpu",
+                    job_count=count,
+                    mean_seconds=60.0,
+                    median_seconds=45.0,
+                    min_seconds=10.0,
+                    max_seconds=900.0,
+                    p90_seconds=300.0,
+                    p99_seconds=900.0,
+                ),
+            }
+
+        stats = ClusterStats(
+            total_nodes=10,
+            free_nodes=5,
+            wait_stats_by_partition=_stats(5),
+            wait_stats_by_window={1: _stats(5), 24: _stats(40), 168: _stats(40)},
+        )
+        cluster_sidebar.update_stats(stats)
+        rendered = cluster_sidebar._render_stats()
+        assert "Wait Percentiles" in rendered
+        assert "Last 1h" in rendered
+        assert "Last 24h" in rendered
+        # 7d holds no more jobs than 24h yet, so it is not shown
+        assert "Last 7d" not in rendered
+        assert "cpu: 45s/5m/15m (40)" in rendered
+
+        # Before the backfill, the longer windows only hold the session's history
+        stats.wait_stats_covered_seconds = 3 * 3600.0
+        cluster_sidebar.update_stats(stats)
+        rendered = cluster_sidebar._render_stats()
+        assert "Last 1h" in rendered
+        assert "Last 3.0h (of 24h)" in rendered
+        assert "Last 24h" not in rendered
@@ -1,8 +1,13 @@
 """Tests for the LogPane widget."""
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
+import pytest
+from loguru import logger
 from stoei.widgets.log_pane import LogPane
+from textual.app import App, ComposeResult
+from textual.containers import Container
 
 
 class TestLogPane:
@@ -192,3 +197,59 @@ class TestLogPaneSink:
         timestamp = record_time.replace(tzinfo=None)
         assert timestamp is not None
         assert timestamp == datetime(2024, 1, 15, 10, 30, 45)
+
+
+class _LogPaneApp(App[None]):
+    def compose(self) -> ComposeResult:
+        with Container(id="log-container"):
+            yield LogPane(id="log_pane")
+
+
+class TestLogPaneBatching:
+    """Tests for buffering sink records and writing them in batches."""
+
+    @pytest.mark.asyncio
+    async def test_records_are_written_in_one_batch(self) -> None:
+        """Test that a burst of records is rendered with a single write."""
+        app = _LogPaneApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            pane = app.query_one(LogPane)
+            sink_id = logger.add(pane.sink, level="DEBUG", format="{message}")
+            try:
+                with patch.object(pane, "write", wraps=pane.write) as mock_write:
+                    for index in range(50):
+                        logger.debug("Record {}", index)
+                    await pilot.pause(0.05)
+            finally:
+                logger.remove(sink_id)
+
+            assert mock_write.call_count == 1
+            assert len(pane.lines) == 50
+
+    @pytest.mark.asyncio
+    async def test_hidden_pane_buffers_and_counts_dropped_records(self) -> None:
+        """Test that records are held while hidden, bounded, and written when shown."""
+        app = _LogPaneApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            pane = app.query_one(LogPane)
+            container = app.query_one("#log-container")
+            container.display = False
+            await pilot.pause()
+
+            sink_id = logger.add(pane.sink, level="DEBUG", format="{message}")
+            try:
+                for index in range(LogPane.MAX_PENDING_ENTRIES + 5):
+                    logger.debug("Record {}", index)
+                await pilot.pause(0.05)
+                assert len(pane.lines) == 0
+
+                container.display = True
+                await pilot.pause(0.05)
+            finally:
+                logger.remove(sink_id)
+
+            assert len(pane.lines) == LogPane.MAX_PENDING_ENTRIES + 1
+            assert pane.lines[0].text.startswith("5 log messages dropped")
+            assert pane.lines[1].text.endswith("Record 5")
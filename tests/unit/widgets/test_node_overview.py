@@ -227,6 +227,11 @@ class TestNodeOverviewTab:
         column_keys = [col.key for col in NodeOverviewTab.NODE_TABLE_COLUMN_CONFIGS]
         assert "reason" in column_keys
 
+    def test_jobs_column_in_config(self) -> None:
+        """Test that the resident Jobs column is present in column configs."""
+        column_keys = [col.key for col in NodeOverviewTab.NODE_TABLE_COLUMN_CONFIGS]
+        assert "jobs" in column_keys
+
     async def test_update_nodes_with_reason(self, app: NodeOverviewTestApp) -> None:
         """Test that reason field is included in node display."""
         async with app.run_test(size=(120, 24)):
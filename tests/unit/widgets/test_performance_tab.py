@@ -0,0 +1,56 @@
+"""Unit tests for the PerformanceTab widget."""
+
+from stoei.app import SlurmMonitor
+from stoei.telemetry import COMMAND, StageSummary
+from stoei.widgets.filterable_table import FilterableDataTable
+from stoei.widgets.performance_tab import PerformanceTab
+from textual.app import App
+from textual.widgets import Static
+
+
+class PerformanceTestApp(App[None]):
+    """Test app hosting a PerformanceTab."""
+
+    def get_theme_variable_defaults(self) -> dict[str, str]:
+        """Return theme variables required by stoei widgets."""
+        return SlurmMonitor.THEME_VARIABLE_DEFAULTS
+
+    def compose(self):
+        """Create test app layout."""
+        yield PerformanceTab(id="performance-overview")
+
+
+class TestPerformanceTab:
+    """Tests for PerformanceTab.update_stats."""
+
+    async def test_update_stats_fills_table_and_counters(self) -> None:
+        """Test that each stage summary becomes one row, in milliseconds."""
+        app = PerformanceTestApp()
+        async with app.run_test(size=(120, 30)):
+            tab = app.query_one("#performance-overview", PerformanceTab)
+            summary = StageSummary(
+                kind=COMMAND,
+                name="squeue",
+                count=3,
+                p50=0.0512,
+                p95=0.1024,
+                max=0.09,
+                total=0.2,
+                output_bytes=2048,
+            )
+            tab.update_stats([summary], "Commands shared by concurrent callers: 2")
+
+            table = tab.query_one("#performance-filterable-table", FilterableDataTable)
+            assert table.table.row_count == 1
+            assert table.table.get_row_at(0) == [
+                "SLURM command",
+                "squeue",
+                "3",
+                "51.2",
+                "102.4",
+                "90.0",
+                "200.0",
+                "2.0 KB",
+            ]
+            counters = tab.query_one("#performance-counters", Static)
+            assert "shared by concurrent callers: 2" in str(counters.render())
@@ -499,6 +499,44 @@ class TestPriorityOverviewTab:
             assert "Your Priority" in content
             assert "physics" in content
 
+    async def test_unchanged_rows_not_reapplied(self) -> None:
+        """Test that re-applying the same row lists skips the table updates."""
+
+        class PriorityTestApp(App[None]):
+            def compose(self):
+                yield PriorityOverviewTab(current_username="user1", id="priority-overview")
+
+        app = PriorityTestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            priority_tab = app.query_one("#priority-overview", PriorityOverviewTab)
+            colors = _fallback_colors()
+            user_priorities = [UserPriority("user1", "physics", "100", "0.125", "50000", "0.075", "0.15", "0.85")]
+            sorted_users, user_rows = build_user_priority_rows(user_priorities, "user1", colors)
+            data = PrebuiltPriorityData(
+                user_priorities=sorted_users,
+                account_priorities=[],
+                job_priorities=[],
+                user_rows=user_rows,
+                account_rows=[],
+                job_rows=[],
+                my_job_rows=[],
+                summary_markup="summary",
+            )
+            priority_tab.apply_prebuilt_data(data)
+            await pilot.pause()
+
+            applied: list[list[tuple[str, ...]]] = []
+            priority_tab._apply_user_rows = applied.append  # type: ignore[method-assign]
+            priority_tab.apply_prebuilt_data(data)
+            await pilot.pause()
+            assert applied == []
+
+            priority_tab.apply_prebuilt_data(
+                PrebuiltPriorityData(**{**data.__dict__, "user_rows": list(user_rows)}),
+            )
+            await pilot.pause()
+            assert applied == [user_rows]
+
     async def test_user_highlighting(self) -> None:
         """Test that current user's row is highlighted with >> prefix."""
 
@@ -507,7 +545,7 @@ class TestPriorityOverviewTab:
                 yield PriorityOverviewTab(current_username="user1", id="priority-overview")
 
         app = PriorityTestApp()
-        async with app.run_test(size=(80, 24)):
+        async with app.run_test(size=(80, 24)) as pilot:
             priority_tab = app.query_one("#priority-overview", PriorityOverviewTab)
             priorities = [
                 UserPriority("user1", "physics", "100", "0.125", "50000", "0.075", "0.15", "0.85"),
@@ -515,8 +553,9 @@ class TestPriorityOverviewTab:
             ]
             priority_tab.update_user_priorities(priorities)
 
-            # Switch to users subtab and check the data
+            # Switch to users subtab (composed on first show) and check the data
             priority_tab.switch_subtab("users")
+            await pilot.pause()
             filterable = priority_tab.query_one("#user-priority-filterable-table", FilterableDataTable)
             table = filterable.query_one("#user_priority_table")
             # The first row (user1) should have >> prefix in the User column
@@ -64,6 +64,15 @@ class TestTabContainer:
             tab_container.switch_tab("logs")
             assert tab_container.active_tab == "logs"
 
+    async def test_switch_tab_to_performance(self) -> None:
+        """Test switching to performance tab."""
+        app = TabTestApp()
+        async with app.run_test(size=(80, 24)):
+            tab_container = app.query_one("#tab-container", TabContainer)
+            tab_container.switch_tab("performance")
+            assert tab_container.active_tab == "performance"
+            assert "active" in app.query_one("#tab-performance", Button).classes
+
     def test_switch_tab_same_tab(self, tab_container: TabContainer) -> None:
         """Test switching to the same tab does nothing."""
         initial_tab = tab_container.active_tab
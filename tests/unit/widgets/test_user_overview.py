@@ -79,6 +79,28 @@ class TestUserOverviewTab:
             user_tab.update_users(users)
             assert len(user_tab.users) == 2
 
+    async def test_hidden_subtab_is_composed_on_first_show(self) -> None:
+        """Test that pending users wait outside the widget tree until their sub-tab is shown."""
+        from stoei.widgets.filterable_table import FilterableDataTable
+        from textual.app import App
+
+        class UserTestApp(App[None]):
+            def compose(self):
+                yield UserOverviewTab(id="user-overview")
+
+        app = UserTestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            user_tab = app.query_one("#user-overview", UserOverviewTab)
+            assert not user_tab.query("#pending-users-filterable-table")
+            pending = [UserPendingStats("user1", 2, 8, 32.0, 0, "")]
+            user_tab.update_pending_users(pending)
+            assert user_tab.pending_users == pending
+
+            user_tab.switch_subtab("pending")
+            await pilot.pause()
+            table = user_tab.query_one("#pending-users-filterable-table", FilterableDataTable)
+            assert table.table.row_count == 1
+
     def test_aggregate_user_stats_empty_list(self) -> None:
         """Test aggregating stats from empty job list."""
         result = UserOverviewTab.aggregate_user_stats([])